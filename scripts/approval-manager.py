@@ -23,9 +23,8 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, read_json, save_json
 
 VALID_TYPES = [
     "publish-blog", "send-email", "launch-ad", "schedule-social",
@@ -34,18 +33,10 @@ VALID_TYPES = [
 VALID_RISK_LEVELS = ["low", "medium", "high", "critical"]
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_approval(filepath):
     """Load a single approval JSON file."""
     try:
-        return json.loads(filepath.read_text())
+        return read_json(filepath)
     except json.JSONDecodeError:
         return None
 
@@ -133,7 +124,7 @@ def create_approval(slug, data):
     }
 
     filepath = approvals_dir / f"{approval_id}.json"
-    filepath.write_text(json.dumps(approval, indent=2))
+    save_json(filepath, approval)
 
     return {
         "status": "created",
@@ -181,7 +172,7 @@ def approve(slug, approval_id):
     approval["approved_by"] = "user"
     approval["approved_at"] = datetime.now().isoformat()
 
-    filepath.write_text(json.dumps(approval, indent=2))
+    save_json(filepath, approval)
 
     return {
         "status": "approved",
@@ -214,7 +205,7 @@ def reject(slug, approval_id, data):
     approval["status"] = "rejected"
     approval["rejected_reason"] = reason
 
-    filepath.write_text(json.dumps(approval, indent=2))
+    save_json(filepath, approval)
 
     return {
         "status": "rejected",
@@ -251,7 +242,7 @@ def mark_executed(slug, approval_id, data):
     approval["url"] = data.get("url")
     approval["rollback_data"] = data.get("rollback_data")
 
-    filepath.write_text(json.dumps(approval, indent=2))
+    save_json(filepath, approval)
 
     return {
         "status": approval["status"],
@@ -8,9 +8,15 @@ Creates synthetic audience panels from segment data, runs simulated focus
 groups, tests message variants, pricing scenarios, and positioning statements.
 Tracks calibration against real-world outcomes for continuous improvement.
 
+Each test scores the panel either per segment (the default: one simulated
+answer per segment) or per respondent: with --respondents N every segment is
+expanded into N synthetic respondents with jittered traits, all respondents x
+variants are scored as arrays, and results carry 95% confidence intervals
+per segment. Both modes are deterministic for a given panel ID.
+
 Storage: ~/.claude-marketing/brands/{slug}/panels/
 
-Dependencies: none (stdlib only)
+Dependencies: stdlib only; numpy (optional) for --respondents
 
 Usage:
     python audience-simulator.py --brand acme --action create-panel --panel-name "Q1 Panel" --segments '[{"name":"Enterprise","size_pct":40,...}]'
@@ -19,6 +25,7 @@ Usage:
     python audience-simulator.py --brand acme --action test-message --panel-id panel-20260101-120000 --variants '[{"name":"A","headline":"...","body":"...","cta":"..."}]'
     python audience-simulator.py --brand acme --action test-pricing --panel-id panel-20260101-120000 --price-points '[29,49,79,99]' --product-description "SaaS analytics tool"
     python audience-simulator.py --brand acme --action test-positioning --panel-id panel-20260101-120000 --statements '[{"name":"Value","statement":"We deliver 10x ROI"}]'
+    python audience-simulator.py --brand acme --action test-message --panel-id panel-20260101-120000 --variants '[...]' --respondents 2000
     python audience-simulator.py --brand acme --action calibrate --panel-id panel-20260101-120000 --test-type message --predicted '{"winning":"A"}' --actual '{"winning":"B"}'
     python audience-simulator.py --brand acme --action panel-stats --panel-id panel-20260101-120000
 """
@@ -32,30 +39,38 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import load_json, save_json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 ENGAGEMENT_WEIGHTS = {"high": 1.3, "medium": 1.0, "low": 0.7}
 INCOME_MULTIPLIERS = {"low": 0.6, "medium": 1.0, "high": 1.4, "very-high": 1.8}
 SENTIMENTS = ["positive", "neutral", "negative"]
 TEST_TYPES = ["message", "pricing", "positioning"]
+PRICE_THRESHOLDS = (0.3, 0.6, 1.2, 1.8)  # too cheap, good deal, expensive, too expensive
+
+# Respondent mode
+MAX_RESPONDENTS = 100000   # per segment
+RESPONDENTS_RANGE_ERROR = f"--respondents must be between 0 (segment-level scoring) and {MAX_RESPONDENTS}"
+TRAIT_JITTER = 0.15        # lognormal sigma on engagement
+COUNT_JITTER = 0.25        # lognormal sigma on goal/objection/value counts
+PRICE_JITTER = 0.2         # lognormal sigma on each respondent's reference price
+Z_95 = 1.96
 
 
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
 def _load_json(path, default=None):
-    if default is None:
-        default = {}
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, {} if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _panels_dir(slug):
@@ -75,20 +90,38 @@ def _deterministic_seed(panel_id, *args):
     return int(hashlib.md5(raw.encode()).hexdigest()[:8], 16)
 
 
-def _score_with_profile(base, segment, factor_key, panel_id, variant_idx=0):
+def _segment_traits(seg):
+    """Read the segment attributes the scorers use, once per segment."""
+    psycho = seg.get("psychographics", {})
+    values = psycho.get("values", [])
+    motivations = psycho.get("motivations", [])
+    objections = psycho.get("objections", [])
+    goals = seg.get("goals", [])
+    pain_points = seg.get("pain_points", [])
+    engagement = seg.get("behavior", {}).get("engagement_level", "medium")
+
+    # Positive bias from goals/motivations, negative from pain_points/objections
+    pos_weight = len(goals) + len(motivations)
+    neg_weight = len(pain_points) + len(objections)
+    return {
+        "engagement": ENGAGEMENT_WEIGHTS.get(engagement, 1.0),
+        "profile_bonus": min(2.0, (len(values) + len(motivations)) * 0.2),
+        "goals": len(goals),
+        "objections": len(objections),
+        "values": len(values),
+        "pos_prob": (pos_weight + 1) / (pos_weight + neg_weight + 2),
+        "objection_list": objections,
+        "value_list": values,
+    }
+
+
+def _score_with_profile(base, seg_name, traits, factor_key, panel_id, variant_idx=0):
     """Generate a deterministic score influenced by segment profile."""
-    seed = _deterministic_seed(panel_id, segment["name"], factor_key, variant_idx)
+    seed = _deterministic_seed(panel_id, seg_name, factor_key, variant_idx)
     rng = random.Random(seed)
 
-    engagement = segment.get("behavior", {}).get("engagement_level", "medium")
-    weight = ENGAGEMENT_WEIGHTS.get(engagement, 1.0)
-
     # Profile influence: psychographic alignment adds up to 2 points
-    values = segment.get("psychographics", {}).get("values", [])
-    motivations = segment.get("psychographics", {}).get("motivations", [])
-    profile_bonus = min(2.0, (len(values) + len(motivations)) * 0.2)
-
-    score = base * weight + profile_bonus + rng.uniform(-1.0, 1.0)
+    score = base * traits["engagement"] + traits["profile_bonus"] + rng.uniform(-1.0, 1.0)
     return round(max(1.0, min(10.0, score)), 1)
 
 
@@ -102,9 +135,115 @@ def _load_panel(slug, panel_id):
     return panel, None
 
 
+def _respondent_count(panel, respondents):
+    """Respondents per segment: the --respondents override, else the panel default."""
+    if respondents is None:
+        respondents = panel.get("respondents_per_segment", 0)
+    if not respondents:
+        return 0, None
+    if not 0 < respondents <= MAX_RESPONDENTS:
+        return None, {"error": RESPONDENTS_RANGE_ERROR}
+    if np is None:
+        return None, {"error": "numpy not installed. Use --respondents 0 for segment-level scoring, or: pip install numpy"}
+    return respondents, None
+
+
+# ── Respondent engine (numpy) ───────────────────────────────────────────────
+#
+# Each segment expands into n synthetic respondents whose traits are the
+# segment's traits with per-respondent jitter. Respondents are drawn from a
+# Generator seeded by (panel ID, segment, n), so the same respondents answer
+# every test on a panel; each test draws its answer noise from a second
+# Generator seeded by (panel ID, segment, test). All respondents x variants x
+# dimensions are scored as one array per segment.
+
+def _expand_segment(panel_id, seg, traits, n):
+    """Draw n respondents for a segment as arrays of jittered traits."""
+    rng = np.random.default_rng(_deterministic_seed(panel_id, seg["name"], "respondents", n))
+    return {
+        "engagement": traits["engagement"] * rng.lognormal(0.0, TRAIT_JITTER, n),
+        "profile_bonus": np.clip(traits["profile_bonus"] + rng.normal(0.0, 0.3, n), 0.0, 2.0),
+        "goals": traits["goals"] * rng.lognormal(0.0, COUNT_JITTER, n),
+        "objections": traits["objections"] * rng.lognormal(0.0, COUNT_JITTER, n),
+        "values": traits["values"] * rng.lognormal(0.0, COUNT_JITTER, n),
+        "pos_prob": np.clip(traits["pos_prob"] + rng.normal(0.0, 0.1, n), 0.02, 0.98),
+        "price_ref": rng.lognormal(0.0, PRICE_JITTER, n),
+    }
+
+
+def _test_rng(panel_id, seg, test_key, n):
+    return np.random.default_rng(_deterministic_seed(panel_id, seg["name"], test_key, n))
+
+
+def _mean_ci(samples, axis=-1):
+    """Mean and 95% confidence half-width along axis."""
+    n = samples.shape[axis]
+    mean = samples.mean(axis=axis)
+    if n < 2:
+        return mean, np.zeros_like(mean)
+    return mean, Z_95 * samples.std(axis=axis, ddof=1) / math.sqrt(n)
+
+
+def _ci(mean, half, digits=1):
+    return [round(float(mean - half), digits), round(float(mean + half), digits)]
+
+
+def _respondent_dim_scores(resp, rng, variant_terms, respondent_terms):
+    """Score every respondent on every variant and dimension.
+
+    variant_terms (V, D) and respondent_terms (n, D) add up to each
+    respondent's base score; the rest mirrors _score_with_profile.
+    Returns an array of shape (V, n, D).
+    """
+    base = variant_terms[:, None, :] + respondent_terms[None, :, :]
+    noise = rng.uniform(-1.0, 1.0, base.shape)
+    scores = base * resp["engagement"][None, :, None] + resp["profile_bonus"][None, :, None] + noise
+    return np.clip(scores, 1.0, 10.0)
+
+
+def _summarize_variants(panel, names, seg_scores, dims, key):
+    """Turn per-segment (V, n, D) score arrays into the test_* result shape."""
+    weights = [seg.get("size_pct", 0) / 100 for seg in panel["segments"]]
+    n_variants = len(names)
+    totals = np.zeros(n_variants)
+    total_var = np.zeros(n_variants)
+    per_variant = [[] for _ in names]
+    dim_means_by_seg = []
+    segment_winners = {}
+
+    for seg, weight, scores in zip(panel["segments"], weights, seg_scores):
+        n = scores.shape[1]
+        dim_means = scores.mean(axis=1)                     # (V, D)
+        seg_totals = scores.sum(axis=2)                     # (V, n)
+        total_mean, total_half = _mean_ci(seg_totals)       # (V,)
+        totals += total_mean * weight
+        if n > 1:
+            total_var += weight ** 2 * seg_totals.var(axis=1, ddof=1) / n
+        dim_means_by_seg.append(dim_means)
+
+        for vi in range(n_variants):
+            per_variant[vi].append({
+                "segment_name": seg["name"],
+                "scores": {dim: round(float(v), 1) for dim, v in zip(dims, dim_means[vi])},
+                "segment_total": round(float(total_mean[vi]), 1),
+                "segment_total_ci95": _ci(total_mean[vi], total_half[vi]),
+            })
+        best = int(np.argmax(total_mean))
+        segment_winners[seg["name"]] = names[best]
+
+    total_half = Z_95 * np.sqrt(total_var)
+    breakdown = [{key: name, "segment_scores": rows} for name, rows in zip(names, per_variant)]
+    summary = [
+        {key: name, "total_score": round(float(totals[vi]), 2),
+         "total_score_ci95": _ci(totals[vi], total_half[vi], 2)}
+        for vi, name in enumerate(names)
+    ]
+    return summary, breakdown, segment_winners, dim_means_by_seg
+
+
 # ── Actions ─────────────────────────────────────────────────────────────────
 
-def create_panel(slug, panel_name, segments_str):
+def create_panel(slug, panel_name, segments_str, respondents=0):
     err = _brand_check(slug)
     if err:
         return err
@@ -117,6 +256,9 @@ def create_panel(slug, panel_name, segments_str):
     if not isinstance(segments, list) or not segments:
         return {"error": "Provide a non-empty array of segments"}
 
+    if respondents and not 0 < respondents <= MAX_RESPONDENTS:
+        return {"error": RESPONDENTS_RANGE_ERROR}
+
     # Validate size_pct sums to 100
     total_pct = sum(s.get("size_pct", 0) for s in segments)
     if abs(total_pct - 100.0) > 0.5:
@@ -151,12 +293,17 @@ def create_panel(slug, panel_name, segments_str):
         "tests_run": 0,
         "calibrations": [],
     }
+    if respondents:
+        panel["respondents_per_segment"] = respondents
 
     pdir = _panels_dir(slug) / panel_id
     _save_json(pdir / "panel.json", panel)
 
-    return {"panel_id": panel_id, "segments_count": len(segments),
-            "total_characteristics": total_chars}
+    result = {"panel_id": panel_id, "segments_count": len(segments),
+              "total_characteristics": total_chars}
+    if respondents:
+        result["respondents_per_segment"] = respondents
+    return result
 
 
 def list_panels(slug):
@@ -184,44 +331,28 @@ def list_panels(slug):
     return {"panels": panels, "total": len(panels)}
 
 
-def focus_group(slug, panel_id, stimulus, questions_str):
-    err = _brand_check(slug)
-    if err:
-        return err
+def _predicted_response(seg_name, stimulus, sentiment, traits):
+    values = traits["value_list"]
+    objections = traits["objection_list"]
+    val_str = f" Their core values ({', '.join(values[:2])}) shape this view." if values else ""
+    obj_str = f" Key concern: {objections[0]}." if objections else ""
+    return (f"As a {seg_name} segment member, "
+            f"reaction to '{stimulus}' is {sentiment}.{val_str}{obj_str}")
 
-    panel, perr = _load_panel(slug, panel_id)
-    if perr:
-        return perr
-
-    try:
-        questions = json.loads(questions_str) if isinstance(questions_str, str) else questions_str
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON in --questions"}
-
-    if not isinstance(questions, list) or not questions:
-        return {"error": "Provide a non-empty array of questions"}
 
+def _focus_group_segments(panel, panel_id, stimulus, questions):
+    """Segment-level focus group: one simulated answer per segment and question."""
     responses_by_segment = []
-    all_sentiments = []
+    counts = dict.fromkeys(SENTIMENTS, 0)
 
     for seg in panel["segments"]:
+        traits = _segment_traits(seg)
+        pos_prob = traits["pos_prob"]
         seg_responses = []
-        for qi, question in enumerate(questions):
+        for question in questions:
             seed = _deterministic_seed(panel_id, seg["name"], question)
             rng = random.Random(seed)
 
-            # Determine sentiment based on segment profile
-            pain_points = seg.get("pain_points", [])
-            goals = seg.get("goals", [])
-            motivations = seg.get("psychographics", {}).get("motivations", [])
-            objections = seg.get("psychographics", {}).get("objections", [])
-
-            # Positive bias from goals/motivations, negative from pain_points/objections
-            pos_weight = len(goals) + len(motivations)
-            neg_weight = len(pain_points) + len(objections)
-            total_w = pos_weight + neg_weight + 1
-            pos_prob = (pos_weight + 1) / (total_w + 1)
-
             roll = rng.random()
             if roll < pos_prob * 0.6:
                 sentiment = "positive"
@@ -230,36 +361,95 @@ def focus_group(slug, panel_id, stimulus, questions_str):
             else:
                 sentiment = "negative"
 
-            engagement = seg.get("behavior", {}).get("engagement_level", "medium")
-            confidence = round(ENGAGEMENT_WEIGHTS.get(engagement, 1.0) * rng.uniform(0.5, 0.85), 2)
+            confidence = round(traits["engagement"] * rng.uniform(0.5, 0.85), 2)
             confidence = min(0.95, max(0.3, confidence))
 
-            # Build predicted response based on profile
-            values = seg.get("psychographics", {}).get("values", [])
-            val_str = f" Their core values ({', '.join(values[:2])}) shape this view." if values else ""
-            obj_str = f" Key concern: {objections[0]}." if objections else ""
+            seg_responses.append({
+                "question": question,
+                "predicted_response": _predicted_response(seg["name"], stimulus, sentiment, traits),
+                "sentiment": sentiment,
+                "confidence": confidence,
+            })
+            counts[sentiment] += 1
 
-            predicted = (f"As a {seg['name']} segment member, "
-                         f"reaction to '{stimulus}' is {sentiment}.{val_str}{obj_str}")
+        responses_by_segment.append({
+            "segment_name": seg["name"],
+            "responses": seg_responses,
+        })
+
+    return responses_by_segment, counts
+
+
+def _focus_group_respondents(panel, panel_id, stimulus, questions, n):
+    """Respondent-level focus group: sentiment shares with 95% intervals."""
+    responses_by_segment = []
+    counts = dict.fromkeys(SENTIMENTS, 0)
+
+    for seg in panel["segments"]:
+        traits = _segment_traits(seg)
+        resp = _expand_segment(panel_id, seg, traits, n)
+        positive_cut = resp["pos_prob"] * 0.6
+        seg_responses = []
+        for question in questions:
+            rng = _test_rng(panel_id, seg, f"focus-group:{question}", n)
+            roll = rng.random(n)
+            codes = np.where(roll < positive_cut, 0, np.where(roll < positive_cut + 0.3, 1, 2))
+            tally = np.bincount(codes, minlength=3)
+            shares = tally / n
+            halves = Z_95 * np.sqrt(shares * (1 - shares) / n)
+            confidence = np.clip(resp["engagement"] * rng.uniform(0.5, 0.85, n), 0.3, 0.95)
+            sentiment = SENTIMENTS[int(np.argmax(tally))]
 
             seg_responses.append({
                 "question": question,
-                "predicted_response": predicted,
+                "predicted_response": _predicted_response(seg["name"], stimulus, sentiment, traits),
                 "sentiment": sentiment,
-                "confidence": confidence,
+                "sentiment_pct": {s: round(float(p) * 100, 1) for s, p in zip(SENTIMENTS, shares)},
+                "sentiment_pct_ci95": {s: _ci(p * 100, h * 100) for s, p, h in zip(SENTIMENTS, shares, halves)},
+                "confidence": round(float(confidence.mean()), 2),
             })
-            all_sentiments.append(sentiment)
+            for s, count in zip(SENTIMENTS, tally):
+                counts[s] += int(count)
 
         responses_by_segment.append({
             "segment_name": seg["name"],
+            "respondents": n,
             "responses": seg_responses,
         })
 
+    return responses_by_segment, counts
+
+
+def focus_group(slug, panel_id, stimulus, questions_str, respondents=None):
+    err = _brand_check(slug)
+    if err:
+        return err
+
+    panel, perr = _load_panel(slug, panel_id)
+    if perr:
+        return perr
+
+    try:
+        questions = json.loads(questions_str) if isinstance(questions_str, str) else questions_str
+    except json.JSONDecodeError:
+        return {"error": "Invalid JSON in --questions"}
+
+    if not isinstance(questions, list) or not questions:
+        return {"error": "Provide a non-empty array of questions"}
+
+    n, rerr = _respondent_count(panel, respondents)
+    if rerr:
+        return rerr
+    if n:
+        responses_by_segment, counts = _focus_group_respondents(panel, panel_id, stimulus, questions, n)
+    else:
+        responses_by_segment, counts = _focus_group_segments(panel, panel_id, stimulus, questions)
+
     # Consensus themes
-    pos_count = all_sentiments.count("positive")
-    neg_count = all_sentiments.count("negative")
-    neu_count = all_sentiments.count("neutral")
-    total = len(all_sentiments) or 1
+    pos_count = counts["positive"]
+    neg_count = counts["negative"]
+    neu_count = counts["neutral"]
+    total = sum(counts.values()) or 1
 
     consensus = []
     if pos_count / total > 0.6:
@@ -286,32 +476,23 @@ def focus_group(slug, panel_id, stimulus, questions_str):
     panel["tests_run"] = panel.get("tests_run", 0) + 1
     _save_json(_panels_dir(slug) / panel_id / "panel.json", panel)
 
-    return {
+    result = {
         "responses_by_segment": responses_by_segment,
         "consensus_themes": consensus if consensus else ["Mixed reactions — no clear consensus"],
         "divergence_points": divergence,
         "overall_sentiment": overall,
     }
+    if n:
+        result["respondents_per_segment"] = n
+    return result
 
 
-def test_message(slug, panel_id, variants_str):
-    err = _brand_check(slug)
-    if err:
-        return err
-
-    panel, perr = _load_panel(slug, panel_id)
-    if perr:
-        return perr
-
-    try:
-        variants = json.loads(variants_str) if isinstance(variants_str, str) else variants_str
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON in --variants"}
+MESSAGE_DIMS = ["resonance", "clarity", "credibility", "urgency", "differentiation"]
 
-    if not isinstance(variants, list) or not variants:
-        return {"error": "Provide a non-empty array of message variants"}
 
-    scoring_dims = ["resonance", "clarity", "credibility", "urgency", "differentiation"]
+def _message_segments(panel, panel_id, variants):
+    """Segment-level message scoring (one score per segment, variant and dimension)."""
+    traits_by_seg = [_segment_traits(seg) for seg in panel["segments"]]
     variant_scores = []
     per_segment = []
     segment_winners = {}
@@ -321,9 +502,9 @@ def test_message(slug, panel_id, variants_str):
         total_score = 0
         seg_scores = []
 
-        for seg in panel["segments"]:
+        for seg, traits in zip(panel["segments"], traits_by_seg):
             dim_scores = {}
-            for dim in scoring_dims:
+            for dim in MESSAGE_DIMS:
                 base = 5.5
                 # Adjust base by variant properties
                 if dim == "clarity" and len(variant.get("headline", "")) < 50:
@@ -331,16 +512,13 @@ def test_message(slug, panel_id, variants_str):
                 if dim == "urgency" and variant.get("cta", ""):
                     base += 0.5
                 if dim == "credibility":
-                    objections = seg.get("psychographics", {}).get("objections", [])
-                    base -= len(objections) * 0.3
+                    base -= traits["objections"] * 0.3
                 if dim == "resonance":
-                    goals = seg.get("goals", [])
-                    base += len(goals) * 0.2
+                    base += traits["goals"] * 0.2
                 if dim == "differentiation":
                     base += 0.5  # Slight boost for having a distinct variant
 
-                score = _score_with_profile(base, seg, dim, panel_id, vi)
-                dim_scores[dim] = score
+                dim_scores[dim] = _score_with_profile(base, seg["name"], traits, dim, panel_id, vi)
 
             seg_total = sum(dim_scores.values())
             weighted_total = round(seg_total * seg.get("size_pct", 0) / 100, 2)
@@ -358,15 +536,68 @@ def test_message(slug, panel_id, variants_str):
                 segment_winners[seg["name"]] = (v_name, seg_total)
 
         per_segment.append({"variant": v_name, "segment_scores": seg_scores})
-        variant_scores.append({"variant": v_name, "total_score": round(total_score, 2),
-                                "headline": variant.get("headline", ""),
-                                "cta": variant.get("cta", "")})
+        variant_scores.append({"variant": v_name, "total_score": round(total_score, 2)})
+
+    return variant_scores, per_segment, {seg: winner for seg, (winner, _) in segment_winners.items()}
+
+
+def _message_respondents(panel, panel_id, variants, n):
+    """Respondent-level message scoring: all respondents x variants x dimensions at once."""
+    dims = MESSAGE_DIMS
+    variant_terms = np.full((len(variants), len(dims)), 5.5)
+    for vi, variant in enumerate(variants):
+        if len(variant.get("headline", "")) < 50:
+            variant_terms[vi, dims.index("clarity")] += 1
+        if variant.get("cta", ""):
+            variant_terms[vi, dims.index("urgency")] += 0.5
+        variant_terms[vi, dims.index("differentiation")] += 0.5
+
+    seg_scores = []
+    for seg in panel["segments"]:
+        traits = _segment_traits(seg)
+        resp = _expand_segment(panel_id, seg, traits, n)
+        respondent_terms = np.zeros((n, len(dims)))
+        respondent_terms[:, dims.index("credibility")] = -resp["objections"] * 0.3
+        respondent_terms[:, dims.index("resonance")] = resp["goals"] * 0.2
+        rng = _test_rng(panel_id, seg, "test-message", n)
+        seg_scores.append(_respondent_dim_scores(resp, rng, variant_terms, respondent_terms))
+
+    names = [v.get("name", f"Variant {vi + 1}") for vi, v in enumerate(variants)]
+    variant_scores, per_segment, winners, _ = _summarize_variants(panel, names, seg_scores, dims, "variant")
+    return variant_scores, per_segment, winners
+
+
+def test_message(slug, panel_id, variants_str, respondents=None):
+    err = _brand_check(slug)
+    if err:
+        return err
+
+    panel, perr = _load_panel(slug, panel_id)
+    if perr:
+        return perr
+
+    try:
+        variants = json.loads(variants_str) if isinstance(variants_str, str) else variants_str
+    except json.JSONDecodeError:
+        return {"error": "Invalid JSON in --variants"}
+
+    if not isinstance(variants, list) or not variants:
+        return {"error": "Provide a non-empty array of message variants"}
+
+    n, rerr = _respondent_count(panel, respondents)
+    if rerr:
+        return rerr
+    if n:
+        variant_scores, per_segment, seg_win_map = _message_respondents(panel, panel_id, variants, n)
+    else:
+        variant_scores, per_segment, seg_win_map = _message_segments(panel, panel_id, variants)
+    for entry, variant in zip(variant_scores, variants):
+        entry["headline"] = variant.get("headline", "")
+        entry["cta"] = variant.get("cta", "")
 
     variant_scores.sort(key=lambda v: v["total_score"], reverse=True)
     winning = variant_scores[0]["variant"] if variant_scores else None
 
-    seg_win_map = {seg: winner for seg, (winner, _) in segment_winners.items()}
-
     recs = []
     if winning:
         recs.append(f"Lead with '{winning}' as the primary variant.")
@@ -378,16 +609,41 @@ def test_message(slug, panel_id, variants_str):
     panel["tests_run"] = panel.get("tests_run", 0) + 1
     _save_json(_panels_dir(slug) / panel_id / "panel.json", panel)
 
-    return {
+    result = {
         "variant_scores": variant_scores,
         "per_segment_breakdown": per_segment,
         "winning_variant": winning,
         "segment_specific_winners": seg_win_map,
         "recommendations": recs,
     }
+    if n:
+        result["respondents_per_segment"] = n
+    return result
+
+
+def _segment_price_reference(seg, mid):
+    """Reference price for a segment from income, order value and purchase frequency."""
+    income = seg.get("demographics", {}).get("income_bracket", "medium")
+    income_mult = INCOME_MULTIPLIERS.get(income, 1.0)
 
+    aov = seg.get("behavior", {}).get("avg_order_value", mid)
+    if isinstance(aov, str):
+        try:
+            aov = float(aov)
+        except ValueError:
+            aov = mid
 
-def test_pricing(slug, panel_id, price_points_str, product_description):
+    freq = seg.get("behavior", {}).get("purchase_frequency", "monthly")
+    freq_mult = 1.0
+    if freq in ("weekly", "daily"):
+        freq_mult = 0.8  # Price-sensitive frequent buyers
+    elif freq in ("quarterly", "annually"):
+        freq_mult = 1.2  # Less price-sensitive infrequent buyers
+
+    return aov * income_mult * freq_mult, income
+
+
+def test_pricing(slug, panel_id, price_points_str, product_description, respondents=None):
     err = _brand_check(slug)
     if err:
         return err
@@ -404,49 +660,48 @@ def test_pricing(slug, panel_id, price_points_str, product_description):
     if not isinstance(price_points, list) or not price_points:
         return {"error": "Provide a non-empty array of price points"}
 
+    n, rerr = _respondent_count(panel, respondents)
+    if rerr:
+        return rerr
+
     price_points = sorted([float(p) for p in price_points])
     mid = price_points[len(price_points) // 2]
+    prices = np.array(price_points) if n else None
 
     per_segment = []
     all_too_cheap = []
     all_good_deal = []
     all_expensive = []
     all_too_expensive = []
+    acceptance = []  # per segment: share of respondents finding each price acceptable
 
     for seg in panel["segments"]:
-        income = seg.get("demographics", {}).get("income_bracket", "medium")
-        income_mult = INCOME_MULTIPLIERS.get(income, 1.0)
-
-        aov = seg.get("behavior", {}).get("avg_order_value", mid)
-        if isinstance(aov, str):
-            try:
-                aov = float(aov)
-            except ValueError:
-                aov = mid
-
-        freq = seg.get("behavior", {}).get("purchase_frequency", "monthly")
-        freq_mult = 1.0
-        if freq in ("weekly", "daily"):
-            freq_mult = 0.8  # Price-sensitive frequent buyers
-        elif freq in ("quarterly", "annually"):
-            freq_mult = 1.2  # Less price-sensitive infrequent buyers
-
-        base_ref = aov * income_mult * freq_mult
-        seed = _deterministic_seed(panel_id, seg["name"], "pricing")
-        rng = random.Random(seed)
-        noise = rng.uniform(0.9, 1.1)
-
-        too_cheap = round(base_ref * 0.3 * noise, 2)
-        good_deal = round(base_ref * 0.6 * noise, 2)
-        expensive = round(base_ref * 1.2 * noise, 2)
-        too_expensive = round(base_ref * 1.8 * noise, 2)
+        base_ref, income = _segment_price_reference(seg, mid)
+
+        if n:
+            traits = _segment_traits(seg)
+            resp = _expand_segment(panel_id, seg, traits, n)
+            rng = _test_rng(panel_id, seg, "test-pricing", n)
+            ref = base_ref * resp["price_ref"] * rng.uniform(0.9, 1.1, n)
+            thresholds = ref[:, None] * np.array(PRICE_THRESHOLDS)   # (n, 4)
+            means, halves = _mean_ci(thresholds, axis=0)
+            too_cheap, good_deal, expensive, too_expensive = (round(float(m), 2) for m in means)
+            accepted = (thresholds[:, 1:2] <= prices) & (prices <= thresholds[:, 2:3])
+            acceptance.append(accepted.mean(axis=0))
+        else:
+            seed = _deterministic_seed(panel_id, seg["name"], "pricing")
+            rng = random.Random(seed)
+            noise = rng.uniform(0.9, 1.1)
+            too_cheap, good_deal, expensive, too_expensive = (
+                round(base_ref * factor * noise, 2) for factor in PRICE_THRESHOLDS
+            )
 
         all_too_cheap.append(too_cheap)
         all_good_deal.append(good_deal)
         all_expensive.append(expensive)
         all_too_expensive.append(too_expensive)
 
-        per_segment.append({
+        entry = {
             "segment_name": seg["name"],
             "size_pct": seg.get("size_pct", 0),
             "too_cheap": too_cheap,
@@ -454,7 +709,16 @@ def test_pricing(slug, panel_id, price_points_str, product_description):
             "expensive": expensive,
             "too_expensive": too_expensive,
             "income_bracket": income,
-        })
+        }
+        if n:
+            entry["ci95"] = {
+                name: _ci(m, h, 2)
+                for name, m, h in zip(("too_cheap", "good_deal", "expensive", "too_expensive"), means, halves)
+            }
+            entry["acceptance_pct"] = {
+                f"{p:g}": round(float(a) * 100, 1) for p, a in zip(price_points, acceptance[-1])
+            }
+        per_segment.append(entry)
 
     # Weighted averages
     weights = [seg.get("size_pct", 0) / 100 for seg in panel["segments"]]
@@ -465,45 +729,64 @@ def test_pricing(slug, panel_id, price_points_str, product_description):
     acceptable_low = round(sum(tc * w for tc, w in zip(all_good_deal, weights)), 2)
     acceptable_high = round(sum(te * w for te, w in zip(all_expensive, weights)), 2)
 
-    # Revenue vs volume: higher price = more revenue per unit, lower price = more volume
-    viable = [p for p in price_points if acceptable_low <= p <= acceptable_high]
-    revenue_max = max(viable) if viable else price_points[-1]
-    volume_max = min(viable) if viable else price_points[0]
-
-    # Increment tests_run
-    panel["tests_run"] = panel.get("tests_run", 0) + 1
-    _save_json(_panels_dir(slug) / panel_id / "panel.json", panel)
-
-    return {
+    result = {
         "product_description": product_description,
         "price_points_tested": price_points,
         "optimal_price_point": optimal,
         "acceptable_range": {"low": acceptable_low, "high": acceptable_high},
         "per_segment_sensitivity": per_segment,
-        "revenue_maximizing_price": revenue_max,
-        "volume_maximizing_price": volume_max,
     }
 
+    if n:
+        # Panel-wide acceptance per price point, weighted by segment size
+        w = np.array(weights)[:, None]
+        shares = np.array(acceptance)                          # (segments, prices)
+        accept = (w * shares).sum(axis=0)
+        halves = Z_95 * np.sqrt((w ** 2 * shares * (1 - shares) / n).sum(axis=0))
+        revenue_index = prices * accept
+        result["price_point_acceptance"] = [
+            {"price": p, "acceptance_pct": round(float(a) * 100, 1),
+             "acceptance_ci95": _ci(a * 100, h * 100), "revenue_index": round(float(r), 2)}
+            for p, a, h, r in zip(price_points, accept, halves, revenue_index)
+        ]
+        if accept.max() > 0:
+            revenue_max = price_points[int(np.argmax(revenue_index))]
+            volume_max = price_points[int(np.argmax(accept))]
+        else:
+            revenue_max, volume_max = price_points[-1], price_points[0]
+        result["respondents_per_segment"] = n
+    else:
+        # Revenue vs volume: higher price = more revenue per unit, lower price = more volume
+        viable = [p for p in price_points if acceptable_low <= p <= acceptable_high]
+        revenue_max = max(viable) if viable else price_points[-1]
+        volume_max = min(viable) if viable else price_points[0]
+    result["revenue_maximizing_price"] = revenue_max
+    result["volume_maximizing_price"] = volume_max
 
-def test_positioning(slug, panel_id, statements_str):
-    err = _brand_check(slug)
-    if err:
-        return err
-
-    panel, perr = _load_panel(slug, panel_id)
-    if perr:
-        return perr
+    # Increment tests_run
+    panel["tests_run"] = panel.get("tests_run", 0) + 1
+    _save_json(_panels_dir(slug) / panel_id / "panel.json", panel)
 
-    try:
-        statements = json.loads(statements_str) if isinstance(statements_str, str) else statements_str
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON in --statements"}
+    return result
 
-    if not isinstance(statements, list) or not statements:
-        return {"error": "Provide a non-empty array of positioning statements"}
 
-    scoring_dims = ["resonance", "believability", "differentiation",
+POSITIONING_DIMS = ["resonance", "believability", "differentiation",
                     "emotional_appeal", "memorability"]
+
+
+def _memorability_bonus(text):
+    # Shorter statements are more memorable
+    word_count = len(text.split())
+    if word_count < 15:
+        return 1.5
+    if word_count > 30:
+        return -1.0
+    return 0.0
+
+
+def _positioning_segments(panel, panel_id, statements):
+    """Segment-level positioning scoring. Returns scores, breakdown, winners, objections."""
+    traits_by_seg = [_segment_traits(seg) for seg in panel["segments"]]
     statement_scores = []
     per_segment = []
     objection_patterns = []
@@ -515,31 +798,22 @@ def test_positioning(slug, panel_id, statements_str):
         total_score = 0
         seg_scores = []
 
-        for seg in panel["segments"]:
+        for seg, traits in zip(panel["segments"], traits_by_seg):
             dim_scores = {}
-            for dim in scoring_dims:
+            for dim in POSITIONING_DIMS:
                 base = 5.0
                 if dim == "resonance":
-                    goals = seg.get("goals", [])
-                    base += min(2, len(goals) * 0.3)
+                    base += min(2, traits["goals"] * 0.3)
                 if dim == "believability":
-                    objections = seg.get("psychographics", {}).get("objections", [])
-                    base -= len(objections) * 0.4
+                    base -= traits["objections"] * 0.4
                 if dim == "emotional_appeal":
-                    values = seg.get("psychographics", {}).get("values", [])
-                    base += min(2, len(values) * 0.3)
+                    base += min(2, traits["values"] * 0.3)
                 if dim == "memorability":
-                    # Shorter statements are more memorable
-                    word_count = len(s_text.split())
-                    if word_count < 15:
-                        base += 1.5
-                    elif word_count > 30:
-                        base -= 1.0
+                    base += _memorability_bonus(s_text)
                 if dim == "differentiation":
                     base += 0.5
 
-                score = _score_with_profile(base, seg, dim, panel_id, si)
-                dim_scores[dim] = score
+                dim_scores[dim] = _score_with_profile(base, seg["name"], traits, dim, panel_id, si)
 
             seg_total = sum(dim_scores.values())
             weighted = round(seg_total * seg.get("size_pct", 0) / 100, 2)
@@ -553,8 +827,7 @@ def test_positioning(slug, panel_id, statements_str):
 
             # Collect objection patterns
             if dim_scores.get("believability", 10) < 5:
-                objections = seg.get("psychographics", {}).get("objections", [])
-                for obj in objections:
+                for obj in traits["objection_list"]:
                     objection_patterns.append({
                         "segment": seg["name"],
                         "statement": s_name,
@@ -569,6 +842,80 @@ def test_positioning(slug, panel_id, statements_str):
         statement_scores.append({"statement": s_name, "text": s_text,
                                   "total_score": round(total_score, 2)})
 
+    winners = {seg: winner for seg, (winner, _) in segment_winners.items()}
+    return statement_scores, per_segment, winners, objection_patterns
+
+
+def _positioning_respondents(panel, panel_id, statements, n):
+    """Respondent-level positioning scoring."""
+    dims = POSITIONING_DIMS
+    names = [stmt.get("name", f"Statement {si + 1}") for si, stmt in enumerate(statements)]
+    variant_terms = np.full((len(statements), len(dims)), 5.0)
+    variant_terms[:, dims.index("differentiation")] += 0.5
+    for si, stmt in enumerate(statements):
+        variant_terms[si, dims.index("memorability")] += _memorability_bonus(stmt.get("statement", ""))
+
+    seg_scores = []
+    traits_by_seg = []
+    for seg in panel["segments"]:
+        traits = _segment_traits(seg)
+        traits_by_seg.append(traits)
+        resp = _expand_segment(panel_id, seg, traits, n)
+        respondent_terms = np.zeros((n, len(dims)))
+        respondent_terms[:, dims.index("resonance")] = np.minimum(2, resp["goals"] * 0.3)
+        respondent_terms[:, dims.index("believability")] = -resp["objections"] * 0.4
+        respondent_terms[:, dims.index("emotional_appeal")] = np.minimum(2, resp["values"] * 0.3)
+        rng = _test_rng(panel_id, seg, "test-positioning", n)
+        seg_scores.append(_respondent_dim_scores(resp, rng, variant_terms, respondent_terms))
+
+    statement_scores, per_segment, winners, dim_means = _summarize_variants(
+        panel, names, seg_scores, dims, "statement")
+    statement_scores = [
+        {"statement": entry["statement"], "text": stmt.get("statement", ""), **entry}
+        for entry, stmt in zip(statement_scores, statements)
+    ]
+
+    objection_patterns = []
+    believability = dims.index("believability")
+    for si, s_name in enumerate(names):
+        for seg, traits, means in zip(panel["segments"], traits_by_seg, dim_means):
+            if means[si, believability] < 5:
+                for obj in traits["objection_list"]:
+                    objection_patterns.append({
+                        "segment": seg["name"],
+                        "statement": s_name,
+                        "objection": obj,
+                    })
+    return statement_scores, per_segment, winners, objection_patterns
+
+
+def test_positioning(slug, panel_id, statements_str, respondents=None):
+    err = _brand_check(slug)
+    if err:
+        return err
+
+    panel, perr = _load_panel(slug, panel_id)
+    if perr:
+        return perr
+
+    try:
+        statements = json.loads(statements_str) if isinstance(statements_str, str) else statements_str
+    except json.JSONDecodeError:
+        return {"error": "Invalid JSON in --statements"}
+
+    if not isinstance(statements, list) or not statements:
+        return {"error": "Provide a non-empty array of positioning statements"}
+
+    n, rerr = _respondent_count(panel, respondents)
+    if rerr:
+        return rerr
+    if n:
+        statement_scores, per_segment, _, objection_patterns = _positioning_respondents(
+            panel, panel_id, statements, n)
+    else:
+        statement_scores, per_segment, _, objection_patterns = _positioning_segments(
+            panel, panel_id, statements)
+
     statement_scores.sort(key=lambda s: s["total_score"], reverse=True)
     winning = statement_scores[0]["statement"] if statement_scores else None
 
@@ -592,13 +939,16 @@ def test_positioning(slug, panel_id, statements_str):
     panel["tests_run"] = panel.get("tests_run", 0) + 1
     _save_json(_panels_dir(slug) / panel_id / "panel.json", panel)
 
-    return {
+    result = {
         "statement_scores": statement_scores,
         "per_segment_breakdown": per_segment,
         "winning_statement": winning,
         "objection_patterns": unique_objections,
         "recommendation": recs,
     }
+    if n:
+        result["respondents_per_segment"] = n
+    return result
 
 
 def calibrate(slug, panel_id, test_type, predicted_str, actual_str):
@@ -734,6 +1084,9 @@ def main():
                         help="Test type for calibration (calibrate)")
     parser.add_argument("--predicted", help="JSON of predicted outcomes (calibrate)")
     parser.add_argument("--actual", help="JSON of actual outcomes (calibrate)")
+    parser.add_argument("--respondents", type=int,
+                        help="Synthetic respondents per segment (requires numpy). On create-panel, "
+                             "stored as the panel default; on tests, overrides it (0 = segment-level)")
 
     args = parser.parse_args()
 
@@ -741,7 +1094,7 @@ def main():
         if not args.panel_name or not args.segments:
             print(json.dumps({"error": "Provide --panel-name and --segments"}))
             sys.exit(1)
-        result = create_panel(args.brand, args.panel_name, args.segments)
+        result = create_panel(args.brand, args.panel_name, args.segments, args.respondents or 0)
 
     elif args.action == "list-panels":
         result = list_panels(args.brand)
@@ -750,25 +1103,26 @@ def main():
         if not args.panel_id or not args.stimulus or not args.questions:
             print(json.dumps({"error": "Provide --panel-id, --stimulus, and --questions"}))
             sys.exit(1)
-        result = focus_group(args.brand, args.panel_id, args.stimulus, args.questions)
+        result = focus_group(args.brand, args.panel_id, args.stimulus, args.questions, args.respondents)
 
     elif args.action == "test-message":
         if not args.panel_id or not args.variants:
             print(json.dumps({"error": "Provide --panel-id and --variants"}))
             sys.exit(1)
-        result = test_message(args.brand, args.panel_id, args.variants)
+        result = test_message(args.brand, args.panel_id, args.variants, args.respondents)
 
     elif args.action == "test-pricing":
         if not args.panel_id or not args.price_points or not args.product_description:
             print(json.dumps({"error": "Provide --panel-id, --price-points, and --product-description"}))
             sys.exit(1)
-        result = test_pricing(args.brand, args.panel_id, args.price_points, args.product_description)
+        result = test_pricing(args.brand, args.panel_id, args.price_points, args.product_description,
+                              args.respondents)
 
     elif args.action == "test-positioning":
         if not args.panel_id or not args.statements:
             print(json.dumps({"error": "Provide --panel-id and --statements"}))
             sys.exit(1)
-        result = test_positioning(args.brand, args.panel_id, args.statements)
+        result = test_positioning(args.brand, args.panel_id, args.statements, args.respondents)
 
     elif args.action == "calibrate":
         if not args.panel_id or not args.test_type or not args.predicted or not args.actual:
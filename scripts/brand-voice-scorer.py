@@ -14,6 +14,9 @@ Usage:
     python brand-voice-scorer.py --brand acme --text "Check out our amazing product!"
     python brand-voice-scorer.py --brand acme --file content.txt
 
+When scorer-daemon.py is running, requests are served by the warm daemon;
+pass --no-daemon to always score in this process.
+
 Brand Profile JSON Schema (profile.json — from setup.py / brand-setup):
     {
         "brand_name": "Acme Corp",
@@ -43,6 +46,15 @@ import json
 import sys
 from pathlib import Path
 
+import scorer_client
+
+# ---------------------------------------------------------------------------
+# Scorer daemon fast path — when scorer-daemon.py is running, hand the request
+# to it before importing NLTK; otherwise continue with the normal CLI below.
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    scorer_client.fast_path("brand_voice.score", {"--brand": "brand"}, required=("brand",))
+
 # ---------------------------------------------------------------------------
 # NLTK bootstrap — download the required data silently on first run
 # ---------------------------------------------------------------------------
@@ -483,6 +495,10 @@ def build_parser() -> argparse.ArgumentParser:
         "--file", type=str,
         help="Path to a text file containing content to analyze.",
     )
+    parser.add_argument(
+        "--no-daemon", action="store_true",
+        help="Score in this process even if scorer-daemon.py is running.",
+    )
     return parser
 
 
@@ -0,0 +1,264 @@
+"""
+brand_store.py
+==============
+Shared access layer for brand data under ~/.claude-marketing/brands/.
+
+Scripts import this module instead of each carrying their own
+get_brand_dir / _load_json / _save_json helpers. It provides:
+
+- get_brand_dir(slug): the (brand_dir, error) convention used by every script
+- load_json(path, default): reads cached per process and validated against the
+  file's mtime and size, so repeated reads of an index skip re-parsing
+- save_json(path, data): atomic write (temp file + os.replace), so a reader
+  never sees a half-written file
+- locked(path): exclusive advisory lock (fcntl/msvcrt) for read-modify-write
+  cycles, so parallel agents writing the same brand don't lose index updates
+- update_json(path, mutate, default): load + mutate + save under the lock
+
+Writes are indented by default. Set "compact_json": true in
+~/.claude-marketing/settings.json (or pass compact=True) to write
+non-indented JSON for large indexes.
+
+Dependencies: stdlib only (json, os, pickle, tempfile, threading, contextlib,
+              pathlib, fcntl/msvcrt).
+
+Usage (from a script in this directory):
+    from brand_store import get_brand_dir, load_json, save_json, locked
+
+    brand_dir, err = get_brand_dir(slug)
+    with locked(index_path):
+        index = load_json(index_path, [])
+        index.append(entry)
+        save_json(index_path, index)
+"""
+
+import contextlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+MEMORY_ROOT = Path.home() / ".claude-marketing"
+BRANDS_DIR = MEMORY_ROOT / "brands"
+SETTINGS_FILE = MEMORY_ROOT / "settings.json"
+
+# path -> (mtime_ns, size, pickled data). Pickle round-trips give each caller
+# its own mutable copy and are roughly twice as fast as json.loads.
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_CACHE_MAX_ENTRIES = 256
+
+# path -> [RLock, depth, fd]; makes locked() re-entrant within a process
+_LOCKS = {}
+_LOCKS_GUARD = threading.Lock()
+
+_COMPACT_DEFAULT = None
+
+
+def get_brand_dir(slug):
+    """Get and validate brand directory."""
+    brand_dir = BRANDS_DIR / slug
+    if not brand_dir.exists():
+        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
+    return brand_dir, None
+
+
+# ---------------------------------------------------------------------------
+# Reads
+# ---------------------------------------------------------------------------
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def read_json(path):
+    """Load and parse a JSON file through the cache.
+
+    Raises OSError / json.JSONDecodeError like json.loads(path.read_text())
+    would; use load_json() for the forgiving variant.
+    """
+    key = str(path)
+    stamp = _stat_key(path)
+    if stamp is None:
+        raise FileNotFoundError(key)
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+    if cached and cached[:2] == stamp:
+        return pickle.loads(cached[2])
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    # Only cache if the file did not change while we were reading it
+    if _stat_key(path) == stamp:
+        _remember(key, stamp, data)
+    return data
+
+
+def _remember(key, stamp, data):
+    blob = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+    with _CACHE_LOCK:
+        _CACHE.pop(key, None)
+        if len(_CACHE) >= _CACHE_MAX_ENTRIES:
+            del _CACHE[next(iter(_CACHE))]  # evict the oldest entry
+        _CACHE[key] = (*stamp, blob)
+
+
+def load_json(path, default=None):
+    """Load a JSON file, returning default on missing/corrupt."""
+    try:
+        return read_json(path)
+    except (OSError, ValueError):
+        return default
+
+
+def invalidate(path=None):
+    """Drop one cached file (or everything) from the read cache."""
+    with _CACHE_LOCK:
+        if path is None:
+            _CACHE.clear()
+        else:
+            _CACHE.pop(str(path), None)
+
+
+# ---------------------------------------------------------------------------
+# Writes
+# ---------------------------------------------------------------------------
+
+def _compact_default():
+    global _COMPACT_DEFAULT
+    if _COMPACT_DEFAULT is None:
+        try:
+            settings = json.loads(SETTINGS_FILE.read_text(encoding="utf-8"))
+            _COMPACT_DEFAULT = bool(settings.get("compact_json", False))
+        except (OSError, ValueError, AttributeError):
+            _COMPACT_DEFAULT = False
+    return _COMPACT_DEFAULT
+
+
+def dumps(data, compact=None):
+    """Serialize data the way save_json writes it."""
+    if compact is None:
+        compact = _compact_default()
+    if compact:
+        return json.dumps(data, separators=(",", ":"))
+    return json.dumps(data, indent=2)
+
+
+def write_text(path, text):
+    """Atomically replace path with text (temp file in the same directory + rename)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        # mkstemp creates 0600; keep the permissions a plain write would give
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp, mode)
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def save_json(path, data, compact=None):
+    """Atomically write JSON to a file, creating parent dirs as needed."""
+    write_text(path, dumps(data, compact))
+    stamp = _stat_key(path)
+    if stamp is not None:
+        _remember(str(path), stamp, data)
+
+
+# ---------------------------------------------------------------------------
+# Locking
+# ---------------------------------------------------------------------------
+
+def _lock_fd(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        while True:
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue  # LK_LOCK gives up after ~10s; keep waiting
+
+
+def _unlock_fd(fd):
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+@contextlib.contextmanager
+def locked(path):
+    """Hold an exclusive lock on path (via a sibling .lock file).
+
+    Re-entrant within a process, exclusive across threads and processes.
+    Advisory: only writers that also use locked() are serialized.
+    """
+    path = Path(path)
+    key = str(path)
+    with _LOCKS_GUARD:
+        state = _LOCKS.setdefault(key, [threading.RLock(), 0, None])
+    state[0].acquire()
+    try:
+        if state[1] == 0:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(path.with_name(path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_fd(fd)
+            except BaseException:
+                os.close(fd)
+                raise
+            state[2] = fd
+        state[1] += 1
+        try:
+            yield path
+        finally:
+            state[1] -= 1
+            if state[1] == 0:
+                fd, state[2] = state[2], None
+                try:
+                    _unlock_fd(fd)
+                finally:
+                    os.close(fd)
+    finally:
+        state[0].release()
+
+
+def update_json(path, mutate, default=None, compact=None):
+    """Load, mutate and save a JSON file under its lock.
+
+    mutate(data) may modify data in place (return None) or return a
+    replacement value. Returns the saved data.
+    """
+    with locked(path):
+        data = load_json(path, default)
+        result = mutate(data)
+        if result is not None:
+            data = result
+        save_json(path, data, compact)
+        return data
@@ -2,22 +2,31 @@
 """
 budget-optimizer.py
 ===================
-Data-driven marketing budget reallocation optimizer. Analyses current channel
-performance, applies a diminishing-returns model (square-root scaling), and
-recommends an optimised allocation that maximises projected revenue within the
-given total budget.
+Data-driven marketing budget reallocation optimizer. Fits a saturating
+response curve per channel from its spend/revenue history and allocates the
+budget where the next dollar earns the most, until marginal ROAS is equal
+across channels (subject to minimum/maximum spend and the test budget).
+
+Response curves: each channel may carry "history": [{"spend":N,"revenue":N}, ...]
+(past periods). With only the current period the curve is square-root scaling
+through it; with more points a power curve (revenue = a * spend^b) or an
+exponential saturation curve (revenue = v * (1 - exp(-spend/k))) is fitted.
+Optional per-channel "min_spend" / "max_spend" bound the allocation.
 
 Dependencies: none (stdlib only)
 
 Usage:
     python budget-optimizer.py --channels '[{"name":"Google Ads","spend":5000,"conversions":150,"revenue":22500}]' --total-budget 15000
     python budget-optimizer.py --file channels.json --total-budget 20000 --min-spend 500 --test-budget-pct 15
+    python budget-optimizer.py --file channels.json --total-budget 20000 --max-change-pct 30 --solver greedy
 """
 
 import argparse
+import heapq
 import json
 import math
 import sys
+import time
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -65,10 +74,155 @@ def load_channels(args):
     return data, None
 
 
+# ---------------------------------------------------------------------------
+# Response curves
+# ---------------------------------------------------------------------------
+
+DEFAULT_ELASTICITY = 0.5       # revenue ~ spend^0.5 when there is no history to fit
+MIN_ELASTICITY = 0.05
+MAX_ELASTICITY = 0.95          # keep curves strictly concave so marginals can be equalised
+SATURATION_GRID = 32           # coarse log-spaced scales tried before golden-section refinement
+
+
+class ResponseCurve:
+    """Saturating spend -> revenue curve for one channel.
+
+    power:       revenue = a * spend^b                (0 < b < 1)
+    exponential: revenue = v * (1 - exp(-spend / k))  (ceiling v)
+    none:        no usable data; the channel earns nothing
+    """
+
+    def __init__(self, model, params, points=0, r2=None):
+        self.model = model
+        self.params = params
+        self.points = points
+        self.r2 = r2
+
+    def revenue(self, spend):
+        if self.model == "power":
+            return self.params["a"] * spend ** self.params["b"] if spend > 0 else 0.0
+        if self.model == "exponential":
+            return self.params["v"] * -math.expm1(-spend / self.params["k"])
+        return 0.0
+
+    def marginal(self, spend):
+        """Marginal ROAS: extra revenue per extra unit of spend at this spend level."""
+        if self.model == "power":
+            a, b = self.params["a"], self.params["b"]
+            return a * b * spend ** (b - 1) if spend > 0 else math.inf
+        if self.model == "exponential":
+            v, k = self.params["v"], self.params["k"]
+            return v / k * math.exp(-spend / k)
+        return 0.0
+
+    def spend_at_marginal(self, lam):
+        """Spend at which marginal ROAS falls to lam (inverse of marginal)."""
+        if self.model == "power":
+            a, b = self.params["a"], self.params["b"]
+            try:
+                return (lam / (a * b)) ** (1 / (b - 1))
+            except OverflowError:
+                return math.inf
+        if self.model == "exponential":
+            v, k = self.params["v"], self.params["k"]
+            return max(0.0, k * math.log(v / (k * lam)))
+        return 0.0
+
+    def to_dict(self):
+        return {
+            "model": self.model,
+            "params": {key: round(val, 6) for key, val in self.params.items()},
+            "fit_points": self.points,
+            "r2": round(self.r2, 4) if self.r2 is not None else None,
+        }
+
+
+def _observations(channel):
+    """(spend, revenue) pairs with both values positive: history plus the current period."""
+    pairs = [(ch_point.get("spend", 0), ch_point.get("revenue", 0))
+             for ch_point in channel.get("history", []) if isinstance(ch_point, dict)]
+    pairs.append((channel["spend"], channel["revenue"]))
+    return [(float(sp), float(rev)) for sp, rev in pairs if sp > 0 and rev > 0]
+
+
+def _r2(points, curve):
+    mean_rev = sum(rev for _, rev in points) / len(points)
+    ss_tot = sum((rev - mean_rev) ** 2 for _, rev in points)
+    ss_res = sum((rev - curve.revenue(sp)) ** 2 for sp, rev in points)
+    return (1 - ss_res / ss_tot) if ss_tot > 0 else None, ss_res
+
+
+def _fit_power(points):
+    xs = [math.log(sp) for sp, _ in points]
+    ys = [math.log(rev) for _, rev in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    if var_x <= 1e-12:
+        b = DEFAULT_ELASTICITY
+    else:
+        b = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
+        b = min(MAX_ELASTICITY, max(MIN_ELASTICITY, b))
+    a = math.exp(mean_y - b * mean_x)
+    return ResponseCurve("power", {"a": a, "b": b}, len(points))
+
+
+def _fit_exponential(points):
+    """Least squares in k (v has a closed form for each k): coarse log-spaced
+    grid over 0.1x..20x the largest spend, then golden-section refinement."""
+    def sse_at(log_k):
+        k = math.exp(log_k)
+        xs = [-math.expm1(-sp / k) for sp, _ in points]
+        v = sum(x * rev for x, (_, rev) in zip(xs, points)) / sum(x * x for x in xs)
+        return sum((rev - v * x) ** 2 for x, (_, rev) in zip(xs, points)), v, k
+
+    lo_k = math.log(max(sp for sp, _ in points) * 0.1)
+    span = math.log(200)
+    grid = [lo_k + span * step / (SATURATION_GRID - 1) for step in range(SATURATION_GRID)]
+    best = min(range(SATURATION_GRID), key=lambda j: sse_at(grid[j])[0])
+    a, b = grid[max(0, best - 1)], grid[min(SATURATION_GRID - 1, best + 1)]
+    ratio = (math.sqrt(5) - 1) / 2
+    for _ in range(25):
+        c, d = b - ratio * (b - a), a + ratio * (b - a)
+        if sse_at(c)[0] < sse_at(d)[0]:
+            b = d
+        else:
+            a = c
+    _, v, k = min(sse_at(grid[best]), sse_at((a + b) / 2))
+    return ResponseCurve("exponential", {"v": v, "k": k}, len(points))
+
+
+def fit_response_curve(channel):
+    """Fit a saturating response curve from the channel's spend/revenue history.
+
+    One observation (or no spend variation) gives the square-root curve through
+    the current point. Two or more give a log-log power fit; three or more
+    distinct spend levels also try an exponential saturation curve and keep
+    whichever fits revenue better.
+    """
+    points = _observations(channel)
+    if not points:
+        return ResponseCurve("none", {}, 0)
+
+    curve = _fit_power(points)
+    curve.r2, sse = _r2(points, curve)
+    if len({sp for sp, _ in points}) >= 3:
+        alt = _fit_exponential(points)
+        alt.r2, alt_sse = _r2(points, alt)
+        if alt_sse < sse:
+            curve = alt
+    return curve
+
+
 # ---------------------------------------------------------------------------
 # Optimisation logic
 # ---------------------------------------------------------------------------
 
+BISECTION_MAX_ITER = 200
+BISECTION_TOL = 1e-9           # relative budget residual
+GREEDY_STEPS = 2000
+
+
 def projected_revenue(current_revenue, current_spend, new_spend):
     """Diminishing returns model: revenue scales with sqrt(new/current).
 
@@ -86,56 +240,232 @@ def marginal_efficiency(channel):
     return channel["revenue"] / channel["spend"]
 
 
-def optimise(channels, total_budget, min_spend, test_budget_pct):
-    """Allocate budget across channels to maximise projected revenue.
+def spend_bounds(channels, min_spend, max_change_pct=None):
+    """Per-channel (low, high) spend limits.
+
+    low: the larger of --min-spend and the channel's own "min_spend".
+    high: the channel's "max_spend" (default unbounded), tightened by
+    --max-change-pct around current spend for channels that have spend.
+    """
+    bounds = []
+    for ch in channels:
+        low = max(min_spend, float(ch.get("min_spend", 0) or 0))
+        high = float(ch["max_spend"]) if ch.get("max_spend") is not None else math.inf
+        if max_change_pct is not None and ch["spend"] > 0:
+            low = max(low, ch["spend"] * (1 - max_change_pct / 100.0))
+            high = min(high, ch["spend"] * (1 + max_change_pct / 100.0))
+        bounds.append((low, max(low, high)))
+    return bounds
+
+
+def _water_fill(alloc, bounds, amount, eligible):
+    """Spread amount evenly over the eligible channels, each capped at its upper bound.
+
+    Returns (allocation, leftover), leftover being what no channel had room for.
+    """
+    alloc = list(alloc)
+    room = sorted((i for i in eligible if bounds[i][1] - alloc[i] > 1e-9),
+                  key=lambda i: bounds[i][1] - alloc[i])
+    for k, i in enumerate(room):
+        give = min(amount / (len(room) - k), bounds[i][1] - alloc[i])
+        alloc[i] += give
+        amount -= give
+    return alloc, max(0.0, amount)
+
+
+def _solve_bisection(curves, bounds, budget):
+    """Equalise marginal ROAS: find lam with sum(clip(spend_at_marginal(lam))) == budget.
+
+    Total spend is monotone decreasing in lam, so bisection (in log space)
+    converges for any mix of concave curves.
+    """
+    active = [i for i, c in enumerate(curves) if c.model != "none"]
+    target = budget - sum(low for i, (low, _) in enumerate(bounds) if curves[i].model == "none")
+    stats = {}
+    if sum(bounds[i][1] for i in active) < target:
+        # Fitted channels cannot absorb the budget; optimise() spreads the rest
+        # over channels without data
+        target = sum(bounds[i][1] for i in active)
+        stats["note"] = "Every channel with a response curve is at its maximum spend"
+    tolerance = BISECTION_TOL * max(1.0, budget)
+
+    def spend_for(lam):
+        return {i: min(bounds[i][1], max(bounds[i][0], curves[i].spend_at_marginal(lam)))
+                for i in active}
+
+    # Bracket: at lam_hi every channel sits at its lower bound; lower lam_lo
+    # until the channels absorb the whole budget.
+    lam_hi = min(1e12, max(curves[i].marginal(max(bounds[i][0], 1e-6)) for i in active))
+    lam_lo = lam_hi
+    iterations = 0
+    while sum(spend_for(lam_lo).values()) < target and lam_lo > 1e-300:
+        lam_lo /= 2
+        iterations += 1
+
+    lam = lam_hi
+    converged = False
+    for _ in range(BISECTION_MAX_ITER):
+        iterations += 1
+        mid = math.sqrt(lam_lo * lam_hi)
+        gap = sum(spend_for(mid).values()) - target
+        if abs(gap) <= tolerance:
+            lam, converged = mid, True
+            break
+        if gap > 0:
+            lam_lo = mid
+        else:
+            lam_hi = lam = mid
+        if lam_hi / lam_lo - 1 < 1e-15:
+            break
+
+    alloc = [low for low, _ in bounds]
+    for i, spend in spend_for(lam).items():
+        alloc[i] = spend
+    stats.update(iterations=iterations, converged=converged, **{"lambda": lam})
+    return alloc, stats
+
+
+def _solve_greedy(curves, bounds, budget, steps=GREEDY_STEPS):
+    """Priority-queue greedy: hand out the budget in equal steps, each to the
+    channel with the highest revenue gain for that step."""
+    alloc = [low for low, _ in bounds]
+    remaining = budget - sum(alloc)
+    step = remaining / steps if steps else remaining
+    heap = []
+
+    def push(i):
+        room = min(step, bounds[i][1] - alloc[i])
+        if room > 1e-12 and curves[i].model != "none":
+            gain = (curves[i].revenue(alloc[i] + room) - curves[i].revenue(alloc[i])) / room
+            heapq.heappush(heap, (-gain, i, room))
+
+    for i in range(len(curves)):
+        push(i)
+    iterations = 0
+    while remaining > 1e-9 and heap:
+        _, i, room = heapq.heappop(heap)
+        room = min(room, remaining)
+        alloc[i] += room
+        remaining -= room
+        iterations += 1
+        push(i)
+    return alloc, {"iterations": iterations, "converged": remaining <= 1e-6 * max(1.0, budget),
+                   "step_size": round(step, 4)}
+
+
+def optimise(channels, total_budget, min_spend, test_budget_pct, curves=None,
+             solver="bisection", max_change_pct=None):
+    """Allocate budget across channels to maximise revenue from response curves.
 
     Strategy:
     1. Reserve test budget.
-    2. Give every active channel at least min_spend.
-    3. Distribute remaining budget proportionally to marginal efficiency,
-       then use iterative greedy allocation (step chunks) to refine.
+    2. Fit a saturating response curve per channel (fit_response_curve).
+    3. Start every channel at its lower bound (--min-spend, per-channel
+       "min_spend", --max-change-pct), then give the rest of the budget where
+       marginal ROAS is highest until marginal ROAS is equal across every
+       channel that is not pinned at a bound — via bisection on the common
+       marginal ROAS, or a priority-queue greedy in small steps.
+    4. Channels without data share what is left evenly, each up to its upper
+       bound; spend no channel has room for is reported as "unallocated".
+
+    Returns (allocation, test_budget, diagnostics).
     """
+    started = time.perf_counter()
     n = len(channels)
     test_budget = round(total_budget * (test_budget_pct / 100.0), 2)
     allocatable = total_budget - test_budget
-
-    # Edge case: not enough budget for minimums
-    total_min = min_spend * n
-    if total_min > allocatable:
-        # Distribute evenly what we have
-        per_channel = allocatable / n if n > 0 else 0
-        allocation = [per_channel] * n
+    if curves is None:
+        curves = [fit_response_curve(ch) for ch in channels]
+    bounds = spend_bounds(channels, min_spend, max_change_pct)
+
+    total_min = sum(low for low, _ in bounds)
+    total_max = sum(high for _, high in bounds)
+    has_curve = any(c.model != "none" for c in curves)
+    diagnostics = {"solver": solver, "iterations": 0, "converged": True}
+
+    if solver == "proportional":
+        allocation = optimise_proportional(channels, allocatable, min_spend)
+    elif total_min > allocatable:
+        # Not enough budget for the minimums: scale them down
+        allocation = [low * allocatable / total_min for low, _ in bounds] if total_min > 0 else [0.0] * n
+        diagnostics["note"] = "Budget below the sum of minimum spends; minimums scaled down"
+    elif total_max <= allocatable:
+        allocation = [high for _, high in bounds]
+        diagnostics["unallocated"] = round(allocatable - total_max, 2)
+        diagnostics["note"] = "Every channel is at its maximum spend"
+    elif not has_curve:
+        # No channel has spend/revenue data: split evenly above the minimums,
+        # up to each channel's maximum
+        allocation, leftover = _water_fill([low for low, _ in bounds], bounds,
+                                           allocatable - total_min, range(n))
+        if leftover > 0.005:
+            diagnostics["unallocated"] = round(leftover, 2)
     else:
-        # Start with minimum, distribute rest by efficiency ranking
-        efficiencies = [marginal_efficiency(ch) for ch in channels]
-        total_eff = sum(efficiencies)
-
-        allocation = [min_spend] * n
-        remaining = allocatable - total_min
-
-        if total_eff > 0 and remaining > 0:
-            # Proportional allocation by efficiency
-            for i in range(n):
-                share = (efficiencies[i] / total_eff) * remaining
-                allocation[i] += share
-        elif remaining > 0:
-            # All channels have zero efficiency, split evenly
-            per_channel = remaining / n
-            for i in range(n):
-                allocation[i] += per_channel
+        if solver == "greedy":
+            allocation, stats = _solve_greedy(curves, bounds, allocatable)
+        else:
+            allocation, stats = _solve_bisection(curves, bounds, allocatable)
+        diagnostics.update(stats)
+        fitted = [i for i in range(n) if curves[i].model != "none"]
+        if all(allocation[i] >= bounds[i][1] - 1e-6 for i in fitted):
+            # Every fitted channel is maxed out: the rest goes evenly to channels
+            # without data, up to their maximums
+            unfitted = [i for i in range(n) if curves[i].model == "none"]
+            allocation, leftover = _water_fill(allocation, bounds, allocatable - sum(allocation), unfitted)
+            if leftover > 0.005:
+                diagnostics["unallocated"] = round(leftover, 2)
 
     # Round allocations to 2 decimal places, absorb rounding dust
     allocation = [round(a, 2) for a in allocation]
-    dust = round(allocatable - sum(allocation), 2)
+    dust = round(allocatable - diagnostics.get("unallocated", 0) - sum(allocation), 2)
     if dust != 0 and n > 0:
-        # Add dust to the most efficient channel
-        best_idx = max(range(n), key=lambda i: marginal_efficiency(channels[i]))
+        if solver == "proportional":
+            # Add dust to the most efficient channel
+            best_idx = max(range(n), key=lambda i: marginal_efficiency(channels[i]))
+        else:
+            # Positive dust to the highest marginal ROAS, negative dust from the
+            # lowest, among channels that stay within their bounds
+            room = [i for i in range(n) if bounds[i][0] <= allocation[i] + dust <= bounds[i][1]] or range(n)
+            pick = max if dust > 0 else min
+            best_idx = pick(room, key=lambda i: curves[i].marginal(allocation[i]))
         allocation[best_idx] = round(allocation[best_idx] + dust, 2)
 
-    return allocation, test_budget
+    # Marginal ROAS spread across channels not pinned at a bound: 0 at the optimum
+    free = [curves[i].marginal(allocation[i]) for i in range(n)
+            if curves[i].model != "none" and bounds[i][0] + 0.01 < allocation[i] < bounds[i][1] - 0.01]
+    if "lambda" in diagnostics:
+        diagnostics["lambda"] = round(diagnostics["lambda"], 4)
+    diagnostics["marginal_roas_spread"] = round(max(free) - min(free), 4) if free else 0.0
+    diagnostics["budget_residual"] = round(allocatable - sum(allocation), 2)
+    diagnostics["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return allocation, test_budget, diagnostics
 
 
-def build_output(channels, allocation, test_budget, total_budget):
+def optimise_proportional(channels, allocatable, min_spend):
+    """Previous heuristic: min_spend each, the rest split in proportion to ROAS."""
+    n = len(channels)
+    total_min = min_spend * n
+    if total_min > allocatable:
+        # Distribute evenly what we have
+        per_channel = allocatable / n if n > 0 else 0
+        return [per_channel] * n
+
+    efficiencies = [marginal_efficiency(ch) for ch in channels]
+    total_eff = sum(efficiencies)
+    allocation = [min_spend] * n
+    remaining = allocatable - total_min
+    if total_eff > 0 and remaining > 0:
+        # Proportional allocation by efficiency
+        for i in range(n):
+            allocation[i] += (efficiencies[i] / total_eff) * remaining
+    elif remaining > 0:
+        # All channels have zero efficiency, split evenly
+        for i in range(n):
+            allocation[i] += remaining / n
+    return allocation
+
+
+def build_output(channels, allocation, test_budget, total_budget, curves=None, diagnostics=None):
     """Construct the full output JSON."""
     # Current state
     current_total_spend = sum(ch["spend"] for ch in channels)
@@ -148,14 +478,17 @@ def build_output(channels, allocation, test_budget, total_budget):
 
     for i, ch in enumerate(channels):
         new_spend = allocation[i]
-        proj_rev = projected_revenue(ch["revenue"], ch["spend"], new_spend)
+        if curves:
+            proj_rev = curves[i].revenue(new_spend)
+        else:
+            proj_rev = projected_revenue(ch["revenue"], ch["spend"], new_spend)
         opt_total_revenue += proj_rev
 
         current_roas_ch = (ch["revenue"] / ch["spend"]) if ch["spend"] > 0 else 0
         proj_roas_ch = (proj_rev / new_spend) if new_spend > 0 else 0
         change_pct = ((new_spend - ch["spend"]) / ch["spend"] * 100) if ch["spend"] > 0 else None
 
-        opt_channels.append({
+        entry = {
             "name": ch["name"],
             "current_spend": ch["spend"],
             "optimized_spend": round(new_spend, 2),
@@ -163,7 +496,12 @@ def build_output(channels, allocation, test_budget, total_budget):
             "current_roas": round(current_roas_ch, 2),
             "projected_roas": round(proj_roas_ch, 2),
             "projected_revenue": round(proj_rev, 2),
-        })
+        }
+        if curves:
+            marginal = curves[i].marginal(new_spend)
+            entry["marginal_roas"] = round(marginal, 4) if math.isfinite(marginal) else None
+            entry["response_curve"] = curves[i].to_dict()
+        opt_channels.append(entry)
 
     opt_total_revenue = round(opt_total_revenue, 2)
     opt_total_spend = round(sum(allocation), 2)
@@ -178,7 +516,7 @@ def build_output(channels, allocation, test_budget, total_budget):
     # Recommendations
     recs = generate_recommendations(channels, opt_channels, test_budget)
 
-    return {
+    output = {
         "current_allocation": {
             "total_spend": round(current_total_spend, 2),
             "total_revenue": round(current_total_revenue, 2),
@@ -198,6 +536,9 @@ def build_output(channels, allocation, test_budget, total_budget):
         },
         "recommendations": recs,
     }
+    if diagnostics:
+        output["optimizer"] = diagnostics
+    return output
 
 
 def generate_recommendations(channels, opt_channels, test_budget):
@@ -283,6 +624,15 @@ def main():
         "--test-budget-pct", type=float, default=10,
         help="Percentage of budget to reserve for testing (default: 10)",
     )
+    parser.add_argument(
+        "--max-change-pct", type=float, default=None,
+        help="Limit each channel's change from current spend to +/- this percentage",
+    )
+    parser.add_argument(
+        "--solver", choices=["bisection", "greedy", "proportional"], default="bisection",
+        help="bisection: equalise marginal ROAS exactly (default); greedy: priority-queue "
+             "allocation in small steps; proportional: previous split by average ROAS",
+    )
     args = parser.parse_args()
 
     # --- Load and validate ---
@@ -307,13 +657,25 @@ def main():
         print()
         return
 
+    if args.max_change_pct is not None and args.max_change_pct < 0:
+        json.dump({"error": "max-change-pct must be non-negative"}, sys.stdout, indent=2)
+        print()
+        return
+
     # --- Optimise ---
-    allocation, test_budget = optimise(
-        channels, args.total_budget, args.min_spend, args.test_budget_pct
+    curves = [fit_response_curve(ch) for ch in channels]
+    allocation, test_budget, diagnostics = optimise(
+        channels, args.total_budget, args.min_spend, args.test_budget_pct,
+        curves=curves, solver=args.solver, max_change_pct=args.max_change_pct,
     )
 
     # --- Build and emit output ---
-    output = build_output(channels, allocation, test_budget, args.total_budget)
+    if args.solver == "proportional":
+        # Same output as the previous optimizer: square-root revenue projection,
+        # no curve details or optimizer diagnostics
+        output = build_output(channels, allocation, test_budget, args.total_budget)
+    else:
+        output = build_output(channels, allocation, test_budget, args.total_budget, curves, diagnostics)
     json.dump(output, sys.stdout, indent=2)
     print()
 
@@ -25,6 +25,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import read_json, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 # Default guardrails
@@ -149,7 +151,7 @@ def _load_guardrails(brand_dir):
     gp = config_dir / "guardrails.json"
     if gp.exists():
         try:
-            return json.loads(gp.read_text(encoding="utf-8"))
+            return read_json(gp)
         except json.JSONDecodeError:
             pass
     return dict(DEFAULT_GUARDRAILS)
@@ -427,7 +429,7 @@ def set_guardrails(slug, guardrails):
     current.update(guardrails)
 
     gp = config_dir / "guardrails.json"
-    gp.write_text(json.dumps(current, indent=2), encoding="utf-8")
+    save_json(gp, current)
 
     return {"status": "saved", "guardrails": current, "path": str(gp)}
 
@@ -453,7 +455,7 @@ def log_correction(slug, campaign_id, issue, correction_applied, was_auto, expec
     }
 
     fp = cdir / f"{correction_id}.json"
-    fp.write_text(json.dumps(correction, indent=2), encoding="utf-8")
+    save_json(fp, correction)
 
     return {"status": "logged", "correction_id": correction_id, "path": str(fp)}
 
@@ -470,7 +472,7 @@ def corrections_history(slug, since=None, campaign_id=None):
     corrections = []
     for fp in sorted(cdir.glob("*.json")):
         try:
-            c = json.loads(fp.read_text(encoding="utf-8"))
+            c = read_json(fp)
             corrections.append(c)
         except json.JSONDecodeError:
             continue
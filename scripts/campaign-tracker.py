@@ -23,17 +23,8 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
-
-
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+from brand_store import get_brand_dir, load_json, locked, read_json, save_json
 
 
 def save_campaign(slug, data):
@@ -60,25 +51,20 @@ def save_campaign(slug, data):
 
     # Save campaign file
     filepath = campaigns_dir / f"{campaign_id}.json"
-    filepath.write_text(json.dumps(campaign, indent=2))
+    save_json(filepath, campaign)
 
     # Update campaign index
     index_path = campaigns_dir / "_index.json"
-    index = []
-    if index_path.exists():
-        try:
-            index = json.loads(index_path.read_text())
-        except json.JSONDecodeError:
-            index = []
-
-    index.append({
-        "campaign_id": campaign_id,
-        "name": data.get("name", "Untitled"),
-        "status": data.get("status", "planned"),
-        "channels": data.get("channels", []),
-        "created_at": campaign["created_at"],
-    })
-    index_path.write_text(json.dumps(index, indent=2))
+    with locked(index_path):
+        index = load_json(index_path, [])
+        index.append({
+            "campaign_id": campaign_id,
+            "name": data.get("name", "Untitled"),
+            "status": data.get("status", "planned"),
+            "channels": data.get("channels", []),
+            "created_at": campaign["created_at"],
+        })
+        save_json(index_path, index)
 
     return {
         "status": "saved",
@@ -100,7 +86,7 @@ def list_campaigns(slug):
         return {"campaigns": [], "total": 0, "note": "No campaigns saved yet."}
 
     try:
-        index = json.loads(index_path.read_text())
+        index = read_json(index_path)
         return {"campaigns": index, "total": len(index)}
     except json.JSONDecodeError:
         return {"error": "Campaign index is corrupted."}
@@ -117,7 +103,7 @@ def get_campaign(slug, campaign_id):
         return {"error": f"Campaign '{campaign_id}' not found."}
 
     try:
-        return json.loads(filepath.read_text())
+        return read_json(filepath)
     except json.JSONDecodeError:
         return {"error": f"Campaign file corrupted: {campaign_id}"}
 
@@ -141,7 +127,7 @@ def save_performance(slug, data):
     }
 
     filepath = perf_dir / f"{campaign_id}-{timestamp}.json"
-    filepath.write_text(json.dumps(snapshot, indent=2))
+    save_json(filepath, snapshot)
 
     return {"status": "saved", "snapshot_id": snapshot["snapshot_id"], "path": str(filepath)}
 
@@ -153,12 +139,6 @@ def save_insight(slug, data):
         return {"error": err}
 
     insights_path = brand_dir / "insights.json"
-    insights = []
-    if insights_path.exists():
-        try:
-            insights = json.loads(insights_path.read_text())
-        except json.JSONDecodeError:
-            insights = []
 
     insight = {
         "recorded_at": datetime.now().isoformat(),
@@ -168,11 +148,13 @@ def save_insight(slug, data):
         "context": data.get("context", ""),
         "actionable": data.get("actionable", True),
     }
-    insights.append(insight)
+    with locked(insights_path):
+        insights = load_json(insights_path, [])
+        insights.append(insight)
 
-    # Keep last 200 insights
-    insights = insights[-200:]
-    insights_path.write_text(json.dumps(insights, indent=2))
+        # Keep last 200 insights
+        insights = insights[-200:]
+        save_json(insights_path, insights)
 
     return {"status": "saved", "total_insights": len(insights)}
 
@@ -188,7 +170,7 @@ def get_insights(slug, insight_type=None, limit=20):
         return {"insights": [], "total": 0, "note": "No insights saved yet."}
 
     try:
-        insights = json.loads(insights_path.read_text())
+        insights = read_json(insights_path)
     except json.JSONDecodeError:
         return {"error": "Insights file corrupted."}
 
@@ -207,12 +189,6 @@ def save_violation(slug, data):
         return {"error": err}
 
     violations_path = brand_dir / "guideline-violations.json"
-    violations = []
-    if violations_path.exists():
-        try:
-            violations = json.loads(violations_path.read_text())
-        except json.JSONDecodeError:
-            violations = []
 
     violation = {
         "recorded_at": datetime.now().isoformat(),
@@ -224,11 +200,13 @@ def save_violation(slug, data):
         "source": data.get("source", "session"),
         "module": data.get("module", ""),
     }
-    violations.append(violation)
+    with locked(violations_path):
+        violations = load_json(violations_path, [])
+        violations.append(violation)
 
-    # Keep last 500 violations
-    violations = violations[-500:]
-    violations_path.write_text(json.dumps(violations, indent=2))
+        # Keep last 500 violations
+        violations = violations[-500:]
+        save_json(violations_path, violations)
 
     return {"status": "saved", "total_violations": len(violations)}
 
@@ -244,7 +222,7 @@ def get_violations(slug, category=None, severity=None, limit=50):
         return {"violations": [], "total": 0, "note": "No violations recorded."}
 
     try:
-        violations = json.loads(violations_path.read_text())
+        violations = read_json(violations_path)
     except json.JSONDecodeError:
         return {"error": "Violations file corrupted."}
 
@@ -5,9 +5,30 @@ Scores customer segments using weighted behavioral signals, tracks churn
 trends over time, generates intervention playbooks, and analyzes cohort
 risk. All scoring uses deterministic weighted formulas (no ML dependencies).
 
-Dependencies: none (stdlib only)
+score-customers streams a customer-level export (CSV, or Parquet with
+pyarrow) in chunks and scores every row with the same formula, column-wise
+with numpy when it is installed (row-by-row otherwise). Scored rows are
+written to --output; only tier/score histograms and the top-risk rows are
+kept in memory. With --brand the run's mean score and tier counts are
+recorded in the segment's trend history.
+
+Input columns (missing columns or blank cells count as missing signals):
+    customer_id (or --id-column)
+    email_open_rate_recent, email_open_rate_baseline
+    login_frequency_recent, login_frequency_baseline
+    purchase_frequency_recent, purchase_frequency_baseline
+    support_tickets_recent, support_tickets_baseline
+    feature_usage_recent, feature_usage_baseline
+    payment_failures, months_since_last_purchase, contract_months_remaining
+
+Dependencies: stdlib only; numpy (optional) for vectorized score-customers,
+              pyarrow (optional) for Parquet input/output
 
 Storage: ~/.claude-marketing/brands/{slug}/churn/
+    {segment}.json   score history per segment (trend)
+    _summary.json    latest score, data points and tier counts per segment,
+                     stamped with each history file's mtime/size so summary
+                     only re-reads histories that changed
 
 Usage:
     python churn-predictor.py --action score-segment --segment-name "Enterprise Q4" --signals '{"email_open_rate_trend":[0.12,0.25],"login_frequency_trend":[3,8],"purchase_frequency_trend":[1,3]}'
@@ -16,14 +37,27 @@ Usage:
     python churn-predictor.py --action trend --brand acme --segment-name "Enterprise" --score 72
     python churn-predictor.py --action cohort-risk --data '{"cohorts":[{"name":"Q1-2025","acquisition_date":"2025-01","current_customers":500,"churned_customers":45,"avg_ltv":2400,"engagement_score":65}]}'
     python churn-predictor.py --action summary --brand acme
+    python churn-predictor.py --action score-customers --input customers.csv --output scored.csv --brand acme --segment-name "All Customers"
 """
 
 import argparse
+import csv
+import heapq
+import importlib.util
 import json
+import math
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import load_json, locked, save_json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 # Signal weights (must sum to 1.0)
@@ -37,6 +71,23 @@ WEIGHTS = {
     "recency": 0.05,
 }
 
+# Trend signals: factor name -> (signals key, CSV column prefix)
+TREND_SIGNALS = {
+    "email_engagement": ("email_open_rate_trend", "email_open_rate"),
+    "login_frequency": ("login_frequency_trend", "login_frequency"),
+    "purchase_frequency": ("purchase_frequency_trend", "purchase_frequency"),
+    "support_tickets": ("support_tickets_trend", "support_tickets"),
+    "feature_usage": ("feature_usage_trend", "feature_usage"),
+}
+COUNT_SIGNALS = ["payment_failures", "months_since_last_purchase", "contract_months_remaining"]
+
+# Factor order of _score_segment_signals (ties in impact go to the earlier one)
+FACTOR_ORDER = list(WEIGHTS)
+TIERS = ["low", "medium", "high", "critical"]
+
+DEFAULT_CHUNK_SIZE = 100000
+DEFAULT_TOP = 100
+
 INTERVENTIONS = {
     "low": {
         "tier": "low",
@@ -115,19 +166,11 @@ INTERVENTIONS = {
 
 
 def _load_json(path, default=None):
-    if default is None:
-        default = []
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, [] if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _decay_score(recent, baseline):
@@ -252,6 +295,297 @@ def score_segment(segment_name, signals):
     return result
 
 
+# ---------------------------------------------------------------------------
+# Customer-level streaming scores
+# ---------------------------------------------------------------------------
+
+def _row_signals(row):
+    """Signals dict (as score-segment takes it) from one customer row of strings."""
+    def num(name):
+        value = row.get(name)
+        if value is None or value == "":
+            return None
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            return None
+        return value if math.isfinite(value) else None  # inf/nan count as missing
+
+    signals = {}
+    for key, prefix in TREND_SIGNALS.values():
+        recent, baseline = num(prefix + "_recent"), num(prefix + "_baseline")
+        if recent is not None and baseline is not None:
+            signals[key] = [recent, baseline]
+    for name in COUNT_SIGNALS:
+        value = num(name)
+        if value is not None:
+            signals[name] = value
+    return signals
+
+
+def _float_column(values, size):
+    """float64 array from a column of strings/numbers; blanks, junk and inf become NaN."""
+    if values is None:
+        return np.full(size, np.nan)
+    arr = np.asarray(values)
+    if arr.dtype.kind in "fiub":
+        return _finite(arr.astype(np.float64))
+    if arr.dtype.kind != "O":
+        try:
+            return _finite(np.where(arr == "", "nan", arr).astype(np.float64))
+        except ValueError:
+            pass
+    # Junk or mixed values: parse each distinct value once
+    uniques, inverse = np.unique(arr.astype(str), return_inverse=True)
+    parsed = np.empty(len(uniques))
+    for i, v in enumerate(uniques.tolist()):
+        try:
+            parsed[i] = float(v)
+        except ValueError:
+            parsed[i] = np.nan
+    return _finite(parsed[inverse.reshape(-1)])
+
+
+def _finite(arr):
+    """arr with inf/-inf replaced by NaN, so they count as missing like in _row_signals."""
+    arr[~np.isfinite(arr)] = np.nan
+    return arr
+
+
+def _round1(a):
+    """round(x, 1) elementwise with Python's (correctly rounded) semantics.
+
+    np.round scales by 10 first, which can land the other side of a tie;
+    the few values that sit near a tie are rounded individually.
+    """
+    r = np.round(a, 1)
+    t = a * 10.0
+    near = np.abs(t - np.floor(t) - 0.5) < 1e-6
+    if near.any():
+        r[near] = [round(v, 1) for v in a[near].tolist()]
+    return r
+
+
+def _decay_scores(recent, baseline):
+    """Vectorized _decay_score; 50 where the trend pair is missing."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = _round1(np.clip((1.0 - recent / baseline) * 100.0, 0.0, 100.0))
+    score = np.where(baseline <= 0, 50.0, score)
+    return np.where(np.isnan(recent) | np.isnan(baseline), 50.0, score)
+
+
+def score_columns(cols, size):
+    """Score a chunk column-wise; returns (churn_score, tier_code, top_factor, top_impact).
+
+    Same arithmetic, in the same order, as _score_segment_signals, so each
+    row's score equals what score-segment returns for it.
+    """
+    col = {name: _float_column(values, size) for name, values in cols.items()}
+
+    def get(name):
+        return col.get(name, np.full(size, np.nan))
+
+    scores = {}
+    for factor, (_, prefix) in TREND_SIGNALS.items():
+        recent, baseline = get(prefix + "_recent"), get(prefix + "_baseline")
+        if factor == "support_tickets":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio_score = np.minimum(100.0, np.maximum(0.0, (recent / baseline - 1.0) * 50.0 + 50.0))
+            s = np.where(baseline > 0, ratio_score, np.minimum(100.0, recent * 20.0))
+            s = _round1(s)
+            scores[factor] = np.where(np.isnan(recent) | np.isnan(baseline), 50.0, s)
+        else:
+            scores[factor] = _decay_scores(recent, baseline)
+
+    pf = np.nan_to_num(get("payment_failures"), nan=0.0)
+    scores["payment_failures"] = _round1(np.minimum(100.0, pf * 33.0))
+    months = np.nan_to_num(get("months_since_last_purchase"), nan=0.0)
+    scores["recency"] = _round1(np.minimum(100.0, months * 15.0))
+
+    impacts = [scores[f] * WEIGHTS[f] for f in FACTOR_ORDER]
+    churn = impacts[0]
+    for impact in impacts[1:]:
+        churn = churn + impact
+
+    contract = get("contract_months_remaining")
+    with np.errstate(invalid="ignore"):
+        has_contract = contract > 0
+    buffer = np.minimum(np.where(has_contract, contract, 0.0) / 12.0 * 20.0, 20.0)
+    churn = np.where(has_contract, np.maximum(0.0, churn - buffer), churn)
+    churn = _round1(np.minimum(100.0, np.maximum(0.0, churn)))
+
+    tier = (churn >= 25).astype(np.int8) + (churn >= 50) + (churn >= 75)
+    stacked = np.vstack(impacts)
+    top = np.argmax(stacked, axis=0)  # first maximum = stable sort order
+    top_impact = _round1(stacked[top, np.arange(size)])
+    return churn, tier, top, top_impact
+
+
+def _score_rows_python(rows):
+    """Row-by-row fallback producing the same four columns as score_columns."""
+    churn, tier, top, top_impact = [], [], [], []
+    for row in rows:
+        result = _score_segment_signals(_row_signals(row))
+        lead = result["contributing_factors"][0]
+        churn.append(result["churn_score"])
+        tier.append(TIERS.index(result["risk_tier"]))
+        top.append(FACTOR_ORDER.index(lead["signal"]))
+        top_impact.append(lead["impact"])
+    return churn, tier, top, top_impact
+
+
+def _iter_csv_chunks(path, chunk_size):
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        reader = csv.reader(fh)
+        header = [h.strip() for h in next(reader, [])]
+        while True:
+            rows = [r for _, r in zip(range(chunk_size), reader)]
+            if not rows:
+                return
+            width = len(header)
+            if any(len(r) != width for r in rows):
+                rows = [(r + [""] * width)[:width] for r in rows]
+            columns = list(zip(*rows))
+            yield len(rows), {name: list(columns[i]) for i, name in enumerate(header)}
+
+
+def _iter_parquet_chunks(path, chunk_size):
+    import pyarrow.parquet as pq
+
+    for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+        yield batch.num_rows, {name: batch.column(i).to_numpy(zero_copy_only=False)
+                               for i, name in enumerate(batch.schema.names)}
+
+
+class _ScoreWriter:
+    """Writes scored rows as CSV, or Parquet (pyarrow) when the path ends in .parquet."""
+
+    FIELDS = ["customer_id", "churn_score", "risk_tier", "top_factor", "top_factor_impact"]
+
+    def __init__(self, path):
+        self.parquet = str(path).endswith(".parquet")
+        if self.parquet:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            self.pa = pa
+            self.writer = None
+            self.pq = pq
+            self.path = path
+        else:
+            self.fh = open(path, "w", newline="", encoding="utf-8")
+            self.writer = csv.writer(self.fh)
+            self.writer.writerow(self.FIELDS)
+
+    def write(self, ids, churn, tiers, factors, impacts):
+        if self.parquet:
+            table = self.pa.table(dict(zip(self.FIELDS, [list(ids), churn, tiers, factors, impacts])))
+            if self.writer is None:
+                self.writer = self.pq.ParquetWriter(self.path, table.schema)
+            self.writer.write_table(table)
+        else:
+            self.writer.writerows(zip(ids, churn, tiers, factors, impacts))
+
+    def close(self):
+        if self.parquet:
+            if self.writer is not None:
+                self.writer.close()
+        else:
+            self.fh.close()
+
+
+def score_customers(input_path, output_path=None, id_column="customer_id", chunk_size=DEFAULT_CHUNK_SIZE,
+                    top_n=DEFAULT_TOP, engine="auto", brand_slug=None, segment_name=None):
+    """Stream-score a customer export; returns tier/score histograms and top-risk rows."""
+    path = Path(input_path)
+    if not path.exists():
+        return {"error": f"Input file not found: {input_path}"}
+    if engine == "numpy" and np is None:
+        return {"error": "numpy not installed. Use --engine python, or: pip install numpy"}
+    use_numpy = np is not None and engine != "python"
+    if chunk_size < 1:
+        return {"error": "--chunk-size must be at least 1"}
+
+    is_parquet = path.suffix.lower() == ".parquet"
+    if (is_parquet or str(output_path or "").endswith(".parquet")) and importlib.util.find_spec("pyarrow") is None:
+        return {"error": "pyarrow not installed (needed for Parquet). Use CSV, or: pip install pyarrow"}
+    if is_parquet and not use_numpy:
+        return {"error": "Parquet input requires numpy. Use CSV, or: pip install numpy"}
+    if brand_slug and not (BRANDS_DIR / brand_slug).exists():
+        return {"error": f"Brand '{brand_slug}' not found. Run /dm:brand-setup first."}
+
+    chunks = _iter_parquet_chunks(path, chunk_size) if is_parquet else _iter_csv_chunks(path, chunk_size)
+    writer = _ScoreWriter(output_path) if output_path else None
+
+    tier_counts = [0] * len(TIERS)
+    histogram = [0] * 10
+    total_score = 0.0
+    rows_seen = 0
+    top = []  # min-heap of (score, -row, id, tier, factor)
+    try:
+        for size, cols in chunks:
+            ids = cols.get(id_column)
+            ids = list(ids) if ids is not None else [str(rows_seen + i + 1) for i in range(size)]
+            if use_numpy:
+                churn, tier, factor, impact = score_columns(cols, size)
+                tier_counts = [c + int(n) for c, n in zip(tier_counts, np.bincount(tier, minlength=4))]
+                bins = np.minimum((churn // 10).astype(np.int64), 9)
+                histogram = [h + int(n) for h, n in zip(histogram, np.bincount(bins, minlength=10))]
+                total_score += float(churn.sum())
+                # Only this chunk's top_n can enter the running top_n
+                k = min(top_n, size)
+                candidates = np.argpartition(-churn, k - 1)[:k] if k else []
+                churn_l, tier_l = churn.tolist(), tier.tolist()
+                factor_l, impact_l = factor.tolist(), impact.tolist()
+            else:
+                rows = ({name: values[i] for name, values in cols.items()} for i in range(size))
+                churn_l, tier_l, factor_l, impact_l = _score_rows_python(rows)
+                for score, t in zip(churn_l, tier_l):
+                    tier_counts[t] += 1
+                    histogram[min(int(score // 10), 9)] += 1
+                    total_score += score
+                candidates = range(size) if top_n else ()
+
+            for i in candidates:
+                i = int(i)
+                item = (churn_l[i], -(rows_seen + i), ids[i], TIERS[tier_l[i]], FACTOR_ORDER[factor_l[i]])
+                if len(top) < top_n:
+                    heapq.heappush(top, item)
+                elif item > top[0]:
+                    heapq.heapreplace(top, item)
+
+            if writer is not None:
+                writer.write(ids, churn_l, [TIERS[t] for t in tier_l],
+                             [FACTOR_ORDER[f] for f in factor_l], impact_l)
+            rows_seen += size
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        return {"error": f"Cannot read {input_path}: {e}"}
+    finally:
+        if writer is not None:
+            writer.close()
+
+    counts = dict(zip(TIERS, tier_counts))
+    mean_score = round(total_score / rows_seen, 1) if rows_seen else 0
+    result = {
+        "input": str(path),
+        "output": str(output_path) if output_path else None,
+        "engine": "numpy" if use_numpy else "python",
+        "customers_scored": rows_seen,
+        "average_churn_score": mean_score,
+        "tier_counts": counts,
+        "tier_pct": {t: round(c / rows_seen * 100, 1) if rows_seen else 0 for t, c in counts.items()},
+        "score_histogram": [{"range": f"{b * 10}-{b * 10 + 10}", "count": c} for b, c in enumerate(histogram)],
+        "top_risk_customers": [
+            {"customer_id": cid, "churn_score": score, "risk_tier": tier, "top_factor": factor}
+            for score, _, cid, tier, factor in sorted(top, reverse=True)
+        ],
+    }
+    if brand_slug and rows_seen:
+        result["trend"] = trend(brand_slug, segment_name or "All Customers", mean_score,
+                                extra={"tier_counts": counts, "customers": rows_seen})
+    return result
+
+
 def score_batch(data):
     results = []
     for item in data:
@@ -271,7 +605,36 @@ def intervention_plan(tier):
     return plan
 
 
-def trend(brand_slug, segment_name, current_score):
+def _history_stamp(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _summary_entry(path, history):
+    """Per-segment line of _summary.json, derived from a score history."""
+    latest = history[-1]
+    entry = {
+        "segment": path.stem.replace("-", " ").title(),
+        "latest_score": latest.get("score", 0),
+        "data_points": len(history),
+        "stamp": _history_stamp(path),
+    }
+    if latest.get("tier_counts"):
+        entry["tier_counts"] = latest["tier_counts"]
+    return entry
+
+
+def _update_summary_index(churn_dir, path, history):
+    index_path = churn_dir / "_summary.json"
+    with locked(index_path):
+        index = load_json(index_path, {})
+        if not isinstance(index, dict):
+            index = {}
+        index.setdefault("segments", {})[path.stem] = _summary_entry(path, history)
+        save_json(index_path, index)
+
+
+def trend(brand_slug, segment_name, current_score, extra=None):
     brand_dir = BRANDS_DIR / brand_slug
     if not brand_dir.exists():
         return {"error": f"Brand '{brand_slug}' not found. Run /dm:brand-setup first."}
@@ -281,15 +644,18 @@ def trend(brand_slug, segment_name, current_score):
 
     safe_name = segment_name.lower().replace(" ", "-").replace("/", "-")
     history_path = churn_dir / f"{safe_name}.json"
-    history = _load_json(history_path, [])
 
     # Append current score
     entry = {
         "score": current_score,
         "recorded_at": datetime.now().isoformat(),
+        **(extra or {}),
     }
-    history.append(entry)
-    _save_json(history_path, history)
+    with locked(history_path):
+        history = _load_json(history_path, [])
+        history.append(entry)
+        _save_json(history_path, history)
+        _update_summary_index(churn_dir, history_path, history)
 
     # Calculate trend
     scores = [h["score"] for h in history]
@@ -370,16 +736,36 @@ def summary(brand_slug):
             "note": "No churn data tracked yet.",
         }
 
+    # Histories whose mtime/size match _summary.json are not re-read
+    index_path = churn_dir / "_summary.json"
+    with locked(index_path):
+        index = load_json(index_path, {})
+        cached = index.get("segments", {}) if isinstance(index, dict) else {}
+        current = {}
+        for fp in sorted(churn_dir.glob("*.json")):
+            if fp.name.startswith("_"):
+                continue
+            entry = cached.get(fp.stem)
+            if entry is None or entry.get("stamp") != _history_stamp(fp):
+                history = _load_json(fp, [])
+                entry = _summary_entry(fp, history) if history else None
+            if entry is not None:
+                current[fp.stem] = entry
+        if current != cached:
+            save_json(index_path, {"segments": current})
+
     segments = []
     all_scores = []
-    for fp in churn_dir.glob("*.json"):
-        history = _load_json(fp, [])
-        if not history:
-            continue
-        name = fp.stem.replace("-", " ").title()
-        latest = history[-1].get("score", 0)
-        all_scores.append(latest)
-        segments.append({"segment": name, "latest_score": latest, "data_points": len(history)})
+    tier_totals = {}
+    for entry in current.values():
+        all_scores.append(entry["latest_score"])
+        segment = {"segment": entry["segment"], "latest_score": entry["latest_score"],
+                   "data_points": entry["data_points"]}
+        if entry.get("tier_counts"):
+            segment["tier_counts"] = entry["tier_counts"]
+            for tier_name, count in entry["tier_counts"].items():
+                tier_totals[tier_name] = tier_totals.get(tier_name, 0) + count
+        segments.append(segment)
 
     if not segments:
         return {
@@ -401,12 +787,15 @@ def summary(brand_slug):
     else:
         overall = "healthy"
 
-    return {
+    result = {
         "total_segments_tracked": len(segments),
         "average_churn_score": avg_score,
         "highest_risk_segments": segments[:5],
         "trend_direction": overall,
     }
+    if tier_totals:
+        result["customer_tier_counts"] = tier_totals
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -419,7 +808,7 @@ def main():
     )
     parser.add_argument("--action", required=True,
                         choices=["score-segment", "score-batch", "intervention-plan",
-                                 "trend", "cohort-risk", "summary"],
+                                 "trend", "cohort-risk", "summary", "score-customers"],
                         help="Action to perform")
     parser.add_argument("--brand", help="Brand slug")
     parser.add_argument("--segment-name", dest="segment_name",
@@ -430,6 +819,16 @@ def main():
                         help="Risk tier (for intervention-plan)")
     parser.add_argument("--score", type=float,
                         help="Current churn score to record (for trend)")
+    parser.add_argument("--input", help="Customer-level CSV or Parquet (for score-customers)")
+    parser.add_argument("--output", help="Write scored rows to this CSV/Parquet (for score-customers)")
+    parser.add_argument("--id-column", dest="id_column", default="customer_id",
+                        help="Customer ID column (default: customer_id)")
+    parser.add_argument("--chunk-size", dest="chunk_size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Rows per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Top-risk customers to report (default: {DEFAULT_TOP})")
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto",
+                        help="score-customers engine: numpy (vectorized) or python (row by row)")
     args = parser.parse_args()
 
     result = None
@@ -490,6 +889,15 @@ def main():
             sys.exit(1)
         result = cohort_risk(data)
 
+    elif args.action == "score-customers":
+        if not args.input:
+            print(json.dumps({"error": "Provide --input CSV or Parquet file"}))
+            sys.exit(1)
+        result = score_customers(args.input, args.output, id_column=args.id_column,
+                                 chunk_size=args.chunk_size, top_n=max(0, args.top),
+                                 engine=args.engine, brand_slug=args.brand,
+                                 segment_name=args.segment_name)
+
     elif args.action == "summary":
         if not args.brand:
             print(json.dumps({"error": "Provide --brand for summary"}))
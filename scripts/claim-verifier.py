@@ -9,13 +9,27 @@ certifications) from marketing content, then fuzzy-matches them against an
 evidence file to classify each claim as verified, partially verified,
 unverified, or contradicted.
 
-Dependencies: stdlib only (json, re, sys, argparse, pathlib, difflib, math)
+Evidence files are preprocessed into an index (normalized text, numbers and
+word tokens per item) cached under ~/.claude-marketing/cache/evidence-index/
+keyed by the file's SHA-256, so an unchanged evidence pack is only parsed
+once. Each claim retrieves its most likely evidence items through token and
+numeric lookups, and only those candidates (--candidates, default 50) get the
+full SequenceMatcher scoring. --candidates 0 scores every item. A claim that
+shares no token or number with any item falls back to scoring every item, so
+its confidence is the same best sub-threshold similarity as a full scan.
+Otherwise an unverified claim's confidence is the best score among its
+candidates, which can be lower than the full-scan value; use --candidates 0
+when those confidences must match the unindexed scan exactly.
+
+Dependencies: stdlib only (json, re, sys, argparse, pathlib, difflib, math,
+              bisect, hashlib, heapq, collections)
 
 Usage:
     python claim-verifier.py --action verify --text "50% increase in conversions" --evidence evidence.json
     python claim-verifier.py --action verify --file draft.md --evidence evidence.json
     python claim-verifier.py --action extract-claims --text "We grew revenue by 3x and serve 500+ companies"
     python claim-verifier.py --action match-evidence --claim "50% increase" --evidence evidence.json
+    python claim-verifier.py --action verify --file draft.md --evidence pack.json --candidates 0
 
 Actions:
     verify           Extract claims from content and verify against evidence file
@@ -40,14 +54,25 @@ Scoring:
 """
 
 import argparse
+import bisect
+import hashlib
+import heapq
 import json
 import math
 import re
 import sys
+from collections import defaultdict
 from difflib import SequenceMatcher
 from pathlib import Path
 
+from brand_store import MEMORY_ROOT, load_json, save_json
+from pattern_scanner import PatternScanner, resolve_overlaps
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+EVIDENCE_CACHE_DIR = MEMORY_ROOT / "cache" / "evidence-index"
+EVIDENCE_INDEX_VERSION = 1
+DEFAULT_CANDIDATES = 50  # evidence items given full SequenceMatcher scoring per claim
+NUMBER_TOLERANCE = 0.1
 
 # ---------------------------------------------------------------------------
 # Claim extraction patterns
@@ -69,16 +94,23 @@ CLAIM_PATTERNS = [
     (r"\b\d+(?:\.\d+)?\s*(?:million|billion|trillion)\s+(?:in\s+)?(?:revenue|sales|ARR|MRR|funding|valuation)", "financial_claim"),
 ]
 
+_CLAIM_SCANNER = PatternScanner([("claim", CLAIM_PATTERNS, re.IGNORECASE)])
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_NUMBER_RE = re.compile(r"[\d,]+(?:\.\d+)?")
+_WHITESPACE_RE = re.compile(r"\s+")
+_STRIP_RE = re.compile(r"[^\w\s%$.,]")
+
+
 def _extract_numbers(text):
     """Extract all numeric values from text as floats."""
     numbers = []
     # Match integers, decimals, and comma-separated numbers
-    for match in re.finditer(r"[\d,]+(?:\.\d+)?", text):
+    for match in _NUMBER_RE.finditer(text):
         try:
             num_str = match.group(0).replace(",", "")
             numbers.append(float(num_str))
@@ -90,12 +122,12 @@ def _extract_numbers(text):
 def _normalize_text(text):
     """Normalize text for comparison: lowercase, collapse whitespace."""
     text = text.lower().strip()
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\w\s%$.,]", "", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _STRIP_RE.sub("", text)
     return text
 
 
-def _number_similarity(nums_a, nums_b, tolerance=0.1):
+def _number_similarity(nums_a, nums_b, tolerance=NUMBER_TOLERANCE):
     """Compare two sets of numbers with tolerance. Returns 0.0-1.0 score."""
     if not nums_a or not nums_b:
         return 0.0
@@ -134,6 +166,11 @@ def _match_score(claim_text, evidence_item):
     # Number comparison
     claim_nums = _extract_numbers(claim_text)
     evidence_nums = _extract_numbers(evidence_claim)
+    return _combine_scores(text_sim, claim_nums, evidence_nums)
+
+
+def _combine_scores(text_sim, claim_nums, evidence_nums):
+    """Blend text and number similarity into the match score."""
     num_sim = _number_similarity(claim_nums, evidence_nums)
 
     # Combined score: weight text similarity and number similarity
@@ -171,51 +208,193 @@ def _numbers_contradict(claim_text, evidence_claim):
 
 
 # ---------------------------------------------------------------------------
-# Core functions
+# Evidence index
 # ---------------------------------------------------------------------------
 
-def extract_claims(text):
-    """Extract verifiable claims from marketing content."""
-    claims = []
-    seen_spans = set()
+_INDEX_CACHE = {}  # evidence file digest -> EvidenceIndex (per process)
+
+
+def _tokens(normalized):
+    """Distinct word tokens of normalized text, used for candidate retrieval.
+
+    Tokens containing digits are left out: numbers are looked up through the
+    numeric index, with the same tolerance the scorer applies.
+    """
+    tokens = {token.strip(".,") for token in normalized.split()}
+    return sorted(t for t in tokens if t and not any(ch.isdigit() for ch in t))
+
+
+class EvidenceIndex:
+    """Preprocessed evidence items with token and numeric lookup tables.
+
+    items[i] holds the normalized claim text, its numbers and its tokens for
+    evidence_data["evidence"][i]; that is what gets cached on disk. The
+    postings, IDF weights and sorted number list are rebuilt from it on load.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.postings = defaultdict(list)
+        numeric = []
+        for idx, item in enumerate(items):
+            for token in item["tokens"]:
+                self.postings[token].append(idx)
+            for value in set(item["nums"]):
+                numeric.append((value, idx))
+        numeric.sort()
+        self.number_values = [value for value, _ in numeric]
+        self.number_ids = [idx for _, idx in numeric]
+        self.lengths = [len(item["norm"]) for item in items]
+        total = len(items)
+        self.idf = {
+            token: math.log(1 + total / len(ids))
+            for token, ids in self.postings.items()
+        }
+        # Tokens in more than half the items barely separate candidates but
+        # dominate lookup time, so retrieval skips them.
+        self.common_df = max(1, total // 2)
 
-    for pattern, claim_type in CLAIM_PATTERNS:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            span = (match.start(), match.end())
-            # Skip overlapping matches
-            overlap = False
-            for seen_start, seen_end in seen_spans:
-                if not (span[1] <= seen_start or span[0] >= seen_end):
-                    overlap = True
-                    break
-            if overlap:
-                continue
+    @classmethod
+    def build(cls, evidence_items):
+        items = []
+        for ev in evidence_items:
+            claim = ev.get("claim", "")
+            normalized = _normalize_text(claim)
+            items.append({
+                "norm": normalized,
+                "nums": _extract_numbers(claim),
+                "tokens": _tokens(normalized),
+            })
+        return cls(items)
 
-            claim_text = match.group(0).strip()
-            if len(claim_text) < 3:
-                continue
+    def _near(self, value):
+        """Ids of items holding a number within NUMBER_TOLERANCE of value."""
+        if value == 0:
+            low = high = 0.0
+        else:
+            low, high = value * (1 - NUMBER_TOLERANCE), value / (1 - NUMBER_TOLERANCE)
+        lo = bisect.bisect_left(self.number_values, low)
+        hi = bisect.bisect_right(self.number_values, high)
+        return set(self.number_ids[lo:hi])
+
+    def candidates(self, claim_norm, claim_nums, limit):
+        """Ids of the evidence items most likely to match, in index order.
+
+        Items are ranked by IDF-weighted token overlap and by the share of the
+        claim's numbers they contain, weighted like _combine_scores weights
+        text and numbers; ties go to the item closest in length (the
+        SequenceMatcher ratio penalizes length differences). limit <= 0
+        returns every item, and so does a claim that shares no token or
+        number with any item (nothing to rank, so it gets the full scan).
+        """
+        if limit <= 0 or limit >= len(self.items):
+            return range(len(self.items))
+
+        scores = defaultdict(float)
+        tokens = [t for t in _tokens(claim_norm) if t in self.postings]
+        token_weight = sum(self.idf[t] for t in tokens)
+        if claim_nums and token_weight:
+            text_share, number_share = 0.5, 0.5
+        else:
+            text_share, number_share = 1.0, 1.0
+        if token_weight:
+            for token in tokens:
+                ids = self.postings[token]
+                if len(ids) > self.common_df:
+                    continue
+                weight = text_share * self.idf[token] / token_weight
+                for idx in ids:
+                    scores[idx] += weight
+        if claim_nums:
+            weight = number_share / len(claim_nums)
+            for value in claim_nums:
+                for idx in self._near(value):
+                    scores[idx] += weight
+
+        if not scores:
+            return range(len(self.items))
+
+        length = len(claim_norm)
+        lengths = self.lengths
+        top = heapq.nsmallest(
+            limit, scores,
+            key=lambda idx: (-scores[idx], abs(lengths[idx] - length), idx),
+        )
+        return sorted(top)
 
-            seen_spans.add(span)
-            claims.append({
-                "text": claim_text,
-                "type": claim_type,
-                "position": span[0],
-            })
+    def score(self, idx, claim_norm, claim_nums):
+        """_match_score() for item idx, using the preprocessed evidence text."""
+        item = self.items[idx]
+        text_sim = SequenceMatcher(None, claim_norm, item["norm"]).ratio()
+        return _combine_scores(text_sim, claim_nums, item["nums"])
 
-    # Sort by position in text
-    claims.sort(key=lambda c: c["position"])
 
-    # Remove position from output (internal use only)
-    for claim in claims:
-        del claim["position"]
+def load_evidence_index(filepath, evidence_data):
+    """Return the EvidenceIndex for an evidence file, cached by content hash.
 
-    return claims
+    evidence_data must be the file's parsed contents (from _load_evidence).
+    The index is reused from memory or from EVIDENCE_CACHE_DIR when the file
+    is unchanged, and rebuilt (and re-cached) otherwise.
+    """
+    try:
+        digest = hashlib.sha256(Path(filepath).read_bytes()).hexdigest()
+    except OSError:
+        return EvidenceIndex.build(evidence_data.get("evidence", []))
+    if digest in _INDEX_CACHE:
+        return _INDEX_CACHE[digest]
+
+    cache_path = EVIDENCE_CACHE_DIR / f"{digest}.json"
+    cached = load_json(cache_path)
+    evidence_items = evidence_data.get("evidence", [])
+    if (
+        isinstance(cached, dict)
+        and cached.get("version") == EVIDENCE_INDEX_VERSION
+        and len(cached.get("items", [])) == len(evidence_items)
+    ):
+        index = EvidenceIndex(cached["items"])
+    else:
+        index = EvidenceIndex.build(evidence_items)
+        try:
+            save_json(cache_path, {
+                "version": EVIDENCE_INDEX_VERSION,
+                "source": str(Path(filepath).resolve()),
+                "items": index.items,
+            }, compact=True)
+        except OSError:
+            pass  # read-only home: keep the in-memory index
+    _INDEX_CACHE[digest] = index
+    return index
 
 
-def verify_claims(text, evidence_data):
-    """Extract claims and verify against evidence."""
+# ---------------------------------------------------------------------------
+# Core functions
+# ---------------------------------------------------------------------------
+
+def extract_claims(text):
+    """Extract verifiable claims from marketing content."""
+    # Earlier CLAIM_PATTERNS win overlaps; matches too short to be a claim
+    # are dropped before they can block anything.
+    hits = [
+        hit for hit in _CLAIM_SCANNER.scan(text)
+        if len(hit.match.group(0).strip()) >= 3
+    ]
+    return [
+        {"text": hit.match.group(0).strip(), "type": hit.label}
+        for hit in resolve_overlaps(hits)
+    ]
+
+
+def verify_claims(text, evidence_data, index=None, candidates=DEFAULT_CANDIDATES):
+    """Extract claims and verify against evidence.
+
+    index is the EvidenceIndex for evidence_data (built in memory when
+    omitted). Each claim is scored against at most `candidates` retrieved
+    evidence items; 0 scores every item.
+    """
     claims = extract_claims(text)
     evidence_items = evidence_data.get("evidence", [])
+    if index is None:
+        index = EvidenceIndex.build(evidence_items)
 
     if not claims:
         return {
@@ -240,18 +419,22 @@ def verify_claims(text, evidence_data):
         "total": len(claims),
     }
 
+    best_by_text = {}  # repeated claims in one document are matched once
     for claim in claims:
         claim_text = claim["text"]
-        best_match = None
-        best_score = 0.0
-        best_evidence = None
-
-        for ev in evidence_items:
-            score = _match_score(claim_text, ev)
-            if score > best_score:
-                best_score = score
-                best_match = ev.get("claim", "")
-                best_evidence = ev
+        if claim_text not in best_by_text:
+            claim_norm = _normalize_text(claim_text)
+            claim_nums = _extract_numbers(claim_text)
+            best = (0.0, None)
+            for idx in index.candidates(claim_norm, claim_nums, candidates):
+                score = index.score(idx, claim_norm, claim_nums)
+                if score > best[0]:
+                    best = (score, idx)
+            best_by_text[claim_text] = best
+
+        best_score, best_idx = best_by_text[claim_text]
+        best_evidence = evidence_items[best_idx] if best_idx is not None else None
+        best_match = best_evidence.get("claim", "") if best_evidence is not None else None
 
         # Classify the claim
         if best_score >= 0.6 and best_evidence is not None:
@@ -326,13 +509,18 @@ def verify_claims(text, evidence_data):
     }
 
 
-def match_single_claim(claim_text, evidence_data):
+def match_single_claim(claim_text, evidence_data, index=None):
     """Match a single claim against evidence items and return matches."""
     evidence_items = evidence_data.get("evidence", [])
+    if index is None:
+        index = EvidenceIndex.build(evidence_items)
+    claim_norm = _normalize_text(claim_text)
+    claim_nums = _extract_numbers(claim_text)
     matches = []
 
-    for ev in evidence_items:
-        score = _match_score(claim_text, ev)
+    # Every item is scored: this action lists all matches above 0.3
+    for idx, ev in enumerate(evidence_items):
+        score = index.score(idx, claim_norm, claim_nums)
         if score >= 0.3:  # include lower-confidence matches for visibility
             matches.append({
                 "evidence_claim": ev.get("claim", ""),
@@ -351,6 +539,52 @@ def match_single_claim(claim_text, evidence_data):
     }
 
 
+# ---------------------------------------------------------------------------
+# Reference implementation
+# ---------------------------------------------------------------------------
+
+def extract_claims_bruteforce(text):
+    """Original per-pattern extraction with a pairwise overlap check.
+
+    Kept for benchmarking and verifying the scanner:
+        python pattern_scanner.py --benchmark 10000
+    """
+    claims = []
+    seen_spans = set()
+
+    for pattern, claim_type in CLAIM_PATTERNS:
+        for match in re.finditer(pattern, text, re.IGNORECASE):
+            span = (match.start(), match.end())
+            # Skip overlapping matches
+            overlap = False
+            for seen_start, seen_end in seen_spans:
+                if not (span[1] <= seen_start or span[0] >= seen_end):
+                    overlap = True
+                    break
+            if overlap:
+                continue
+
+            claim_text = match.group(0).strip()
+            if len(claim_text) < 3:
+                continue
+
+            seen_spans.add(span)
+            claims.append({
+                "text": claim_text,
+                "type": claim_type,
+                "position": span[0],
+            })
+
+    # Sort by position in text
+    claims.sort(key=lambda c: c["position"])
+
+    # Remove position from output (internal use only)
+    for claim in claims:
+        del claim["position"]
+
+    return claims
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -374,6 +608,9 @@ def build_parser():
             '  python claim-verifier.py --action verify --file draft.md --evidence evidence.json\n'
             '  python claim-verifier.py --action extract-claims --text "We grew revenue by 3x"\n'
             '  python claim-verifier.py --action match-evidence --claim "50% increase" --evidence evidence.json\n'
+            "\n"
+            "Evidence files are indexed once and cached under\n"
+            "~/.claude-marketing/cache/evidence-index/ by content hash.\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -399,6 +636,13 @@ def build_parser():
         "--evidence", type=str,
         help="Path to evidence JSON file.",
     )
+    parser.add_argument(
+        "--candidates", type=int, default=DEFAULT_CANDIDATES,
+        help=(
+            "Evidence items given full similarity scoring per claim "
+            f"(default: {DEFAULT_CANDIDATES}; 0 scores every item)."
+        ),
+    )
     return parser
 
 
@@ -452,7 +696,8 @@ def main():
         if err:
             print(json.dumps({"error": err}))
             sys.exit(1)
-        result = verify_claims(text, evidence_data)
+        index = load_evidence_index(args.evidence, evidence_data)
+        result = verify_claims(text, evidence_data, index, args.candidates)
 
     elif args.action == "extract-claims":
         if not text:
@@ -475,7 +720,8 @@ def main():
         if err:
             print(json.dumps({"error": err}))
             sys.exit(1)
-        result = match_single_claim(args.claim, evidence_data)
+        index = load_evidence_index(args.evidence, evidence_data)
+        result = match_single_claim(args.claim, evidence_data, index)
 
     else:
         result = {"error": f"Unknown action: {args.action}"}
@@ -1,12 +1,43 @@
 #!/usr/bin/env python3
-"""Extract public competitor data from URLs with robots.txt respect and rate limiting."""
+"""Extract public competitor data from URLs with robots.txt respect and rate limiting.
+
+Batch mode (--urls / --urls-file) groups URLs by domain and scrapes domains
+concurrently (--workers). Each domain gets one keep-alive session, one
+robots.txt fetch, and a 0.5-1.5s randomised gap between its own requests,
+so different sites are fetched in parallel while any single site still sees
+polite sequential traffic. Pages are parsed with lxml when it is installed
+(--parser auto), falling back to BeautifulSoup's html.parser.
+
+With --brand, the fetched HTML is stored gzip-compressed under
+~/.claude-marketing/brands/{slug}/competitors/{competitor}/snapshots/
+(content-addressed, with an index.json of fetches). --snapshot re-parses a
+stored page without touching the network; competitor-tracker.py uses it for
+`scan --snapshot` / `save-baseline --snapshot`.
+
+Usage:
+    python competitor-scraper.py --url https://rival.com
+    python competitor-scraper.py --urls '["https://rival.com", "https://other.io/pricing"]' --workers 8
+    python competitor-scraper.py --urls-file competitors.txt --brand acme --output jsonl
+    python competitor-scraper.py --url https://rival.com --brand acme --competitor Rival
+    python competitor-scraper.py --snapshot ~/.claude-marketing/brands/acme/competitors/rival/snapshots/3f2a9c1d0b7e4a56.html.gz
+
+Dependencies: requests, beautifulsoup4 (lxml optional, used when installed)
+"""
 
 import argparse
+import gzip
+import hashlib
+import importlib.util
 import json
+import queue
 import re
 import sys
+import threading
 import time
 import random
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
 from urllib.parse import urlparse, urljoin
 
 try:
@@ -31,12 +62,25 @@ except ImportError:
     }))
     sys.exit(0)
 
+from brand_store import BRANDS_DIR, load_json, locked, save_json
+
+HAS_LXML = importlib.util.find_spec("lxml") is not None
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_0) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Safari/605.1.15",
     "Mozilla/5.0 (X11; Linux x86_64; rv:120.0) Gecko/20100101 Firefox/120.0",
 ]
 
+DELAY_RANGE = (0.5, 1.5)  # seconds between requests to the same domain
+DEFAULT_WORKERS = 8       # domains scraped concurrently in batch mode
+
+LEGAL_DISCLAIMER = (
+    "This data was collected from publicly accessible web pages. "
+    "No login-protected or paywalled content was accessed. "
+    "Use responsibly and in compliance with applicable laws and terms of service."
+)
+
 SOCIAL_DOMAINS = {
     "facebook.com": "Facebook", "fb.com": "Facebook",
     "twitter.com": "Twitter", "x.com": "Twitter",
@@ -64,30 +108,80 @@ TECH_SIGNALS = {
 }
 
 
-def check_robots_txt(url):
-    """Check if scraping is allowed by robots.txt. Returns (allowed, message)."""
+# ---------------------------------------------------------------------------
+# robots.txt
+# ---------------------------------------------------------------------------
+
+def _robots_url(url):
     parsed = urlparse(url)
-    robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+    return f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+
+
+def _fetch_robots_rules(robots_url, session=None):
+    """Fetch robots.txt and return its "User-agent: *" Disallow prefixes in file order.
+
+    Returns None when robots.txt could not be fetched.
+    """
+    get = session.get if session is not None else requests.get
     try:
-        resp = requests.get(robots_url, timeout=5, headers={"User-Agent": random.choice(USER_AGENTS)})
-        if resp.status_code == 200:
-            path = parsed.path or "/"
-            lines = resp.text.splitlines()
-            user_agent_match = False
-            for line in lines:
-                line = line.strip().lower()
-                if line.startswith("user-agent:"):
-                    agent = line.split(":", 1)[1].strip()
-                    user_agent_match = agent == "*"
-                elif user_agent_match and line.startswith("disallow:"):
-                    disallowed = line.split(":", 1)[1].strip()
-                    if disallowed and path.startswith(disallowed):
-                        return False, f"Blocked by robots.txt: {disallowed}"
-        return True, "Allowed or no robots.txt restriction found"
+        resp = get(robots_url, timeout=5, headers={"User-Agent": random.choice(USER_AGENTS)})
     except Exception:
+        return None
+    rules = []
+    if resp.status_code == 200:
+        user_agent_match = False
+        for line in resp.text.splitlines():
+            line = line.strip().lower()
+            if line.startswith("user-agent:"):
+                agent = line.split(":", 1)[1].strip()
+                user_agent_match = agent == "*"
+            elif user_agent_match and line.startswith("disallow:"):
+                disallowed = line.split(":", 1)[1].strip()
+                if disallowed:
+                    rules.append(disallowed)
+    return rules
+
+
+def _robots_verdict(rules, url):
+    if rules is None:
         return True, "Could not fetch robots.txt, proceeding with caution"
+    path = urlparse(url).path or "/"
+    for disallowed in rules:
+        if path.startswith(disallowed):
+            return False, f"Blocked by robots.txt: {disallowed}"
+    return True, "Allowed or no robots.txt restriction found"
+
+
+class RobotsCache:
+    """robots.txt rules fetched once per scheme+host and shared across threads."""
+
+    def __init__(self):
+        self._rules = {}
+        self._lock = threading.Lock()
+
+    def check(self, url, session=None):
+        robots_url = _robots_url(url)
+        with self._lock:
+            cached = robots_url in self._rules
+            rules = self._rules.get(robots_url)
+        if not cached:
+            rules = _fetch_robots_rules(robots_url, session)
+            with self._lock:
+                self._rules[robots_url] = rules
+        return _robots_verdict(rules, url)
 
 
+def check_robots_txt(url, cache=None, session=None):
+    """Check if scraping is allowed by robots.txt. Returns (allowed, message)."""
+    if cache is not None:
+        return cache.check(url, session)
+    return _robots_verdict(_fetch_robots_rules(_robots_url(url), session), url)
+
+
+# ---------------------------------------------------------------------------
+# Extraction
+# ---------------------------------------------------------------------------
+
 def extract_headings(soup):
     """Extract H1-H3 headings."""
     headings = {}
@@ -135,7 +229,7 @@ def detect_schema_types(soup):
         schema_type = schema_url.split("/")[-1] if "/" in schema_url else schema_url
         if schema_type:
             schemas.append(schema_type)
-    return list(set(schemas))
+    return sorted(set(schemas), key=str)
 
 
 def detect_technologies(html_text):
@@ -148,27 +242,16 @@ def detect_technologies(html_text):
     return sorted(found)
 
 
-def scrape_url(url):
-    """Main scraping function."""
-    if not url.startswith("http"):
-        url = "https://" + url
+def resolve_parser(name="auto"):
+    """Map --parser to a BeautifulSoup tree builder name."""
+    if name == "auto":
+        return "lxml" if HAS_LXML else "html.parser"
+    return name
 
-    allowed, robots_msg = check_robots_txt(url)
-    if not allowed:
-        return {"error": robots_msg, "url": url}
-
-    # Rate limiting: small delay
-    time.sleep(random.uniform(0.5, 1.5))
-
-    headers = {"User-Agent": random.choice(USER_AGENTS)}
-    try:
-        resp = requests.get(url, timeout=15, headers=headers, allow_redirects=True)
-        resp.raise_for_status()
-    except requests.RequestException as e:
-        return {"error": f"Request failed: {str(e)}", "url": url}
 
-    html = resp.text
-    soup = BeautifulSoup(html, "html.parser")
+def parse_page(html, url, final_url, status_code, robots_msg, parser="html.parser"):
+    """Build the scrape result for an already-fetched page."""
+    soup = BeautifulSoup(html, parser)
 
     title_tag = soup.find("title")
     meta_desc_tag = soup.find("meta", attrs={"name": "description"})
@@ -177,10 +260,10 @@ def scrape_url(url):
     og_title = soup.find("meta", attrs={"property": "og:title"})
     og_desc = soup.find("meta", attrs={"property": "og:description"})
 
-    result = {
+    return {
         "url": url,
-        "final_url": resp.url,
-        "status_code": resp.status_code,
+        "final_url": final_url,
+        "status_code": status_code,
         "title": title_tag.get_text(strip=True) if title_tag else None,
         "meta_description": meta_desc_tag.get("content", "").strip() if meta_desc_tag else None,
         "meta_keywords": meta_kw_tag.get("content", "").strip() if meta_kw_tag else None,
@@ -192,27 +275,278 @@ def scrape_url(url):
         "schema_types": detect_schema_types(soup),
         "technologies_detected": detect_technologies(html),
         "robots_txt": robots_msg,
-        "legal_disclaimer": (
-            "This data was collected from publicly accessible web pages. "
-            "No login-protected or paywalled content was accessed. "
-            "Use responsibly and in compliance with applicable laws and terms of service."
-        ),
+        "legal_disclaimer": LEGAL_DISCLAIMER,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Snapshots
+# ---------------------------------------------------------------------------
+
+def _slugify(name):
+    """Create a filesystem-safe slug from a name (same as competitor-tracker.py)."""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+def snapshot_dir(slug, competitor):
+    return BRANDS_DIR / slug / "competitors" / _slugify(competitor) / "snapshots"
+
+
+def save_snapshot(snap_dir, result, html):
+    """Store html gzip-compressed (content-addressed) and record the fetch in index.json."""
+    data = html.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    path = snap_dir / f"{digest}.html.gz"
+    snap_dir.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        tmp = path.with_name(path.name + f".{threading.get_ident()}.tmp")
+        tmp.write_bytes(gzip.compress(data, compresslevel=6))
+        tmp.replace(path)
+
+    entry = {
+        "file": path.name,
+        "url": result["url"],
+        "final_url": result["final_url"],
+        "status_code": result["status_code"],
+        "robots_txt": result["robots_txt"],
+        "fetched_at": datetime.now().isoformat(),
+        "bytes": len(data),
     }
+    index_path = snap_dir / "index.json"
+    with locked(index_path):
+        index = load_json(index_path, [])
+        index.append(entry)
+        save_json(index_path, index)
+    return path
+
+
+def parse_snapshot(path, parser="html.parser"):
+    """Re-run extraction on a stored snapshot without refetching."""
+    path = Path(path).expanduser()
+    if not path.exists():
+        return {"error": f"Snapshot not found: {path}"}
+    try:
+        html = gzip.decompress(path.read_bytes()).decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        return {"error": f"Could not read snapshot {path}: {e}"}
+
+    entries = [e for e in load_json(path.parent / "index.json", []) if e.get("file") == path.name]
+    meta = entries[-1] if entries else {}
+    url = meta.get("url") or meta.get("final_url") or ""
+    result = parse_page(html, url, meta.get("final_url", url), meta.get("status_code"),
+                        meta.get("robots_txt", "Parsed from stored snapshot"), parser)
+    result["snapshot"] = str(path)
+    result["fetched_at"] = meta.get("fetched_at")
     return result
 
 
+# ---------------------------------------------------------------------------
+# Fetching
+# ---------------------------------------------------------------------------
+
+def scrape_url(url, parser="html.parser", session=None, robots=None, snap_dir=None, pace=None):
+    """Main scraping function.
+
+    Batch mode passes a per-domain session, a shared RobotsCache and a
+    per-domain pace() that replaces the fixed pre-request sleep.
+    """
+    if not url.startswith("http"):
+        url = "https://" + url
+
+    allowed, robots_msg = check_robots_txt(url, robots, session)
+    if not allowed:
+        return {"error": robots_msg, "url": url}
+
+    # Rate limiting: small delay
+    if pace is None:
+        time.sleep(random.uniform(*DELAY_RANGE))
+    else:
+        pace()
+
+    get = session.get if session is not None else requests.get
+    headers = {"User-Agent": random.choice(USER_AGENTS)}
+    try:
+        resp = get(url, timeout=15, headers=headers, allow_redirects=True)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        return {"error": f"Request failed: {str(e)}", "url": url}
+
+    html = resp.text
+    result = parse_page(html, url, resp.url, resp.status_code, robots_msg, parser)
+    if snap_dir is not None:
+        result["snapshot"] = str(save_snapshot(snap_dir, result, html))
+    return result
+
+
+def _domain_of(url):
+    if not url.startswith("http"):
+        url = "https://" + url
+    return urlparse(url).netloc.lower()
+
+
+class _DomainPacer:
+    """Keeps a randomised DELAY_RANGE gap between page requests to one domain.
+
+    The first page waits a full gap after its robots.txt fetch; later pages
+    only wait for whatever is left of the gap since the previous request.
+    """
+
+    def __init__(self):
+        self.last = None
+
+    def __call__(self):
+        gap = random.uniform(*DELAY_RANGE)
+        wait = gap if self.last is None else self.last + gap - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        self.last = time.monotonic()
+
+
+def _scrape_domain(urls, parser, robots, snap_dir_for):
+    """Scrape one domain's URLs in order on a single keep-alive session.
+
+    Yields (position, result).
+    """
+    pace = _DomainPacer()
+    with requests.Session() as session:
+        for position, url in urls:
+            try:
+                result = scrape_url(url, parser, session, robots, snap_dir_for(url), pace)
+            except Exception as e:
+                result = {"error": f"Unexpected error: {e}", "url": url}
+            yield position, result
+
+
+def scrape_batch(urls, parser="html.parser", workers=DEFAULT_WORKERS, snap_dir_for=None):
+    """Scrape urls concurrently across domains; yields (position, result) as each finishes.
+
+    Each domain is handled by one worker, so requests to a single site stay
+    sequential and paced while different sites are fetched in parallel.
+    """
+    by_domain = {}
+    for position, url in enumerate(urls):
+        by_domain.setdefault(_domain_of(url), []).append((position, url))
+
+    robots = RobotsCache()
+    snap_dir_for = snap_dir_for or (lambda url: None)
+    finished = queue.Queue()
+
+    def _run(domain_urls):
+        try:
+            for item in _scrape_domain(domain_urls, parser, robots, snap_dir_for):
+                finished.put(item)
+        finally:
+            finished.put(None)  # this domain is done
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for domain_urls in by_domain.values():
+            pool.submit(_run, domain_urls)
+        remaining = len(by_domain)
+        while remaining:
+            item = finished.get()
+            if item is None:
+                remaining -= 1
+            else:
+                yield item
+
+
+def _read_urls(args):
+    """Collect batch URLs from --urls / --urls-file. Returns (urls, error)."""
+    urls = []
+    if args.urls:
+        try:
+            parsed = json.loads(args.urls)
+        except json.JSONDecodeError as e:
+            return None, f"Invalid JSON in --urls: {e}"
+        if not isinstance(parsed, list):
+            return None, "--urls must be a JSON array of strings"
+        urls.extend(u.strip() for u in parsed if isinstance(u, str) and u.strip())
+    if args.urls_file:
+        path = Path(args.urls_file)
+        if not path.exists():
+            return None, f"File not found: {args.urls_file}"
+        for line in path.read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#"):
+                urls.append(line)
+    return urls, None
+
+
 def main():
     parser = argparse.ArgumentParser(description="Extract public competitor data from URLs")
-    parser.add_argument("--url", required=True, help="Competitor URL to analyze")
-    parser.add_argument("--output", default="json", help="Output format (json)")
+    parser.add_argument("--url", help="Competitor URL to analyze")
+    parser.add_argument("--urls", help="JSON array of URLs to analyze in one batch")
+    parser.add_argument("--urls-file", help="File with one URL per line (# comments allowed)")
+    parser.add_argument("--snapshot", help="Re-parse a stored .html.gz snapshot instead of fetching")
+    parser.add_argument("--brand", help="Brand slug; store compressed HTML snapshots for competitor-tracker.py")
+    parser.add_argument("--competitor", help="Competitor name for snapshots (default: each URL's domain)")
+    parser.add_argument("--parser", default="auto", choices=["auto", "lxml", "html.parser"],
+                        help="HTML parser (default: auto = lxml when installed)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"Domains scraped concurrently in batch mode (default: {DEFAULT_WORKERS})")
+    parser.add_argument("--output", default="json", choices=["json", "jsonl"],
+                        help="Output format: json, or jsonl to stream batch results as they finish")
     args = parser.parse_args()
 
-    if not args.url.strip():
-        print(json.dumps({"error": "URL cannot be empty"}))
+    html_parser = resolve_parser(args.parser)
+    if html_parser == "lxml" and not HAS_LXML:
+        print(json.dumps({"error": "lxml not installed. Install with: pip install lxml, or use --parser html.parser"}))
+        sys.exit(1)
+
+    if args.snapshot:
+        result = parse_snapshot(args.snapshot, html_parser)
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+
+    snap_dir_for = None
+    if args.brand:
+        if not (BRANDS_DIR / args.brand).exists():
+            print(json.dumps({"error": f"Brand '{args.brand}' not found. Run /dm:brand-setup first."}))
+            sys.exit(1)
+        if args.competitor:
+            fixed_dir = snapshot_dir(args.brand, args.competitor)
+            snap_dir_for = lambda url: fixed_dir  # noqa: E731
+        else:
+            snap_dir_for = lambda url: snapshot_dir(args.brand, _domain_of(url))  # noqa: E731
+
+    if not (args.urls or args.urls_file):
+        if not args.url or not args.url.strip():
+            print(json.dumps({"error": "Provide --url, --urls, --urls-file, or --snapshot"}))
+            sys.exit(1)
+        url = args.url.strip()
+        result = scrape_url(url, html_parser, snap_dir=snap_dir_for(url) if snap_dir_for else None)
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+
+    urls, error = _read_urls(args)
+    if error:
+        print(json.dumps({"error": error}))
+        sys.exit(1)
+    if args.url and args.url.strip():
+        urls.insert(0, args.url.strip())
+    if not urls:
+        print(json.dumps({"error": "No URLs to scrape"}))
         sys.exit(1)
 
-    result = scrape_url(args.url.strip())
-    json.dump(result, sys.stdout, indent=2)
+    start = time.monotonic()
+    summary = {"urls": len(urls), "scraped": 0, "failed": 0,
+               "domains": len({_domain_of(u) for u in urls}), "parser": html_parser}
+    results = [None] * len(urls)
+    for position, result in scrape_batch(urls, html_parser, args.workers, snap_dir_for):
+        summary["failed" if "error" in result else "scraped"] += 1
+        if args.output == "jsonl":
+            sys.stdout.write(json.dumps(result) + "\n")
+            sys.stdout.flush()
+        else:
+            results[position] = result
+    summary["elapsed_seconds"] = round(time.monotonic() - start, 2)
+
+    if args.output == "jsonl":
+        sys.stdout.write(json.dumps({"summary": summary}) + "\n")
+        return
+    json.dump({"results": results, "summary": summary}, sys.stdout, indent=2)
     print()
 
 
@@ -10,9 +10,15 @@ alert summaries across the full competitive landscape.
 
 Storage: ~/.claude-marketing/brands/{slug}/competitors/
 
+save-baseline and scan accept --snapshot instead of --data: a page stored by
+`competitor-scraper.py --brand` (a .html.gz path, or "latest" for the
+competitor's newest snapshot of its baseline URL) is re-parsed by
+competitor-scraper.py, so a diff can be rerun without refetching the site.
+
 Usage:
     python competitor-tracker.py --brand acme --action save-baseline --competitor Rival --url https://rival.com --data '{"tagline": "We do X", "key_features": ["A","B"]}'
     python competitor-tracker.py --brand acme --action scan --competitor Rival --data '{"tagline": "We do Y"}'
+    python competitor-tracker.py --brand acme --action scan --competitor Rival --snapshot latest
     python competitor-tracker.py --brand acme --action diff --competitor Rival
     python competitor-tracker.py --brand acme --action track-mentions --competitor Rival --platform reddit --sentiment positive --content "Saw Rival praised"
     python competitor-tracker.py --brand acme --action share-of-voice --data '{"keywords": [{"keyword": "crm software", "your_rank": 3, "competitor_ranks": {"Rival": 1}}]}'
@@ -26,11 +32,12 @@ Usage:
 import argparse
 import json
 import re
+import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, locked, save_json
 
 MENTION_PLATFORMS = ["reddit", "twitter", "linkedin", "news", "blog", "forum"]
 SENTIMENTS = ["positive", "negative", "neutral"]
@@ -38,13 +45,12 @@ AD_PLATFORMS = ["google", "meta", "linkedin", "tiktok"]
 AD_TYPES = ["search", "display", "social", "video"]
 OUTCOMES = ["won", "lost"]
 
-
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+SCRAPER_SCRIPT = Path(__file__).resolve().parent / "competitor-scraper.py"
+SNAPSHOT_FIELDS = [
+    "title", "meta_description", "meta_keywords", "canonical", "og_title",
+    "og_description", "headings", "social_links", "schema_types",
+    "technologies_detected",
+]
 
 
 def _slugify(name):
@@ -54,32 +60,51 @@ def _slugify(name):
 
 def _load_json(path):
     """Safely load a JSON file."""
-    if not path.exists():
-        return []
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data if isinstance(data, list) else [data]
-    except (json.JSONDecodeError, OSError):
-        return []
+    data = load_json(path, [])
+    return data if isinstance(data, list) else [data]
 
 
 def _load_json_obj(path):
     """Safely load a JSON file expecting an object."""
-    if not path.exists():
-        return {}
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return load_json(path, {})
 
 
 def _save_json(path, data):
     """Write JSON data to file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
+    save_json(path, data)
+
+
+def _snapshot_data(comp_dir, snapshot, url=None):
+    """Extract tracked fields from a competitor-scraper.py snapshot.
+
+    snapshot is a .html.gz path or "latest" (newest snapshot of url, or of
+    any URL when url is None). Returns (data, page_url, error).
+    """
+    if snapshot == "latest":
+        entries = _load_json(comp_dir / "snapshots" / "index.json")
+        if url:
+            entries = [e for e in entries if url in (e.get("url"), e.get("final_url"))]
+        if not entries:
+            target = f" of {url}" if url else ""
+            return None, None, f"No stored snapshots{target}. Run competitor-scraper.py with --brand first."
+        path = comp_dir / "snapshots" / entries[-1]["file"]
+    else:
+        path = Path(snapshot).expanduser()
 
-def save_baseline(slug, competitor, url, data):
+    try:
+        proc = subprocess.run(
+            [sys.executable, str(SCRAPER_SCRIPT), "--snapshot", str(path)],
+            capture_output=True, text=True, timeout=120,
+        )
+        page = json.loads(proc.stdout)
+    except (OSError, subprocess.TimeoutExpired, ValueError):
+        return None, None, f"Could not parse snapshot {path} with competitor-scraper.py"
+    if page.get("fallback") or page.get("error"):
+        return None, None, page.get("message") or page.get("error")
+    return {k: page[k] for k in SNAPSHOT_FIELDS if k in page}, page.get("url"), None
+
+
+def save_baseline(slug, competitor, url, data, snapshot=None):
     """Save initial competitor snapshot."""
     brand_dir, err = get_brand_dir(slug)
     if err:
@@ -89,10 +114,16 @@ def save_baseline(slug, competitor, url, data):
     comp_dir = brand_dir / "competitors" / comp_slug
     comp_dir.mkdir(parents=True, exist_ok=True)
 
-    try:
-        parsed = json.loads(data) if isinstance(data, str) else data
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON in --data"}
+    if snapshot:
+        parsed, page_url, err = _snapshot_data(comp_dir, snapshot, url)
+        if err:
+            return {"error": err}
+        url = url or page_url
+    else:
+        try:
+            parsed = json.loads(data) if isinstance(data, str) else data
+        except json.JSONDecodeError:
+            return {"error": "Invalid JSON in --data"}
 
     baseline = {
         "competitor": competitor,
@@ -112,7 +143,7 @@ def save_baseline(slug, competitor, url, data):
     }
 
 
-def scan(slug, competitor, data):
+def scan(slug, competitor, data, snapshot=None):
     """Compare current competitor data against baseline."""
     brand_dir, err = get_brand_dir(slug)
     if err:
@@ -121,14 +152,19 @@ def scan(slug, competitor, data):
     comp_slug = _slugify(competitor)
     comp_dir = brand_dir / "competitors" / comp_slug
 
-    try:
-        current = json.loads(data) if isinstance(data, str) else data
-    except json.JSONDecodeError:
-        return {"error": "Invalid JSON in --data"}
-
     baseline = _load_json_obj(comp_dir / "baseline.json")
     baseline_data = baseline.get("data", {})
 
+    if snapshot:
+        current, _, err = _snapshot_data(comp_dir, snapshot, baseline.get("url"))
+        if err:
+            return {"error": err}
+    else:
+        try:
+            current = json.loads(data) if isinstance(data, str) else data
+        except json.JSONDecodeError:
+            return {"error": "Invalid JSON in --data"}
+
     # Calculate diff
     new_fields = [k for k in current if k not in baseline_data]
     removed_fields = [k for k in baseline_data if k not in current]
@@ -152,9 +188,10 @@ def scan(slug, competitor, data):
 
     # Save scan history
     scans_path = comp_dir / "scans.json"
-    scans = _load_json(scans_path)
-    scans.append(scan_result)
-    _save_json(scans_path, scans)
+    with locked(scans_path):
+        scans = _load_json(scans_path)
+        scans.append(scan_result)
+        _save_json(scans_path, scans)
 
     return scan_result
 
@@ -438,6 +475,8 @@ def main():
     parser.add_argument("--competitor", help="Competitor name")
     parser.add_argument("--url", help="Competitor URL (save-baseline) or source URL")
     parser.add_argument("--data", help="JSON data payload")
+    parser.add_argument("--snapshot",
+                        help="competitor-scraper.py snapshot (.html.gz path or 'latest') used instead of --data (save-baseline, scan)")
     parser.add_argument("--platform", choices=MENTION_PLATFORMS + AD_PLATFORMS,
                         help="Platform (track-mentions, track-ads)")
     parser.add_argument("--sentiment", choices=SENTIMENTS, help="Mention sentiment")
@@ -451,16 +490,20 @@ def main():
     args = parser.parse_args()
 
     if args.action == "save-baseline":
-        if not args.competitor or not args.url or not args.data:
-            print(json.dumps({"error": "Provide --competitor, --url, and --data"}))
+        if args.snapshot:
+            if not args.competitor:
+                print(json.dumps({"error": "Provide --competitor with --snapshot"}))
+                sys.exit(1)
+        elif not args.competitor or not args.url or not args.data:
+            print(json.dumps({"error": "Provide --competitor, --url, and --data (or --snapshot)"}))
             sys.exit(1)
-        result = save_baseline(args.brand, args.competitor, args.url, args.data)
+        result = save_baseline(args.brand, args.competitor, args.url, args.data, args.snapshot)
 
     elif args.action == "scan":
-        if not args.competitor or not args.data:
-            print(json.dumps({"error": "Provide --competitor and --data"}))
+        if not args.competitor or not (args.data or args.snapshot):
+            print(json.dumps({"error": "Provide --competitor and --data (or --snapshot)"}))
             sys.exit(1)
-        result = scan(args.brand, args.competitor, args.data)
+        result = scan(args.brand, args.competitor, args.data, args.snapshot)
 
     elif args.action == "diff":
         if not args.competitor:
@@ -16,6 +16,9 @@ Usage:
     python content-scorer.py --file email.txt --type email
 
 Content Types:  blog | email | ad | landing_page | social
+
+When scorer-daemon.py is running, requests are served by the warm daemon;
+pass --no-daemon to always score in this process.
 """
 
 import argparse
@@ -24,6 +27,22 @@ import re
 import sys
 from pathlib import Path
 
+import scorer_client
+
+# ---------------------------------------------------------------------------
+# Scorer daemon fast path — when scorer-daemon.py is running, hand the request
+# to it before importing NLTK; otherwise continue with the normal CLI below.
+# ---------------------------------------------------------------------------
+CONTENT_TYPES = ("blog", "email", "ad", "landing_page", "social")
+
+if __name__ == "__main__":
+    scorer_client.fast_path(
+        "content.score",
+        {"--type": "content_type", "--keyword": "keyword"},
+        required=("content_type",),
+        choices={"content_type": CONTENT_TYPES},
+    )
+
 # ---------------------------------------------------------------------------
 # Dependency checks
 # ---------------------------------------------------------------------------
@@ -888,13 +907,17 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--type", dest="content_type", required=True,
-        choices=list(CONTENT_TYPE_WEIGHTS.keys()),
+        choices=list(CONTENT_TYPES),
         help="Type of marketing content.",
     )
     parser.add_argument(
         "--keyword", type=str, default=None,
         help="Primary SEO keyword to check for (optional).",
     )
+    parser.add_argument(
+        "--no-daemon", action="store_true",
+        help="Score in this process even if scorer-daemon.py is running.",
+    )
     return parser
 
 
@@ -8,9 +8,19 @@ Scores creative health from performance metrics, predicts fatigue dates using
 trend analysis, generates refresh briefs, scans content libraries for decay,
 and prioritizes refresh work by business impact.
 
+fatigue-scan runs the predict-fatigue model over a whole ad account export
+(one row per creative per day: creative_id, date, ctr, cpm, impressions;
+CSV, JSONL or JSON, or Parquet with pyarrow). Histories are loaded into
+columns and every creative's CTR/CPM trend is fitted in one vectorized
+least-squares pass when numpy is installed (per creative otherwise); the
+refresh queue is a partial sort by days remaining, then impressions.
+decay-scan, priority-refresh and batch-health also take their item list
+from a file (--input) and can return only the --top N.
+
 Storage: ~/.claude-marketing/brands/{slug}/creative/
 
-Dependencies: none (stdlib only)
+Dependencies: stdlib only; numpy (optional) for the vectorized fatigue-scan,
+              pyarrow (optional) for fast CSV parsing and Parquet input
 
 Usage:
     python creative-fatigue-predictor.py --action score-health --creative-id ad_001 --data '{"impressions":50000,"frequency":4.2,"ctr_current":0.018,"ctr_baseline":0.025,"cpm_current":12.5,"cpm_baseline":9.0,"engagement_rate_current":0.03,"engagement_rate_baseline":0.05,"days_running":28,"audience_size":200000}'
@@ -19,15 +29,27 @@ Usage:
     python creative-fatigue-predictor.py --action decay-scan --data '[{"content_id":"blog_01","url":"/blog/seo-guide","title":"SEO Guide","monthly_traffic_current":1200,"monthly_traffic_previous":1800,"monthly_traffic_6mo_ago":2500,"keyword_positions_current":{"seo tips":12},"keyword_positions_previous":{"seo tips":7},"publish_date":"2024-06-15","last_updated":"2025-01-10","backlinks":45}]'
     python creative-fatigue-predictor.py --action priority-refresh --data '[{"content_id":"blog_01","monthly_traffic_current":1200,"monthly_traffic_previous":2500,"conversion_rate":0.03,"revenue_per_conversion":50}]'
     python creative-fatigue-predictor.py --action batch-health --data '[...]'
+    python creative-fatigue-predictor.py --action fatigue-scan --input creatives_daily.csv --output predictions.csv --top 50
+    python creative-fatigue-predictor.py --action decay-scan --input content.jsonl --top 25
 """
 
 import argparse
+import csv
+import heapq
+import importlib.util
 import json
 import math
 import sys
-from datetime import datetime
+from array import array
+from itertools import islice
+from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 
@@ -129,19 +151,10 @@ def score_health(creative_id, data):
 
 # ── Predict Fatigue ──────────────────────────────────────────────────────────
 
-def predict_fatigue(creative_id, history):
-    if len(history) < 3:
-        return {"creative_id": creative_id, "error": "Need at least 3 data points for prediction"}
-
-    x = list(range(len(history)))
-    ctrs = [h.get("ctr", 0) for h in history]
-    cpms = [h.get("cpm", 0) for h in history]
-
-    ctr_slope, ctr_intercept = _linear_regression(x, ctrs)
-    cpm_slope, cpm_intercept = _linear_regression(x, cpms)
-
-    baseline_ctr = ctrs[0] if ctrs[0] > 0 else 0.01
-    baseline_cpm = cpms[0] if cpms[0] > 0 else 1.0
+def _fatigue_days(n, ctr_slope, ctr_intercept, cpm_slope, cpm_intercept, ctr0, cpm0):
+    """Days until the CTR or CPM trend line crosses its fatigue threshold (or None)."""
+    baseline_ctr = ctr0 if ctr0 > 0 else 0.01
+    baseline_cpm = cpm0 if cpm0 > 0 else 1.0
     fatigue_ctr = baseline_ctr * 0.70
     fatigue_cpm = baseline_cpm * 1.30
 
@@ -150,58 +163,81 @@ def predict_fatigue(creative_id, history):
     if ctr_slope < 0:
         # Solve: ctr_slope * x + ctr_intercept = fatigue_ctr
         ctr_x = (fatigue_ctr - ctr_intercept) / ctr_slope
-        if ctr_x > len(history):
-            ctr_days = int(ctr_x - len(history))
+        if ctr_x > n:
+            ctr_days = int(ctr_x - n)
 
     cpm_days = None
     if cpm_slope > 0:
         cpm_x = (fatigue_cpm - cpm_intercept) / cpm_slope
-        if cpm_x > len(history):
-            cpm_days = int(cpm_x - len(history))
+        if cpm_x > n:
+            cpm_days = int(cpm_x - n)
 
     # Take the sooner of the two
     candidates = [d for d in [ctr_days, cpm_days] if d is not None]
-    days_remaining = min(candidates) if candidates else None
+    return min(candidates) if candidates else None
 
+
+def _fatigue_confidence(n):
     # Confidence based on data points and trend clarity
-    n = len(history)
     if n >= 14:
-        confidence = "high"
-    elif n >= 7:
-        confidence = "medium"
-    else:
-        confidence = "low"
+        return "high"
+    if n >= 7:
+        return "medium"
+    return "low"
 
-    # Predicted fatigue date
-    predicted_date = None
-    if days_remaining is not None:
-        try:
-            last_date = datetime.strptime(history[-1]["date"], "%Y-%m-%d")
-            from datetime import timedelta
-            predicted_date = (last_date + timedelta(days=days_remaining)).strftime("%Y-%m-%d")
-        except (KeyError, ValueError):
-            pass
 
-    # Recommendation
+def _fatigue_date(last_date, days_remaining):
     if days_remaining is None:
-        rec = "No fatigue trend detected. Creative is performing steadily."
-    elif days_remaining <= 7:
-        rec = "URGENT: Creative fatigue imminent. Prepare replacement creative immediately."
-    elif days_remaining <= 14:
-        rec = "Creative approaching fatigue. Begin developing refresh variants now."
-    elif days_remaining <= 30:
-        rec = "Creative has runway but plan refresh within next sprint."
-    else:
-        rec = "Creative is healthy. Schedule routine review in 2-4 weeks."
+        return None
+    try:
+        last = datetime.strptime(last_date, "%Y-%m-%d")
+        return (last + timedelta(days=days_remaining)).strftime("%Y-%m-%d")
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+# days_remaining ceiling -> (status, recommendation)
+FATIGUE_STATUSES = [
+    (7, "urgent", "URGENT: Creative fatigue imminent. Prepare replacement creative immediately."),
+    (14, "refresh-now", "Creative approaching fatigue. Begin developing refresh variants now."),
+    (30, "plan-refresh", "Creative has runway but plan refresh within next sprint."),
+]
+
+
+def _fatigue_status(days_remaining):
+    """(status, recommendation) for a predicted days_remaining."""
+    if days_remaining is None:
+        return "no-trend", "No fatigue trend detected. Creative is performing steadily."
+    for ceiling, status, rec in FATIGUE_STATUSES:
+        if days_remaining <= ceiling:
+            return status, rec
+    return "healthy", "Creative is healthy. Schedule routine review in 2-4 weeks."
+
+
+def predict_fatigue(creative_id, history):
+    if len(history) < 3:
+        return {"creative_id": creative_id, "error": "Need at least 3 data points for prediction"}
+
+    x = list(range(len(history)))
+    ctrs = [h.get("ctr", 0) for h in history]
+    cpms = [h.get("cpm", 0) for h in history]
+
+    ctr_slope, ctr_intercept = _linear_regression(x, ctrs)
+    cpm_slope, cpm_intercept = _linear_regression(x, cpms)
+    days_remaining = _fatigue_days(len(history), ctr_slope, ctr_intercept,
+                                   cpm_slope, cpm_intercept, ctrs[0], cpms[0])
+
+    # Predicted fatigue date
+    predicted_date = _fatigue_date(history[-1].get("date"), days_remaining)
 
     return {
         "creative_id": creative_id,
         "predicted_fatigue_date": predicted_date,
         "days_remaining": days_remaining,
-        "confidence": confidence,
+        "confidence": _fatigue_confidence(len(history)),
         "ctr_trend_slope": round(ctr_slope, 6),
         "cpm_trend_slope": round(cpm_slope, 4),
-        "recommendation": rec,
+        "recommendation": _fatigue_status(days_remaining)[1],
     }
 
 
@@ -256,9 +292,46 @@ def generate_refresh_brief(creative_id, data):
     }
 
 
+# ── Item lists ───────────────────────────────────────────────────────────────
+
+def _ranked(results, key, top=None):
+    """results sorted by key; with top, only the first top (heap partial sort, same order)."""
+    if top:
+        return heapq.nsmallest(top, results, key=key)
+    results.sort(key=key)
+    return results
+
+
+def _csv_value(value):
+    """CSV cell -> number, parsed JSON (for {...}/[...] cells) or the string itself."""
+    value = value.strip()
+    if value[:1] in "{[":
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    return int(number) if number.is_integer() and "." not in value else number
+
+
+def read_items(path):
+    """Items for decay-scan / priority-refresh / batch-health from a JSON array, JSONL or CSV file."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        if path.suffix.lower() == ".csv":
+            return [{k: _csv_value(v) for k, v in row.items() if k and v is not None and v.strip()}
+                    for row in csv.DictReader(fh)]
+        if path.suffix.lower() == ".json":
+            return json.load(fh)
+        return [json.loads(line) for line in fh if line.strip()]
+
+
 # ── Decay Scan ───────────────────────────────────────────────────────────────
 
-def decay_scan(items):
+def decay_scan(items, top=None):
     results = []
     for item in items:
         cid = item.get("content_id", "unknown")
@@ -342,13 +415,12 @@ def decay_scan(items):
             "priority_score": priority,
         })
 
-    results.sort(key=lambda r: -r["priority_score"])
-    return results
+    return _ranked(results, lambda r: -r["priority_score"], top)
 
 
 # ── Priority Refresh ─────────────────────────────────────────────────────────
 
-def priority_refresh(items):
+def priority_refresh(items, top=None):
     results = []
     for item in items:
         cid = item.get("content_id", "unknown")
@@ -372,20 +444,357 @@ def priority_refresh(items):
             "monthly_revenue_at_risk": round(traffic * cr * rev * decay_sev, 2),
         })
 
-    results.sort(key=lambda r: -r["priority_score"])
-    return results
+    return _ranked(results, lambda r: -r["priority_score"], top)
 
 
 # ── Batch Health ─────────────────────────────────────────────────────────────
 
-def batch_health(items):
+def batch_health(items, top=None):
     results = []
     for item in items:
         cid = item.pop("creative_id", item.pop("id", "unknown"))
         result = score_health(cid, item)
         results.append(result)
-    results.sort(key=lambda r: r["health_score"])
-    return results
+    return _ranked(results, lambda r: r["health_score"], top)
+
+
+# ── Portfolio Fatigue Scan ───────────────────────────────────────────────────
+#
+# fatigue-scan runs predict_fatigue over a whole account export at once. The
+# export is read row by row into compact columns (array.array, with creative
+# ids and dates interned to integer codes), ordered by (creative, date), and
+# every creative's CTR and CPM trend is fitted in one pass: per-creative sums
+# come from np.bincount over the group codes and the x sums are closed form,
+# so the slopes match _linear_regression exactly. The refresh queue is a
+# partial sort (argpartition / heapq) over days remaining.
+
+HISTORY_FIELDS = ("date", "ctr", "cpm", "impressions")
+SCAN_OUTPUT_FIELDS = ["creative_id", "data_points", "days_remaining", "predicted_fatigue_date", "status",
+                      "confidence", "ctr_trend_slope", "cpm_trend_slope", "avg_daily_impressions"]
+DEFAULT_TOP = 50
+CHUNK_SIZE = 50000
+
+
+def _num(value):
+    """float of a cell/field value; blanks, junk and missing values count as 0."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _iter_history_chunks(path, id_column, chunk_size=CHUNK_SIZE):
+    """Yield (ids, dates, ctr, cpm, impressions) column chunks from a CSV, JSONL or JSON export.
+
+    JSON(L) records are either one daily row ({"creative_id", "date", "ctr",
+    ...}) or one creative with its rows nested under "history". Missing
+    columns come back as None.
+    """
+    if path.suffix.lower() == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            reader = csv.reader(fh)
+            header = [h.strip() for h in next(reader, [])]
+            if id_column not in header:
+                raise ValueError(f"column '{id_column}' not found in {path.name}")
+            idx = [header.index(id_column)] + [header.index(f) if f in header else None for f in HISTORY_FIELDS]
+            width = len(header)
+            while True:
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    return
+                if any(len(r) != width for r in rows):
+                    rows = [(r + [""] * width)[:width] for r in rows]
+                columns = list(zip(*rows))
+                yield [columns[i] if i is not None else None for i in idx]
+
+    def records():
+        with open(path, encoding="utf-8") as fh:
+            if path.suffix.lower() == ".json":
+                yield from json.load(fh)
+                return
+            for line in fh:
+                if line.strip():
+                    yield json.loads(line)
+
+    def rows():
+        for record in records():
+            cid = str(record.get(id_column, record.get("id", "unknown")))
+            for h in record["history"] if isinstance(record.get("history"), list) else [record]:
+                yield (cid, str(h.get("date", "")), h.get("ctr", 0), h.get("cpm", 0), h.get("impressions", 0))
+
+    stream = rows()
+    while True:
+        chunk = list(islice(stream, chunk_size))
+        if not chunk:
+            return
+        yield list(zip(*chunk))
+
+
+def _float_array(values, size):
+    if values is None:
+        return array("d", bytes(8 * size))
+    try:
+        return array("d", map(float, values))
+    except (TypeError, ValueError):
+        return array("d", map(_num, values))
+
+
+class _HistoryColumns:
+    """Creative histories held column-wise; ids and dates interned to int codes."""
+
+    def __init__(self):
+        self.ids = {}
+        self.dates = {}
+        self.code = array("q")
+        self.date = array("q")
+        self.ctr = array("d")
+        self.cpm = array("d")
+        self.impressions = array("d")
+
+    def load(self, chunks):
+        ids, dates = self.ids, self.dates
+        for cids, days, ctr, cpm, imps in chunks:
+            size = len(cids)
+            self.code.extend([ids.setdefault(c, len(ids)) for c in cids])
+            self.date.extend([dates.setdefault(d, len(dates)) for d in days] if days is not None
+                             else [dates.setdefault("", len(dates))] * size)
+            self.ctr.extend(_float_array(ctr, size))
+            self.cpm.extend(_float_array(cpm, size))
+            self.impressions.extend(_float_array(imps, size))
+        # Re-code dates by sort order so (code, date) sorts chronologically
+        self.date_names = sorted(dates)
+        rank = {d: r for r, d in enumerate(self.date_names)}
+        remap = [rank[d] for d in dates]
+        self.date = array("q", [remap[d] for d in self.date])
+        self.id_names = list(ids)
+        return self
+
+    def __len__(self):
+        return len(self.code)
+
+
+def _load_arrow(path, id_column):
+    """_HistoryColumns of numpy arrays via pyarrow's CSV/Parquet reader (None if the CSV needs the stdlib path)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    names = [id_column, *HISTORY_FIELDS]
+    if path.suffix.lower() == ".parquet":
+        import pyarrow.parquet as pq
+
+        present = set(pq.read_schema(path).names)
+        table = pq.read_table(path, columns=[c for c in names if c in present])
+    else:
+        import pyarrow.csv as pcsv
+
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            present = set(next(csv.reader(fh), []))
+        if id_column not in present:
+            return None  # let the stdlib reader report it (or match a padded header)
+        types = {id_column: pa.string(), "date": pa.string(),
+                 **{f: pa.float64() for f in HISTORY_FIELDS[1:]}}
+        try:
+            table = pcsv.read_csv(path, convert_options=pcsv.ConvertOptions(
+                include_columns=[c for c in names if c in present], column_types=types,
+                null_values=[""], strings_can_be_null=False))
+        except pa.ArrowInvalid:
+            return None  # junk numeric cells: _num semantics need the stdlib reader
+    if id_column not in present:
+        raise ValueError(f"column '{id_column}' not found in {path.name}")
+
+    size = table.num_rows
+
+    def encoded(name):
+        if name not in present:
+            return np.zeros(size, dtype=np.int64), [""]
+        column = pc.fill_null(pc.cast(table.column(name), pa.string()), "").combine_chunks().dictionary_encode()
+        return (column.indices.to_numpy(zero_copy_only=False).astype(np.int64),
+                column.dictionary.to_pylist())
+
+    cols = _HistoryColumns()
+    cols.code, cols.id_names = encoded(id_column)
+    dates, date_names = encoded("date")
+    cols.date_names = sorted(date_names)
+    rank = {d: r for r, d in enumerate(cols.date_names)}
+    cols.date = np.array([rank[d] for d in date_names], dtype=np.int64)[dates]
+    for field in HISTORY_FIELDS[1:]:
+        if field in present:
+            values = pc.fill_null(pc.cast(table.column(field), pa.float64()), 0.0).to_numpy()
+        else:
+            values = np.zeros(size)
+        setattr(cols, field, values)
+    return cols
+
+
+def _scan_numpy(cols):
+    """Fit every creative at once; returns per-creative lists (see _scan_python)."""
+    codes = np.asarray(cols.code, dtype=np.int64)
+    dates = np.asarray(cols.date, dtype=np.int64)
+    order = np.lexsort((dates, codes))  # stable: same-day rows keep file order
+    codes, dates = codes[order], dates[order]
+    groups = len(cols.id_names)
+    counts = np.bincount(codes, minlength=groups)
+    starts = np.cumsum(counts) - counts
+    pos = (np.arange(len(codes)) - starts[codes]).astype(np.float64)
+    n = counts.astype(np.float64)
+
+    # x = 0..n-1, so sum(x) and sum(x^2) are closed form (and exact)
+    sx = n * (n - 1) / 2
+    denom = n * ((n - 1) * n * (2 * n - 1) / 6) - sx * sx
+    valid = counts >= 3
+    safe_n = np.where(valid, n, 1.0)
+    safe_denom = np.where(valid, denom, 1.0)
+
+    fits = []
+    for column in (cols.ctr, cols.cpm):
+        y = np.asarray(column, dtype=np.float64)[order]
+        sy = np.bincount(codes, weights=y, minlength=groups)
+        sxy = np.bincount(codes, weights=pos * y, minlength=groups)
+        slope = (n * sxy - sx * sy) / safe_denom
+        intercept = (sy - slope * sx) / safe_n
+        fits.append((slope, intercept, y[starts]))
+    (ctr_slope, ctr_icpt, ctr0), (cpm_slope, cpm_icpt, cpm0) = fits
+
+    # Vectorized _fatigue_days; inf marks "no crossover"
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ctr_x = (np.where(ctr0 > 0, ctr0, 0.01) * 0.70 - ctr_icpt) / ctr_slope
+        cpm_x = (np.where(cpm0 > 0, cpm0, 1.0) * 1.30 - cpm_icpt) / cpm_slope
+    ctr_days = np.where((ctr_slope < 0) & (ctr_x > n), np.floor(ctr_x - n), np.inf)
+    cpm_days = np.where((cpm_slope > 0) & (cpm_x > n), np.floor(cpm_x - n), np.inf)
+    days = np.minimum(ctr_days, cpm_days)
+
+    imps = np.bincount(codes, weights=np.asarray(cols.impressions, dtype=np.float64)[order], minlength=groups)
+    last_date = dates[starts + counts - 1]
+    return {
+        "valid": valid.tolist(), "n": counts.tolist(), "days": days.tolist(),
+        "ctr_slope": ctr_slope.tolist(), "cpm_slope": cpm_slope.tolist(),
+        "avg_impressions": (imps / np.maximum(n, 1)).tolist(), "last_date": last_date.tolist(),
+    }
+
+
+def _scan_python(cols):
+    """Per-creative fallback: group rows, then _linear_regression each creative."""
+    members = [[] for _ in cols.id_names]
+    for i, c in enumerate(cols.code):
+        members[c].append(i)
+    out = {k: [] for k in ("valid", "n", "days", "ctr_slope", "cpm_slope", "avg_impressions", "last_date")}
+    date = cols.date
+    for rows in members:
+        rows.sort(key=date.__getitem__)
+        n = len(rows)
+        ctrs = [cols.ctr[i] for i in rows]
+        cpms = [cols.cpm[i] for i in rows]
+        valid = n >= 3
+        if valid:
+            x = list(range(n))
+            ctr_slope, ctr_icpt = _linear_regression(x, ctrs)
+            cpm_slope, cpm_icpt = _linear_regression(x, cpms)
+            days = _fatigue_days(n, ctr_slope, ctr_icpt, cpm_slope, cpm_icpt, ctrs[0], cpms[0])
+        else:
+            ctr_slope = cpm_slope = 0.0
+            days = None
+        out["valid"].append(valid)
+        out["n"].append(n)
+        out["days"].append(float("inf") if days is None else float(days))
+        out["ctr_slope"].append(ctr_slope)
+        out["cpm_slope"].append(cpm_slope)
+        out["avg_impressions"].append(sum(cols.impressions[i] for i in rows) / max(n, 1))
+        out["last_date"].append(date[rows[-1]] if rows else 0)
+    return out
+
+
+def _refresh_queue(fit, top_n, use_numpy):
+    """Indexes of the top_n creatives by (days remaining, -avg impressions, file order)."""
+    days, imps, valid = fit["days"], fit["avg_impressions"], fit["valid"]
+    pool = [i for i, v in enumerate(valid) if v and days[i] != float("inf")]
+    if not top_n or not pool:
+        return []
+    if use_numpy and len(pool) > top_n:
+        # Partition on days, keeping every creative tied with the cut-off
+        d = np.asarray(days)[pool]
+        kth = np.partition(d, top_n - 1)[top_n - 1]
+        pool = [pool[i] for i in np.flatnonzero(d <= kth).tolist()]
+    return heapq.nsmallest(top_n, pool, key=lambda i: (days[i], -imps[i], i))
+
+
+def fatigue_scan(input_path, output_path=None, id_column="creative_id", top_n=DEFAULT_TOP, engine="auto"):
+    """predict_fatigue over every creative in an export; returns status counts and the refresh queue."""
+    path = Path(input_path)
+    if not path.exists():
+        return {"error": f"Input file not found: {input_path}"}
+    if engine == "numpy" and np is None:
+        return {"error": "numpy not installed. Use --engine python, or: pip install numpy"}
+    use_numpy = np is not None and engine != "python"
+    suffix = path.suffix.lower()
+    has_arrow = importlib.util.find_spec("pyarrow") is not None
+    if suffix == ".parquet" and not (use_numpy and has_arrow):
+        return {"error": "Parquet input requires numpy and pyarrow. Use CSV/JSONL, or: pip install numpy pyarrow"}
+
+    try:
+        cols = None
+        if use_numpy and has_arrow and suffix in (".csv", ".parquet"):
+            cols = _load_arrow(path, id_column)
+        if cols is None:
+            cols = _HistoryColumns().load(_iter_history_chunks(path, id_column))
+    except (OSError, csv.Error, UnicodeDecodeError, ValueError, KeyError, AttributeError, TypeError) as e:
+        return {"error": f"Cannot read {input_path}: {e}"}
+
+    fit = _scan_numpy(cols) if use_numpy else _scan_python(cols)
+
+    def entry(i):
+        days = fit["days"][i]
+        days = None if days == float("inf") else int(days)
+        status, rec = _fatigue_status(days)
+        return {
+            "creative_id": cols.id_names[i],
+            "data_points": fit["n"][i],
+            "days_remaining": days,
+            "predicted_fatigue_date": _fatigue_date(cols.date_names[fit["last_date"][i]], days),
+            "status": status,
+            "confidence": _fatigue_confidence(fit["n"][i]),
+            "ctr_trend_slope": round(fit["ctr_slope"][i], 6),
+            "cpm_trend_slope": round(fit["cpm_slope"][i], 4),
+            "avg_daily_impressions": round(fit["avg_impressions"][i], 1),
+            "recommendation": rec,
+        }
+
+    status_counts = {s: 0 for s in ("urgent", "refresh-now", "plan-refresh", "healthy", "no-trend")}
+    confidence_counts = {"high": 0, "medium": 0, "low": 0}
+    skipped = 0
+    writer = None
+    fh = open(output_path, "w", newline="", encoding="utf-8") if output_path else None
+    try:
+        if fh:
+            writer = csv.writer(fh)
+            writer.writerow(SCAN_OUTPUT_FIELDS)
+        for i, valid in enumerate(fit["valid"]):
+            if not valid:
+                skipped += 1
+                continue
+            days = fit["days"][i]
+            status_counts[_fatigue_status(None if days == float("inf") else int(days))[0]] += 1
+            confidence_counts[_fatigue_confidence(fit["n"][i])] += 1
+            if writer:
+                row = entry(i)
+                writer.writerow([row[f] if row[f] is not None else "" for f in SCAN_OUTPUT_FIELDS])
+    finally:
+        if fh:
+            fh.close()
+
+    return {
+        "input": str(path),
+        "output": str(output_path) if output_path else None,
+        "engine": "numpy" if use_numpy else "python",
+        "rows_read": len(cols),
+        "creatives_scanned": len(cols.id_names) - skipped,
+        "creatives_skipped": skipped,
+        "skipped_reason": "fewer than 3 data points" if skipped else None,
+        "status_counts": status_counts,
+        "confidence_counts": confidence_counts,
+        "refresh_queue": [entry(i) for i in _refresh_queue(fit, top_n, use_numpy)],
+    }
 
 
 # ── CLI ──────────────────────────────────────────────────────────────────────
@@ -397,12 +806,22 @@ def main():
     parser.add_argument("--action", required=True,
                         choices=["score-health", "predict-fatigue",
                                  "generate-refresh-brief", "decay-scan",
-                                 "priority-refresh", "batch-health"],
+                                 "priority-refresh", "batch-health", "fatigue-scan"],
                         help="Action to perform")
     parser.add_argument("--creative-id", help="Creative/ad identifier")
     parser.add_argument("--data", help="JSON data object or array")
     parser.add_argument("--performance-history",
                         help="JSON array of daily performance data (for predict-fatigue)")
+    parser.add_argument("--input",
+                        help="CSV, JSONL or JSON file: daily creative rows for fatigue-scan, "
+                             "or the item list for decay-scan / priority-refresh / batch-health")
+    parser.add_argument("--output", help="fatigue-scan: write every creative's prediction to this CSV")
+    parser.add_argument("--id-column", dest="id_column", default="creative_id",
+                        help="fatigue-scan: creative id column (default: creative_id)")
+    parser.add_argument("--top", type=int, default=None,
+                        help=f"Keep only the top N ranked results (fatigue-scan default: {DEFAULT_TOP})")
+    parser.add_argument("--engine", choices=["auto", "numpy", "python"], default="auto",
+                        help="fatigue-scan engine: numpy (vectorized) or python (per creative)")
 
     args = parser.parse_args()
 
@@ -413,6 +832,23 @@ def main():
             print(json.dumps({"error": f"Invalid JSON in {label}: {e}"}))
             sys.exit(1)
 
+    def _items(action):
+        if args.input:
+            try:
+                data = read_items(args.input)
+            except (OSError, csv.Error, UnicodeDecodeError, ValueError) as e:
+                print(json.dumps({"error": f"Cannot read {args.input}: {e}"}))
+                sys.exit(1)
+        elif args.data:
+            data = _parse_json(args.data)
+        else:
+            print(json.dumps({"error": f"--data or --input required for {action} (JSON array)"}))
+            sys.exit(1)
+        if not isinstance(data, list):
+            print(json.dumps({"error": f"--data must be a JSON array for {action}"}))
+            sys.exit(1)
+        return data
+
     if args.action == "score-health":
         if not args.creative_id or not args.data:
             print(json.dumps({"error": "--creative-id and --data required for score-health"}))
@@ -432,34 +868,20 @@ def main():
         result = generate_refresh_brief(args.creative_id, _parse_json(args.data))
 
     elif args.action == "decay-scan":
-        if not args.data:
-            print(json.dumps({"error": "--data required for decay-scan (JSON array)"}))
-            sys.exit(1)
-        data = _parse_json(args.data)
-        if not isinstance(data, list):
-            print(json.dumps({"error": "--data must be a JSON array for decay-scan"}))
-            sys.exit(1)
-        result = decay_scan(data)
+        result = decay_scan(_items("decay-scan"), args.top)
 
     elif args.action == "priority-refresh":
-        if not args.data:
-            print(json.dumps({"error": "--data required for priority-refresh (JSON array)"}))
-            sys.exit(1)
-        data = _parse_json(args.data)
-        if not isinstance(data, list):
-            print(json.dumps({"error": "--data must be a JSON array for priority-refresh"}))
-            sys.exit(1)
-        result = priority_refresh(data)
+        result = priority_refresh(_items("priority-refresh"), args.top)
 
     elif args.action == "batch-health":
-        if not args.data:
-            print(json.dumps({"error": "--data required for batch-health (JSON array)"}))
-            sys.exit(1)
-        data = _parse_json(args.data)
-        if not isinstance(data, list):
-            print(json.dumps({"error": "--data must be a JSON array for batch-health"}))
+        result = batch_health(_items("batch-health"), args.top)
+
+    elif args.action == "fatigue-scan":
+        if not args.input:
+            print(json.dumps({"error": "--input required for fatigue-scan (CSV or JSONL export)"}))
             sys.exit(1)
-        result = batch_health(data)
+        top = DEFAULT_TOP if args.top is None else max(0, args.top)
+        result = fatigue_scan(args.input, args.output, args.id_column, top, args.engine)
 
     json.dump(result, sys.stdout, indent=2)
     print()
@@ -14,21 +14,33 @@ Usage:
     python crm-sync.py --brand acme --action prepare-contact --data '{"email": "j@co.com", "name": "Jane", "source": "webinar"}'
     python crm-sync.py --brand acme --action prepare-deal --data '{"deal_name": "Enterprise Plan", "stage": "proposal", "value": 25000, "currency": "USD", "contact_email": "j@co.com", "pipeline": "sales"}'
     python crm-sync.py --brand acme --action check-dedup --data '{"email": "j@co.com"}'
+    python crm-sync.py --brand acme --action check-dedup --batch leads.csv --fuzzy
     python crm-sync.py --brand acme --action log-synced --data '{"record_type": "contact", "crm_platform": "hubspot", "crm_record_id": "hs_123", "local_id": "abc123"}'
     python crm-sync.py --brand acme --action get-sync-history --platform hubspot --type contact --limit 50
     python crm-sync.py --brand acme --action get-crm-status
+
+Dedup index:
+    _contacts_index.json holds contacts keyed by local_id plus hashed lookup
+    tables on normalized email, normalized phone (digits only) and a
+    company+name key, so check-dedup is a few dict lookups instead of a scan
+    of every contact. prepare-contact and log-synced update it incrementally;
+    indexes written by older versions (a plain list) are converted on load.
+    --batch checks a whole CSV (email, phone, company, name columns) in one
+    pass, including duplicates within the file itself. --fuzzy adds
+    edit-distance matching on the email local part and name, compared only
+    within the same email domain (blocking keeps it near-linear).
 """
 
 import argparse
+import csv
 import hashlib
 import json
 import os
 import re
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, locked, save_json
 
 CRM_ENV_VARS = {
     "salesforce": "SALESFORCE_ACCESS_TOKEN",
@@ -43,30 +55,28 @@ VALID_DEAL_STAGES = [
     "lead", "qualified", "proposal", "negotiation", "closed-won", "closed-lost",
 ]
 
+INDEX_VERSION = 2
+FUZZY_MAX_DISTANCE = 2
+FUZZY_MIN_LENGTH = 4  # shorter local parts / names are too ambiguous to fuzz
+
+# Name similarity within these domains says nothing about the company
+FREE_MAIL_DOMAINS = {
+    "gmail.com", "googlemail.com", "yahoo.com", "hotmail.com", "outlook.com",
+    "live.com", "msn.com", "aol.com", "icloud.com", "me.com", "proton.me",
+    "protonmail.com", "gmx.com", "mail.com", "yandex.com", "zoho.com",
+}
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+COMPANY_SUFFIXES = {"inc", "llc", "ltd", "limited", "corp", "corporation", "co", "gmbh", "plc", "sa", "bv"}
 
 
 def _load_json(path, default=None):
     """Safely load a JSON file, returning default on missing/corrupt."""
-    if default is None:
-        default = []
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, [] if default is None else default)
 
 
 def _save_json(path, data):
     """Atomically write JSON to a file."""
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _validate_email(email):
@@ -79,6 +89,168 @@ def _generate_local_id(email):
     return hashlib.sha256(email.lower().strip().encode("utf-8")).hexdigest()[:12]
 
 
+def _normalize_email(email):
+    return (email or "").strip().lower()
+
+
+def _normalize_phone(phone):
+    """Digits only, without an international 00 prefix ("+1 (555) 010-0123" -> "15550100123")."""
+    digits = re.sub(r"\D", "", str(phone or ""))
+    return digits[2:] if digits.startswith("00") else digits
+
+
+def _normalize_words(text):
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", str(text or "").lower()).split())
+
+
+def _company_name_key(company, name):
+    """Case/punctuation-insensitive company+name key, ignoring legal suffixes."""
+    company_words = _normalize_words(company).split()
+    while company_words and company_words[-1] in COMPANY_SUFFIXES:
+        company_words.pop()
+    name = _normalize_words(name)
+    if not company_words or not name:
+        return ""
+    return " ".join(company_words) + "|" + name
+
+
+def _edit_distance(a, b, limit):
+    """Levenshtein distance between a and b, or None if it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        # Only cells within `limit` of the diagonal can stay within the limit
+        lo = max(1, i - limit)
+        hi = min(len(b), i + limit)
+        if lo > 1:
+            current[lo - 1] = limit + 1
+        for j in range(lo, hi + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1,
+                             previous[j - 1] + (ca != b[j - 1]))
+        if hi < len(b):
+            current[hi + 1:] = [limit + 1] * (len(b) - hi)
+        if min(current[lo - 1:hi + 1]) > limit:
+            return None
+        previous = current
+    return previous[-1] if previous[-1] <= limit else None
+
+
+class ContactIndex:
+    """Contacts keyed by local_id with hashed email / phone / company+name lookups.
+
+    Serialized as {"version", "contacts", "by_phone", "by_company_name"};
+    email needs no table because local_id is derived from the email.
+    Insertion order of "contacts" is the order contacts were (re)added.
+    """
+
+    def __init__(self, data=None):
+        self.contacts = {}
+        self.by_phone = {}
+        self.by_company_name = {}
+        self._domains = None
+        if isinstance(data, list):  # pre-v2 index: a flat list of entries
+            for entry in data:
+                if entry.get("email"):
+                    self.add(entry)
+        elif isinstance(data, dict):
+            self.contacts = data.get("contacts", {})
+            self.by_phone = data.get("by_phone", {})
+            self.by_company_name = data.get("by_company_name", {})
+
+    def to_json(self):
+        return {
+            "version": INDEX_VERSION,
+            "contacts": self.contacts,
+            "by_phone": self.by_phone,
+            "by_company_name": self.by_company_name,
+        }
+
+    def __len__(self):
+        return len(self.contacts)
+
+    @staticmethod
+    def _keys(entry):
+        return _normalize_phone(entry.get("phone")), _company_name_key(entry.get("company"), entry.get("name"))
+
+    def add(self, entry):
+        local_id = entry.get("local_id") or _generate_local_id(entry["email"])
+        self.remove(local_id)
+        self.contacts[local_id] = {**entry, "local_id": local_id}
+        phone, company_name = self._keys(entry)
+        if phone:
+            self.by_phone.setdefault(phone, []).append(local_id)
+        if company_name:
+            self.by_company_name.setdefault(company_name, []).append(local_id)
+        if self._domains is not None:
+            self._domains.setdefault(entry["email"].rpartition("@")[2], []).append(local_id)
+        return local_id
+
+    def remove(self, local_id):
+        entry = self.contacts.pop(local_id, None)
+        if entry is None:
+            return None
+        phone, company_name = self._keys(entry)
+        for table, key in ((self.by_phone, phone), (self.by_company_name, company_name)):
+            ids = table.get(key)
+            if ids and local_id in ids:
+                ids.remove(local_id)
+                if not ids:
+                    del table[key]
+        if self._domains is not None:
+            ids = self._domains.get(entry["email"].rpartition("@")[2], [])
+            if local_id in ids:
+                ids.remove(local_id)
+        return entry
+
+    def match(self, email, phone="", company="", name=""):
+        """Exact matches as {local_id: match_type}, strongest type per contact."""
+        found = {}
+        local_id = _generate_local_id(email) if email else None
+        if local_id in self.contacts:
+            found[local_id] = "email"
+        phone = _normalize_phone(phone)
+        for other in self.by_phone.get(phone, []) if phone else []:
+            found.setdefault(other, "phone")
+        key = _company_name_key(company, name)
+        for other in self.by_company_name.get(key, []) if key else []:
+            found.setdefault(other, "company+name")
+        return found
+
+    def fuzzy_match(self, email, name="", max_distance=FUZZY_MAX_DISTANCE):
+        """Near-duplicates sharing the email domain: {local_id: (match_type, distance)}.
+
+        Compares the email local part, and for non-free-mail domains also the
+        normalized name, against contacts in the same domain block only.
+        """
+        if self._domains is None:
+            self._domains = {}
+            for local_id, entry in self.contacts.items():
+                self._domains.setdefault(entry["email"].rpartition("@")[2], []).append(local_id)
+        local, _, domain = email.rpartition("@")
+        name = _normalize_words(name)
+        found = {}
+        for other in self._domains.get(domain, []):
+            entry = self.contacts[other]
+            if entry["email"] == email:
+                continue
+            if len(local) >= FUZZY_MIN_LENGTH:
+                distance = _edit_distance(local, entry["email"].rpartition("@")[0], max_distance)
+                if distance is not None:
+                    found[other] = ("fuzzy:email", distance)
+                    continue
+            if domain not in FREE_MAIL_DOMAINS and len(name) >= FUZZY_MIN_LENGTH:
+                distance = _edit_distance(name, _normalize_words(entry.get("name")), max_distance)
+                if distance is not None:
+                    found[other] = ("fuzzy:name+domain", distance)
+        return found
+
+
+def _load_contact_index(crm_dir):
+    return ContactIndex(_load_json(crm_dir / "_contacts_index.json", []))
+
+
 def _build_field_mappings(contact):
     """Map generic contact fields to platform-specific formats."""
     return {
@@ -159,20 +331,19 @@ def prepare_contact(slug, data):
     filepath = pending_dir / f"contact-{local_id}.json"
     _save_json(filepath, payload)
 
-    # Update contacts index for dedup
+    # Update contacts index for dedup (re-adding replaces the same email)
     index_path = crm_dir / "_contacts_index.json"
-    index = _load_json(index_path, [])
-    # Remove existing entry for same email (update scenario)
-    index = [e for e in index if e.get("email") != email.lower()]
-    index.append({
-        "local_id": local_id,
-        "email": email.lower(),
-        "name": name,
-        "phone": data.get("phone", ""),
-        "company": data.get("company", ""),
-        "added_at": datetime.now().isoformat(),
-    })
-    _save_json(index_path, index)
+    with locked(index_path):
+        index = _load_contact_index(crm_dir)
+        index.add({
+            "local_id": local_id,
+            "email": email.lower(),
+            "name": name,
+            "phone": data.get("phone", ""),
+            "company": data.get("company", ""),
+            "added_at": datetime.now().isoformat(),
+        })
+        _save_json(index_path, index.to_json())
 
     return {"status": "prepared", "local_id": local_id, "path": str(filepath), "payload": payload}
 
@@ -247,41 +418,122 @@ def prepare_deal(slug, data):
     return {"status": "prepared", "local_id": deal_id, "path": str(filepath), "payload": payload}
 
 
-def check_dedup(slug, data):
+def check_dedup(slug, data, fuzzy=False):
     """Check if a contact already exists in the local index."""
     brand_dir, err = get_brand_dir(slug)
     if err:
         return {"error": err}
 
-    email = data.get("email", "").lower().strip()
-    phone = data.get("phone", "")
-    company = data.get("company", "")
-    name = data.get("name", "")
-
+    email = _normalize_email(data.get("email", ""))
     if not email:
         return {"error": "Missing required field: email"}
 
-    index = _load_json(brand_dir / "crm" / "_contacts_index.json", [])
-    matches = []
-
-    for entry in index:
-        # Primary match: email
-        if entry.get("email") == email:
-            matches.append({**entry, "match_type": "email"})
-            continue
-        # Secondary match: phone
-        if phone and entry.get("phone") == phone:
-            matches.append({**entry, "match_type": "phone"})
-            continue
-        # Tertiary match: company + name
-        if company and name and entry.get("company") == company and entry.get("name") == name:
-            matches.append({**entry, "match_type": "company+name"})
+    index = _load_contact_index(brand_dir / "crm")
+    found = index.match(email, data.get("phone", ""), data.get("company", ""), data.get("name", ""))
+    # Report in index order, like the original linear scan
+    order = {local_id: i for i, local_id in enumerate(index.contacts)} if len(found) > 1 else {}
+    matches = [{**index.contacts[local_id], "match_type": match_type}
+               for local_id, match_type in sorted(found.items(), key=lambda item: order.get(item[0], 0))]
 
-    return {
+    result = {
         "is_duplicate": len(matches) > 0,
         "matching_records": matches,
         "checked_against": len(index),
     }
+    if fuzzy:
+        near = index.fuzzy_match(email, data.get("name", ""))
+        result["fuzzy_matches"] = [
+            {**index.contacts[local_id], "match_type": match_type, "distance": distance}
+            for local_id, (match_type, distance) in near.items() if local_id not in found
+        ]
+    return result
+
+
+def _csv_field(row, *names):
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ""
+
+
+def check_dedup_batch(slug, csv_path, fuzzy=False):
+    """Check every row of a CSV against the index (and earlier rows) in one pass.
+
+    Only rows that are duplicates, near-duplicates or invalid are listed;
+    new rows are counted.
+    """
+    brand_dir, err = get_brand_dir(slug)
+    if err:
+        return {"error": err}
+
+    try:
+        handle = open(csv_path, newline="", encoding="utf-8-sig")
+    except OSError as e:
+        return {"error": f"Cannot read CSV: {e}"}
+
+    index = _load_contact_index(brand_dir / "crm")
+    batch = ContactIndex()  # rows seen so far, to catch duplicates inside the file
+    counts = {"rows": 0, "new": 0, "duplicate": 0, "duplicate_in_batch": 0, "fuzzy": 0, "invalid": 0}
+    flagged = []
+
+    with handle:
+        reader = csv.DictReader(handle)
+        reader.fieldnames = [(f or "").strip().lower() for f in reader.fieldnames or []]
+        if "email" not in reader.fieldnames:
+            return {"error": "CSV must have an 'email' column"}
+
+        for row_no, row in enumerate(reader, 2):
+            counts["rows"] += 1
+            email = _normalize_email(row.get("email"))
+            name = _csv_field(row, "name", "full_name") or " ".join(
+                p for p in (_csv_field(row, "first_name"), _csv_field(row, "last_name")) if p)
+            phone = _csv_field(row, "phone", "phone_number")
+            company = _csv_field(row, "company", "company_name", "organization")
+
+            if not email or not _validate_email(email):
+                counts["invalid"] += 1
+                flagged.append({"row": row_no, "email": email, "status": "invalid"})
+                continue
+
+            record = {"row": row_no, "email": email}
+            found = index.match(email, phone, company, name)
+            if found:
+                status = "duplicate"
+            else:
+                found = batch.match(email, phone, company, name)
+                status = "duplicate_in_batch" if found else "new"
+            if found:
+                record["matches"] = [
+                    {"local_id": local_id, "match_type": match_type,
+                     "email": (index.contacts.get(local_id) or batch.contacts[local_id])["email"]}
+                    for local_id, match_type in found.items()
+                ]
+            elif fuzzy:
+                near = index.fuzzy_match(email, name)
+                near.update(batch.fuzzy_match(email, name))
+                if near:
+                    status = "fuzzy"
+                    record["matches"] = [
+                        {"local_id": local_id, "match_type": match_type, "distance": distance,
+                         "email": (index.contacts.get(local_id) or batch.contacts[local_id])["email"]}
+                        for local_id, (match_type, distance) in near.items()
+                    ]
+
+            counts[status] += 1
+            if status != "new":
+                record["status"] = status
+                flagged.append(record)
+            batch.add({"email": email, "name": name, "phone": phone, "company": company,
+                       "row": row_no})
+
+    return {
+        "file": str(csv_path),
+        "checked_against": len(index),
+        "fuzzy": fuzzy,
+        "summary": counts,
+        "flagged_records": flagged,
+    }
 
 
 def log_synced(slug, data):
@@ -305,17 +557,28 @@ def log_synced(slug, data):
 
     # Append to sync log
     log_path = crm_dir / "_sync_log.json"
-    log = _load_json(log_path, [])
-    log.append({
-        "local_id": local_id,
-        "record_type": record_type,
-        "crm_platform": crm_platform,
-        "crm_record_id": crm_record_id,
-        "synced_at": datetime.now().isoformat(),
-    })
-    # Keep last 1000 entries
-    log = log[-1000:]
-    _save_json(log_path, log)
+    with locked(log_path):
+        log = _load_json(log_path, [])
+        log.append({
+            "local_id": local_id,
+            "record_type": record_type,
+            "crm_platform": crm_platform,
+            "crm_record_id": crm_record_id,
+            "synced_at": datetime.now().isoformat(),
+        })
+        # Keep last 1000 entries
+        log = log[-1000:]
+        _save_json(log_path, log)
+
+    # Record the CRM id on the indexed contact so dedup results show it
+    if record_type == "contact":
+        index_path = crm_dir / "_contacts_index.json"
+        with locked(index_path):
+            index = _load_contact_index(crm_dir)
+            entry = index.contacts.get(local_id)
+            if entry is not None:
+                entry.setdefault("synced", {})[crm_platform] = crm_record_id
+                _save_json(index_path, index.to_json())
 
     # Remove from pending if present
     for prefix in ["contact", "deal", "campaign"]:
@@ -396,9 +659,15 @@ def main():
     parser.add_argument("--platform", help="Filter sync history by CRM platform")
     parser.add_argument("--type", dest="record_type", help="Filter by record type")
     parser.add_argument("--limit", type=int, default=50, help="Max items to return")
+    parser.add_argument("--batch", help="CSV of contacts to check in one pass (check-dedup)")
+    parser.add_argument("--fuzzy", action="store_true",
+                        help="Also report near-duplicates (edit distance within the same email domain)")
     args = parser.parse_args()
 
-    if args.action in ("prepare-contact", "prepare-deal", "check-dedup", "log-synced"):
+    if args.action == "check-dedup" and args.batch:
+        result = check_dedup_batch(args.brand, args.batch, fuzzy=args.fuzzy)
+
+    elif args.action in ("prepare-contact", "prepare-deal", "check-dedup", "log-synced"):
         if not args.data:
             print(json.dumps({"error": f"Provide --data for {args.action}"}))
             sys.exit(1)
@@ -413,7 +682,7 @@ def main():
         elif args.action == "prepare-deal":
             result = prepare_deal(args.brand, data)
         elif args.action == "check-dedup":
-            result = check_dedup(args.brand, data)
+            result = check_dedup(args.brand, data, fuzzy=args.fuzzy)
         elif args.action == "log-synced":
             result = log_synced(args.brand, data)
 
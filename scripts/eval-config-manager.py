@@ -34,6 +34,8 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from brand_store import read_json, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 # ---------------------------------------------------------------------------
@@ -129,7 +131,7 @@ def resolve_brand(slug: str | None) -> str:
         sys.exit(1)
 
     try:
-        data = json.loads(active_path.read_text(encoding="utf-8"))
+        data = read_json(active_path)
         active_slug = data.get("slug") or data.get("brand") or data.get("active")
         if not active_slug:
             print(json.dumps({
@@ -161,7 +163,7 @@ def load_config(slug: str) -> dict:
     path = _config_path(slug)
     if path.exists():
         try:
-            return json.loads(path.read_text(encoding="utf-8"))
+            return read_json(path)
         except json.JSONDecodeError:
             # Corrupted file — recreate with defaults
             pass
@@ -176,7 +178,7 @@ def save_config(slug: str, config: dict) -> None:
     """Save config to disk, creating directories as needed."""
     path = _config_path(slug)
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    save_json(path, config)
 
 
 # ---------------------------------------------------------------------------
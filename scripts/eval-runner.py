@@ -4,12 +4,28 @@ eval-runner.py
 ==============
 Master orchestrator for the Digital Marketing Pro evaluation suite.
 
-Runs the full eval pipeline via subprocess, calling sibling scripts for each
-scoring dimension, then produces a unified composite report with weighted
-scores, letter grades, and pass/fail gate checks.
+Runs the full eval pipeline by calling sibling scripts for each scoring
+dimension, then produces a unified composite report with weighted scores,
+letter grades, and pass/fail gate checks.
+
+Two execution engines are available:
+    inproc      (default) Imports each scorer module once and runs the
+                dimensions concurrently on a thread pool. No interpreter
+                cold starts and no temp-file round trip.
+    subprocess  Runs each scorer as a separate Python process, one after
+                another. Used automatically for any dimension whose module
+                cannot be imported in-process.
+
+Timeouts: a subprocess scorer is killed after SUBPROCESS_TIMEOUT seconds. An
+in-process scorer cannot be killed, so its timeout only stops the caller
+waiting: the dimension is reported as timed out and the scorer keeps running
+on a daemon thread (which never holds the process open at exit). Once
+ABANDONED_THREAD_LIMIT such threads are still alive, later evals in the same
+process (e.g. in a --batch worker) run their dimensions as subprocesses.
 
 Dependencies: stdlib only (json, re, sys, argparse, pathlib, datetime,
-              subprocess, os, math, tempfile, uuid)
+              subprocess, os, math, tempfile, uuid, importlib, io,
+              contextlib, time, threading, concurrent.futures)
 
 Usage:
     python eval-runner.py --action run-full --text "Your marketing copy..."
@@ -17,12 +33,25 @@ Usage:
     python eval-runner.py --action run-full --file draft.md --evidence claims.json --schema blog_post --log
     python eval-runner.py --action run-quick --text "Quick check on this copy."
     python eval-runner.py --action run-compliance --file page.md --evidence facts.json --schema landing_page
+    python eval-runner.py --action run-full --file draft.md --engine subprocess
+    python eval-runner.py --action run-quick --batch drafts/ --workers 8 --log
+    python eval-runner.py --action run-full --batch items.jsonl --brand acme > results.jsonl
 
 Actions:
     run-full        Full eval pipeline (all 6 dimensions)
     run-quick       Quick eval (hallucination + content quality + readability)
     run-compliance  Compliance-focused eval (hallucination + claims + brand voice + structure)
 
+Batch mode (--batch):
+    Accepts a directory of drafts (.md/.txt/.html) or a JSONL file of
+    {"id", "text", "content_type"} objects. The eval config and brand
+    profile are loaded once, items are spread across a process pool, and
+    results stream out as JSONL in completion order, followed by a
+    {"batch_summary": ...} line. An item that is malformed or fails to
+    evaluate gets its own {"item_id", "error"} line and the batch carries
+    on. Item eval_ids share a per-batch batch_id prefix. With --log every
+    result is appended to quality-tracker in one bulk write.
+
 Scoring:
     A+  95-100    A  90-94    A-  85-89
     B+  80-84     B  75-79    B-  70-74
@@ -31,13 +60,26 @@ Scoring:
 """
 
 import argparse
+import contextlib
+import importlib.util
+import io
 import json
 import math
 import os
 import subprocess
 import sys
 import tempfile
+import threading
+import time
 import uuid
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -49,6 +91,10 @@ BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 ACTIVE_BRAND_FILE = BRANDS_DIR / "_active-brand.json"
 SCRIPTS_DIR = Path(__file__).resolve().parent
 SUBPROCESS_TIMEOUT = 30  # seconds
+ABANDONED_THREAD_LIMIT = 4  # timed-out in-process scorers left running before falling back to subprocesses
+
+ENGINES = ("inproc", "subprocess")
+DEFAULT_ENGINE = "inproc"
 
 # ---------------------------------------------------------------------------
 # Default dimension weights for each eval type
@@ -281,6 +327,212 @@ def _run_script(script_name, args_list):
     return True, data, None
 
 
+# ---------------------------------------------------------------------------
+# In-process runner
+# ---------------------------------------------------------------------------
+
+_MODULE_CACHE = {}    # script name -> (module | None, fallback data | None, error | None)
+_ARTIFACT_CACHE = {}  # (kind, key) -> loaded brand profile / evidence data
+_ABANDONED = set()    # futures of dimension runs still going after their timeout
+
+
+def _load_sibling(script_name):
+    """Import a sibling script as a module, once per process.
+
+    Scorer scripts check their optional dependencies at import time and, when
+    one is missing, print a fallback JSON object and call sys.exit(0). Both
+    are captured here so the fallback is reported exactly as the subprocess
+    path would report it.
+
+    Must be called from the main thread (stdout is redirected while the
+    module body runs).
+
+    Returns (module | None, fallback_data | None, error | None).
+    """
+    if script_name in _MODULE_CACHE:
+        return _MODULE_CACHE[script_name]
+
+    script_path = SCRIPTS_DIR / script_name
+    if not script_path.exists():
+        entry = (None, None, f"Script not found: {script_name}")
+        _MODULE_CACHE[script_name] = entry
+        return entry
+
+    module_name = "_dm_" + script_path.stem.replace("-", "_")
+    captured = io.StringIO()
+    try:
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        with contextlib.redirect_stdout(captured):
+            spec.loader.exec_module(module)
+        entry = (module, None, None)
+    except SystemExit:
+        sys.modules.pop(module_name, None)
+        try:
+            data = json.loads(captured.getvalue())
+        except (json.JSONDecodeError, TypeError):
+            data = None
+        if isinstance(data, dict) and data.get("fallback"):
+            entry = (None, data, (
+                f"{script_name} ran in fallback mode: "
+                f"{data.get('message', 'missing dependency')}"
+            ))
+        else:
+            entry = (None, None, f"{script_name} exited during import")
+    except Exception as exc:
+        sys.modules.pop(module_name, None)
+        entry = (None, None, f"Failed to import {script_name}: {exc}")
+
+    _MODULE_CACHE[script_name] = entry
+    return entry
+
+
+def _cached_artifact(kind, key, loader):
+    """Return a loaded artifact (brand profile, evidence file), loading it once."""
+    cache_key = (kind, key)
+    if cache_key not in _ARTIFACT_CACHE:
+        _ARTIFACT_CACHE[cache_key] = loader()
+    return _ARTIFACT_CACHE[cache_key]
+
+
+def _inproc_content_quality(module, ctx):
+    """content-scorer.py --type blog"""
+    return True, module.score_content(ctx["content"], "blog", None), None
+
+
+def _inproc_brand_voice(module, ctx):
+    """brand-voice-scorer.py --brand <slug>"""
+    slug = ctx["brand_slug"]
+    profile = _cached_artifact(
+        "profile", slug, lambda: module.load_brand_profile(slug),
+    )
+    if "error" in profile:
+        return False, profile, profile["error"]
+    return True, module.score_content(ctx["content"], profile), None
+
+
+def _inproc_hallucination(module, ctx):
+    """hallucination-detector.py --action detect"""
+    return True, module.action_detect(ctx["content"]), None
+
+
+def _inproc_claim_verification(module, ctx):
+    """claim-verifier.py --action verify --evidence <path>"""
+    path = ctx["evidence_path"]
+    evidence_data, err = _cached_artifact(
+        "evidence", path, lambda: module._load_evidence(path),
+    )
+    if err:
+        return False, {"error": err}, err
+    index = module.load_evidence_index(path, evidence_data)
+    return True, module.verify_claims(ctx["content"], evidence_data, index), None
+
+
+def _inproc_output_structure(module, ctx):
+    """output-validator.py --action validate --schema <name>"""
+    schema_name = ctx["schema_name"]
+    if schema_name not in module.SCHEMAS:
+        err = f"Unknown schema: '{schema_name}'"
+        return False, {
+            "error": err,
+            "available_schemas": sorted(module.SCHEMAS.keys()),
+        }, err
+    schema = module.SCHEMAS[schema_name]
+    return True, module.validate_content(ctx["content"], schema, schema_name), None
+
+
+def _inproc_readability(module, ctx):
+    """readability-analyzer.py (no --target)"""
+    metrics = module.compute_metrics(ctx["content"])
+    if "error" in metrics:
+        return False, metrics, metrics["error"]
+    audience_rec = module.recommend_audience(metrics)
+    suggestions = module.generate_suggestions(
+        metrics, audience_rec["best_fit_audience"],
+    )
+    return True, {
+        "metrics": metrics,
+        "audience_recommendation": audience_rec,
+        "suggestions": suggestions,
+    }, None
+
+
+def _run_inproc(runner, ctx):
+    """Run a dimension in-process using its preloaded scorer module.
+
+    Returns (success: bool, data: dict, error: str | None), mirroring
+    _run_script.
+    """
+    module, fallback_data, load_err = _load_sibling(runner["script"])
+    if module is None:
+        return False, fallback_data or {}, load_err
+
+    try:
+        ok, data, err = runner["inproc"](module, ctx)
+    except Exception as exc:
+        return False, {}, (
+            f"{runner['script']} raised {type(exc).__name__}: {exc}"
+        )
+
+    if ok and data.get("fallback"):
+        return False, data, (
+            f"{runner['script']} ran in fallback mode: "
+            f"{data.get('message', 'missing dependency')}"
+        )
+    return ok, data, err
+
+
+def _submit_daemon(func, *args):
+    """Run func(*args) on a daemon thread and return a Future for the result.
+
+    ThreadPoolExecutor workers are joined at interpreter exit, so a scorer
+    that never returns would keep the CLI alive after its timeout had been
+    reported; a daemon thread is simply dropped.
+    """
+    future = Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def _abandoned_threads():
+    """Number of timed-out dimension runs whose threads are still running."""
+    _ABANDONED.difference_update([f for f in _ABANDONED if f.done()])
+    return len(_ABANDONED)
+
+
+def _dimension_engine(runner, engine):
+    """Decide which engine actually executes a dimension.
+
+    In-process runs fall back to a subprocess when the scorer module cannot
+    be imported for a reason other than a reported missing dependency, and
+    when ABANDONED_THREAD_LIMIT timed-out in-process runs are still alive
+    (a subprocess can be killed at its timeout; a thread cannot).
+    """
+    if engine != "inproc" or _abandoned_threads() >= ABANDONED_THREAD_LIMIT:
+        return "subprocess"
+    module, fallback_data, _ = _load_sibling(runner["script"])
+    if module is None and fallback_data is None:
+        return "subprocess"
+    return "inproc"
+
+
+def _timed(func, *args):
+    """Call func(*args) and return its result plus elapsed milliseconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, round((time.perf_counter() - start) * 1000, 2)
+
+
 # ---------------------------------------------------------------------------
 # Score extractors -- pull the score from each script's JSON output
 # ---------------------------------------------------------------------------
@@ -383,10 +635,11 @@ def _load_eval_config(brand_slug):
 
 def _build_dimension_runners(content_file, brand_slug, evidence_path,
                              schema_name):
-    """Build a dict mapping dimension name -> (script, args, extractor, skip_reason).
+    """Build a dict mapping dimension name -> (script, args, inproc, extractor, skip_reason).
 
-    If a dimension should be conditionally skipped (e.g., no evidence file),
-    skip_reason is set; otherwise it is None.
+    ``args`` drive the subprocess engine; ``inproc`` is the equivalent
+    in-process call. If a dimension should be conditionally skipped (e.g.,
+    no evidence file), skip_reason is set; otherwise it is None.
     """
     runners = {}
 
@@ -394,6 +647,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
     runners["content_quality"] = {
         "script": "content-scorer.py",
         "args": ["--file", content_file, "--type", "blog"],
+        "inproc": _inproc_content_quality,
         "extractor": _extract_content_quality_score,
         "skip_reason": None,
     }
@@ -403,6 +657,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
         runners["brand_voice"] = {
             "script": "brand-voice-scorer.py",
             "args": ["--file", content_file, "--brand", brand_slug],
+            "inproc": _inproc_brand_voice,
             "extractor": _extract_brand_voice_score,
             "skip_reason": None,
         }
@@ -418,6 +673,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
     runners["hallucination"] = {
         "script": "hallucination-detector.py",
         "args": ["--action", "detect", "--file", content_file],
+        "inproc": _inproc_hallucination,
         "extractor": _extract_hallucination_score,
         "skip_reason": None,
     }
@@ -428,6 +684,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
             "script": "claim-verifier.py",
             "args": ["--action", "verify", "--file", content_file,
                       "--evidence", evidence_path],
+            "inproc": _inproc_claim_verification,
             "extractor": _extract_verification_score,
             "skip_reason": None,
         }
@@ -445,6 +702,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
             "script": "output-validator.py",
             "args": ["--action", "validate", "--file", content_file,
                       "--schema", schema_name],
+            "inproc": _inproc_output_structure,
             "extractor": _extract_validation_score,
             "skip_reason": None,
         }
@@ -460,6 +718,7 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
     runners["readability"] = {
         "script": "readability-analyzer.py",
         "args": ["--file", content_file],
+        "inproc": _inproc_readability,
         "extractor": _extract_readability_score,
         "skip_reason": None,
     }
@@ -467,13 +726,43 @@ def _build_dimension_runners(content_file, brand_slug, evidence_path,
     return runners
 
 
+# ---------------------------------------------------------------------------
+# Quality-tracker payload
+# ---------------------------------------------------------------------------
+
+def _tracker_payload(eval_id, composite, grade, eval_type, content_type,
+                     results, timestamp, title=""):
+    """Build the quality-tracker log-eval payload for one eval report.
+
+    quality-tracker keys its running averages on ``scores``; dimensions that
+    were skipped are omitted rather than logged as zero.
+    """
+    scores = {
+        dim: res["score"]
+        for dim, res in results.items()
+        if res.get("score") is not None
+    }
+    scores["composite"] = composite
+    return {
+        "eval_id": eval_id,
+        "title": title,
+        "scores": scores,
+        "composite_score": composite,
+        "grade": grade,
+        "eval_type": eval_type,
+        "content_type": content_type,
+        "dimensions": results,
+        "timestamp": timestamp,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Core eval orchestrator
 # ---------------------------------------------------------------------------
 
 def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
               evidence_path, schema_name, content_type, eval_type,
-              log_results, config):
+              log_results, config, engine=DEFAULT_ENGINE):
     """Execute the eval pipeline for the given dimensions.
 
     Parameters:
@@ -487,33 +776,84 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
         eval_type         : "full", "quick", or "compliance"
         log_results       : whether to persist via quality-tracker
         config            : eval config dict
+        engine            : "inproc" (parallel, in-process) or "subprocess"
 
     Returns:
         dict -- the complete eval report
     """
     eval_id = _generate_eval_id()
     timestamp = _utc_timestamp()
+    eval_start = time.perf_counter()
 
-    # Write content to temp file for subprocess calls
-    tmp_path = _write_temp_content(content)
+    tmp_path = None
 
     try:
-        all_runners = _build_dimension_runners(
-            tmp_path, brand_slug, evidence_path, schema_name,
-        )
-
-        # Filter to only requested dimensions
+        # Runner layout (skips, scripts) does not depend on the content
+        # file, so decide per-dimension engines before touching disk.
         runners = {
-            dim: all_runners[dim]
-            for dim in dimensions_to_run
-            if dim in all_runners
+            dim: runner
+            for dim, runner in _build_dimension_runners(
+                None, brand_slug, evidence_path, schema_name,
+            ).items()
+            if dim in dimensions_to_run
+        }
+        dim_engines = {
+            dim: _dimension_engine(runner, engine)
+            for dim, runner in runners.items()
+            if not runner["skip_reason"]
         }
 
-        # --- Execute each dimension ---
+        # Write content to a temp file only if a subprocess needs it
+        if "subprocess" in dim_engines.values():
+            tmp_path = _write_temp_content(content)
+            all_runners = _build_dimension_runners(
+                tmp_path, brand_slug, evidence_path, schema_name,
+            )
+            runners = {dim: all_runners[dim] for dim in runners}
+
+        ctx = {
+            "content": content,
+            "brand_slug": brand_slug,
+            "evidence_path": evidence_path,
+            "schema_name": schema_name,
+        }
+
+        # --- Execute dimensions ---
+        outcomes = {}  # dim -> ((ok, data, err), duration_ms)
+        if engine == "inproc":
+            futures = {}
+            for dim, dim_engine in dim_engines.items():
+                runner = runners[dim]
+                if dim_engine == "inproc":
+                    futures[dim] = _submit_daemon(_timed, _run_inproc, runner, ctx)
+                else:
+                    futures[dim] = _submit_daemon(
+                        _timed, _run_script, runner["script"], runner["args"],
+                    )
+            deadline = time.monotonic() + SUBPROCESS_TIMEOUT
+            for dim, future in futures.items():
+                try:
+                    outcomes[dim] = future.result(
+                        timeout=max(0, deadline - time.monotonic()),
+                    )
+                except FutureTimeoutError:
+                    # The thread cannot be stopped; track it so a pile-up
+                    # switches later evals to killable subprocesses
+                    _ABANDONED.add(future)
+                    outcomes[dim] = ((False, {}, (
+                        f"Timed out after {SUBPROCESS_TIMEOUT}s: "
+                        f"{runners[dim]['script']}"
+                    )), SUBPROCESS_TIMEOUT * 1000)
+        else:
+            for dim in dim_engines:
+                runner = runners[dim]
+                outcomes[dim] = _timed(_run_script, runner["script"], runner["args"])
+
         results = {}       # dim -> {"score", "weight", "status", ...}
         active_dims = []   # dims that produced a score
         skipped_dims = []  # dims that were skipped
         errors = {}        # dim -> error detail
+        dim_timings = {}   # dim -> {"engine", "duration_ms"}
 
         for dim, runner in runners.items():
             # Pre-skip if skip_reason is set
@@ -527,8 +867,11 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
                 skipped_dims.append(dim)
                 continue
 
-            # Run the script
-            ok, data, err = _run_script(runner["script"], runner["args"])
+            (ok, data, err), duration_ms = outcomes[dim]
+            dim_timings[dim] = {
+                "engine": dim_engines[dim],
+                "duration_ms": duration_ms,
+            }
 
             if not ok:
                 results[dim] = {
@@ -562,6 +905,12 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
             }
             active_dims.append(dim)
 
+        timings = {
+            "engine": engine,
+            "total_ms": round((time.perf_counter() - eval_start) * 1000, 2),
+            "dimensions": dim_timings,
+        }
+
         # --- Redistribute weights among active dimensions ---
         final_weights = _redistribute_weights(base_weights, set(active_dims))
         for dim in results:
@@ -575,6 +924,7 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
                 "eval_type": eval_type,
                 "details": errors,
                 "skipped_dimensions": skipped_dims,
+                "timings": timings,
                 "timestamp": timestamp,
             }
 
@@ -623,15 +973,10 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
         # --- Optional: log results via quality-tracker ---
         logged = False
         if log_results:
-            log_data = {
-                "eval_id": eval_id,
-                "composite_score": composite,
-                "grade": grade,
-                "eval_type": eval_type,
-                "content_type": content_type,
-                "dimensions": results,
-                "timestamp": timestamp,
-            }
+            log_data = _tracker_payload(
+                eval_id, composite, grade, eval_type, content_type,
+                results, timestamp,
+            )
             log_args = ["--action", "log-eval", "--data", json.dumps(log_data)]
             if brand_slug:
                 log_args += ["--brand", brand_slug]
@@ -653,6 +998,7 @@ def _run_eval(dimensions_to_run, base_weights, content, brand_slug,
             "weights_used": weights_used,
             "content_type": content_type or "unknown",
             "logged": logged,
+            "timings": timings,
             "timestamp": timestamp,
         }
 
@@ -698,6 +1044,7 @@ def action_run_full(args):
         eval_type="full",
         log_results=args.log,
         config=config,
+        engine=args.engine,
     )
 
 
@@ -729,6 +1076,7 @@ def action_run_quick(args):
         eval_type="quick",
         log_results=args.log,
         config=config,
+        engine=args.engine,
     )
 
 
@@ -760,9 +1108,268 @@ def action_run_compliance(args):
         eval_type="compliance",
         log_results=args.log,
         config=config,
+        engine=args.engine,
     )
 
 
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+# action -> (eval_type, base weights, uses evidence/schema)
+BATCH_EVAL_TYPES = {
+    "run-full":       ("full", FULL_EVAL_WEIGHTS, True),
+    "run-quick":      ("quick", QUICK_EVAL_WEIGHTS, False),
+    "run-compliance": ("compliance", COMPLIANCE_EVAL_WEIGHTS, True),
+}
+
+BATCH_FILE_SUFFIXES = {".md", ".markdown", ".txt", ".html", ".htm"}
+
+
+def _iter_batch_items(batch_path):
+    """Yield content items from a directory of drafts or a JSONL file.
+
+    Directory: every file with a BATCH_FILE_SUFFIXES extension, sorted by
+    name; the file name is the item id.
+    JSONL: one object per line with "text" (or "content") and optional
+    "id", "title" and "content_type" keys.
+
+    Each yielded item is a dict with id, title, text, content_type and,
+    for unreadable or malformed entries, an error message instead of text.
+    """
+    path = Path(batch_path)
+    if path.is_dir():
+        for fp in sorted(path.iterdir()):
+            if not fp.is_file() or fp.suffix.lower() not in BATCH_FILE_SUFFIXES:
+                continue
+            item = {"id": fp.name, "title": fp.stem, "content_type": None}
+            try:
+                item["text"] = fp.read_text(encoding="utf-8")
+            except (OSError, UnicodeDecodeError) as exc:
+                item["error"] = f"Could not read file: {exc}"
+            yield item
+        return
+
+    with open(path, "r", encoding="utf-8") as fh:
+        for line_no, line in enumerate(fh, start=1):
+            if not line.strip():
+                continue
+            item = {"id": f"line-{line_no}", "title": "", "content_type": None}
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as exc:
+                item["error"] = f"Invalid JSON on line {line_no}: {exc}"
+                yield item
+                continue
+            if not isinstance(data, dict):
+                item["error"] = f"Line {line_no} is not a JSON object"
+                yield item
+                continue
+            item["id"] = str(data.get("id", item["id"]))
+            item["title"] = str(data.get("title", item["id"]))
+            text = data.get("text", data.get("content", ""))
+            content_type = data.get("content_type")
+            if not isinstance(text, str):
+                item["error"] = f'Line {line_no}: "text" must be a string'
+            elif content_type is not None and not isinstance(content_type, str):
+                item["error"] = f'Line {line_no}: "content_type" must be a string'
+            else:
+                item["text"] = text
+                item["content_type"] = content_type
+            yield item
+
+
+def _batch_init(artifacts):
+    """Worker initializer: seed the artifact cache loaded by the parent."""
+    _ARTIFACT_CACHE.update(artifacts)
+
+
+def _batch_worker(item, job):
+    """Evaluate one batch item. Runs inside a pool worker process."""
+    if item.get("error"):
+        return {"item_id": item["id"], "error": item["error"]}
+    text = item.get("text") or ""
+    if not text.strip():
+        return {"item_id": item["id"], "error": "Empty content"}
+
+    report = _run_eval(
+        dimensions_to_run=job["dimensions"],
+        base_weights=job["base_weights"],
+        content=text,
+        brand_slug=job["brand_slug"],
+        evidence_path=job["evidence_path"],
+        schema_name=job["schema_name"],
+        content_type=item.get("content_type") or job["content_type"],
+        eval_type=job["eval_type"],
+        log_results=False,
+        config=job["config"],
+        engine=job["engine"],
+    )
+    report = {"item_id": item["id"], **report}
+    if "error" not in report:
+        report["eval_id"] = f"{job['batch_id']}-{item['seq']:05d}"
+        report["tracker_payload"] = _tracker_payload(
+            report["eval_id"], report["composite_score"], report["grade"],
+            report["eval_type"], report["content_type"], report["dimensions"],
+            report["timestamp"], title=item.get("title") or item["id"],
+        )
+    return report
+
+
+def _preload_batch_artifacts(job):
+    """Load the brand profile and evidence once in the parent process."""
+    if job["engine"] != "inproc":
+        return {}
+    runners = _build_dimension_runners(
+        None, job["brand_slug"], job["evidence_path"], job["schema_name"],
+    )
+    ctx = {
+        "content": "",
+        "brand_slug": job["brand_slug"],
+        "evidence_path": job["evidence_path"],
+        "schema_name": job["schema_name"],
+    }
+    for dim in ("brand_voice", "claim_verification"):
+        runner = runners.get(dim)
+        if dim not in job["dimensions"] or not runner or runner["skip_reason"]:
+            continue
+        module, _, _ = _load_sibling(runner["script"])
+        if module is None:
+            continue
+        if dim == "brand_voice":
+            slug = ctx["brand_slug"]
+            _cached_artifact("profile", slug, lambda: module.load_brand_profile(slug))
+        else:
+            path = ctx["evidence_path"]
+            _cached_artifact("evidence", path, lambda: module._load_evidence(path))
+    return dict(_ARTIFACT_CACHE)
+
+
+def _log_batch(payloads, brand_slug):
+    """Append every batch result to quality-tracker in a single call."""
+    if not payloads:
+        return False, None
+    tmp_path = _write_temp_content(
+        "".join(json.dumps(p) + "\n" for p in payloads)
+    )
+    try:
+        log_args = ["--action", "log-batch", "--file", tmp_path]
+        if brand_slug:
+            log_args += ["--brand", brand_slug]
+        ok, _, err = _run_script("quality-tracker.py", log_args)
+        return ok, err
+    finally:
+        _cleanup_temp(tmp_path)
+
+
+def run_batch(args, out=sys.stdout):
+    """Evaluate every item in --batch across a worker pool.
+
+    Streams one JSON line per item to ``out`` as each finishes, then a final
+    ``batch_summary`` line. Config and brand artifacts are loaded once; with
+    --log all results are appended to quality-tracker in one bulk write.
+    """
+    batch_path = Path(args.batch)
+    if not batch_path.exists():
+        return {"error": f"Batch input not found: {args.batch}"}
+
+    eval_type, default_weights, uses_inputs = BATCH_EVAL_TYPES[args.action]
+    brand_slug = args.brand or _resolve_active_brand()
+    config = _load_eval_config(brand_slug)
+
+    base_weights = dict(default_weights)
+    cfg_weights = config.get("weights", {}).get(eval_type, {})
+    for dim in base_weights:
+        if dim in cfg_weights:
+            base_weights[dim] = cfg_weights[dim]
+
+    job = {
+        "dimensions": list(default_weights.keys()),
+        "base_weights": base_weights,
+        "brand_slug": brand_slug,
+        "evidence_path": args.evidence if uses_inputs else None,
+        "schema_name": args.schema if uses_inputs else None,
+        "content_type": args.content_type or "general",
+        "eval_type": eval_type,
+        "config": config,
+        "engine": args.engine,
+        # Item eval_ids hang off this, so batches started in the same second stay distinct
+        "batch_id": f"{_generate_eval_id()}-{uuid.uuid4().hex[:8]}",
+    }
+    artifacts = _preload_batch_artifacts(job)
+
+    workers = max(1, args.workers or os.cpu_count() or 1)
+    max_in_flight = workers * 4
+    batch_start = time.perf_counter()
+    counts = {"items": 0, "evaluated": 0, "failed": 0, "auto_rejected": 0}
+    composites = []
+    payloads = []
+
+    def _emit(report):
+        payload = report.pop("tracker_payload", None)
+        counts["items"] += 1
+        if "error" in report:
+            counts["failed"] += 1
+        else:
+            counts["evaluated"] += 1
+            composites.append(report["composite_score"])
+            if report.get("auto_rejected"):
+                counts["auto_rejected"] += 1
+            if payload:
+                payloads.append(payload)
+        out.write(json.dumps(report) + "\n")
+        out.flush()
+
+    def _failed(item, exc):
+        return {"item_id": item["id"], "error": f"Evaluation failed: {type(exc).__name__}: {exc}"}
+
+    def _collect(future):
+        # One failing item (or a crashed worker) is reported on its own row
+        item = in_flight.pop(future)
+        try:
+            report = future.result()
+        except Exception as exc:
+            report = _failed(item, exc)
+        _emit(report)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_batch_init,
+                             initargs=(artifacts,)) as pool:
+        in_flight = {}  # future -> item
+        for seq, item in enumerate(_iter_batch_items(batch_path)):
+            item["seq"] = seq
+            try:
+                in_flight[pool.submit(_batch_worker, item, job)] = item
+            except Exception as exc:  # BrokenProcessPool after a worker died
+                _emit(_failed(item, exc))
+                continue
+            if len(in_flight) >= max_in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _collect(future)
+        for future in as_completed(list(in_flight)):
+            _collect(future)
+
+    logged, log_err = (False, None)
+    if args.log:
+        logged, log_err = _log_batch(payloads, brand_slug)
+
+    summary = {
+        "batch_id": job["batch_id"],
+        "eval_type": eval_type,
+        "engine": args.engine,
+        "workers": workers,
+        **counts,
+        "average_composite": (
+            round(sum(composites) / len(composites), 2) if composites else None
+        ),
+        "logged": logged,
+        "total_ms": round((time.perf_counter() - batch_start) * 1000, 2),
+    }
+    if log_err:
+        summary["log_error"] = log_err
+    return {"batch_summary": summary}
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -772,9 +1379,9 @@ def build_parser():
     parser = argparse.ArgumentParser(
         description=(
             "Master orchestrator for the Digital Marketing Pro evaluation suite.\n"
-            "Runs sibling eval scripts via subprocess and produces a unified\n"
-            "composite quality report with weighted scores, letter grades,\n"
-            "and pass/fail gate checks."
+            "Runs sibling eval scripts (in-process in parallel, or via subprocess)\n"
+            "and produces a unified composite quality report with weighted scores,\n"
+            "letter grades, and pass/fail gate checks."
         ),
         epilog=(
             "Actions:\n"
@@ -795,12 +1402,22 @@ def build_parser():
             "  unavailable), its weight is redistributed proportionally among the\n"
             "  remaining active dimensions so weights always sum to 1.0.\n"
             "\n"
+            "Engines:\n"
+            "  inproc      Import each scorer once and run dimensions concurrently\n"
+            "              (default). Falls back to subprocess per dimension when a\n"
+            "              scorer module cannot be imported.\n"
+            "  subprocess  Run each scorer as a separate Python process, serially.\n"
+            "  Per-dimension timings are reported under \"timings\".\n"
+            "\n"
             "Examples:\n"
             "  python eval-runner.py --action run-full --text \"Your copy here.\"\n"
             "  python eval-runner.py --action run-full --file draft.md --brand acme\n"
             "  python eval-runner.py --action run-full --file draft.md --evidence claims.json --schema blog_post --log\n"
             "  python eval-runner.py --action run-quick --file email.txt\n"
             "  python eval-runner.py --action run-compliance --file page.md --evidence facts.json --schema landing_page\n"
+            "  python eval-runner.py --action run-full --file draft.md --engine subprocess\n"
+            "  python eval-runner.py --action run-quick --batch drafts/ --workers 8 --log\n"
+            "  python eval-runner.py --action run-full --batch items.jsonl --brand acme > results.jsonl\n"
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
@@ -823,6 +1440,14 @@ def build_parser():
         type=str,
         help="Path to a file containing content to evaluate.",
     )
+    input_group.add_argument(
+        "--batch",
+        type=str,
+        help=(
+            "Directory of drafts or JSONL file of content items to evaluate "
+            "in one run. Streams one JSON result per line."
+        ),
+    )
 
     parser.add_argument(
         "--brand",
@@ -866,6 +1491,24 @@ def build_parser():
         default=False,
         help="Auto-log eval results via quality-tracker.py (default: false).",
     )
+    parser.add_argument(
+        "--engine",
+        choices=list(ENGINES),
+        default=DEFAULT_ENGINE,
+        help=(
+            "Execution engine: 'inproc' runs scorers in-process in parallel, "
+            "'subprocess' runs each scorer as a separate process "
+            f"(default: {DEFAULT_ENGINE}). Only subprocess scorers are killed "
+            "at the timeout; a timed-out in-process scorer keeps running "
+            "in the background."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count).",
+    )
 
     return parser
 
@@ -893,8 +1536,12 @@ def main():
         }, indent=2))
         sys.exit(1)
 
-    result = handler(args)
-    print(json.dumps(result, indent=2))
+    if args.batch:
+        result = run_batch(args)
+        print(json.dumps(result))
+    else:
+        result = handler(args)
+        print(json.dumps(result, indent=2))
 
     # Exit with non-zero if there was a top-level error
     if "error" in result:
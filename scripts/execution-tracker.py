@@ -20,34 +20,18 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
-
-
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+from brand_store import get_brand_dir, load_json, locked, read_json, save_json
 
 
 def _load_index(executions_dir):
     """Load the execution index file."""
-    index_path = executions_dir / "_index.json"
-    if not index_path.exists():
-        return []
-    try:
-        return json.loads(index_path.read_text())
-    except json.JSONDecodeError:
-        return []
+    return load_json(executions_dir / "_index.json", [])
 
 
 def _save_index(executions_dir, index):
     """Save the execution index file."""
-    index_path = executions_dir / "_index.json"
-    index_path.write_text(json.dumps(index, indent=2))
+    save_json(executions_dir / "_index.json", index)
 
 
 def log_execution(slug, data):
@@ -90,18 +74,19 @@ def log_execution(slug, data):
 
     # Save individual execution file
     filepath = executions_dir / f"{execution_id}.json"
-    filepath.write_text(json.dumps(execution, indent=2))
+    save_json(filepath, execution)
 
     # Update index
-    index = _load_index(executions_dir)
-    index.append({
-        "execution_id": execution_id,
-        "platform": platform,
-        "action_type": action_type,
-        "result": result,
-        "executed_at": execution["executed_at"],
-    })
-    _save_index(executions_dir, index)
+    with locked(executions_dir / "_index.json"):
+        index = _load_index(executions_dir)
+        index.append({
+            "execution_id": execution_id,
+            "platform": platform,
+            "action_type": action_type,
+            "result": result,
+            "executed_at": execution["executed_at"],
+        })
+        _save_index(executions_dir, index)
 
     return {
         "status": "logged",
@@ -124,7 +109,7 @@ def get_history(slug, platform=None, status=None, limit=50):
     executions = []
     for fp in sorted(executions_dir.glob("exec-*.json"), reverse=True):
         try:
-            execution = json.loads(fp.read_text())
+            execution = read_json(fp)
             executions.append(execution)
         except json.JSONDecodeError:
             continue
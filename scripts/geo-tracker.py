@@ -26,9 +26,8 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, save_json
 
 PLATFORMS = ["chatgpt", "perplexity", "gemini", "copilot", "ai-overviews"]
 RESULTS = ["cited", "mentioned", "concept-only", "absent", "misrepresented"]
@@ -44,39 +43,20 @@ ENTITY_PLATFORMS = ["wikidata", "google-kp", "wikipedia", "directory"]
 ENTITY_STATUSES = ["present", "absent", "inconsistent", "outdated"]
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_json(path):
     """Safely load a JSON file, returning empty list on failure."""
-    if not path.exists():
-        return []
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        return data if isinstance(data, list) else [data]
-    except (json.JSONDecodeError, OSError):
-        return []
+    data = load_json(path, [])
+    return data if isinstance(data, list) else [data]
 
 
 def _load_json_obj(path):
     """Safely load a JSON file expecting an object."""
-    if not path.exists():
-        return {}
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
+    return load_json(path, {})
 
 
 def _save_json(path, data):
     """Write JSON data to file."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def audit_visibility(slug, query, platform, result, context, url=None):
@@ -22,6 +22,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 MONTHS_PROJECTION = 12
 
@@ -353,7 +355,7 @@ def _save_to_brand(slug, data, filename):
     growth_dir.mkdir(exist_ok=True)
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     fp = growth_dir / f"{filename}-{ts}.json"
-    fp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(fp, data)
 
 
 # ---------------------------------------------------------------------------
@@ -18,20 +18,37 @@ Usage:
     python guidelines-manager.py --brand acme --action get --category restrictions
     python guidelines-manager.py --brand acme --action save --category restrictions --file restrictions.md
     python guidelines-manager.py --brand acme --action list-categories
+    python guidelines-manager.py --brand acme --action compile
+    python guidelines-manager.py --brand acme --action scan --file draft.md --channel linkedin
     python guidelines-manager.py --brand acme --action list-templates
     python guidelines-manager.py --brand acme --action get-template --name proposal
     python guidelines-manager.py --brand acme --action save-template --name proposal --file proposal.md
     python guidelines-manager.py --action list-sops
     python guidelines-manager.py --action get-sop --name content-workflow
     python guidelines-manager.py --action save-sop --name content-workflow --file content-workflow.md
+
+Rule index:
+    restrictions.md, channel-styles.md and custom/*.md are compiled into
+    guidelines/_rules.json (banned terms with suggested alternatives, restricted
+    claim patterns, mandatory disclaimers, prohibited topics and per-channel
+    limits). The index records each source file's mtime and size and is rebuilt
+    only when one of them changes (save/delete rebuild it directly). The scan
+    action checks a draft against every literal term in one Aho-Corasick pass
+    (pattern_scanner.KeywordScanner) plus the compiled claim regexes, and
+    returns violations with character offsets and line numbers.
 """
 
 import argparse
+import bisect
 import json
+import re
 import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import get_brand_dir, load_json, read_json, save_json
+from pattern_scanner import KeywordScanner, PatternScanner
+
 MEMORY_ROOT = Path.home() / ".claude-marketing"
 BRANDS_DIR = MEMORY_ROOT / "brands"
 SOPS_DIR = MEMORY_ROOT / "sops"
@@ -59,13 +76,31 @@ GUIDELINE_CATEGORIES = {
     },
 }
 
+RULE_INDEX_FILE = "_rules.json"
+RULE_INDEX_VERSION = 1
+
+# Restricted-claim headings name a claim type ("Performance claims", "ROI
+# claims") rather than the literal wording, so each type maps to the
+# phrasings that make such a claim.
+CLAIM_TRIGGERS = {
+    "performance": r"\b\d+(?:\.\d+)?\s*(?:%|x\b|times\b)\s*(?:faster|better|more|increase|improvement|boost|higher|lower|less|fewer|reduction)\b",
+    "roi": r"\b(?:ROI|ROAS|return on (?:investment|ad spend)|\d+(?:\.\d+)?x\s+returns?|pays for itself)\b",
+    "health": r"\b(?:cures?|heals?|treats?|prevents?|immunity|detox|clinically (?:proven|tested)|medically)\b",
+    "wellness": r"\b(?:cures?|heals?|treats?|prevents?|immunity|detox|wellness)\b",
+    "award": r"\b(?:award-winning|awarded|winner of|voted (?:the )?(?:best|#1|top))\b",
+    "financial": r"\b(?:guaranteed (?:returns?|income|profit)|risk-free|earn \$?\d|passive income)\b",
+    "environmental": r"\b(?:eco-friendly|carbon[- ]neutral|net[- ]zero|biodegradable|sustainable|green)\b",
+    "sustainab": r"\b(?:eco-friendly|carbon[- ]neutral|net[- ]zero|biodegradable|sustainable)\b",
+    "comparative": r"\b(?:better than|faster than|cheaper than|unlike (?:other|competitor))\b",
+    "superlative": r"(?:\B#1\b|\b(?:number one|the best|the leading|the fastest|the only)\b)",
+    "guarantee": r"\bguarantee[ds]?\b",
+}
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+RULE_SEPARATORS = re.compile(r"\s*(?:→|->|=>|—)\s*")
+QUOTED = re.compile(r'["“”`]([^"“”`]+)["“”`]')
+LABEL = re.compile(r"^\*\*([^*]+)\*\*\s*:?\s*")
+EMOJI = re.compile("[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F]")
+HASHTAG = re.compile(r"(?<![\w&])#[A-Za-z_][\w]*")
 
 
 def get_guidelines_dir(slug):
@@ -93,7 +128,7 @@ def load_manifest(manifest_path):
     """Load a _manifest.json file, returning empty dict if missing."""
     if manifest_path.exists():
         try:
-            return json.loads(manifest_path.read_text(encoding="utf-8"))
+            return read_json(manifest_path)
         except json.JSONDecodeError:
             return {}
     return {}
@@ -102,14 +137,11 @@ def load_manifest(manifest_path):
 def save_manifest(manifest_path, data):
     """Save a _manifest.json file."""
     data["updated_at"] = datetime.now().isoformat()
-    manifest_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(manifest_path, data)
 
 
-def count_rules_in_file(filepath):
-    """Count rules/items in a markdown file (lines starting with - or *)."""
-    if not filepath.exists():
-        return 0
-    content = filepath.read_text(encoding="utf-8")
+def count_rules(content):
+    """Count rules/items in markdown text (lines starting with - or *)."""
     count = 0
     for line in content.splitlines():
         stripped = line.strip()
@@ -118,8 +150,222 @@ def count_rules_in_file(filepath):
     return count
 
 
+def count_rules_in_file(filepath):
+    """Count rules/items in a markdown file (lines starting with - or *)."""
+    if not filepath.exists():
+        return 0
+    return count_rules(filepath.read_text(encoding="utf-8"))
+
+
+# --- Rule Index ---
+
+def restriction_items(content):
+    """Yield (section, line_no, item) for each bullet in restrictions markdown.
+
+    section is "banned", "claims", "disclaimers", "topics" or None. The banned
+    and claims sections are detected exactly as the manifest always counted
+    them, so the index and the manifest agree on those counts.
+    """
+    section = None
+    for line_no, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+        lower = stripped.lower()
+        if "banned" in lower and ("word" in lower or "phrase" in lower or "#" in line):
+            section = "banned"
+        elif "restricted" in lower and "claim" in lower:
+            section = "claims"
+        elif stripped.startswith("#"):
+            if "disclaimer" in lower:
+                section = "disclaimers"
+            elif "prohibited" in lower or "topic" in lower:
+                section = "topics"
+            else:
+                section = None
+
+        if section and (stripped.startswith("- ") or stripped.startswith("* ")):
+            yield section, line_no, stripped[2:].strip()
+
+
+def channel_sections(content):
+    """Yield (channel_name, line_no, item) for bullets under each ## heading."""
+    channel = None
+    for line_no, line in enumerate(content.splitlines(), 1):
+        stripped = line.strip()
+        if stripped.startswith("##") and not stripped.startswith("###"):
+            channel = stripped.lstrip("#").strip()
+        elif stripped.startswith("# "):
+            channel = None
+        elif channel and (stripped.startswith("- ") or stripped.startswith("* ")):
+            yield channel, line_no, stripped[2:].strip()
+
+
+def _split_rule(item):
+    """Split a rule bullet into (subject, guidance) at its arrow or dash."""
+    parts = RULE_SEPARATORS.split(item, maxsplit=1)
+    subject = parts[0].strip()
+    guidance = parts[1].strip() if len(parts) > 1 else ""
+    return subject, guidance
+
+
+def _literal_terms(text):
+    """Quoted terms in text, skipping placeholders like "[Competitor] is bad"."""
+    return [t.strip() for t in QUOTED.findall(text) if t.strip() and "[" not in t]
+
+
+def _banned_terms(subject):
+    terms = _literal_terms(subject)
+    if terms or QUOTED.search(subject):
+        return terms
+    # Unquoted: "cheap, bargain" or "synergy / leverage" lists of short terms
+    bare = re.sub(r"[*_]", "", subject)
+    parts = [p.strip() for p in re.split(r"\s*[,/]\s*", bare) if p.strip()]
+    if parts and all(len(p.split()) <= 4 and "[" not in p for p in parts):
+        return parts
+    return []
+
+
+def _claim_patterns(subject):
+    lower = subject.lower()
+    return [pattern for key, pattern in CLAIM_TRIGGERS.items() if key in lower]
+
+
+def _channel_rules(name, items):
+    rules = {
+        "name": name,
+        "max_chars": None,
+        "max_hashtags": None,
+        "max_emoji": None,
+        "emoji_first_line": True,
+        "avoid_terms": [],
+        "rules": [],
+    }
+    for line_no, item in items:
+        rules["rules"].append({"rule": item, "line": line_no})
+        match = LABEL.match(item)
+        label = match.group(1).strip().lower() if match else ""
+        body = item[match.end():] if match else item
+        lower = body.lower()
+
+        if "no emoji in first line" in lower or "no emoji in the first line" in lower:
+            rules["emoji_first_line"] = False
+        if "avoid" in label or "never" in lower:
+            rules["avoid_terms"].extend(_literal_terms(body))
+
+        limit = re.search(r"(?:max(?:imum)?|under|up to|limit)\s*:?\s*(\d[\d,]*)\s*(?:characters|chars)"
+                          r"|(\d[\d,]*)\s*(?:characters|chars)\s*(?:max|maximum|limit)", lower)
+        # Subject lines, preview text and headlines have their own limits
+        if limit and not any(k in label for k in ("subject", "preview", "headline", "title")):
+            rules["max_chars"] = int((limit.group(1) or limit.group(2)).replace(",", ""))
+
+        if "hashtag" in label or "hashtag" in lower:
+            if re.search(r"\bno hashtags?\b", lower):
+                rules["max_hashtags"] = 0
+            else:
+                count = (re.search(r"(\d+)\s*(?:-|–|to)\s*(\d+)\s*in (?:the )?caption", lower)
+                         or re.search(r"(\d+)(?:\s*(?:-|–|to)\s*(\d+))?", lower))
+                if count:
+                    rules["max_hashtags"] = int(count.group(2) or count.group(1))
+        if "emoji" in label:
+            if re.search(r"^(?:no|none|never)\b", lower):
+                rules["max_emoji"] = 0
+            else:
+                count = re.search(r"(\d+)(?:\s*(?:-|–|to)\s*(\d+))?\s*per", lower)
+                if count:
+                    rules["max_emoji"] = int(count.group(2) or count.group(1))
+    return rules
+
+
+def _source_stamps(guidelines_dir):
+    """{relative path: [mtime_ns, size]} for every file the rule index reads."""
+    stamps = {}
+    paths = [guidelines_dir / GUIDELINE_CATEGORIES[c]["file"] for c in ("restrictions", "channel-styles")]
+    custom_dir = guidelines_dir / "custom"
+    if custom_dir.exists():
+        paths.extend(sorted(f for f in custom_dir.iterdir() if f.suffix == ".md"))
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        stamps[path.relative_to(guidelines_dir).as_posix()] = [st.st_mtime_ns, st.st_size]
+    return stamps
+
+
+def compile_rule_index(guidelines_dir, slug, texts=None):
+    """Compile restrictions, channel styles and custom files into _rules.json.
+
+    texts optionally maps relative paths to already-read contents (so
+    rebuild_manifest does not read each file twice).
+    """
+    texts = texts or {}
+    stamps = _source_stamps(guidelines_dir)
+    index = {
+        "version": RULE_INDEX_VERSION,
+        "brand": slug,
+        "compiled_at": datetime.now().isoformat(),
+        "sources": stamps,
+        "banned_terms": [],
+        "restricted_claims": [],
+        "disclaimers": [],
+        "prohibited_topics": [],
+        "channels": {},
+    }
+
+    for source in stamps:
+        content = texts.get(source)
+        if content is None:
+            content = (guidelines_dir / source).read_text(encoding="utf-8")
+
+        if source == GUIDELINE_CATEGORIES["channel-styles"]["file"]:
+            grouped = {}
+            for channel, line_no, item in channel_sections(content):
+                grouped.setdefault(channel, []).append((line_no, item))
+            for channel, items in grouped.items():
+                index["channels"][channel.lower()] = _channel_rules(channel, items)
+            continue
+
+        for section, line_no, item in restriction_items(content):
+            subject, guidance = _split_rule(item)
+            base = {"rule": item, "source": source, "line": line_no}
+            if section == "banned":
+                index["banned_terms"].append({
+                    "terms": _banned_terms(subject), "suggestion": guidance or None, **base,
+                })
+            elif section == "claims":
+                index["restricted_claims"].append({
+                    "claim": re.sub(r"[*_]", "", subject),
+                    "terms": _literal_terms(subject),
+                    "patterns": _claim_patterns(subject),
+                    "requirement": guidance or None,
+                    "qualifiers": _literal_terms(guidance),
+                    **base,
+                })
+            elif section == "disclaimers":
+                match = LABEL.match(item)
+                applies_to = match.group(1).strip() if match else subject.split(":")[0].strip()
+                index["disclaimers"].append({
+                    "applies_to": applies_to, "text": _literal_terms(item), **base,
+                })
+            elif section == "topics":
+                index["prohibited_topics"].append({
+                    "topic": re.sub(r"[*_]", "", subject), "terms": _literal_terms(item), **base,
+                })
+
+    save_json(guidelines_dir / RULE_INDEX_FILE, index)
+    return index
+
+
+def load_rule_index(guidelines_dir, slug):
+    """Return (index, rebuilt); recompiles only when a source file changed."""
+    index = load_json(guidelines_dir / RULE_INDEX_FILE)
+    if (isinstance(index, dict) and index.get("version") == RULE_INDEX_VERSION
+            and index.get("sources") == _source_stamps(guidelines_dir)):
+        return index, False
+    return compile_rule_index(guidelines_dir, slug), True
+
+
 def rebuild_manifest(guidelines_dir, slug):
-    """Rebuild _manifest.json from existing guideline files."""
+    """Rebuild _manifest.json (and the rule index) from existing guideline files."""
     manifest = {
         "brand": slug,
         "updated_at": datetime.now().isoformat(),
@@ -128,11 +374,15 @@ def rebuild_manifest(guidelines_dir, slug):
         "total_rules": 0,
     }
 
+    # Each file is read once; the rule index is compiled from the same text
+    texts = {}
     total = 0
     for cat_key, cat_info in GUIDELINE_CATEGORIES.items():
         filepath = guidelines_dir / cat_info["file"]
         if filepath.exists():
-            rules = count_rules_in_file(filepath)
+            content = filepath.read_text(encoding="utf-8")
+            texts[cat_info["file"]] = content
+            rules = count_rules(content)
             total += rules
             entry = {
                 "file": cat_info["file"],
@@ -141,32 +391,10 @@ def rebuild_manifest(guidelines_dir, slug):
             }
             if cat_key == "restrictions":
                 # Count banned words and restricted claims separately
-                content = filepath.read_text(encoding="utf-8")
-                banned = 0
-                claims = 0
-                in_banned = False
-                in_claims = False
-                for line in content.splitlines():
-                    lower = line.lower().strip()
-                    if "banned" in lower and ("word" in lower or "phrase" in lower or "#" in line):
-                        in_banned = True
-                        in_claims = False
-                    elif "restricted" in lower and "claim" in lower:
-                        in_claims = True
-                        in_banned = False
-                    elif line.strip().startswith("#"):
-                        in_banned = False
-                        in_claims = False
-
-                    if (in_banned and (line.strip().startswith("- ") or line.strip().startswith("* "))):
-                        banned += 1
-                    elif (in_claims and (line.strip().startswith("- ") or line.strip().startswith("* "))):
-                        claims += 1
-
-                entry["banned_words"] = banned
-                entry["restricted_claims"] = claims
+                sections = [section for section, _, _ in restriction_items(content)]
+                entry["banned_words"] = sections.count("banned")
+                entry["restricted_claims"] = sections.count("claims")
             elif cat_key == "channel-styles":
-                content = filepath.read_text(encoding="utf-8")
                 channels = sum(1 for line in content.splitlines()
                              if line.strip().startswith("##") and not line.strip().startswith("###"))
                 entry["channels_covered"] = channels
@@ -179,10 +407,13 @@ def rebuild_manifest(guidelines_dir, slug):
         for f in sorted(custom_dir.iterdir()):
             if f.is_file() and f.suffix == ".md":
                 manifest["custom_files"].append(f.name)
-                total += count_rules_in_file(f)
+                content = f.read_text(encoding="utf-8")
+                texts[f"custom/{f.name}"] = content
+                total += count_rules(content)
 
     manifest["total_rules"] = total
     save_manifest(guidelines_dir / "_manifest.json", manifest)
+    compile_rule_index(guidelines_dir, slug, texts)
     return manifest
 
 
@@ -383,6 +614,222 @@ def delete_category(slug, category):
     return {"status": "deleted", "category": category, "total_rules": manifest.get("total_rules", 0)}
 
 
+def compile_rules(slug):
+    """Force a rebuild of the compiled rule index."""
+    guidelines_dir, err = get_guidelines_dir(slug)
+    if err:
+        return {"error": err}
+
+    index = compile_rule_index(guidelines_dir, slug)
+    return {
+        "status": "compiled",
+        "brand": slug,
+        "file": str(guidelines_dir / RULE_INDEX_FILE),
+        "sources": sorted(index["sources"]),
+        "banned_terms": sum(len(r["terms"]) for r in index["banned_terms"]),
+        "restricted_claims": len(index["restricted_claims"]),
+        "disclaimers": len(index["disclaimers"]),
+        "prohibited_topics": len(index["prohibited_topics"]),
+        "channels": sorted(index["channels"]),
+    }
+
+
+_SCANNERS = {}
+
+
+def _index_scanners(index):
+    """(KeywordScanner, PatternScanner) for an index, built once per compile."""
+    key = (index.get("brand"), index.get("compiled_at"))
+    if key not in _SCANNERS:
+        keywords = []
+        for i, rule in enumerate(index["banned_terms"]):
+            keywords.extend((term, ("banned_term", i)) for term in rule["terms"])
+        for i, rule in enumerate(index["restricted_claims"]):
+            keywords.extend((term, ("restricted_claim", i)) for term in rule["terms"])
+        for i, rule in enumerate(index["prohibited_topics"]):
+            keywords.extend((term, ("prohibited_topic", i)) for term in rule["terms"])
+        for channel, rules in index["channels"].items():
+            keywords.extend((term, ("channel_style", channel)) for term in rules["avoid_terms"])
+        patterns = [(pattern, i) for i, rule in enumerate(index["restricted_claims"])
+                    for pattern in rule["patterns"]]
+        _SCANNERS[key] = (KeywordScanner(keywords),
+                          PatternScanner([("claims", patterns, re.IGNORECASE)]))
+    return _SCANNERS[key]
+
+
+def _find_channel(index, channel):
+    wanted = channel.lower().strip()
+    for key, rules in index["channels"].items():
+        names = [key] + [part.strip() for part in re.split(r"[/(),]", key) if part.strip()]
+        if wanted in names:
+            return key, rules
+    for key, rules in index["channels"].items():
+        if key.startswith(wanted):
+            return key, rules
+    return None, None
+
+
+def scan_text(index, text, channel=None):
+    """Check text against every compiled rule; returns (violations, channel_key)."""
+    keyword_scanner, claim_scanner = _index_scanners(index)
+    lower_text = text.lower()
+    violations = []
+    qualified_cache = {}
+
+    def qualified(rule):
+        # Whether the draft already carries the claim's required qualifier
+        key = rule["rule"]
+        if key not in qualified_cache:
+            qualified_cache[key] = any(q.lower() in lower_text for q in rule.get("qualifiers", []))
+        return qualified_cache[key]
+
+    for hit in keyword_scanner.scan(text):
+        kind, ref = hit.payload
+        if kind == "channel_style":
+            if channel is None or ref != channel:
+                continue
+            rule = {"rule": f"Avoid \"{hit.keyword}\" on {index['channels'][ref]['name']}",
+                    "source": GUIDELINE_CATEGORIES["channel-styles"]["file"], "line": None}
+            violations.append(_violation(kind, hit.start, hit.end, text, rule))
+            continue
+        if kind == "banned_term":
+            rule = index["banned_terms"][ref]
+            violations.append(_violation(kind, hit.start, hit.end, text, rule, rule["suggestion"]))
+        elif kind == "restricted_claim":
+            rule = index["restricted_claims"][ref]
+            if not qualified(rule):
+                violations.append(_violation(kind, hit.start, hit.end, text, rule, rule["requirement"]))
+        else:
+            rule = index["prohibited_topics"][ref]
+            violations.append(_violation(kind, hit.start, hit.end, text, rule))
+
+    for hit in claim_scanner.scan(text):
+        rule = index["restricted_claims"][hit.label]
+        if not qualified(rule):
+            violations.append(_violation("restricted_claim", hit.start, hit.end, text, rule,
+                                         rule["requirement"]))
+
+    if channel is not None:
+        violations.extend(_channel_violations(index["channels"][channel], text))
+
+    # One report per span and rule (a claim can match several trigger patterns)
+    seen = set()
+    unique = []
+    for v in sorted(violations, key=lambda v: (v["start"] if v["start"] is not None else len(text),
+                                               v["end"] or 0)):
+        key = (v["type"], v["start"], v["end"], v["rule"])
+        if key not in seen:
+            seen.add(key)
+            unique.append(v)
+    return unique
+
+
+def _violation(kind, start, end, text, rule, suggestion=None):
+    return {
+        "type": kind,
+        "match": text[start:end] if start is not None else None,
+        "start": start,
+        "end": end,
+        "rule": rule["rule"],
+        "suggestion": suggestion,
+        "source": rule.get("source"),
+        "source_line": rule.get("line"),
+    }
+
+
+def _channel_violations(rules, text):
+    source = {"source": GUIDELINE_CATEGORIES["channel-styles"]["file"], "line": None}
+    name = rules["name"]
+    found = []
+    if rules["max_chars"] is not None and len(text) > rules["max_chars"]:
+        found.append(_violation("channel_style", rules["max_chars"], len(text), text,
+                                {**source, "rule": f"{name}: max {rules['max_chars']} characters"},
+                                f"Trim {len(text) - rules['max_chars']} characters"))
+    if rules["max_hashtags"] is not None:
+        tags = list(HASHTAG.finditer(text))
+        for m in tags[rules["max_hashtags"]:]:
+            found.append(_violation("channel_style", m.start(), m.end(), text,
+                                    {**source, "rule": f"{name}: max {rules['max_hashtags']} hashtags"},
+                                    f"Remove {len(tags) - rules['max_hashtags']} hashtag(s)"))
+    emoji = list(EMOJI.finditer(text))
+    if rules["max_emoji"] is not None:
+        for m in emoji[rules["max_emoji"]:]:
+            found.append(_violation("channel_style", m.start(), m.end(), text,
+                                    {**source, "rule": f"{name}: max {rules['max_emoji']} emoji"}))
+    if not rules["emoji_first_line"]:
+        first_line_end = text.find("\n") if "\n" in text else len(text)
+        for m in emoji:
+            if m.start() >= first_line_end:
+                break
+            found.append(_violation("channel_style", m.start(), m.end(), text,
+                                    {**source, "rule": f"{name}: no emoji in first line"}))
+    return found
+
+
+def _missing_disclaimers(index, text, channel, violations):
+    """Mandatory disclaimers whose trigger (channel or claim type) applies but are absent."""
+    lower_text = text.lower()
+    claim_hit = {v["rule"] for v in violations if v["type"] == "restricted_claim"}
+    claim_text = " ".join(r["claim"].lower() for r in index["restricted_claims"] if r["rule"] in claim_hit)
+    missing = []
+    for rule in index["disclaimers"]:
+        applies = rule["applies_to"].lower()
+        triggered = (channel is not None and channel.split("/")[0] in applies) or any(
+            key in applies and key in claim_text for key in CLAIM_TRIGGERS)
+        if triggered and rule["text"] and not any(t.lower() in lower_text for t in rule["text"]):
+            missing.append(_violation("missing_disclaimer", None, None, text, rule,
+                                      "Add: " + " / ".join(f'"{t}"' for t in rule["text"])))
+    return missing
+
+
+def scan_draft(slug, text=None, filepath=None, channel=None):
+    """Scan a draft against the brand's compiled guideline rules."""
+    guidelines_dir, err = get_guidelines_dir(slug)
+    if err:
+        return {"error": err}
+
+    if filepath:
+        source = Path(filepath)
+        if not source.exists():
+            return {"error": f"Draft file not found: {filepath}"}
+        text = source.read_text(encoding="utf-8")
+    elif text is None:
+        return {"error": "Provide --content or --file with the draft to scan."}
+
+    index, rebuilt = load_rule_index(guidelines_dir, slug)
+
+    channel_key = None
+    if channel:
+        channel_key, _ = _find_channel(index, channel)
+        if channel_key is None:
+            return {"error": f"No channel style for '{channel}'. "
+                             f"Configured: {', '.join(index['channels']) or 'none'}"}
+
+    violations = scan_text(index, text, channel_key)
+    violations.extend(_missing_disclaimers(index, text, channel_key, violations))
+
+    line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+    counts = {}
+    for v in violations:
+        v["line"] = bisect.bisect_right(line_starts, v["start"]) if v["start"] is not None else None
+        counts[v["type"]] = counts.get(v["type"], 0) + 1
+
+    return {
+        "brand": slug,
+        "channel": channel_key,
+        "characters": len(text),
+        "violations": violations,
+        "counts": counts,
+        "passed": not violations,
+        "index": {
+            "rebuilt": rebuilt,
+            "compiled_at": index["compiled_at"],
+            "banned_terms": sum(len(r["terms"]) for r in index["banned_terms"]),
+            "restricted_claims": len(index["restricted_claims"]),
+        },
+    }
+
+
 # --- Template Actions ---
 
 def list_templates(slug):
@@ -579,7 +1026,7 @@ def main():
         "--action",
         required=True,
         choices=[
-            "summary", "get", "save", "delete", "list-categories",
+            "summary", "get", "save", "delete", "list-categories", "compile", "scan",
             "list-templates", "get-template", "save-template", "delete-template",
             "list-sops", "get-sop", "save-sop", "delete-sop",
         ],
@@ -587,14 +1034,15 @@ def main():
     )
     parser.add_argument("--category", help="Guideline category (for get/save/delete)")
     parser.add_argument("--name", help="Template or SOP name")
-    parser.add_argument("--file", help="Source file path (for save actions)")
-    parser.add_argument("--content", help="Direct content string (for save actions)")
+    parser.add_argument("--file", help="Source file path (for save actions, or the draft to scan)")
+    parser.add_argument("--content", help="Direct content string (for save actions, or the draft to scan)")
+    parser.add_argument("--channel", help="Channel style to enforce when scanning (e.g. linkedin, email)")
     parser.add_argument("--description", default="", help="Description (for save-template/save-sop)")
 
     args = parser.parse_args()
 
     # Brand-level actions require --brand
-    brand_actions = {"summary", "get", "save", "delete", "list-categories",
+    brand_actions = {"summary", "get", "save", "delete", "list-categories", "compile", "scan",
                      "list-templates", "get-template", "save-template", "delete-template"}
     if args.action in brand_actions and not args.brand:
         print(json.dumps({"error": f"--brand is required for action '{args.action}'"}))
@@ -625,6 +1073,12 @@ def main():
     elif args.action == "list-categories":
         result = list_categories(args.brand)
 
+    elif args.action == "compile":
+        result = compile_rules(args.brand)
+
+    elif args.action == "scan":
+        result = scan_draft(args.brand, text=args.content, filepath=args.file, channel=args.channel)
+
     elif args.action == "list-templates":
         result = list_templates(args.brand)
 
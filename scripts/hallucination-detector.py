@@ -40,6 +40,8 @@ import re
 import sys
 from pathlib import Path
 
+from pattern_scanner import PatternScanner, compile_any, sentence_of, sentence_spans
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 # ---------------------------------------------------------------------------
@@ -180,9 +182,333 @@ SEVERITY_DEDUCTIONS = {
 
 
 # ---------------------------------------------------------------------------
-# Helper: split text into sentences (stdlib-only)
+# Compiled scanner (built once per process)
+# ---------------------------------------------------------------------------
+
+# Every finding pattern goes through one single-pass scan; the context
+# checks (citation, substantiation, hedging, headline/CTA) are one combined
+# regex each, evaluated at most once per sentence. None of the per-sentence
+# patterns can match across a sentence boundary, so scanning the whole text
+# and mapping hits back to sentences gives the same matches as scanning each
+# sentence separately.
+_SCANNER = PatternScanner([
+    ("stat", STAT_PATTERNS, re.IGNORECASE),
+    ("claim", SUPERLATIVE_PATTERNS, re.IGNORECASE),
+    ("hedging", DEFINITIVE_CLAIM_PATTERNS, re.IGNORECASE),
+    ("entity", ENTITY_PATTERNS, 0),
+    ("placeholder", PLACEHOLDER_TEXT_PATTERNS, re.IGNORECASE),
+])
+_SENTENCE_FAMILIES = ("stat", "claim", "hedging")
+
+_CITATION_RE = compile_any(CITATION_PATTERNS, re.IGNORECASE)
+_SUBSTANTIATION_RE = compile_any(SUBSTANTIATION_PATTERNS, re.IGNORECASE)
+_HEDGING_RE = compile_any(HEDGING_PATTERNS, re.IGNORECASE)
+_HEADLINE_CTA_RE = compile_any(HEADLINE_CTA_PATTERNS, re.IGNORECASE)
+_PLACEHOLDER_URL_RE = compile_any(PLACEHOLDER_URL_PATTERNS)
+_URL_RE = re.compile(r'https?://[^\s<>\[\]"\')\}]+')
+
+
+class ScanResult:
+    """One scan of a text: its sentences, hits per family and cached context checks."""
+
+    def __init__(self, text):
+        spans = sentence_spans(text)
+        self.sentences = [text[start:end] for start, end in spans]
+        self.hits = {family: [] for family in ("stat", "claim", "hedging", "entity", "placeholder")}
+        for hit in _SCANNER.scan(text):
+            if hit.family in _SENTENCE_FAMILIES:
+                sent_idx = sentence_of(spans, hit.start)
+                if sent_idx is None:
+                    continue
+                self.hits[hit.family].append((sent_idx, hit))
+            else:
+                self.hits[hit.family].append((None, hit))
+        self._matches = {}
+
+    def ordered(self, family):
+        """Hits of one family in the order the per-pattern loops produced them."""
+        hits = self.hits[family]
+        if family in _SENTENCE_FAMILIES:
+            return sorted(hits, key=lambda item: (item[0], item[1].index, item[1].start))
+        return sorted(hits, key=lambda item: (item[1].index, item[1].start))
+
+    def sentence_matches(self, regex, idx):
+        """Whether regex matches sentence idx (cached per regex and sentence)."""
+        key = (regex.pattern, idx)
+        found = self._matches.get(key)
+        if found is None:
+            found = self._matches[key] = regex.search(self.sentences[idx]) is not None
+        return found
+
+    def window_matches(self, regex, idx, window=2):
+        """Whether regex matches any sentence within +/- window of idx."""
+        start = max(0, idx - window)
+        end = min(len(self.sentences), idx + window + 1)
+        return any(self.sentence_matches(regex, i) for i in range(start, end))
+
+
+# ---------------------------------------------------------------------------
+# Check functions
+# ---------------------------------------------------------------------------
+
+def check_stats(text, scan=None):
+    """Detect statistics without source attribution."""
+    if scan is None:
+        scan = ScanResult(text)
+    flags = []
+
+    for sent_idx, hit in scan.ordered("stat"):
+        # Check for citation in a 2-sentence window
+        if scan.window_matches(_CITATION_RE, sent_idx, window=2):
+            continue
+        sentence = scan.sentences[sent_idx]
+        in_headline = scan.sentence_matches(_HEADLINE_CTA_RE, sent_idx)
+        severity = "high" if in_headline else "medium"
+        flags.append({
+            "type": "unverified_statistic",
+            "value": hit.match.group(0),
+            "stat_type": hit.label,
+            "context": sentence.strip()[:200],
+            "severity": severity,
+            "reason": (
+                "Statistic lacks source attribution. No citation, "
+                "source reference, date, or hyperlink found within "
+                "surrounding context."
+            ),
+        })
+
+    return flags
+
+
+def check_urls(text, brand_domain=None, scan=None):
+    """Detect placeholder or suspicious URLs."""
+    if scan is None:
+        scan = ScanResult(text)
+    flags = []
+
+    # Check inline placeholder patterns (e.g. [link], [URL])
+    for _, hit in scan.ordered("placeholder"):
+        flags.append({
+            "type": "placeholder_text",
+            "value": hit.match.group(0),
+            "context": text[max(0, hit.start - 40):hit.end + 40].strip(),
+            "severity": "high",
+            "reason": "Placeholder text found that should be replaced with actual content.",
+        })
+
+    # Extract URLs and check for placeholder patterns
+    for match in _URL_RE.finditer(text):
+        url = match.group(0).rstrip(".,;:!?)")
+        url_lower = url.lower()
+
+        # Skip if it matches the brand's own domain
+        if brand_domain and brand_domain.lower() in url_lower:
+            continue
+
+        if _PLACEHOLDER_URL_RE.search(url_lower):
+            flags.append({
+                "type": "suspicious_url",
+                "value": url,
+                "context": text[max(0, match.start() - 40):match.end() + 40].strip(),
+                "severity": "high",
+                "reason": (
+                    f"URL matches placeholder pattern. Replace with "
+                    f"a real, verified link before publishing."
+                ),
+            })
+
+    return flags
+
+
+def check_claims(text, scan=None):
+    """Detect unsubstantiated superlative and exclusive claims."""
+    if scan is None:
+        scan = ScanResult(text)
+    flags = []
+
+    for sent_idx, hit in scan.ordered("claim"):
+        if scan.window_matches(_SUBSTANTIATION_RE, sent_idx, window=2):
+            continue
+        sentence = scan.sentences[sent_idx]
+        in_headline = scan.sentence_matches(_HEADLINE_CTA_RE, sent_idx)
+        severity = "high" if in_headline else "medium"
+        flags.append({
+            "type": "unsubstantiated_claim",
+            "claim_type": hit.label,
+            "value": hit.match.group(0),
+            "context": sentence.strip()[:200],
+            "severity": severity,
+            "reason": (
+                "Superlative or exclusive claim lacks substantiation. "
+                "Add a certification, ranking source, or qualifying "
+                "context."
+            ),
+        })
+
+    return flags
+
+
+def check_entities(text, scan=None):
+    """Detect potentially fabricated entity references."""
+    if scan is None:
+        scan = ScanResult(text)
+    flags = []
+
+    for _, hit in scan.ordered("entity"):
+        match = hit.match
+        entity_type = hit.label
+        entity_name = match.group(1) if match.lastindex else match.group(0)
+        # Get surrounding context
+        start = max(0, match.start() - 60)
+        end = min(len(text), match.end() + 60)
+        context = text[start:end].strip()
+
+        severity = "medium" if entity_type == "academic_citation" else "low"
+        flags.append({
+            "type": "entity_to_verify",
+            "entity_type": entity_type,
+            "value": entity_name.strip(),
+            "context": context[:200],
+            "severity": severity,
+            "status": "requires_verification",
+            "reason": (
+                "Entity reference should be independently verified. "
+                "AI models can fabricate study names, organizations, "
+                "and expert citations."
+            ),
+        })
+
+    return flags
+
+
+def check_hedging(text, scan=None):
+    """Detect definitive forward-looking claims that lack hedging."""
+    if scan is None:
+        scan = ScanResult(text)
+    flags = []
+
+    for sent_idx, hit in scan.ordered("hedging"):
+        # Check if the same sentence has hedging language
+        if scan.sentence_matches(_HEDGING_RE, sent_idx):
+            continue
+        claim_type = hit.label
+        severity = "medium" if claim_type in ("definitive_future", "guarantee") else "low"
+        flags.append({
+            "type": "missing_hedging",
+            "claim_type": claim_type,
+            "value": hit.match.group(0),
+            "context": scan.sentences[sent_idx].strip()[:200],
+            "severity": severity,
+            "reason": (
+                "Definitive claim without hedging language. "
+                "Consider softer phrasing (e.g., 'can increase' "
+                "instead of 'will increase', 'may help' instead "
+                "of 'guarantees')."
+            ),
+        })
+
+    return flags
+
+
+# ---------------------------------------------------------------------------
+# Scoring
+# ---------------------------------------------------------------------------
+
+def compute_score(all_flags):
+    """Compute hallucination score from flags. Start at 100, subtract per flag."""
+    score = 100
+    critical_count = 0
+
+    for flag in all_flags:
+        severity = flag.get("severity", "low")
+        deduction = SEVERITY_DEDUCTIONS.get(severity, 2)
+        score -= deduction
+        if severity == "critical":
+            critical_count += 1
+
+    score = max(0, score)
+    return score, critical_count
+
+
+def interpret_score(score):
+    """Return human-readable interpretation of the hallucination score."""
+    if score >= 90:
+        return "Minimal hallucination risk"
+    elif score >= 75:
+        return "Low hallucination risk"
+    elif score >= 60:
+        return "Moderate hallucination risk - review recommended"
+    elif score >= 40:
+        return "High hallucination risk - revision required"
+    else:
+        return "Critical hallucination risk - do not publish"
+
+
+# ---------------------------------------------------------------------------
+# Action handlers
+# ---------------------------------------------------------------------------
+
+def action_detect(text, brand_domain=None):
+    """Run all hallucination checks and return combined results."""
+    scan = ScanResult(text)
+    stat_flags = check_stats(text, scan)
+    url_flags = check_urls(text, brand_domain, scan)
+    claim_flags = check_claims(text, scan)
+    entity_flags = check_entities(text, scan)
+    hedging_flags = check_hedging(text, scan)
+
+    all_flags = stat_flags + url_flags + claim_flags + entity_flags + hedging_flags
+    score, critical_count = compute_score(all_flags)
+
+    return {
+        "hallucination_score": score,
+        "interpretation": interpret_score(score),
+        "checks": {
+            "unverified_statistics": stat_flags,
+            "suspicious_urls": url_flags,
+            "unsubstantiated_claims": claim_flags,
+            "entities_to_verify": entity_flags,
+            "missing_hedging": hedging_flags,
+        },
+        "total_flags": len(all_flags),
+        "critical_flags": critical_count,
+    }
+
+
+def action_check_urls(text, brand_domain=None):
+    """Run URL checks only."""
+    flags = check_urls(text, brand_domain)
+    return {
+        "suspicious_urls": flags,
+        "total_flags": len(flags),
+    }
+
+
+def action_check_stats(text):
+    """Run statistics checks only."""
+    flags = check_stats(text)
+    return {
+        "unverified_statistics": flags,
+        "total_flags": len(flags),
+    }
+
+
+def action_check_entities(text):
+    """Run entity checks only."""
+    flags = check_entities(text)
+    return {
+        "entities_to_verify": flags,
+        "total_flags": len(flags),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (per-sentence, per-pattern loops)
 # ---------------------------------------------------------------------------
-def _split_sentences(text):
+# The original checks, kept for benchmarking and verifying the scanner:
+#   python pattern_scanner.py --benchmark 10000
+
+def _split_sentences_bruteforce(text):
     """Split text into rough sentences using regex."""
     # Split on sentence-ending punctuation followed by space and uppercase letter
     # This avoids splitting on abbreviations like Dr., Inc., U.S., e.g., etc.
@@ -197,7 +523,7 @@ def _get_sentence_window(sentences, idx, window=2):
     return " ".join(sentences[start:end])
 
 
-def _is_in_headline_or_cta(sentence):
+def _is_in_headline_or_cta_bruteforce(sentence):
     """Check if a sentence appears to be a headline or CTA."""
     for pattern in HEADLINE_CTA_PATTERNS:
         if re.search(pattern, sentence, re.IGNORECASE):
@@ -205,14 +531,10 @@ def _is_in_headline_or_cta(sentence):
     return False
 
 
-# ---------------------------------------------------------------------------
-# Check functions
-# ---------------------------------------------------------------------------
-
-def check_stats(text):
+def _check_stats_bruteforce(text):
     """Detect statistics without source attribution."""
     flags = []
-    sentences = _split_sentences(text)
+    sentences = _split_sentences_bruteforce(text)
 
     for sent_idx, sentence in enumerate(sentences):
         for pattern, stat_type in STAT_PATTERNS:
@@ -226,7 +548,7 @@ def check_stats(text):
                 )
 
                 if not has_citation:
-                    in_headline = _is_in_headline_or_cta(sentence)
+                    in_headline = _is_in_headline_or_cta_bruteforce(sentence)
                     severity = "high" if in_headline else "medium"
                     flags.append({
                         "type": "unverified_statistic",
@@ -244,7 +566,7 @@ def check_stats(text):
     return flags
 
 
-def check_urls(text, brand_domain=None):
+def _check_urls_bruteforce(text, brand_domain=None):
     """Detect placeholder or suspicious URLs."""
     flags = []
 
@@ -277,8 +599,8 @@ def check_urls(text, brand_domain=None):
                     "context": text[max(0, match.start() - 40):match.end() + 40].strip(),
                     "severity": "high",
                     "reason": (
-                        f"URL matches placeholder pattern. Replace with "
-                        f"a real, verified link before publishing."
+                        "URL matches placeholder pattern. Replace with "
+                        "a real, verified link before publishing."
                     ),
                 })
                 break  # one flag per URL is sufficient
@@ -286,10 +608,10 @@ def check_urls(text, brand_domain=None):
     return flags
 
 
-def check_claims(text):
+def _check_claims_bruteforce(text):
     """Detect unsubstantiated superlative and exclusive claims."""
     flags = []
-    sentences = _split_sentences(text)
+    sentences = _split_sentences_bruteforce(text)
 
     for sent_idx, sentence in enumerate(sentences):
         for pattern, claim_type in SUPERLATIVE_PATTERNS:
@@ -302,7 +624,7 @@ def check_claims(text):
                 )
 
                 if not has_substantiation:
-                    in_headline = _is_in_headline_or_cta(sentence)
+                    in_headline = _is_in_headline_or_cta_bruteforce(sentence)
                     severity = "high" if in_headline else "medium"
                     flags.append({
                         "type": "unsubstantiated_claim",
@@ -320,7 +642,7 @@ def check_claims(text):
     return flags
 
 
-def check_entities(text):
+def _check_entities_bruteforce(text):
     """Detect potentially fabricated entity references."""
     flags = []
 
@@ -350,10 +672,10 @@ def check_entities(text):
     return flags
 
 
-def check_hedging(text):
+def _check_hedging_bruteforce(text):
     """Detect definitive forward-looking claims that lack hedging."""
     flags = []
-    sentences = _split_sentences(text)
+    sentences = _split_sentences_bruteforce(text)
 
     for sent_idx, sentence in enumerate(sentences):
         for pattern, claim_type in DEFINITIVE_CLAIM_PATTERNS:
@@ -384,51 +706,13 @@ def check_hedging(text):
     return flags
 
 
-# ---------------------------------------------------------------------------
-# Scoring
-# ---------------------------------------------------------------------------
-
-def compute_score(all_flags):
-    """Compute hallucination score from flags. Start at 100, subtract per flag."""
-    score = 100
-    critical_count = 0
-
-    for flag in all_flags:
-        severity = flag.get("severity", "low")
-        deduction = SEVERITY_DEDUCTIONS.get(severity, 2)
-        score -= deduction
-        if severity == "critical":
-            critical_count += 1
-
-    score = max(0, score)
-    return score, critical_count
-
-
-def interpret_score(score):
-    """Return human-readable interpretation of the hallucination score."""
-    if score >= 90:
-        return "Minimal hallucination risk"
-    elif score >= 75:
-        return "Low hallucination risk"
-    elif score >= 60:
-        return "Moderate hallucination risk - review recommended"
-    elif score >= 40:
-        return "High hallucination risk - revision required"
-    else:
-        return "Critical hallucination risk - do not publish"
-
-
-# ---------------------------------------------------------------------------
-# Action handlers
-# ---------------------------------------------------------------------------
-
-def action_detect(text, brand_domain=None):
-    """Run all hallucination checks and return combined results."""
-    stat_flags = check_stats(text)
-    url_flags = check_urls(text, brand_domain)
-    claim_flags = check_claims(text)
-    entity_flags = check_entities(text)
-    hedging_flags = check_hedging(text)
+def detect_bruteforce(text, brand_domain=None):
+    """action_detect() computed with the reference loops."""
+    stat_flags = _check_stats_bruteforce(text)
+    url_flags = _check_urls_bruteforce(text, brand_domain)
+    claim_flags = _check_claims_bruteforce(text)
+    entity_flags = _check_entities_bruteforce(text)
+    hedging_flags = _check_hedging_bruteforce(text)
 
     all_flags = stat_flags + url_flags + claim_flags + entity_flags + hedging_flags
     score, critical_count = compute_score(all_flags)
@@ -448,33 +732,6 @@ def action_detect(text, brand_domain=None):
     }
 
 
-def action_check_urls(text, brand_domain=None):
-    """Run URL checks only."""
-    flags = check_urls(text, brand_domain)
-    return {
-        "suspicious_urls": flags,
-        "total_flags": len(flags),
-    }
-
-
-def action_check_stats(text):
-    """Run statistics checks only."""
-    flags = check_stats(text)
-    return {
-        "unverified_statistics": flags,
-        "total_flags": len(flags),
-    }
-
-
-def action_check_entities(text):
-    """Run entity checks only."""
-    flags = check_entities(text)
-    return {
-        "entities_to_verify": flags,
-        "total_flags": len(flags),
-    }
-
-
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
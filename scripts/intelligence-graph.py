@@ -10,6 +10,11 @@ and exports actionable playbooks.  Supports time-decay and archival.
 
 Storage: ~/.claude-marketing/brands/{slug}/intelligence/active/
          ~/.claude-marketing/brands/{slug}/intelligence/archived/
+         ~/.claude-marketing/brands/{slug}/intelligence/_index.json
+
+Queries read a compact index (confidence, last-validated, agent and
+conditions per learning, plus postings by dimension value) and load only
+the learning files they return. Time decay is applied lazily at read time.
 
 Dependencies: none (stdlib only)
 
@@ -22,34 +27,35 @@ Usage:
     python intelligence-graph.py --brand acme --action archive-stale --max-age-days 180 --min-confidence 0.3
     python intelligence-graph.py --brand acme --action export-playbook --channel organic --min-confidence 0.6
     python intelligence-graph.py --brand acme --action apply-time-decay --decay-rate 0.01
+    python intelligence-graph.py --brand acme --action rebuild-index
 """
 
 import argparse
+import bisect
 import hashlib
+import heapq
 import json
+import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from brand_store import load_json, locked, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 CONTEXT_DIMENSIONS = ["channel", "audience", "objective", "industry", "campaign_type"]
 
+INDEX_FILE = "_index.json"
+INDEX_VERSION = 1
+
 
 def _load_json(path, default=None):
-    if default is None:
-        default = {}
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, {} if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _intel_dirs(slug):
@@ -77,6 +83,133 @@ def _brand_check(slug):
     return None
 
 
+# ── Index ────────────────────────────────────────────────────────────────────
+#
+# intelligence/_index.json holds one compact entry per active learning and
+# postings keyed by condition dimension -> lowercased value -> learning ids,
+# so queries read the index plus only the learning files they return.
+#
+#   {"version": 1, "dir_mtime_ns": ..., "decay": {"rate": 0.01, "set_at": ...},
+#    "learnings": {lid: {"c": confidence, "v": last_validated, "t": created_at,
+#                        "a": source_agent, "d": {dimension: value}}},
+#    "postings": {dimension: {value.lower(): [lid, ...]}}}
+#
+# Every write in this script goes through an atomic rename in active/, which
+# bumps the directory mtime; an index whose dir_mtime_ns no longer matches
+# is rebuilt from the learning files on next use.
+
+def _index_path(base):
+    return base / INDEX_FILE
+
+
+def _dir_stamp(active_dir):
+    try:
+        return os.stat(active_dir).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _norm(value):
+    return value.lower() if isinstance(value, str) else None
+
+
+def _index_put(index, lid, record):
+    _index_drop(index, lid)
+    conds = record.get("conditions")
+    if not isinstance(conds, dict):
+        conds = {}
+    dims = {dim: conds[dim] for dim in CONTEXT_DIMENSIONS if isinstance(conds.get(dim), str)}
+    index["learnings"][lid] = {
+        "c": record.get("confidence", 0.5),
+        "v": record.get("last_validated"),
+        "t": record.get("created_at"),
+        "a": record.get("source_agent", "unknown"),
+        "d": dims,
+    }
+    for dim, value in dims.items():
+        bisect.insort(index["postings"].setdefault(dim, {}).setdefault(value.lower(), []), lid)
+
+
+def _index_drop(index, lid):
+    entry = index["learnings"].pop(lid, None)
+    if not entry:
+        return
+    for dim, value in entry["d"].items():
+        values = index["postings"].get(dim, {})
+        ids = values.get(value.lower(), [])
+        if lid in ids:
+            ids.remove(lid)
+        if not ids:
+            values.pop(value.lower(), None)
+
+
+def _commit_index(base, active_dir, index):
+    index["dir_mtime_ns"] = _dir_stamp(active_dir)
+    save_json(_index_path(base), index, compact=True)
+
+
+def _rebuild_index(base, active_dir, decay=None):
+    index = {"version": INDEX_VERSION, "dir_mtime_ns": None, "decay": decay,
+             "learnings": {}, "postings": {}}
+    if not active_dir.exists():
+        return index
+    for f in sorted(active_dir.glob("lrn_*.json")):
+        obj = _load_json(f, None)
+        if obj and isinstance(obj, dict):
+            _index_put(index, f.stem, obj)
+    _commit_index(base, active_dir, index)
+    return index
+
+
+def _index_fresh(index, active_dir):
+    return (isinstance(index, dict) and index.get("version") == INDEX_VERSION
+            and index.get("dir_mtime_ns") == _dir_stamp(active_dir))
+
+
+def _load_index(base, active_dir):
+    """Load the learnings index, rebuilding it if learning files changed."""
+    path = _index_path(base)
+    index = _load_json(path, None)
+    if _index_fresh(index, active_dir):
+        return index
+    with locked(path):
+        index = _load_json(path, None)
+        if _index_fresh(index, active_dir):
+            return index
+        decay = index.get("decay") if isinstance(index, dict) else None
+        return _rebuild_index(base, active_dir, decay)
+
+
+def _validated(entry):
+    return entry["v"] if entry["v"] is not None else (entry["t"] or "")
+
+
+def _effective_confidence(entry, rate, now):
+    """Stored confidence less time decay since last validation (lazy decay)."""
+    conf = entry["c"]
+    if not rate:
+        return conf
+    try:
+        months = (now - datetime.fromisoformat(_validated(entry))).days / 30.0
+    except (TypeError, ValueError):
+        months = 6.0
+    return max(0.0, round(conf - rate * months, 3))
+
+
+def _decay_rate(index):
+    return (index.get("decay") or {}).get("rate", 0)
+
+
+def _confidences(index, now):
+    rate = _decay_rate(index)
+    return {lid: _effective_confidence(entry, rate, now)
+            for lid, entry in index["learnings"].items()}
+
+
+def _load_learning(active_dir, lid):
+    return _load_json(active_dir / f"{lid}.json", {})
+
+
 # ── Actions ──────────────────────────────────────────────────────────────────
 
 def save_learning(slug, agent, insight, conditions, confidence, evidence):
@@ -100,9 +233,13 @@ def save_learning(slug, agent, insight, conditions, confidence, evidence):
         "last_validated": ts,
     }
 
-    _, active_dir, _ = _intel_dirs(slug)
+    base, active_dir, _ = _intel_dirs(slug)
     active_dir.mkdir(parents=True, exist_ok=True)
-    _save_json(active_dir / f"{learning_id}.json", record)
+    with locked(_index_path(base)):
+        index = _load_index(base, active_dir)
+        _save_json(active_dir / f"{learning_id}.json", record)
+        _index_put(index, learning_id, record)
+        _commit_index(base, active_dir, index)
 
     return {"status": "saved", "learning_id": learning_id, "confidence": record["confidence"]}
 
@@ -112,59 +249,57 @@ def query_relevant(slug, context):
     if err:
         return err
 
-    _, active_dir, _ = _intel_dirs(slug)
-    learnings = _load_all_learnings(active_dir)
+    base, active_dir, _ = _intel_dirs(slug)
+    index = _load_index(base, active_dir)
+    learnings = index["learnings"]
     if not learnings:
         return {"results": [], "total": 0, "note": "No learnings stored yet."}
 
+    # Relevance: how many context dimensions match. Only learnings sharing at
+    # least one dimension value with the context can score above zero.
+    wanted = [(dim, _norm(context.get(dim))) for dim in CONTEXT_DIMENSIONS if context.get(dim)]
+    if wanted:
+        matches = {}
+        for dim, value in wanted:
+            for lid in index["postings"].get(dim, {}).get(value, ()):
+                matches[lid] = matches.get(lid, 0) + 1
+        candidates = {lid: count / len(wanted) for lid, count in matches.items()}
+    else:
+        candidates = dict.fromkeys(learnings, 0.5)  # no context provided, give equal weight
+
     now = datetime.now()
+    rate = _decay_rate(index)
     scored = []
-    for l in learnings:
-        conds = l.get("conditions", {})
-        # Relevance: how many context dimensions match
-        match_count = 0
-        total_dims = 0
-        for dim in CONTEXT_DIMENSIONS:
-            ctx_val = context.get(dim)
-            cond_val = conds.get(dim)
-            if ctx_val:
-                total_dims += 1
-                if cond_val and cond_val.lower() == ctx_val.lower():
-                    match_count += 1
-
-        if total_dims == 0:
-            relevance = 0.5  # no context provided, give equal weight
-        else:
-            relevance = match_count / total_dims
-
+    for lid, relevance in candidates.items():
+        entry = learnings[lid]
         # Recency factor: newer = higher (half-life 90 days)
         try:
-            created = datetime.fromisoformat(l["last_validated"])
-            age_days = (now - created).days
-        except (KeyError, ValueError):
+            age_days = (now - datetime.fromisoformat(entry["v"])).days
+        except (TypeError, ValueError):
             age_days = 365
 
         recency = max(0.1, 1.0 / (1 + age_days / 90))
 
-        conf = l.get("confidence", 0.5)
+        conf = _effective_confidence(entry, rate, now)
         final_score = round(relevance * conf * recency, 4)
-
         if final_score > 0:
-            scored.append({
-                "learning_id": l["learning_id"],
-                "insight": l["insight"],
-                "confidence": conf,
-                "source_agent": l.get("source_agent", "unknown"),
-                "relevance_score": round(relevance, 3),
-                "recency_factor": round(recency, 3),
-                "final_score": final_score,
-                "age_days": age_days,
-                "conditions": conds,
-            })
-
-    scored.sort(key=lambda s: -s["final_score"])
-    top = scored[:10]
-    return {"results": top, "total": len(scored), "context_used": context}
+            scored.append((-final_score, lid, conf, relevance, recency, age_days))
+
+    results = []
+    for neg_score, lid, conf, relevance, recency, age_days in heapq.nsmallest(10, scored):
+        l = _load_learning(active_dir, lid)
+        results.append({
+            "learning_id": l.get("learning_id", lid),
+            "insight": l.get("insight"),
+            "confidence": conf,
+            "source_agent": learnings[lid]["a"],
+            "relevance_score": round(relevance, 3),
+            "recency_factor": round(recency, 3),
+            "final_score": -neg_score,
+            "age_days": age_days,
+            "conditions": l.get("conditions", {}),
+        })
+    return {"results": results, "total": len(scored), "context_used": context}
 
 
 def update_confidence(slug, learning_id, direction, evidence):
@@ -172,28 +307,37 @@ def update_confidence(slug, learning_id, direction, evidence):
     if err:
         return err
 
-    _, active_dir, _ = _intel_dirs(slug)
+    base, active_dir, _ = _intel_dirs(slug)
     fpath = active_dir / f"{learning_id}.json"
     if not fpath.exists():
         return {"error": f"Learning '{learning_id}' not found."}
 
-    record = _load_json(fpath, {})
-    old_conf = record.get("confidence", 0.5)
-
-    if direction == "up":
-        new_conf = min(1.0, old_conf + 0.1)
-    else:
-        new_conf = max(0.0, old_conf - 0.2)
+    with locked(_index_path(base)):
+        index = _load_index(base, active_dir)
+        record = _load_json(fpath, {})
+        entry = index["learnings"].get(learning_id)
+        if entry:
+            # Decay so far is settled into the stored value on revalidation
+            old_conf = _effective_confidence(entry, _decay_rate(index), datetime.now())
+        else:
+            old_conf = record.get("confidence", 0.5)
 
-    record["confidence"] = round(new_conf, 2)
-    record["last_validated"] = datetime.now().isoformat()
-    record.setdefault("evidence", []).append({
-        "text": evidence,
-        "direction": direction,
-        "added_at": datetime.now().isoformat(),
-    })
+        if direction == "up":
+            new_conf = min(1.0, old_conf + 0.1)
+        else:
+            new_conf = max(0.0, old_conf - 0.2)
+
+        record["confidence"] = round(new_conf, 2)
+        record["last_validated"] = datetime.now().isoformat()
+        record.setdefault("evidence", []).append({
+            "text": evidence,
+            "direction": direction,
+            "added_at": datetime.now().isoformat(),
+        })
 
-    _save_json(fpath, record)
+        _save_json(fpath, record)
+        _index_put(index, learning_id, record)
+        _commit_index(base, active_dir, index)
     return {
         "learning_id": learning_id,
         "old_confidence": round(old_conf, 2),
@@ -207,30 +351,33 @@ def get_patterns(slug, dimension):
     if err:
         return err
 
-    _, active_dir, _ = _intel_dirs(slug)
-    learnings = _load_all_learnings(active_dir)
+    base, active_dir, _ = _intel_dirs(slug)
+    index = _load_index(base, active_dir)
+    learnings = index["learnings"]
     if not learnings:
         return {"patterns": [], "dimension": dimension, "note": "No learnings stored yet."}
 
     # Group by dimension value
     groups = {}
-    for l in learnings:
-        val = l.get("conditions", {}).get(dimension, "unspecified")
-        groups.setdefault(val, []).append(l)
+    for lid, entry in learnings.items():
+        val = entry["d"].get(dimension, "unspecified")
+        groups.setdefault(val, []).append(lid)
 
+    confidences = _confidences(index, datetime.now())
     patterns = []
-    for dim_val, items in sorted(groups.items()):
-        confs = [i.get("confidence", 0.5) for i in items]
+    for dim_val, lids in sorted(groups.items()):
+        confs = [confidences[lid] for lid in lids]
         avg_conf = round(sum(confs) / len(confs), 3) if confs else 0
-        agents = list(set(i.get("source_agent", "unknown") for i in items))
+        agents = sorted(set(learnings[lid]["a"] for lid in lids))
 
         # Top insights: highest confidence first
-        sorted_items = sorted(items, key=lambda i: -i.get("confidence", 0))
-        top_insights = [{"insight": i["insight"], "confidence": i["confidence"]} for i in sorted_items[:5]]
+        top = heapq.nsmallest(5, lids, key=lambda lid: (-confidences[lid], lid))
+        top_insights = [{"insight": _load_learning(active_dir, lid).get("insight"),
+                         "confidence": confidences[lid]} for lid in top]
 
         patterns.append({
             "dimension_value": dim_val,
-            "learnings_count": len(items),
+            "learnings_count": len(lids),
             "avg_confidence": avg_conf,
             "top_insights": top_insights,
             "contributing_agents": agents,
@@ -245,35 +392,39 @@ def get_stats(slug):
     if err:
         return err
 
-    _, active_dir, archived_dir = _intel_dirs(slug)
-    learnings = _load_all_learnings(active_dir)
+    base, active_dir, archived_dir = _intel_dirs(slug)
+    index = _load_index(base, active_dir)
+    learnings = index["learnings"]
 
     if not learnings:
         return {"total_learnings": 0, "by_agent": {}, "by_channel": {}, "avg_confidence": 0, "highest_confidence_learning": None, "stalest_learning": None, "freshest_learning": None}
 
+    lids = sorted(learnings)
+    confidences = _confidences(index, datetime.now())
     by_agent = {}
     by_channel = {}
-    confs = []
-    for l in learnings:
-        agent = l.get("source_agent", "unknown")
-        by_agent[agent] = by_agent.get(agent, 0) + 1
-        ch = l.get("conditions", {}).get("channel", "unspecified")
+    for lid in lids:
+        entry = learnings[lid]
+        by_agent[entry["a"]] = by_agent.get(entry["a"], 0) + 1
+        ch = entry["d"].get("channel", "unspecified")
         by_channel[ch] = by_channel.get(ch, 0) + 1
-        confs.append(l.get("confidence", 0.5))
 
-    avg_conf = round(sum(confs) / len(confs), 3)
+    avg_conf = round(sum(confidences.values()) / len(confidences), 3)
+
+    def _summary(lid, **extra):
+        return {"learning_id": lid, "insight": _load_learning(active_dir, lid).get("insight"), **extra}
 
     # Highest confidence
-    highest = max(learnings, key=lambda l: l.get("confidence", 0))
-    highest_out = {"learning_id": highest["learning_id"], "insight": highest["insight"], "confidence": highest["confidence"]}
+    highest = max(lids, key=lambda lid: confidences[lid])
+    highest_out = _summary(highest, confidence=confidences[highest])
 
     # Stalest (oldest last_validated)
-    stalest = min(learnings, key=lambda l: l.get("last_validated", l.get("created_at", "")))
-    stalest_out = {"learning_id": stalest["learning_id"], "insight": stalest["insight"], "last_validated": stalest.get("last_validated", stalest.get("created_at"))}
+    stalest = min(lids, key=lambda lid: _validated(learnings[lid]))
+    stalest_out = _summary(stalest, last_validated=_validated(learnings[stalest]) or None)
 
     # Freshest
-    freshest = max(learnings, key=lambda l: l.get("last_validated", l.get("created_at", "")))
-    freshest_out = {"learning_id": freshest["learning_id"], "insight": freshest["insight"], "last_validated": freshest.get("last_validated", freshest.get("created_at"))}
+    freshest = max(lids, key=lambda lid: _validated(learnings[lid]))
+    freshest_out = _summary(freshest, last_validated=_validated(learnings[freshest]) or None)
 
     # Archived count
     archived_count = len(list(archived_dir.glob("lrn_*.json"))) if archived_dir.exists() else 0
@@ -295,32 +446,40 @@ def archive_stale(slug, max_age_days, min_confidence):
     if err:
         return err
 
-    _, active_dir, archived_dir = _intel_dirs(slug)
+    base, active_dir, archived_dir = _intel_dirs(slug)
     archived_dir.mkdir(parents=True, exist_ok=True)
-    learnings = _load_all_learnings(active_dir)
 
     now = datetime.now()
     archived = 0
-    for l in learnings:
-        try:
-            validated = datetime.fromisoformat(l.get("last_validated", l.get("created_at", "")))
-            age = (now - validated).days
-        except ValueError:
-            age = max_age_days + 1
-
-        conf = l.get("confidence", 0.5)
-        if age > max_age_days and conf < min_confidence:
-            lid = l["learning_id"]
-            src = active_dir / f"{lid}.json"
-            dst = archived_dir / f"{lid}.json"
-            l["archived_at"] = now.isoformat()
-            l["archive_reason"] = f"age={age}d, confidence={conf}"
-            _save_json(dst, l)
-            if src.exists():
-                src.unlink()
-            archived += 1
-
-    remaining = len(learnings) - archived
+    with locked(_index_path(base)):
+        index = _load_index(base, active_dir)
+        learnings = index["learnings"]
+        total = len(learnings)
+        rate = _decay_rate(index)
+        for lid in sorted(learnings):
+            entry = learnings[lid]
+            try:
+                age = (now - datetime.fromisoformat(_validated(entry))).days
+            except ValueError:
+                age = max_age_days + 1
+
+            conf = _effective_confidence(entry, rate, now)
+            if age > max_age_days and conf < min_confidence:
+                src = active_dir / f"{lid}.json"
+                dst = archived_dir / f"{lid}.json"
+                l = _load_learning(active_dir, lid)
+                l["confidence"] = conf
+                l["archived_at"] = now.isoformat()
+                l["archive_reason"] = f"age={age}d, confidence={conf}"
+                _save_json(dst, l)
+                if src.exists():
+                    src.unlink()
+                _index_drop(index, lid)
+                archived += 1
+        if archived:
+            _commit_index(base, active_dir, index)
+
+    remaining = total - archived
     return {"archived_count": archived, "remaining_count": remaining, "criteria": {"max_age_days": max_age_days, "min_confidence": min_confidence}}
 
 
@@ -329,22 +488,23 @@ def export_playbook(slug, channel=None, audience=None, min_confidence=0.6):
     if err:
         return err
 
-    _, active_dir, _ = _intel_dirs(slug)
-    learnings = _load_all_learnings(active_dir)
+    base, active_dir, _ = _intel_dirs(slug)
+    index = _load_index(base, active_dir)
 
     # Filter
+    candidates = set(index["learnings"])
+    for dim, value in (("channel", channel), ("audience", audience)):
+        if value:
+            candidates &= set(index["postings"].get(dim, {}).get(value.lower(), ()))
+
+    now = datetime.now()
+    rate = _decay_rate(index)
     filtered = []
-    for l in learnings:
-        if l.get("confidence", 0) < min_confidence:
-            continue
-        conds = l.get("conditions", {})
-        if channel and conds.get("channel", "").lower() != channel.lower():
-            continue
-        if audience and conds.get("audience", "").lower() != audience.lower():
-            continue
-        filtered.append(l)
-
-    filtered.sort(key=lambda l: -l.get("confidence", 0))
+    for lid in candidates:
+        conf = _effective_confidence(index["learnings"][lid], rate, now)
+        if conf >= min_confidence:
+            filtered.append((-conf, lid))
+    filtered.sort()
 
     context_parts = []
     if channel:
@@ -358,10 +518,11 @@ def export_playbook(slug, channel=None, audience=None, min_confidence=0.6):
         title += f" / {channel.title()}"
 
     rules = []
-    for l in filtered:
+    for neg_conf, lid in filtered:
+        l = _load_learning(active_dir, lid)
         rules.append({
-            "rule": l["insight"],
-            "confidence": l["confidence"],
+            "rule": l.get("insight"),
+            "confidence": -neg_conf,
             "source_agent": l.get("source_agent", "unknown"),
             "evidence_count": len(l.get("evidence", [])),
             "last_validated": l.get("last_validated", l.get("created_at")),
@@ -377,40 +538,30 @@ def export_playbook(slug, channel=None, audience=None, min_confidence=0.6):
 
 
 def apply_time_decay(slug, decay_rate):
+    """Set the brand's decay rate; confidences decay lazily when read.
+
+    Effective confidence is the stored confidence minus decay_rate per month
+    since last validation, computed at query time, so learning files are not
+    rewritten and repeated calls do not compound. A rate of 0 turns decay off.
+    """
     err = _brand_check(slug)
     if err:
         return err
 
-    _, active_dir, _ = _intel_dirs(slug)
-    learnings = _load_all_learnings(active_dir)
+    base, active_dir, _ = _intel_dirs(slug)
+    with locked(_index_path(base)):
+        index = _load_index(base, active_dir)
+        learnings = index["learnings"]
+        if not learnings:
+            return {"total_affected": 0, "avg_confidence_before": 0, "avg_confidence_after": 0}
 
-    if not learnings:
-        return {"total_affected": 0, "avg_confidence_before": 0, "avg_confidence_after": 0}
-
-    now = datetime.now()
-    confs_before = []
-    confs_after = []
-    affected = 0
+        now = datetime.now()
+        index["decay"] = {"rate": decay_rate, "set_at": now.isoformat()}
+        _commit_index(base, active_dir, index)
 
-    for l in learnings:
-        old_conf = l.get("confidence", 0.5)
-        confs_before.append(old_conf)
-
-        try:
-            validated = datetime.fromisoformat(l.get("last_validated", l.get("created_at", "")))
-            months = (now - validated).days / 30.0
-        except ValueError:
-            months = 6.0
-
-        decay = decay_rate * months
-        new_conf = max(0.0, round(old_conf - decay, 3))
-
-        if new_conf != old_conf:
-            l["confidence"] = new_conf
-            _save_json(active_dir / f"{l['learning_id']}.json", l)
-            affected += 1
-
-        confs_after.append(new_conf)
+    confs_before = [entry["c"] for entry in learnings.values()]
+    confs_after = list(_confidences(index, now).values())
+    affected = sum(1 for before, after in zip(confs_before, confs_after) if before != after)
 
     avg_before = round(sum(confs_before) / len(confs_before), 3)
     avg_after = round(sum(confs_after) / len(confs_after), 3)
@@ -424,6 +575,25 @@ def apply_time_decay(slug, decay_rate):
     }
 
 
+def rebuild_index(slug):
+    err = _brand_check(slug)
+    if err:
+        return err
+
+    base, active_dir, _ = _intel_dirs(slug)
+    path = _index_path(base)
+    with locked(path):
+        old = _load_json(path, None)
+        decay = old.get("decay") if isinstance(old, dict) else None
+        index = _rebuild_index(base, active_dir, decay)
+    return {
+        "status": "rebuilt",
+        "learnings_indexed": len(index["learnings"]),
+        "decay_rate_per_month": _decay_rate(index),
+        "index": str(path),
+    }
+
+
 # ── CLI ──────────────────────────────────────────────────────────────────────
 
 def main():
@@ -435,7 +605,8 @@ def main():
                         choices=["save-learning", "query-relevant",
                                  "update-confidence", "get-patterns",
                                  "get-stats", "archive-stale",
-                                 "export-playbook", "apply-time-decay"],
+                                 "export-playbook", "apply-time-decay",
+                                 "rebuild-index"],
                         help="Action to perform")
     parser.add_argument("--agent", help="Source agent name (for save-learning)")
     parser.add_argument("--insight", help="Learning text (for save-learning)")
@@ -506,6 +677,9 @@ def main():
     elif args.action == "apply-time-decay":
         result = apply_time_decay(args.brand, args.decay_rate)
 
+    elif args.action == "rebuild-index":
+        result = rebuild_index(args.brand)
+
     json.dump(result, sys.stdout, indent=2)
     print()
 
@@ -5,11 +5,18 @@ Design, simulate, and track customer journeys using a state-machine model.
 Supports Monte Carlo simulation of cohort progression, bottleneck detection,
 and touchpoint mapping across channels.
 
-Dependencies: none (stdlib only)
+Simulation modes (--mode):
+    monte-carlo  Walk each customer through the journey (default)
+    analytic     Exact expected values from absorbing Markov chain math;
+                 cost is independent of cohort size
+    vectorized   Monte Carlo that advances the whole cohort at once (numpy)
+
+Dependencies: none (stdlib only); numpy optional for --mode vectorized
 
 Usage:
     python journey-engine.py --action create-journey --brand acme --name "Onboarding Flow" --states '[{"name":"Awareness","description":"First touch"}]' --transitions '[{"from_state":"Awareness","to_state":"Consideration","trigger":"ad_click","probability":0.4,"channel":"paid_search","content_brief":"Search ad"}]'
     python journey-engine.py --action simulate --brand acme --journey-id onboarding-flow --cohort-size 5000
+    python journey-engine.py --action simulate --brand acme --journey-id onboarding-flow --cohort-size 1000000 --mode analytic
     python journey-engine.py --action list-journeys --brand acme
     python journey-engine.py --action get-journey --brand acme --journey-id onboarding-flow
     python journey-engine.py --action analyze-bottleneck --brand acme --journey-id onboarding-flow
@@ -25,6 +32,13 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import read_json, save_json
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 # Default dwell time (days) per state when not specified
@@ -55,7 +69,7 @@ def _load_journey(brand_dir, journey_id):
     if not fp.exists():
         return None, f"Journey '{journey_id}' not found."
     try:
-        return json.loads(fp.read_text(encoding="utf-8")), None
+        return read_json(fp), None
     except json.JSONDecodeError:
         return None, f"Journey file corrupted: {journey_id}"
 
@@ -110,7 +124,7 @@ def create_journey(slug, name, states, transitions):
 
     jdir = _journeys_dir(brand_dir)
     fp = jdir / f"{journey_id}.json"
-    fp.write_text(json.dumps(journey, indent=2), encoding="utf-8")
+    save_json(fp, journey)
 
     return {
         "status": "created",
@@ -122,22 +136,12 @@ def create_journey(slug, name, states, transitions):
     }
 
 
-def simulate(slug, journey_id, cohort_size, seed):
-    brand_dir, err = _get_brand_dir(slug)
-    if err:
-        return {"error": err}
-
-    journey, err = _load_journey(brand_dir, journey_id)
-    if err:
-        return {"error": err}
-
+def _build_model(journey):
+    """Index a journey's states and transitions for simulation."""
     states = journey["states"]
     transitions = journey["transitions"]
     state_names = [s["name"] for s in states]
-    if not state_names:
-        return {"error": "Journey has no states."}
 
-    start_state = state_names[0]
     # Build transition lookup: from_state -> list of (to_state, probability, channel)
     trans_map = {}
     for t in transitions:
@@ -148,32 +152,45 @@ def simulate(slug, journey_id, cohort_size, seed):
             "channel": t.get("channel", "unknown"),
         })
 
-    # Determine terminal states (no outbound transitions)
-    terminal_states = {sn for sn in state_names if sn not in trans_map}
-
     # Dwell times per state
     dwell_map = {}
     for s in states:
         dwell_map[s["name"]] = s.get("dwell_days", DEFAULT_DWELL_DAYS)
 
+    return {
+        "state_names": state_names,
+        "start_state": state_names[0],
+        "last_state": state_names[-1],  # assume last state is "conversion" goal
+        "trans_map": trans_map,
+        # Terminal states have no outbound transitions
+        "terminal_states": {sn for sn in state_names if sn not in trans_map},
+        "dwell_map": dwell_map,
+    }
+
+
+def _simulate_monte_carlo(model, cohort_size, seed):
+    """Walk each customer through the journey one at a time."""
+    state_names = model["state_names"]
+    trans_map = model["trans_map"]
+    terminal_states = model["terminal_states"]
+    dwell_map = model["dwell_map"]
+    last_state = model["last_state"]
+
     rng = random.Random(seed)
-    state_visit_counts = {sn: 0 for sn in state_names}
     state_reach_counts = {sn: 0 for sn in state_names}
     channel_touchpoints = {}
-    touchpoint_counts = []
-    journey_times = []
+    total_touchpoints = 0
+    total_days_all = 0.0
     converted_count = 0
-    last_state = state_names[-1]  # assume last state is "conversion" goal
 
     for _ in range(cohort_size):
-        current = start_state
+        current = model["start_state"]
         visited = set()
         steps = 0
         total_days = 0.0
-        customer_channels = []
+        touches = 0
 
         while steps < MAX_SIM_STEPS:
-            state_visit_counts[current] = state_visit_counts.get(current, 0) + 1
             if current not in visited:
                 state_reach_counts[current] = state_reach_counts.get(current, 0) + 1
                 visited.add(current)
@@ -194,7 +211,7 @@ def simulate(slug, journey_id, cohort_size, seed):
             for tr in outbound:
                 cumulative += tr["probability"]
                 if roll < cumulative:
-                    customer_channels.append(tr["channel"])
+                    touches += 1
                     ch = tr["channel"]
                     channel_touchpoints[ch] = channel_touchpoints.get(ch, 0) + 1
                     current = tr["to_state"]
@@ -207,19 +224,257 @@ def simulate(slug, journey_id, cohort_size, seed):
 
             steps += 1
 
-        touchpoint_counts.append(len(customer_channels))
-        journey_times.append(total_days)
+        total_touchpoints += touches
+        total_days_all += total_days
 
         if current == last_state:
             converted_count += 1
 
+    return {
+        "reach": state_reach_counts,
+        "channel_touchpoints": channel_touchpoints,
+        "avg_touchpoints": total_touchpoints / cohort_size,
+        "avg_days": total_days_all / cohort_size,
+        "converted": converted_count,
+    }
+
+
+def _simulate_vectorized(model, cohort_size, seed):
+    """Advance the whole cohort one step at a time with numpy arrays.
+
+    Same model and step cap as the Monte Carlo walk; draws come from a
+    numpy Generator, so individual results differ from the stdlib walk for
+    the same seed.
+    """
+    state_names = model["state_names"]
+    index = {sn: i for i, sn in enumerate(state_names)}
+    n_states = len(state_names)
+    channels = sorted({tr["channel"] for outs in model["trans_map"].values() for tr in outs})
+    channel_index = {ch: i for i, ch in enumerate(channels)}
+
+    width = max([len(v) for v in model["trans_map"].values()] or [1])
+    cum = np.zeros((n_states, width))
+    dest = np.zeros((n_states, width), dtype=np.int64)
+    chan = np.zeros((n_states, width), dtype=np.int64)
+    n_out = np.zeros(n_states, dtype=np.int64)
+    for sn, outs in model["trans_map"].items():
+        i = index[sn]
+        running = 0.0
+        for k, tr in enumerate(outs):
+            running += tr["probability"]
+            cum[i, k] = running
+            dest[i, k] = index[tr["to_state"]]
+            chan[i, k] = channel_index[tr["channel"]]
+        cum[i, len(outs):] = running  # pad: rolls past the last edge drop off
+        n_out[i] = len(outs)
+    dwell = np.array([model["dwell_map"].get(sn, DEFAULT_DWELL_DAYS) for sn in state_names],
+                     dtype=float)
+    terminal = np.array([sn in model["terminal_states"] for sn in state_names])
+
+    rng = np.random.default_rng(seed)
+    current = np.full(cohort_size, index[model["start_state"]], dtype=np.int64)
+    active = np.arange(cohort_size)
+    reached = np.zeros((cohort_size, n_states), dtype=bool)
+    days = np.zeros(cohort_size)
+    touches = np.zeros(cohort_size, dtype=np.int64)
+    channel_counts = np.zeros(len(channels), dtype=np.int64)
+
+    for _ in range(MAX_SIM_STEPS):
+        if active.size == 0:
+            break
+        cur = current[active]
+        reached[active, cur] = True
+        days[active] += dwell[cur]
+
+        moving = ~terminal[cur] & (n_out[cur] > 0)
+        active, cur = active[moving], cur[moving]
+        roll = rng.random(active.size)
+        pick = (cum[cur] <= roll[:, None]).sum(axis=1)
+        moved = pick < n_out[cur]
+        active, cur, pick = active[moved], cur[moved], pick[moved]
+
+        channel_counts += np.bincount(chan[cur, pick], minlength=len(channels))
+        touches[active] += 1
+        current[active] = dest[cur, pick]
+
+    reach_counts = reached.sum(axis=0)
+    return {
+        "reach": {sn: int(reach_counts[i]) for i, sn in enumerate(state_names)},
+        "channel_touchpoints": {
+            ch: int(channel_counts[i]) for i, ch in enumerate(channels) if channel_counts[i]
+        },
+        "avg_touchpoints": float(touches.mean()),
+        "avg_days": float(days.mean()),
+        "converted": int((current == index[model["last_state"]]).sum()),
+    }
+
+
+def _invert(matrix):
+    """Invert a square matrix by Gauss-Jordan elimination with partial pivoting.
+
+    Returns None when the matrix is singular.
+    """
+    n = len(matrix)
+    a = [row[:] + [1.0 if r == c else 0.0 for c in range(n)]
+         for r, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            return None
+        a[col], a[pivot] = a[pivot], a[col]
+        scale = a[col][col]
+        a[col] = [v / scale for v in a[col]]
+        for r in range(n):
+            if r != col and a[r][col]:
+                factor = a[r][col]
+                a[r] = [v - factor * pv for v, pv in zip(a[r], a[col])]
+    return [row[n:] for row in a]
+
+
+def _simulate_analytic(model, cohort_size):
+    """Exact expected journey outcomes from absorbing Markov chain math.
+
+    Non-terminal states are transient; terminal states and drop-off
+    (outbound probability below 1) are absorbing. With Q the transient
+    transition matrix, the fundamental matrix N = (I - Q)^-1 gives expected
+    visits per transient state, from which reach probabilities, channel
+    touchpoints, time in journey and conversion follow. No step cap is
+    applied.
+    """
+    state_names = model["state_names"]
+    trans_map = model["trans_map"]
+    terminal_states = model["terminal_states"]
+    dwell_map = model["dwell_map"]
+    start, last = model["start_state"], model["last_state"]
+
+    transient = [sn for sn in state_names if sn not in terminal_states]
+    t_index = {sn: i for i, sn in enumerate(transient)}
+    n = len(transient)
+
+    # (I - Q), one-step absorption into terminal states, and total outbound
+    i_minus_q = [[1.0 if r == c else 0.0 for c in range(n)] for r in range(n)]
+    to_terminal = [{} for _ in range(n)]
+    out_prob = [0.0] * n
+    for sn in transient:
+        i = t_index[sn]
+        for tr in trans_map[sn]:
+            p = tr["probability"]
+            out_prob[i] += p
+            if tr["to_state"] in t_index:
+                i_minus_q[i][t_index[tr["to_state"]]] -= p
+            else:
+                to_terminal[i][tr["to_state"]] = to_terminal[i].get(tr["to_state"], 0.0) + p
+
+    def dwell(sn):
+        return dwell_map.get(sn, DEFAULT_DWELL_DAYS)
+
+    if start in terminal_states:
+        fundamental = [[0.0] * n for _ in range(n)]
+        visits = [0.0] * n
+        absorb = {start: 1.0}
+    else:
+        fundamental = _invert(i_minus_q)
+        if fundamental is None:
+            return None, ("Journey has a closed loop with no exit; expected values "
+                          "are unbounded. Use --mode monte-carlo.")
+        visits = fundamental[t_index[start]]
+        absorb = {}
+        for i in range(n):
+            for dest_state, p in to_terminal[i].items():
+                absorb[dest_state] = absorb.get(dest_state, 0.0) + visits[i] * p
+
+    # Reach probability: h_j = N[s, j] / N[j, j] for transient j
+    reach = {}
+    for sn in state_names:
+        if sn in t_index:
+            j = t_index[sn]
+            reach[sn] = visits[j] / fundamental[j][j] if fundamental[j][j] else 0.0
+        else:
+            reach[sn] = absorb.get(sn, 0.0)
+
+    # Probability of converting straight out of each transient state, then
+    # from each transient state overall (N @ direct)
+    if last in terminal_states:
+        direct = [to_terminal[i].get(last, 0.0) for i in range(n)]
+    else:
+        direct = [max(0.0, 1.0 - out_prob[i]) if transient[i] == last else 0.0
+                  for i in range(n)]
+    convert_from = [sum(fundamental[i][k] * direct[k] for k in range(n)) for i in range(n)]
+
+    if start in terminal_states:
+        conversion = 1.0 if start == last else 0.0
+    else:
+        conversion = sum(visits[i] * direct[i] for i in range(n))
+
+    channel_touchpoints = {}
+    for sn in transient:
+        for tr in trans_map[sn]:
+            ch = tr["channel"]
+            channel_touchpoints[ch] = (channel_touchpoints.get(ch, 0.0)
+                                       + visits[t_index[sn]] * tr["probability"])
+
+    avg_touchpoints = sum(visits[i] * out_prob[i] for i in range(n))
+    avg_days = (sum(visits[i] * dwell(transient[i]) for i in range(n))
+                + sum(p * dwell(sn) for sn, p in absorb.items()))
+
+    # E[days | converted]: each visit weighted by the chance of converting afterwards
+    days_if_converted = None
+    if conversion > 0:
+        weighted = sum(visits[i] * convert_from[i] * dwell(transient[i]) for i in range(n))
+        if last in terminal_states:
+            weighted += conversion * dwell(last)
+        days_if_converted = weighted / conversion
+
+    return {
+        "reach": {sn: reach[sn] * cohort_size for sn in state_names},
+        "channel_touchpoints": {ch: v * cohort_size for ch, v in channel_touchpoints.items()},
+        "avg_touchpoints": avg_touchpoints,
+        "avg_days": avg_days,
+        "converted": conversion * cohort_size,
+        "expected_days_given_conversion": days_if_converted,
+    }, None
+
+
+def simulate(slug, journey_id, cohort_size, seed, mode="monte-carlo"):
+    brand_dir, err = _get_brand_dir(slug)
+    if err:
+        return {"error": err}
+
+    journey, err = _load_journey(brand_dir, journey_id)
+    if err:
+        return {"error": err}
+
+    if not journey["states"]:
+        return {"error": "Journey has no states."}
+    if cohort_size < 1:
+        return {"error": "Cohort size must be at least 1."}
+
+    model = _build_model(journey)
+    state_names = model["state_names"]
+
+    if mode == "analytic":
+        outcome, err = _simulate_analytic(model, cohort_size)
+        if err:
+            return {"error": err}
+    elif mode == "vectorized":
+        if np is None:
+            return {"error": "numpy not installed. Use --mode monte-carlo or analytic, or: pip install numpy"}
+        outcome = _simulate_vectorized(model, cohort_size, seed)
+    else:
+        outcome = _simulate_monte_carlo(model, cohort_size, seed)
+
+    state_reach_counts = outcome["reach"]
+    channel_touchpoints = outcome["channel_touchpoints"]
+    converted_count = outcome["converted"]
+
     # Build funnel
     state_funnel = []
     for sn in state_names:
+        reached = state_reach_counts.get(sn, 0)
         state_funnel.append({
             "state": sn,
-            "reached": state_reach_counts.get(sn, 0),
-            "pct_of_cohort": round(state_reach_counts.get(sn, 0) / cohort_size * 100, 1),
+            "reached": reached if isinstance(reached, int) else round(reached, 1),
+            "pct_of_cohort": round(reached / cohort_size * 100, 1),
         })
 
     # Drop-off rates between consecutive states
@@ -245,22 +500,24 @@ def simulate(slug, journey_id, cohort_size, seed):
     total_touches = sum(channel_touchpoints.values()) or 1
     channel_dist = {ch: round(cnt / total_touches * 100, 1) for ch, cnt in channel_touchpoints.items()}
 
-    avg_touchpoints = round(sum(touchpoint_counts) / len(touchpoint_counts), 1) if touchpoint_counts else 0
-    avg_time = round(sum(journey_times) / len(journey_times), 1) if journey_times else 0
-
-    return {
+    result = {
         "journey_id": journey_id,
+        "mode": mode,
         "cohort_size": cohort_size,
-        "seed": seed,
+        "seed": seed if mode != "analytic" else None,
         "conversion_rate": round(converted_count / cohort_size * 100, 2),
-        "avg_touchpoints": avg_touchpoints,
-        "avg_time_to_convert_days": avg_time,
+        "avg_touchpoints": round(outcome["avg_touchpoints"], 1),
+        "avg_time_to_convert_days": round(outcome["avg_days"], 1),
         "state_funnel": state_funnel,
         "bottleneck_state": bottleneck_state,
         "drop_off_rates": drop_off_rates,
         "channel_distribution": channel_dist,
-        "converted": converted_count,
+        "converted": converted_count if isinstance(converted_count, int) else round(converted_count, 1),
     }
+    if mode == "analytic":
+        days = outcome["expected_days_given_conversion"]
+        result["expected_days_given_conversion"] = round(days, 1) if days is not None else None
+    return result
 
 
 def list_journeys(slug):
@@ -275,7 +532,7 @@ def list_journeys(slug):
     journeys = []
     for fp in sorted(jdir.glob("*.json")):
         try:
-            j = json.loads(fp.read_text(encoding="utf-8"))
+            j = read_json(fp)
             journeys.append({
                 "journey_id": j.get("journey_id", fp.stem),
                 "name": j.get("name", "Untitled"),
@@ -464,6 +721,9 @@ def main():
                         help="Number of simulated customers (default: 1000)")
     parser.add_argument("--seed", type=int, default=42,
                         help="Random seed for reproducibility (default: 42)")
+    parser.add_argument("--mode", choices=["monte-carlo", "analytic", "vectorized"],
+                        default="monte-carlo",
+                        help="Simulation mode (default: monte-carlo)")
     parser.add_argument("--data", help="JSON with actual conversion data per state (for analyze-bottleneck)")
     args = parser.parse_args()
 
@@ -495,7 +755,7 @@ def main():
         if not args.journey_id:
             print(json.dumps({"error": "Provide --journey-id"}))
             sys.exit(1)
-        result = simulate(args.brand, args.journey_id, args.cohort_size, args.seed)
+        result = simulate(args.brand, args.journey_id, args.cohort_size, args.seed, args.mode)
 
     elif args.action == "list-journeys":
         result = list_journeys(args.brand)
@@ -1,10 +1,33 @@
 #!/usr/bin/env python3
-"""Cluster keywords by semantic similarity and search intent using word overlap."""
+"""Cluster keywords by semantic similarity and search intent using word overlap.
+
+Similarity is Jaccard overlap of non-stop-word tokens. Candidate pairs come
+from an inverted index over interned token IDs with prefix and size
+filtering, so only keywords that can reach the threshold are compared. This
+keeps 20k-200k keyword exports (e.g. Search Console) tractable.
+
+Linkage (--linkage):
+    greedy  Each keyword joins the cluster of its most similar earlier
+            keyword when that similarity meets the threshold (default;
+            same assignments as the original pairwise scan)
+    single  True single-linkage: every pair at or above the threshold is
+            merged with union-find
+
+Usage:
+    python keyword-clusterer.py --keywords "crm software,best crm,crm pricing"
+    python keyword-clusterer.py --file queries.txt --threshold 0.3
+    python keyword-clusterer.py --file search-console.csv --column "Top queries" --linkage single
+    python keyword-clusterer.py --benchmark 50000
+"""
 
 import argparse
+import csv
 import json
+import math
+import random
 import re
 import sys
+import time
 from collections import defaultdict
 from pathlib import Path
 
@@ -81,8 +104,11 @@ def compute_similarity(tokens_a, tokens_b):
     return len(intersection) / len(union)
 
 
-def cluster_keywords(keywords, threshold=0.25):
-    """Cluster keywords using single-linkage clustering with word overlap."""
+def cluster_keywords_bruteforce(keywords, threshold=0.25):
+    """Reference greedy clustering that compares against every cluster member.
+
+    Quadratic; kept for benchmarking and verifying the indexed engine.
+    """
     if not keywords:
         return []
 
@@ -112,6 +138,130 @@ def cluster_keywords(keywords, threshold=0.25):
     return clusters
 
 
+class _UnionFind:
+    """Disjoint sets over 0..n-1 with path halving and union by size."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+
+
+def _intern_tokens(tokenized):
+    """Map tokens to integer IDs ordered rarest-first (for prefix filtering).
+
+    Returns one sorted tuple of token IDs per keyword.
+    """
+    doc_freq = defaultdict(int)
+    for _, tokens in tokenized:
+        for tok in set(tokens):
+            doc_freq[tok] += 1
+    order = sorted(doc_freq, key=lambda t: (doc_freq[t], t))
+    token_id = {tok: i for i, tok in enumerate(order)}
+    return [tuple(sorted({token_id[t] for t in tokens})) for _, tokens in tokenized]
+
+
+def _prefix_length(size, threshold):
+    """Tokens that must be indexed/probed so no pair with J >= threshold is missed."""
+    return size - math.ceil(threshold * size - 1e-9) + 1
+
+
+def _candidate_pairs(id_sets, threshold):
+    """Yield (i, j, jaccard) for j < i with jaccard >= threshold.
+
+    Uses an inverted index over each keyword's prefix (rarest tokens), a
+    size filter, and exact verification of the surviving candidates.
+    """
+    index = defaultdict(list)  # token id -> keyword indexes (prefix only)
+    sizes = [len(ids) for ids in id_sets]
+    for i, ids in enumerate(id_sets):
+        size = sizes[i]
+        if not size:
+            continue
+        prefix = ids[:_prefix_length(size, threshold)]
+        min_size = threshold * size
+        max_size = size / threshold if threshold > 0 else float("inf")
+
+        seen = set()
+        for tok in prefix:
+            for j in index[tok]:
+                if j in seen or not (min_size <= sizes[j] <= max_size):
+                    continue
+                seen.add(j)
+        if seen:
+            ids_set = set(ids)
+            for j in seen:
+                overlap = len(ids_set.intersection(id_sets[j]))
+                if overlap:
+                    sim = overlap / (size + sizes[j] - overlap)
+                    if sim >= threshold:
+                        yield i, j, sim
+
+        for tok in prefix:
+            index[tok].append(i)
+
+
+def cluster_keywords(keywords, threshold=0.25, linkage="greedy"):
+    """Cluster keywords using the indexed similarity engine.
+
+    Returns a list of clusters, each a list of (keyword, tokens), ordered by
+    first member; members keep input order.
+    """
+    if not keywords:
+        return []
+
+    tokenized = [(kw, tokenize(kw)) for kw in keywords]
+    id_sets = _intern_tokens(tokenized)
+    n = len(tokenized)
+
+    if linkage == "single":
+        uf = _UnionFind(n)
+        for i, j, _ in _candidate_pairs(id_sets, threshold):
+            uf.union(i, j)
+        root_of = [uf.find(i) for i in range(n)]
+    else:
+        # Greedy: join the cluster of the best-matching earlier keyword.
+        # Ties go to the earliest-created cluster, as in the pairwise scan.
+        cluster_of = [0] * n
+        next_cluster = 0
+        pairs = _candidate_pairs(id_sets, threshold)
+        pending = next(pairs, None)
+        for i in range(n):
+            best_sim, best_cluster = 0.0, None
+            while pending is not None and pending[0] == i:
+                _, j, sim = pending
+                cid = cluster_of[j]
+                if sim > best_sim or (sim == best_sim and best_cluster is not None
+                                      and cid < best_cluster):
+                    best_sim, best_cluster = sim, cid
+                pending = next(pairs, None)
+            if best_cluster is None:
+                best_cluster = next_cluster
+                next_cluster += 1
+            cluster_of[i] = best_cluster
+        root_of = cluster_of
+
+    clusters = {}
+    for i, root in enumerate(root_of):
+        clusters.setdefault(root, []).append(tokenized[i])
+    return list(clusters.values())
+
+
 def label_cluster(cluster_keywords_list):
     """Generate a topic label from the most common non-stop words."""
     word_freq = defaultdict(int)
@@ -124,14 +274,99 @@ def label_cluster(cluster_keywords_list):
     return " + ".join(top_words) if top_words else "misc"
 
 
+def iter_keywords_file(path, column=None):
+    """Stream non-empty keywords from a text file or a CSV export.
+
+    CSV files (e.g. Search Console "Top queries") use --column when given,
+    otherwise the first column, and skip the header row.
+    """
+    with open(path, encoding="utf-8-sig", newline="") as fh:
+        if path.suffix.lower() != ".csv":
+            for line in fh:
+                kw = line.strip()
+                if kw:
+                    yield kw
+            return
+        reader = csv.reader(fh)
+        header = next(reader, None)
+        col = 0
+        if column and header:
+            if column not in header:
+                raise ValueError(f"Column '{column}' not found. Available: {', '.join(header)}")
+            col = header.index(column)
+        for row in reader:
+            if len(row) > col and row[col].strip():
+                yield row[col].strip()
+
+
+def run_benchmark(count, threshold=0.25, linkage="greedy", seed=42):
+    """Time the indexed engine on synthetic keywords (and the pairwise scan on a sample)."""
+    rng = random.Random(seed)
+    heads = [f"topic{i}" for i in range(max(10, count // 20))]
+    modifiers = [w for words in INTENT_MODIFIERS.values() for w in words if " " not in w]
+    extras = [f"term{i}" for i in range(max(50, count // 5))]
+    keywords = []
+    for _ in range(count):
+        words = [rng.choice(heads), rng.choice(extras)]
+        if rng.random() < 0.6:
+            words.append(rng.choice(modifiers))
+        if rng.random() < 0.3:
+            words.append(rng.choice(extras))
+        rng.shuffle(words)
+        keywords.append(" ".join(words))
+
+    start = time.perf_counter()
+    clusters = cluster_keywords(keywords, threshold=threshold, linkage=linkage)
+    indexed_seconds = time.perf_counter() - start
+
+    result = {
+        "keywords": count,
+        "threshold": threshold,
+        "linkage": linkage,
+        "clusters": len(clusters),
+        "indexed": {
+            "seconds": round(indexed_seconds, 3),
+            "keywords_per_second": round(count / indexed_seconds) if indexed_seconds else None,
+        },
+    }
+
+    # The pairwise scan is quadratic; time it on a bounded sample.
+    sample = keywords[:min(count, 2000)]
+    start = time.perf_counter()
+    bruteforce = cluster_keywords_bruteforce(sample, threshold=threshold)
+    brute_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = cluster_keywords(sample, threshold=threshold)
+    sample_seconds = time.perf_counter() - start
+    result["bruteforce_sample"] = {
+        "keywords": len(sample),
+        "seconds": round(brute_seconds, 3),
+        "indexed_seconds": round(sample_seconds, 3),
+        "speedup": round(brute_seconds / sample_seconds, 1) if sample_seconds else None,
+        "identical_clusters": [[kw for kw, _ in c] for c in bruteforce] == [[kw for kw, _ in c] for c in indexed],
+    }
+    return result
+
+
 def main():
     parser = argparse.ArgumentParser(description="Cluster keywords by similarity and intent")
     parser.add_argument("--keywords", help="Comma-separated keywords")
-    parser.add_argument("--file", help="File with one keyword per line")
+    parser.add_argument("--file", help="File with one keyword per line, or a CSV export")
+    parser.add_argument("--column", help="CSV column holding the keywords (default: first column)")
     parser.add_argument("--threshold", type=float, default=0.25,
                         help="Similarity threshold for clustering (0.0-1.0, default 0.25)")
+    parser.add_argument("--linkage", choices=["greedy", "single"], default="greedy",
+                        help="greedy: join the best-matching earlier keyword's cluster (default); "
+                             "single: merge every pair above the threshold (union-find)")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Benchmark clustering throughput on N synthetic keywords")
     args = parser.parse_args()
 
+    if args.benchmark:
+        json.dump(run_benchmark(args.benchmark, args.threshold, args.linkage), sys.stdout, indent=2)
+        print()
+        return
+
     if not args.keywords and not args.file:
         parser.error("Provide --keywords or --file")
 
@@ -143,13 +378,17 @@ def main():
         if not path.exists():
             print(json.dumps({"error": f"File not found: {args.file}"}))
             sys.exit(1)
-        keyword_list = [line.strip() for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        try:
+            keyword_list = list(iter_keywords_file(path, args.column))
+        except ValueError as e:
+            print(json.dumps({"error": str(e)}))
+            sys.exit(1)
 
     if not keyword_list:
         print(json.dumps({"error": "No keywords provided"}))
         sys.exit(1)
 
-    raw_clusters = cluster_keywords(keyword_list, threshold=args.threshold)
+    raw_clusters = cluster_keywords(keyword_list, threshold=args.threshold, linkage=args.linkage)
 
     output_clusters = []
     intent_summary = defaultdict(int)
@@ -168,8 +407,8 @@ def main():
             "primary_intent": primary_intent,
             "keyword_count": len(kw_list),
             "keywords": [
-                {"keyword": kw, "intent": classify_intent(kw)}
-                for kw in kw_list
+                {"keyword": kw, "intent": intent}
+                for kw, intent in zip(kw_list, intents)
             ],
         })
 
@@ -183,6 +422,8 @@ def main():
         "similarity_threshold": args.threshold,
         "clusters": output_clusters,
     }
+    if args.linkage != "greedy":
+        result["linkage"] = args.linkage
 
     json.dump(result, sys.stdout, indent=2)
     print()
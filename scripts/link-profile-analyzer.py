@@ -9,10 +9,28 @@ concerning patterns, and actionable recommendations.
 Usage:
     python link-profile-analyzer.py --links '[{"url":"https://example.com/page","anchor_text":"keyword","domain":"example.com","da":45,"follow":true}]'
     python link-profile-analyzer.py --file backlinks.json --brand-domain mybrand.com
+    python link-profile-analyzer.py --file ahrefs_export.csv --brand-domain mybrand.com --top-flagged 100
+    python link-profile-analyzer.py --file links.jsonl --distinct-domains hll --top-domains 25
+
+CSV (.csv) and JSONL (.jsonl/.ndjson) files are streamed: each row is parsed
+and folded into running counts (DA buckets, follow ratio, anchor classes,
+referring domains), so memory does not grow with the number of links. Only
+the --top-flagged links and the --top-domains counts are retained; with
+--distinct-domains hll unique domains come from a HyperLogLog sketch and
+per-domain counts from a bounded summary. CSV headers may use this script's
+field names or Ahrefs/Majestic ones (Referring page URL, Anchor, Domain
+rating, Nofollow, ...). Rows that fail to parse are counted in rows_invalid.
+
+Dependencies: none (stdlib only)
 """
 
 import argparse
+import csv
+import functools
+import hashlib
+import heapq
 import json
+import math
 import sys
 from pathlib import Path
 
@@ -39,6 +57,16 @@ GENERIC_ANCHORS = {
 # Link parsing and validation
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=8)
+def _brand_clean(brand_domain):
+    return brand_domain.lower().strip().replace("www.", "")
+
+
+@functools.lru_cache(maxsize=8)
+def _brand_name(brand_domain):
+    return brand_domain.lower().replace("www.", "").split(".")[0]
+
+
 def parse_link(link_obj, brand_domain):
     """Parse and validate a single link object."""
     if not isinstance(link_obj, dict):
@@ -62,7 +90,7 @@ def parse_link(link_obj, brand_domain):
 
     # Skip internal links
     if brand_domain and domain:
-        brand_clean = brand_domain.lower().strip().replace("www.", "")
+        brand_clean = _brand_clean(brand_domain)
         domain_clean = domain.lower().strip().replace("www.", "")
         if domain_clean == brand_clean or domain_clean.endswith("." + brand_clean):
             return None
@@ -80,15 +108,26 @@ def parse_link(link_obj, brand_domain):
 # Authority distribution
 # ---------------------------------------------------------------------------
 
-def analyze_authority(links):
-    """Bucket links by domain authority ranges."""
-    total = len(links)
+def da_bucket(da):
+    """Name of the DA_BUCKETS range containing da (None if outside every range)."""
+    for bucket_name, (low, high) in DA_BUCKETS.items():
+        if low <= da <= high:
+            return bucket_name
+    return None
+
+
+# parse_link clamps DA to an int in 0-100, so buckets can be looked up
+_DA_BUCKET_OF = [da_bucket(da) for da in range(101)]
+
+
+def authority_from_counts(counts, total):
+    """Authority distribution from per-bucket link counts."""
     if total == 0:
         return {}
 
     distribution = {}
-    for bucket_name, (low, high) in DA_BUCKETS.items():
-        count = sum(1 for link in links if low <= link["da"] <= high)
+    for bucket_name in DA_BUCKETS:
+        count = counts.get(bucket_name, 0)
         distribution[bucket_name] = {
             "count": count,
             "percent": round(count / total * 100, 1),
@@ -97,17 +136,24 @@ def analyze_authority(links):
     return distribution
 
 
+def analyze_authority(links):
+    """Bucket links by domain authority ranges."""
+    counts = {}
+    for link in links:
+        bucket = da_bucket(link["da"])
+        counts[bucket] = counts.get(bucket, 0) + 1
+    return authority_from_counts(counts, len(links))
+
+
 # ---------------------------------------------------------------------------
 # Follow/nofollow analysis
 # ---------------------------------------------------------------------------
 
-def analyze_follow(links):
-    """Analyze dofollow vs nofollow ratio."""
-    total = len(links)
+def follow_from_counts(dofollow, total):
+    """Dofollow vs nofollow ratio from the dofollow count."""
     if total == 0:
         return {"dofollow": {"count": 0, "percent": 0}, "nofollow": {"count": 0, "percent": 0}, "status": "no_data"}
 
-    dofollow = sum(1 for link in links if link["follow"])
     nofollow = total - dofollow
 
     dofollow_pct = round(dofollow / total * 100, 1)
@@ -127,6 +173,11 @@ def analyze_follow(links):
     }
 
 
+def analyze_follow(links):
+    """Analyze dofollow vs nofollow ratio."""
+    return follow_from_counts(sum(1 for link in links if link["follow"]), len(links))
+
+
 # ---------------------------------------------------------------------------
 # Anchor text analysis
 # ---------------------------------------------------------------------------
@@ -148,7 +199,7 @@ def classify_anchor(anchor, brand_domain):
 
     # Branded anchor: contains the brand domain name (without TLD)
     if brand_domain:
-        brand_name = brand_domain.lower().replace("www.", "").split(".")[0]
+        brand_name = _brand_name(brand_domain)
         if brand_name and brand_name in anchor_lower:
             return "branded"
 
@@ -161,24 +212,16 @@ def classify_anchor(anchor, brand_domain):
         return "partial_match"
 
 
-def analyze_anchors(links, brand_domain):
-    """Categorize and analyze anchor text distribution."""
-    total = len(links)
+ANCHOR_CATEGORIES = ("branded", "exact_match", "partial_match", "generic", "url", "image_no_anchor")
+
+
+def anchors_from_counts(counts, total, brand_domain):
+    """Anchor text distribution and health status from per-category counts."""
     if total == 0:
         return {}
 
-    categories = {
-        "branded": 0,
-        "exact_match": 0,
-        "partial_match": 0,
-        "generic": 0,
-        "url": 0,
-        "image_no_anchor": 0,
-    }
-
-    for link in links:
-        cat = classify_anchor(link["anchor_text"], brand_domain)
-        categories[cat] = categories.get(cat, 0) + 1
+    categories = {cat: 0 for cat in ANCHOR_CATEGORIES}
+    categories.update(counts)
 
     result = {}
     for cat, count in categories.items():
@@ -202,6 +245,15 @@ def analyze_anchors(links, brand_domain):
     return result
 
 
+def analyze_anchors(links, brand_domain):
+    """Categorize and analyze anchor text distribution."""
+    counts = {}
+    for link in links:
+        cat = classify_anchor(link["anchor_text"], brand_domain)
+        counts[cat] = counts.get(cat, 0) + 1
+    return anchors_from_counts(counts, len(links), brand_domain)
+
+
 # ---------------------------------------------------------------------------
 # Link quality scoring
 # ---------------------------------------------------------------------------
@@ -236,10 +288,7 @@ def score_link(link, unique_domains, total_links):
         score += 5
 
     # Domain uniqueness bonus (0-20)
-    domain = link["domain"]
-    if domain:
-        domain_count = sum(1 for _ in range(total_links))  # placeholder
-        # Give bonus for domains that appear fewer times
+    if link["domain"]:
         score += 15  # default bonus; adjusted below in profile score
 
     return min(100, score)
@@ -423,69 +472,318 @@ def generate_recommendations(flags, authority_dist, follow_analysis, anchor_anal
 
 
 # ---------------------------------------------------------------------------
-# Main analysis
+# Streaming accumulators
 # ---------------------------------------------------------------------------
 
-def analyze_profile(links_raw, brand_domain):
-    """Run full backlink profile analysis."""
-    # Parse and filter links
-    links = []
-    for link_obj in links_raw:
-        parsed = parse_link(link_obj, brand_domain)
-        if parsed:
-            links.append(parsed)
-
-    total_links = len(links)
-    if total_links == 0:
-        return {"error": "No valid external links found after filtering"}
-
-    # Domain diversity
-    domains = set(link["domain"] for link in links if link["domain"])
-    unique_domains = len(domains)
-    domain_diversity_ratio = round(unique_domains / total_links, 2) if total_links > 0 else 0
-
-    # Authority distribution
-    authority_dist = analyze_authority(links)
-
-    # Follow/nofollow analysis
-    follow_analysis = analyze_follow(links)
-
-    # Anchor text analysis
-    anchor_analysis = analyze_anchors(links, brand_domain)
-
-    # Profile health score
-    health_score = compute_profile_health(
-        links, authority_dist, follow_analysis, anchor_analysis, domain_diversity_ratio
-    )
+class HyperLogLog:
+    """Distinct-count sketch: 2**precision one-byte registers, ~1.04/sqrt(2**precision) error."""
+
+    def __init__(self, precision=14):
+        self.p = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, value):
+        h = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        index = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def __len__(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
+
+    @property
+    def relative_error(self):
+        return 1.04 / math.sqrt(self.m)
+
+
+class DomainCounter:
+    """Links per referring domain; with capacity, a bounded Misra-Gries summary.
+
+    When the table grows past 2 * capacity, the (capacity + 1)-th largest
+    count is subtracted from every domain and non-positive entries dropped,
+    so memory stays O(capacity) and each count undercounts by at most
+    links / (capacity + 1).
+    """
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.counts = {}
+        self.pruned = False
+
+    def add(self, domain):
+        counts = self.counts
+        counts[domain] = counts.get(domain, 0) + 1
+        if self.capacity and len(counts) > 2 * self.capacity:
+            cut = heapq.nlargest(self.capacity + 1, counts.values())[-1]
+            self.counts = {d: c - cut for d, c in counts.items() if c > cut}
+            self.pruned = True
+
+    def top(self, n):
+        return heapq.nsmallest(n, self.counts.items(), key=lambda kv: (-kv[1], kv[0]))
+
+
+def link_flags(link, anchor_class):
+    """Reasons an individual link needs review (empty if none)."""
+    reasons = []
+    if link["da"] <= DA_BUCKETS["low_0_20"][1]:
+        reasons.append("low_authority")
+    if anchor_class == "exact_match":
+        reasons.append("exact_match_anchor")
+    if not link["domain"]:
+        reasons.append("missing_domain")
+    return reasons
+
+
+ANCHOR_CACHE_SIZE = 100000
+DOMAIN_CACHE_SIZE = 100000
+
+
+class ProfileAccumulator:
+    """Single-pass, bounded-memory state behind analyze_profile.
+
+    add() takes parsed links one at a time and keeps only counts: DA
+    buckets, dofollow links, anchor categories and referring domains (an
+    exact set, or a HyperLogLog sketch with distinct="hll"). top_flagged
+    keeps the N lowest-scoring flagged links in a heap; top_domains keeps
+    per-domain link counts (exact, or a Misra-Gries summary in hll mode).
+    """
+
+    def __init__(self, brand_domain=None, distinct="exact", hll_precision=14, top_flagged=0, top_domains=0):
+        self.brand_domain = brand_domain
+        self.total = 0
+        self.buckets = {}
+        self.dofollow = 0
+        self.anchors = {}
+        self.distinct = distinct
+        self.domains = HyperLogLog(hll_precision) if distinct == "hll" else set()
+        self.top_domains = top_domains
+        self.domain_counts = (DomainCounter(max(1000, 10 * top_domains) if distinct == "hll" else None)
+                              if top_domains else None)
+        self.top_flagged = top_flagged
+        self.flagged = []  # max-heap of (-score, -seq, entry): the N lowest scores, earliest first
+        self._recent_domains = set() if distinct == "hll" else None
+        self._anchor_class = {}  # anchor text -> classify_anchor result (exports repeat anchors)
+
+    def __len__(self):
+        return self.total
+
+    def add(self, link):
+        self.total += 1
+        bucket = _DA_BUCKET_OF[link["da"]]
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        if link["follow"]:
+            self.dofollow += 1
+        anchor = link["anchor_text"]
+        cat = self._anchor_class.get(anchor)
+        if cat is None:
+            cat = classify_anchor(anchor, self.brand_domain)
+            if len(self._anchor_class) >= ANCHOR_CACHE_SIZE:
+                self._anchor_class.clear()
+            self._anchor_class[anchor] = cat
+        self.anchors[cat] = self.anchors.get(cat, 0) + 1
+
+        domain = link["domain"]
+        if domain:
+            if self._recent_domains is None:
+                self.domains.add(domain)
+            elif domain not in self._recent_domains:
+                # Re-adding never changes the sketch; a bounded cache of recent
+                # domains skips most of the hashing
+                self.domains.add(domain)
+                if len(self._recent_domains) >= DOMAIN_CACHE_SIZE:
+                    self._recent_domains.clear()
+                self._recent_domains.add(domain)
+            if self.domain_counts is not None:
+                self.domain_counts.add(domain)
+
+        if self.top_flagged:
+            self._consider_flag(link, cat)
+
+    def _consider_flag(self, link, anchor_class):
+        reasons = link_flags(link, anchor_class)
+        if not reasons:
+            return
+        score = score_link(link, 0, 0)
+        key = (-score, -self.total)
+        if len(self.flagged) >= self.top_flagged:
+            if key <= self.flagged[0][:2]:
+                return
+            heapq.heappop(self.flagged)
+        entry = {
+            "url": link["url"],
+            "domain": link["domain"],
+            "anchor_text": link["anchor_text"],
+            "da": link["da"],
+            "follow": link["follow"],
+            "anchor_class": anchor_class,
+            "link_score": score,
+            "reasons": reasons,
+        }
+        heapq.heappush(self.flagged, (*key, entry))
+
+    def result(self):
+        """The analyze_profile output for every link added so far."""
+        links = self
+        total_links = self.total
+        if total_links == 0:
+            return {"error": "No valid external links found after filtering"}
+
+        # Domain diversity
+        unique_domains = len(self.domains)
+        domain_diversity_ratio = round(unique_domains / total_links, 2) if total_links > 0 else 0
+
+        authority_dist = authority_from_counts(self.buckets, total_links)
+        follow_analysis = follow_from_counts(self.dofollow, total_links)
+        anchor_analysis = anchors_from_counts(self.anchors, total_links, self.brand_domain)
+
+        # Profile health score
+        health_score = compute_profile_health(
+            links, authority_dist, follow_analysis, anchor_analysis, domain_diversity_ratio
+        )
 
-    # Flags
-    flags = generate_flags(
-        links, authority_dist, follow_analysis, anchor_analysis, domain_diversity_ratio
-    )
+        # Flags
+        flags = generate_flags(
+            links, authority_dist, follow_analysis, anchor_analysis, domain_diversity_ratio
+        )
 
-    # Recommendations
-    recommendations = generate_recommendations(
-        flags, authority_dist, follow_analysis, anchor_analysis, health_score
-    )
+        # Recommendations
+        recommendations = generate_recommendations(
+            flags, authority_dist, follow_analysis, anchor_analysis, health_score
+        )
 
-    output = {
-        "profile_summary": {
+        summary = {
             "total_links": total_links,
             "unique_domains": unique_domains,
             "domain_diversity_ratio": domain_diversity_ratio,
             "health_score": health_score,
-        },
-        "authority_distribution": authority_dist,
-        "follow_analysis": follow_analysis,
-        "anchor_text_analysis": anchor_analysis,
-        "flags": flags,
-        "recommendations": recommendations,
-    }
+        }
+        if self.distinct == "hll":
+            summary["unique_domains_method"] = "hyperloglog"
+            summary["unique_domains_error_pct"] = round(self.domains.relative_error * 100, 2)
+
+        output = {
+            "profile_summary": summary,
+            "authority_distribution": authority_dist,
+            "follow_analysis": follow_analysis,
+            "anchor_text_analysis": anchor_analysis,
+            "flags": flags,
+            "recommendations": recommendations,
+        }
+        if self.domain_counts is not None:
+            output["top_domains"] = [{"domain": d, "links": c} for d, c in self.domain_counts.top(self.top_domains)]
+            if self.domain_counts.pruned:
+                output["top_domains_note"] = "approximate: counts are lower bounds (bounded-memory summary)"
+        if self.top_flagged:
+            output["flagged_links"] = [entry for _, _, entry in sorted(self.flagged, reverse=True)]
 
-    if brand_domain:
-        output["brand_domain"] = brand_domain
+        if self.brand_domain:
+            output["brand_domain"] = self.brand_domain
 
-    return output
+        return output
+
+
+# ---------------------------------------------------------------------------
+# Main analysis
+# ---------------------------------------------------------------------------
+
+def analyze_profile(links_raw, brand_domain, **options):
+    """Run full backlink profile analysis.
+
+    options are passed to ProfileAccumulator (distinct, hll_precision,
+    top_flagged, top_domains).
+    """
+    profile = ProfileAccumulator(brand_domain, **options)
+    for link_obj in links_raw:
+        parsed = parse_link(link_obj, brand_domain)
+        if parsed:
+            profile.add(parsed)
+    return profile.result()
+
+
+# Export column names (lowercased) -> link field. Ahrefs and Majestic headers
+# are matched as well as this script's own field names.
+CSV_COLUMNS = {
+    "url": "url", "source_url": "url", "referring page url": "url", "sourceurl": "url",
+    "anchor_text": "anchor_text", "anchor": "anchor_text", "anchortext": "anchor_text", "anchor text": "anchor_text",
+    "domain": "domain", "referring domain": "domain", "source domain": "domain", "sourcedomain": "domain",
+    "da": "da", "dr": "da", "domain rating": "da", "domain authority": "da", "sourcetrustflow": "da",
+    "follow": "follow", "nofollow": "nofollow", "flagnofollow": "nofollow",
+}
+INVALID_ROW = object()  # iter_link_file marker for an unparseable row
+STREAM_SUFFIXES = {".csv", ".jsonl", ".ndjson"}
+FALSE_VALUES = {"false", "0", "no", "n", "nofollow", ""}
+
+
+def iter_link_file(path):
+    """Yield link dicts from a CSV or JSONL backlink export, one row at a time.
+
+    A JSONL line that is not valid JSON yields INVALID_ROW so the caller can
+    count it and carry on.
+    """
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        if path.suffix.lower() != ".csv":
+            for line in fh:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        yield INVALID_ROW
+            return
+
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        columns = []
+        seen = set()
+        for i, name in enumerate(header):
+            field = CSV_COLUMNS.get(name.strip().lower())
+            if field and field not in seen:
+                seen.add(field)
+                columns.append((i, field))
+        for row in reader:
+            link = {}
+            for i, field in columns:
+                value = row[i].strip() if i < len(row) else ""
+                if field in ("follow", "nofollow"):
+                    if value:
+                        follow = value.lower() not in FALSE_VALUES
+                        link["follow"] = follow if field == "follow" else not follow
+                elif field == "da":
+                    if value:
+                        link["da"] = float(value) if "." in value else value
+                elif value:
+                    link[field] = value
+            yield link
+
+
+def analyze_stream(records, brand_domain, **options):
+    """analyze_profile over an iterable of link dicts; rows that fail to parse are counted, not fatal."""
+    profile = ProfileAccumulator(brand_domain, **options)
+    invalid = 0
+    for link_obj in records:
+        if link_obj is INVALID_ROW:
+            invalid += 1
+            continue
+        try:
+            parsed = parse_link(link_obj, brand_domain)
+        except (TypeError, ValueError, OverflowError, AttributeError):  # OverflowError: infinite DA
+            invalid += 1
+            continue
+        if parsed:
+            profile.add(parsed)
+    result = profile.result()
+    if invalid:
+        result["rows_invalid"] = invalid
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -502,13 +800,35 @@ def main():
     )
     parser.add_argument(
         "--file", default=None,
-        help="Path to JSON file containing the links array",
+        help="Path to a JSON file containing the links array, or a CSV/JSONL export (streamed row by row)",
     )
     parser.add_argument(
         "--brand-domain", default=None,
         help="Brand domain to exclude internal links (e.g., mybrand.com)",
     )
+    parser.add_argument(
+        "--distinct-domains", choices=["exact", "hll"], default="exact",
+        help="Count unique domains exactly (a set) or with a HyperLogLog sketch (bounded memory)",
+    )
+    parser.add_argument(
+        "--hll-precision", type=int, default=14,
+        help="HyperLogLog precision bits, 4-18 (default: 14, about 0.8%% error)",
+    )
+    parser.add_argument(
+        "--top-flagged", type=int, default=0,
+        help="Also return the N lowest-scoring links flagged for review (default: 0)",
+    )
+    parser.add_argument(
+        "--top-domains", type=int, default=0,
+        help="Also return the N referring domains with the most links (default: 0)",
+    )
     args = parser.parse_args()
+    options = {
+        "distinct": args.distinct_domains,
+        "hll_precision": min(18, max(4, args.hll_precision)),
+        "top_flagged": max(0, args.top_flagged),
+        "top_domains": max(0, args.top_domains),
+    }
 
     if not args.links and not args.file:
         json.dump(
@@ -526,6 +846,14 @@ def main():
             json.dump({"error": f"File not found: {args.file}"}, sys.stdout, indent=2)
             print()
             sys.exit(0)
+        if path.suffix.lower() in STREAM_SUFFIXES:
+            try:
+                result = analyze_stream(iter_link_file(path), args.brand_domain, **options)
+            except (OSError, csv.Error, UnicodeDecodeError) as exc:
+                result = {"error": f"Could not read file: {exc}"}
+            json.dump(result, sys.stdout, indent=2)
+            print()
+            sys.exit(0)
         try:
             content = path.read_text(encoding="utf-8")
             links_raw = json.loads(content)
@@ -556,7 +884,7 @@ def main():
         sys.exit(0)
 
     try:
-        result = analyze_profile(links_raw, args.brand_domain)
+        result = analyze_profile(links_raw, args.brand_domain, **options)
         json.dump(result, sys.stdout, indent=2)
         print()
     except Exception as exc:
@@ -6,18 +6,29 @@ scores Google Business Profile completeness across 16 weighted fields. Returns
 per-citation scores, aggregate consistency score, GBP completeness score, and
 prioritized action items.
 
+Multi-location mode (--locations) checks many stores against one citation
+export: every record is normalized once, citations are blocked by normalized
+phone and postcode so each is scored only against the stores sharing a key,
+and matching runs across a process pool (--workers). The result is a
+location x directory consistency matrix with per-source summaries and the
+citations no store matched. Both sides may be CSV, JSON or JSONL.
+
 Dependencies: none (stdlib only)
 
 Usage:
     python local-seo-checker.py --nap '{"name":"Acme Inc","address":"123 Main Street, Austin, TX 78701","phone":"(512) 555-1234","website":"https://acme.com"}' --citations '[{"source":"Yelp","name":"Acme Inc.","address":"123 Main St, Austin, TX 78701","phone":"512-555-1234","website":""}]'
     python local-seo-checker.py --gbp '{"business_name":"Acme Inc","primary_category":"Plumber","address":"123 Main Street","phone":"512-555-1234","website":"https://acme.com","hours":"Mon-Fri 9-5","description":"Full service plumbing...","photos_count":12}' --industry restaurant
     python local-seo-checker.py --nap '{"name":"Acme"}' --file citations.json --gbp '{"business_name":"Acme"}'
+    python local-seo-checker.py --locations stores.csv --file citations.csv --workers 8 --output nap_matrix.csv
 """
 
 import argparse
+import csv
 import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -146,23 +157,70 @@ def normalize_address(address):
     return addr
 
 
-def compare_names(canonical, citation):
-    """Compare business names. Returns 'exact', 'contains', or 'mismatch'."""
-    if not canonical or not citation:
+def _name_key(name):
+    return name.lower().strip().rstrip(".,") if name else ""
+
+
+def _name_match(c_raw, c_key, t_raw, t_key):
+    if not c_raw or not t_raw:
         return "mismatch"
-    c = canonical.lower().strip().rstrip(".,")
-    t = citation.lower().strip().rstrip(".,")
-    if c == t:
+    if c_key == t_key:
         return "exact"
-    if c in t or t in c:
+    if c_key in t_key or t_key in c_key:
         return "contains"
     return "mismatch"
 
 
-def compare_addresses(canonical, citation):
-    """Compare addresses after normalization. Returns 'exact', 'partial', or 'mismatch' and issues."""
-    c_norm = normalize_address(canonical)
-    t_norm = normalize_address(citation)
+# Postcodes sit at the end of an address, so the match that ends last wins;
+# unit designators such as "Suite A1 2ND Floor" look like UK postcodes but
+# come before the real ZIP.
+POSTCODE_PATTERNS = [
+    re.compile(r"\b([A-Z]{1,2}\d[A-Z\d]?)\s*(\d[A-Z]{2})\b"),  # UK
+    re.compile(r"\b([A-Z]\d[A-Z])\s*(\d[A-Z]\d)\b"),  # Canada
+    re.compile(r"\b(\d{5})(?:-\d{4})?\b"),  # US ZIP / ZIP+4
+]
+
+
+def extract_postcode(postcode, address):
+    """Normalized postcode: the explicit value if given, else the last one found in the address."""
+    if isinstance(postcode, (int, float)) and not isinstance(postcode, bool):
+        # Numeric JSON values: 78701.0 -> "78701", 2134 -> "02134"
+        if isinstance(postcode, float) and not postcode.is_integer():
+            return ""
+        return str(int(postcode)).zfill(5)
+    if postcode:
+        return re.sub(r"\s+", "", str(postcode)).upper().split("-")[0]
+    if not address or not isinstance(address, str):
+        return ""
+    upper = address.upper()
+    best = None
+    for pattern in POSTCODE_PATTERNS:
+        for match in pattern.finditer(upper):
+            if best is None or match.end() > best.end():
+                best = match
+    return "".join(g for g in best.groups() if g) if best else ""
+
+
+def compare_names(canonical, citation):
+    """Compare business names. Returns 'exact', 'contains', or 'mismatch'."""
+    return _name_match(canonical, _name_key(canonical), citation, _name_key(citation))
+
+
+# Full word -> first abbreviation that expands to it
+_ABBREVIATION_OF = {}
+for _abbrev, _word in ADDRESS_EXPANSIONS.items():
+    _ABBREVIATION_OF.setdefault(_word, _abbrev)
+
+
+def _address_parts(address):
+    """(raw, normalized, word set) for an address, computed once per record."""
+    norm = normalize_address(address)
+    return address, norm, set(norm.split())
+
+
+def _address_match(c_parts, t_parts):
+    canonical, c_norm, c_words = c_parts
+    citation, t_norm, t_words = t_parts
     issues = []
 
     if not c_norm or not t_norm:
@@ -179,8 +237,6 @@ def compare_addresses(canonical, citation):
         return "partial", issues
 
     # Check word overlap for partial matching
-    c_words = set(c_norm.split())
-    t_words = set(t_norm.split())
     overlap = c_words & t_words
     total = c_words | t_words
     similarity = len(overlap) / max(len(total), 1)
@@ -189,10 +245,9 @@ def compare_addresses(canonical, citation):
         diff_words = (c_words - t_words) | (t_words - c_words)
         for word in diff_words:
             # Check if this is an abbreviation difference
-            if word in ADDRESS_EXPANSIONS.values():
-                abbrev = [k for k, v in ADDRESS_EXPANSIONS.items() if v == word]
-                if abbrev:
-                    issues.append(f"Address uses '{abbrev[0].title()}' instead of '{word.title()}'")
+            abbrev = _ABBREVIATION_OF.get(word)
+            if abbrev:
+                issues.append(f"Address uses '{abbrev.title()}' instead of '{word.title()}'")
         if not issues:
             issues.append(f"Address partially matches (formatting difference)")
         return "partial", issues
@@ -201,79 +256,97 @@ def compare_addresses(canonical, citation):
     return "mismatch", issues
 
 
+def compare_addresses(canonical, citation):
+    """Compare addresses after normalization. Returns 'exact', 'partial', or 'mismatch' and issues."""
+    return _address_match(_address_parts(canonical), _address_parts(citation))
+
+
 # ---------------------------------------------------------------------------
 # NAP analysis
 # ---------------------------------------------------------------------------
 
-def analyze_nap(canonical, citations):
-    """Analyze NAP consistency across citation sources."""
-    citation_results = []
-    total_score = 0
+def normalize_nap(record):
+    """Normalize a NAP record (canonical or citation) once for repeated comparisons."""
+    name = record.get("name", "")
+    address = record.get("address", "")
+    return {
+        "record": record,
+        "name": name,
+        "name_key": _name_key(name),
+        "address": _address_parts(address),
+        "phone": normalize_phone(record.get("phone", "")),
+        "website": normalize_website(record.get("website", "")),
+        "postcode": extract_postcode(record.get("postcode") or record.get("zip") or "", address),
+    }
 
-    for cit in citations:
-        issues = []
-        score = 0
-
-        # Name comparison (30 pts max)
-        name_match = compare_names(canonical.get("name", ""), cit.get("name", ""))
-        if name_match == "exact":
-            score += 30
-        elif name_match == "contains":
-            score += 15
-            issues.append(f"Business name is a partial match: '{cit.get('name', '')}' vs '{canonical.get('name', '')}'")
+
+def score_citation(canon, cit):
+    """Score one normalized citation against a normalized canonical record."""
+    canonical, citation = canon["record"], cit["record"]
+    issues = []
+    score = 0
+
+    # Name comparison (30 pts max)
+    name_match = _name_match(canon["name"], canon["name_key"], cit["name"], cit["name_key"])
+    if name_match == "exact":
+        score += 30
+    elif name_match == "contains":
+        score += 15
+        issues.append(f"Business name is a partial match: '{citation.get('name', '')}' vs '{canonical.get('name', '')}'")
+    else:
+        issues.append(f"Business name mismatch: '{citation.get('name', '')}' vs '{canonical.get('name', '')}'")
+
+    # Address comparison (30 pts max)
+    addr_match, addr_issues = _address_match(canon["address"], cit["address"])
+    if addr_match == "exact":
+        score += 30
+    elif addr_match == "partial":
+        score += 15
+    issues.extend(addr_issues)
+
+    # Phone comparison (25 pts max)
+    c_phone = canon["phone"]
+    t_phone = cit["phone"]
+    if c_phone and t_phone and c_phone == t_phone:
+        phone_match = "exact"
+        score += 25
+    else:
+        phone_match = "mismatch"
+        if not t_phone:
+            issues.append("Phone number missing from citation")
+        elif not c_phone:
+            issues.append("Canonical phone number not provided for comparison")
         else:
-            issues.append(f"Business name mismatch: '{cit.get('name', '')}' vs '{canonical.get('name', '')}'")
-
-        # Address comparison (30 pts max)
-        addr_match, addr_issues = compare_addresses(canonical.get("address", ""), cit.get("address", ""))
-        if addr_match == "exact":
-            score += 30
-        elif addr_match == "partial":
-            score += 15
-        issues.extend(addr_issues)
-
-        # Phone comparison (25 pts max)
-        c_phone = normalize_phone(canonical.get("phone", ""))
-        t_phone = normalize_phone(cit.get("phone", ""))
-        if c_phone and t_phone and c_phone == t_phone:
-            phone_match = "exact"
-            score += 25
+            issues.append(f"Phone mismatch: '{citation.get('phone', '')}' vs '{canonical.get('phone', '')}'")
+
+    # Website comparison (15 pts max)
+    c_web = canon["website"]
+    t_web = cit["website"]
+    if c_web and t_web and c_web == t_web:
+        web_match = "exact"
+        score += 15
+    else:
+        web_match = "mismatch"
+        if not t_web:
+            issues.append("Website missing from listing")
+        elif not c_web:
+            issues.append("Canonical website not provided for comparison")
         else:
-            phone_match = "mismatch"
-            if not t_phone:
-                issues.append("Phone number missing from citation")
-            elif not c_phone:
-                issues.append("Canonical phone number not provided for comparison")
-            else:
-                issues.append(f"Phone mismatch: '{cit.get('phone', '')}' vs '{canonical.get('phone', '')}'")
-
-        # Website comparison (15 pts max)
-        c_web = normalize_website(canonical.get("website", ""))
-        t_web = normalize_website(cit.get("website", ""))
-        if c_web and t_web and c_web == t_web:
-            web_match = "exact"
-            score += 15
-        else:
-            web_match = "mismatch"
-            if not t_web:
-                issues.append("Website missing from listing")
-            elif not c_web:
-                issues.append("Canonical website not provided for comparison")
-            else:
-                issues.append(f"Website mismatch: '{cit.get('website', '')}' vs '{canonical.get('website', '')}'")
-
-        citation_results.append({
-            "source": cit.get("source", "Unknown"),
-            "name_match": name_match,
-            "address_match": addr_match,
-            "phone_match": phone_match,
-            "website_match": web_match,
-            "score": score,
-            "issues": issues,
-        })
-        total_score += score
+            issues.append(f"Website mismatch: '{citation.get('website', '')}' vs '{canonical.get('website', '')}'")
+
+    return {
+        "source": citation.get("source", "Unknown"),
+        "name_match": name_match,
+        "address_match": addr_match,
+        "phone_match": phone_match,
+        "website_match": web_match,
+        "score": score,
+        "issues": issues,
+    }
 
-    consistency_score = round(total_score / max(len(citations), 1))
+
+def _nap_summary(canonical, citation_results):
+    consistency_score = round(sum(cr["score"] for cr in citation_results) / max(len(citation_results), 1))
 
     # Build recommendations
     recommendations = []
@@ -285,13 +358,206 @@ def analyze_nap(canonical, citations):
 
     return {
         "canonical": canonical,
-        "citations_checked": len(citations),
+        "citations_checked": len(citation_results),
         "consistency_score": consistency_score,
         "citations": citation_results,
         "recommendations": recommendations,
     }
 
 
+def analyze_nap(canonical, citations):
+    """Analyze NAP consistency across citation sources."""
+    canon = normalize_nap(canonical)
+    return _nap_summary(canonical, [score_citation(canon, normalize_nap(cit)) for cit in citations])
+
+
+# ---------------------------------------------------------------------------
+# Multi-location NAP analysis
+# ---------------------------------------------------------------------------
+#
+# Every location and citation is normalized once. Locations are indexed by
+# normalized phone and postcode, and a citation is only scored against the
+# locations that share one of those blocking keys (or the location named in
+# its location_id column). Citations are matched in chunks across a process
+# pool; each worker receives the normalized locations and index once.
+
+MIN_MATCH_SCORE = 30  # below this (and without a phone match) a citation stays unmatched
+LOCATION_ID_FIELDS = ("location_id", "store_id", "id")
+
+_worker_locations = None
+_worker_index = None
+_worker_ids = None
+
+
+def location_id(record, position):
+    for field in LOCATION_ID_FIELDS:
+        value = record.get(field)
+        if value not in (None, ""):
+            return str(value)
+    return str(position + 1)
+
+
+def blocking_keys(norm):
+    keys = []
+    if norm["phone"]:
+        keys.append(("phone", norm["phone"]))
+    if norm["postcode"]:
+        keys.append(("postcode", norm["postcode"]))
+    return keys
+
+
+def build_block_index(locations_norm):
+    """Blocking key -> location positions."""
+    index = {}
+    for i, norm in enumerate(locations_norm):
+        for key in blocking_keys(norm):
+            index.setdefault(key, []).append(i)
+    return index
+
+
+def _init_matcher(locations_norm, index, ids):
+    global _worker_locations, _worker_index, _worker_ids
+    _worker_locations, _worker_index, _worker_ids = locations_norm, index, ids
+
+
+def _match_citations(chunk):
+    """Match (position, citation) pairs to their best location within their blocks."""
+    out = []
+    for position, citation in chunk:
+        cit = normalize_nap(citation)
+        explicit = citation.get("location_id")
+        if explicit not in (None, "") and str(explicit) in _worker_ids:
+            candidates = [_worker_ids[str(explicit)]]
+        else:
+            candidates = sorted({i for key in blocking_keys(cit) for i in _worker_index.get(key, ())})
+        best = None
+        for i in candidates:
+            result = score_citation(_worker_locations[i], cit)
+            if best is None or result["score"] > best[1]["score"]:
+                best = (i, result)
+        if best and not (best[1]["score"] >= MIN_MATCH_SCORE or best[1]["phone_match"] == "exact"):
+            best = (None, best[1])
+        out.append((position, len(candidates), best))
+    return out
+
+
+def analyze_locations(locations, citations, workers=None):
+    """NAP consistency for many locations against one pooled citation set.
+
+    Returns a per-location consistency matrix (location x source scores),
+    per-location details in analyze_nap's shape, per-source summaries and
+    the citations no location matched.
+    """
+    locations_norm = [normalize_nap(loc) for loc in locations]
+    ids = {}
+    for i, loc in enumerate(locations):
+        ids.setdefault(location_id(loc, i), i)
+    index = build_block_index(locations_norm)
+
+    workers = max(1, workers or os.cpu_count() or 1)
+    tasks = list(enumerate(citations))
+    size = max(1, -(-len(tasks) // (workers * 4)))
+    chunks = [tasks[i:i + size] for i in range(0, len(tasks), size)]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks)), initializer=_init_matcher,
+                                 initargs=(locations_norm, index, ids)) as pool:
+            matched = [m for part in pool.map(_match_citations, chunks) for m in part]
+    else:
+        _init_matcher(locations_norm, index, ids)
+        matched = [m for chunk in chunks for m in _match_citations(chunk)]
+
+    per_location = [[] for _ in locations]
+    unmatched = []
+    pairs_scored = 0
+    for position, scored, best in matched:
+        pairs_scored += scored
+        if best is None or best[0] is None:
+            cit = citations[position]
+            unmatched.append({
+                "source": cit.get("source", "Unknown"),
+                "name": cit.get("name", ""),
+                "phone": cit.get("phone", ""),
+                "address": cit.get("address", ""),
+                "reason": "no location shares its phone or postcode" if best is None
+                          else f"best candidate scored {best[1]['score']} (below {MIN_MATCH_SCORE})",
+            })
+        else:
+            per_location[best[0]].append(best[1])
+
+    sources = sorted({cr["source"] for results in per_location for cr in results})
+    matrix = []
+    details = []
+    source_scores = {src: [] for src in sources}
+    for i, (loc, results) in enumerate(zip(locations, per_location)):
+        summary = _nap_summary(loc, results)
+        lid = location_id(loc, i)
+        cells = {}
+        for cr in results:
+            # Duplicate listings on one source: the matrix shows the worst
+            cells[cr["source"]] = min(cr["score"], cells.get(cr["source"], 100))
+        for src, score in cells.items():
+            source_scores[src].append(score)
+        matrix.append({
+            "location_id": lid,
+            "name": loc.get("name", ""),
+            "consistency_score": summary["consistency_score"] if results else None,
+            "citations_checked": len(results),
+            "scores": {src: cells.get(src) for src in sources},
+            "missing_sources": [src for src in sources if src not in cells],
+        })
+        details.append({"location_id": lid, **summary})
+
+    scored_locations = [row for row in matrix if row["consistency_score"] is not None]
+    return {
+        "locations_checked": len(locations),
+        "citations_checked": len(citations),
+        "citations_matched": len(citations) - len(unmatched),
+        "citations_unmatched": len(unmatched),
+        "candidate_pairs_scored": pairs_scored,
+        "pairs_without_blocking": len(locations) * len(citations),
+        "workers": min(workers, len(chunks)) if len(chunks) > 1 else 1,
+        "average_consistency_score": round(sum(r["consistency_score"] for r in scored_locations)
+                                           / len(scored_locations)) if scored_locations else 0,
+        "sources": sources,
+        "source_summary": {
+            src: {
+                "locations_listed": len(scores),
+                "locations_missing": len(locations) - len(scores),
+                "average_score": round(sum(scores) / len(scores), 1) if scores else None,
+            }
+            for src, scores in source_scores.items()
+        },
+        "matrix": matrix,
+        "lowest_consistency": [
+            {"location_id": r["location_id"], "name": r["name"], "consistency_score": r["consistency_score"]}
+            for r in sorted(scored_locations, key=lambda r: r["consistency_score"])[:10]
+        ],
+        "unmatched_citations": unmatched,
+        "details": details,
+    }
+
+
+def read_records(path):
+    """List of record dicts from a CSV, JSON (array) or JSONL file."""
+    path = Path(path)
+    with open(path, newline="", encoding="utf-8-sig") as fh:
+        if path.suffix.lower() == ".csv":
+            return [{k.strip(): (v or "").strip() for k, v in row.items() if k}
+                    for row in csv.DictReader(fh)]
+        if path.suffix.lower() in (".jsonl", ".ndjson"):
+            return [json.loads(line) for line in fh if line.strip()]
+        return json.load(fh)
+
+
+def write_matrix_csv(path, result):
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["location_id", "name", "consistency_score", "citations_checked", *result["sources"]])
+        for row in result["matrix"]:
+            writer.writerow([row["location_id"], row["name"], row["consistency_score"], row["citations_checked"],
+                             *("" if row["scores"][src] is None else row["scores"][src] for src in result["sources"])])
+
+
 # ---------------------------------------------------------------------------
 # GBP completeness analysis
 # ---------------------------------------------------------------------------
@@ -494,6 +760,43 @@ def build_priority_actions(nap_result, gbp_result):
 # CLI
 # ---------------------------------------------------------------------------
 
+def run_locations(args):
+    """--locations mode: load both sides, match, and summarise (full details go to --output)."""
+    if not args.file:
+        return {"error": "Multi-location mode requires --file with the citations (CSV, JSON or JSONL)"}
+    data = {}
+    for label, raw in (("--locations", args.locations), ("--file", args.file)):
+        path = Path(raw)
+        if not path.exists():
+            return {"error": f"File not found: {raw}"}
+        try:
+            data[label] = read_records(path)
+        except (OSError, UnicodeDecodeError, csv.Error, json.JSONDecodeError) as exc:
+            return {"error": f"Could not read {label} file: {exc}"}
+        if not isinstance(data[label], list) or not data[label]:
+            return {"error": f"{label} file must contain a non-empty list of records"}
+        if not all(isinstance(record, dict) for record in data[label]):
+            return {"error": f"{label} file must contain one JSON object per record"}
+
+    result = analyze_locations(data["--locations"], data["--file"], workers=args.workers)
+    if args.output:
+        try:
+            if str(args.output).lower().endswith(".csv"):
+                write_matrix_csv(args.output, result)
+            else:
+                Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+        except OSError as exc:
+            return {"error": f"Could not write {args.output}: {exc}"}
+
+    # stdout stays readable for hundreds of locations; --output has the rest
+    hidden = {"details", "matrix"} if args.output else {"details"}
+    summary = {k: v for k, v in result.items() if k not in hidden}
+    summary["unmatched_citations"] = result["unmatched_citations"][:50]
+    if args.output:
+        summary["output"] = args.output
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Local SEO scoring tool for NAP consistency and GBP completeness"
@@ -503,7 +806,15 @@ def main():
     parser.add_argument("--citations", default=None,
                         help='JSON array of citation objects [{source, name, address, phone, website}]')
     parser.add_argument("--file", default=None,
-                        help="Path to JSON file with citations array")
+                        help="Path to citations file: JSON array, JSONL or CSV (source,name,address,phone,website)")
+    parser.add_argument("--locations", default=None,
+                        help="Multi-location mode: CSV/JSON/JSONL of canonical locations "
+                             "(location_id,name,address,phone,website[,postcode]) matched against --file citations; "
+                             "cannot be combined with --nap or --gbp")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes for multi-location matching (default: CPU count)")
+    parser.add_argument("--output", default=None,
+                        help="Multi-location mode: write full per-location details (.json) or the matrix (.csv)")
     parser.add_argument("--gbp", default=None,
                         help="JSON object with GBP profile fields for completeness check")
     parser.add_argument("--industry", default=None,
@@ -511,8 +822,18 @@ def main():
     args = parser.parse_args()
 
     # --- Validate at least one mode ---
-    if not args.nap and not args.gbp:
-        json.dump({"error": "Provide --nap (with --citations or --file) and/or --gbp for analysis"}, sys.stdout, indent=2)
+    if not args.nap and not args.gbp and not args.locations:
+        json.dump({"error": "Provide --nap (with --citations or --file), --locations (with --file) and/or --gbp for analysis"}, sys.stdout, indent=2)
+        print()
+        sys.exit(0)
+
+    if args.locations and (args.nap or args.gbp):
+        json.dump({"error": "--locations cannot be combined with --nap or --gbp; run those checks separately"}, sys.stdout, indent=2)
+        print()
+        sys.exit(0)
+
+    if args.locations:
+        json.dump(run_locations(args), sys.stdout, indent=2)
         print()
         sys.exit(0)
 
@@ -543,7 +864,7 @@ def main():
                 print()
                 sys.exit(0)
             try:
-                file_data = json.loads(path.read_text(encoding="utf-8"))
+                file_data = read_records(path)
                 if isinstance(file_data, list):
                     citations.extend(file_data)
                 else:
@@ -559,6 +880,11 @@ def main():
                 print()
                 sys.exit(0)
 
+        if not isinstance(canonical, dict) or not all(isinstance(c, dict) for c in citations):
+            json.dump({"error": "--nap and each citation must be JSON objects"}, sys.stdout, indent=2)
+            print()
+            sys.exit(0)
+
         if not citations:
             json.dump({"error": "NAP analysis requires --citations or --file with citation data"}, sys.stdout, indent=2)
             print()
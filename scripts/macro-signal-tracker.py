@@ -29,6 +29,8 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from brand_store import load_json, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 VALID_CATEGORIES = ["economic", "cultural", "industry", "platform", "regulatory"]
@@ -38,19 +40,11 @@ SEVERITY_WEIGHTS = {"low": 1, "medium": 2, "high": 3}
 
 
 def _load_json(path, default=None):
-    if default is None:
-        default = []
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, [] if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _signals_dir(slug):
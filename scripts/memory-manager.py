@@ -26,9 +26,8 @@ import json
 import os
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, locked, save_json
 
 VALID_CONTENT_TYPES = [
     "guideline", "campaign-learning", "competitive-intel",
@@ -47,29 +46,14 @@ MEMORY_ENV_VARS = {
 }
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_json(path, default=None):
     """Safely load a JSON file, returning default on missing/corrupt."""
-    if default is None:
-        default = []
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, [] if default is None else default)
 
 
 def _save_json(path, data):
     """Atomically write JSON to a file."""
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def prepare_store(slug, data):
@@ -171,16 +155,18 @@ def log_stored(slug, data):
         payload = {"content_hash": content_hash}
 
     # Update master index
-    index = _load_json(memory_dir / "_index.json", [])
-    index.append({
-        "content_hash": content_hash,
-        "vector_db": vector_db,
-        "storage_id": storage_id,
-        "content_type": payload.get("content_type", "unknown"),
-        "tags": payload.get("tags", []),
-        "stored_at": datetime.now().isoformat(),
-    })
-    _save_json(memory_dir / "_index.json", index)
+    index_path = memory_dir / "_index.json"
+    with locked(index_path):
+        index = _load_json(index_path, [])
+        index.append({
+            "content_hash": content_hash,
+            "vector_db": vector_db,
+            "storage_id": storage_id,
+            "content_type": payload.get("content_type", "unknown"),
+            "tags": payload.get("tags", []),
+            "stored_at": datetime.now().isoformat(),
+        })
+        _save_json(index_path, index)
 
     return {"status": "logged", "content_hash": content_hash, "vector_db": vector_db}
 
@@ -29,6 +29,8 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+from brand_store import load_json, locked, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 
 MOVE_TYPES = ["price-cut", "feature-launch", "rebrand",
@@ -40,19 +42,11 @@ COUNTER_STRATEGIES = ["direct", "reframe", "category", "social-proof", "zeitgeis
 # ── Helpers ─────────────────────────────────────────────────────────────────
 
 def _load_json(path, default=None):
-    if default is None:
-        default = {}
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, {} if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _narrative_dir(slug):
@@ -359,17 +353,19 @@ def track_narrative(slug, data_str):
         return {"error": "Invalid JSON in --data"}
 
     ndir = _narrative_dir(slug)
-    snapshots = _load_json(ndir / "snapshots.json", [])
-    if not isinstance(snapshots, list):
-        snapshots = []
+    snapshots_path = ndir / "snapshots.json"
 
     snapshot = {
         "snapshot_id": f"snap-{datetime.now().strftime('%Y%m%d-%H%M%S')}",
         "competitors": data.get("competitors", []),
         "recorded_at": datetime.now().isoformat(),
     }
-    snapshots.append(snapshot)
-    _save_json(ndir / "snapshots.json", snapshots)
+    with locked(snapshots_path):
+        snapshots = _load_json(snapshots_path, [])
+        if not isinstance(snapshots, list):
+            snapshots = []
+        snapshots.append(snapshot)
+        _save_json(snapshots_path, snapshots)
 
     return {"status": "snapshot_saved", "snapshot_id": snapshot["snapshot_id"],
             "competitors_recorded": len(snapshot["competitors"]),
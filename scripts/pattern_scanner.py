@@ -0,0 +1,310 @@
+"""
+pattern_scanner.py
+==================
+Shared precompiled multi-pattern scanner for hallucination-detector.py,
+claim-verifier.py and guidelines-manager.py.
+
+Both scripts match marketing copy against lists of regex patterns. The
+original checks re-ran every pattern (as an uncompiled string) on every
+sentence and re-tested the citation/hedging context for every match. This
+module compiles each pattern list once and scans a text once per pattern
+family:
+
+- PatternScanner(families).scan(text): every match of every pattern, merged
+  into text order. Each pattern keeps re.finditer semantics (its own matches
+  never overlap) while matches of different patterns may overlap, exactly
+  as if each pattern had been run on its own.
+- resolve_overlaps(hits): keep the highest-priority non-overlapping matches
+  with a sorted interval sweep (bisect) instead of a pairwise span check.
+- compile_any(patterns): one regex that matches wherever any pattern does,
+  for "is there a citation / hedge / CTA nearby" checks.
+- sentence_spans(text): (start, end) offsets of the detector's sentences.
+- KeywordScanner(keywords).scan(text): Aho-Corasick automaton over literal
+  keywords (case-insensitive, optionally whole-word only), so a draft is
+  checked against any number of terms in one pass over the text. Used by
+  guidelines-manager.py for banned terms and restricted claims.
+
+Each pattern runs as its own compiled finditer rather than as one big
+alternation: CPython's re backtracks through every alternative at every
+position, and with a named group per pattern (needed to tell which one
+matched) the combined regex measured 2-3x slower than the separate scans.
+
+Dependencies: stdlib only (re, bisect, heapq, collections, random, time,
+              json, argparse, importlib, pathlib)
+
+Benchmark (times the scanner-based checks against the original per-sentence
+loops on synthetic copy and confirms identical output):
+    python pattern_scanner.py --benchmark 10000
+"""
+
+import argparse
+import bisect
+import heapq
+import importlib.util
+import json
+import random
+import re
+import sys
+import time
+from collections import deque, namedtuple
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Same boundary the detector has always used: sentence-ending punctuation,
+# whitespace, then an uppercase letter.
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+(?=[A-Z])")
+
+Hit = namedtuple("Hit", "start end family index label match")
+KeywordHit = namedtuple("KeywordHit", "start end keyword payload")
+
+
+def compile_any(patterns, flags=0):
+    """Compile one regex that searches for any of patterns."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class PatternScanner:
+    """Precompiled scanner over one or more named pattern families.
+
+    families: list of (family, patterns, flags); patterns are regex strings
+    or (regex, label) tuples. Hit.index is the pattern's position within its
+    family and Hit.match is the pattern's own match object (so group(1)
+    etc. work as they would with re.finditer).
+    """
+
+    def __init__(self, families):
+        self.entries = []
+        for family, patterns, flags in families:
+            for index, item in enumerate(patterns):
+                pattern, label = (item, None) if isinstance(item, str) else item
+                self.entries.append((family, index, label, re.compile(pattern, flags)))
+
+    def scan(self, text):
+        """Return every Hit in text ordered by start, then by pattern order."""
+        streams = [
+            [(m.start(), order, Hit(m.start(), m.end(), family, index, label, m))
+             for m in regex.finditer(text) if m.end() > m.start()]
+            for order, (family, index, label, regex) in enumerate(self.entries)
+        ]
+        return [hit for _, _, hit in heapq.merge(*streams)]
+
+
+def resolve_overlaps(hits, priority=lambda hit: hit.index):
+    """Keep hits that do not overlap any higher-priority kept hit.
+
+    Hits are considered by (priority, start); ties in priority go to the
+    earlier hit. Returns the kept hits ordered by start.
+    """
+    starts = []
+    ends = []
+    kept = []
+    for hit in sorted(hits, key=lambda h: (priority(h), h.start)):
+        i = bisect.bisect_left(starts, hit.start)
+        if i > 0 and ends[i - 1] > hit.start:
+            continue
+        if i < len(starts) and starts[i] < hit.end:
+            continue
+        starts.insert(i, hit.start)
+        ends.insert(i, hit.end)
+        kept.insert(i, hit)
+    return kept
+
+
+def sentence_spans(text):
+    """(start, end) of each non-empty sentence, using the detector's split rule.
+
+    Offsets index into text itself; text[start:end] equals the corresponding
+    entry of the detector's sentence list.
+    """
+    lead = len(text) - len(text.lstrip())
+    body_end = len(text.rstrip())
+    spans = []
+    cursor = lead
+    for boundary in SENTENCE_BOUNDARY.finditer(text, lead, body_end):
+        spans.append((cursor, boundary.start()))
+        cursor = boundary.end()
+    spans.append((cursor, body_end))
+
+    out = []
+    for start, end in spans:
+        piece = text[start:end]
+        stripped = piece.strip()
+        if stripped:
+            start += len(piece) - len(piece.lstrip())
+            out.append((start, start + len(stripped)))
+    return out
+
+
+def _fold(text):
+    """Lowercase text without changing its length (so offsets stay valid)."""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(c if len(c.lower()) != 1 else c.lower() for c in text)
+
+
+class KeywordScanner:
+    """Aho-Corasick automaton over literal keywords.
+
+    keywords: iterable of (keyword, payload). Matching is case-insensitive;
+    with whole_word a match must not continue an alphanumeric run on either
+    side (so "free" does not match inside "freedom", while "#1" still matches
+    at "#1 choice"). Overlapping and nested matches are all reported.
+    """
+
+    def __init__(self, keywords):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        self.size = 0
+        for keyword, payload in keywords:
+            keyword = _fold(keyword.strip())
+            if not keyword:
+                continue
+            node = 0
+            for ch in keyword:
+                nxt = self.goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[node][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                node = nxt
+            self.out[node].append((len(keyword), keyword, payload))
+            self.size += 1
+
+        # Breadth-first failure links; each node inherits its fallback's outputs
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self.goto[node].items():
+                queue.append(nxt)
+                fallback = self.fail[node]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def scan(self, text, whole_word=True):
+        """Return every KeywordHit in text ordered by start, then by end."""
+        goto, fail, out = self.goto, self.fail, self.out
+        hits = []
+        node = 0
+        for i, ch in enumerate(_fold(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                end = i + 1
+                for length, keyword, payload in out[node]:
+                    start = end - length
+                    if whole_word and (
+                        (start > 0 and text[start].isalnum() and text[start - 1].isalnum())
+                        or (end < len(text) and text[end - 1].isalnum() and text[end].isalnum())
+                    ):
+                        continue
+                    hits.append(KeywordHit(start, end, keyword, payload))
+        hits.sort(key=lambda h: (h.start, h.end))
+        return hits
+
+
+def sentence_of(spans, offset):
+    """Index of the sentence span containing offset (or None)."""
+    i = bisect.bisect_right(spans, (offset, float("inf"))) - 1
+    if i >= 0 and spans[i][0] <= offset < spans[i][1]:
+        return i
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+_BENCH_WORDS = (
+    "the our product platform team will increase revenue by conversions growth "
+    "customers brand market data study report can may helps leading best first "
+    "only guaranteed proven to award-winning trusted by companies users according "
+    "to Gartner in 2024 source: over nearly up to million billion ARR funding"
+).split()
+_BENCH_FRAGMENTS = [
+    "47%", "$1.2 million", "3x", "5 out of 10", "2.5 billion", "over 5,000",
+    "a Harvard study", "the recent study", "Dr. Jane Smith found",
+    '"Acme Holdings Inc."', "https://example.com/x", "[link]", "500+ customers",
+    "ISO 27001 certified", "voted the best", "grew by 40%",
+    "35% increase in signups this year", "# Heading", "Sign up today", "3x faster",
+]
+
+
+def _synthetic_copy(words, seed=42):
+    rng = random.Random(seed)
+    sentences = []
+    count = 0
+    while count < words:
+        sentence = [rng.choice(_BENCH_WORDS) for _ in range(rng.randint(6, 18))]
+        for _ in range(rng.randint(0, 2)):
+            sentence.insert(rng.randint(0, len(sentence)), rng.choice(_BENCH_FRAGMENTS))
+        line = " ".join(sentence)
+        sentences.append(line[0].upper() + line[1:] + rng.choice(".!?."))
+        count += len(sentence)
+    return " ".join(sentences)
+
+
+def _load_script(filename):
+    module_name = "_dm_" + Path(filename).stem.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _timed(fn, *args, repeat=3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def run_benchmark(words, seed=42):
+    """Compare scanner-based checks with the original per-pattern loops."""
+    text = _synthetic_copy(words, seed)
+    detector = _load_script("hallucination-detector.py")
+    verifier = _load_script("claim-verifier.py")
+
+    result = {"words": len(text.split()), "characters": len(text)}
+    for name, fast, slow in (
+        ("hallucination_detect", detector.action_detect, detector.detect_bruteforce),
+        ("claim_extraction", verifier.extract_claims, verifier.extract_claims_bruteforce),
+    ):
+        fast_out, fast_s = _timed(fast, text)
+        slow_out, slow_s = _timed(slow, text)
+        result[name] = {
+            "scanner_seconds": round(fast_s, 4),
+            "bruteforce_seconds": round(slow_s, 4),
+            "speedup": round(slow_s / fast_s, 1) if fast_s else None,
+            "identical_output": fast_out == slow_out,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared multi-pattern scanner (benchmark entry point)")
+    parser.add_argument("--benchmark", type=int, metavar="WORDS", required=True,
+                        help="Benchmark detector and claim extraction on WORDS words of synthetic copy")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the synthetic copy")
+    args = parser.parse_args()
+    json.dump(run_benchmark(args.benchmark, args.seed), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,9 +26,8 @@ import argparse
 import json
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, save_json
 
 VALID_REPORT_TYPES = [
     "executive-summary", "campaign-report", "channel-report",
@@ -47,28 +46,12 @@ DEFAULT_THEME = {
 }
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_json(path, default=None):
-    if default is None:
-        default = []
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, [] if default is None else default)
 
 
 def _save_json(path, data):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _build_markdown(report_type, title, data, theme):
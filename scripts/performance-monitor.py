@@ -8,12 +8,20 @@ Stores timestamped performance snapshots and uses statistical analysis to flag
 metrics that deviate significantly from historical norms.
 
 Storage: ~/.claude-marketing/brands/{slug}/performance/
+    snapshots.jsonl   Append-only log, one compact snapshot per line
+    series.json       Per-metric value arrays for the baseline window with
+                      their mean/stdev/min/max, updated on every append so
+                      baselines and anomaly checks never re-read the log
+
+Older installs stored one snapshot-*.json file per pull. Run --action migrate
+to fold them into the log; writes migrate automatically on first use.
 
 Usage:
     python performance-monitor.py --brand acme --action pull-metrics --data '{"sessions": 1234, "conversions": 56, "revenue": 7890, "ctr": 3.2}'
     python performance-monitor.py --brand acme --action save-snapshot --data '{"sessions": 1234, "conversions": 56, "revenue": 7890}'
     python performance-monitor.py --brand acme --action detect-anomalies --data '{"sessions": 500, "conversions": 2, "revenue": 100}'
     python performance-monitor.py --brand acme --action get-baseline
+    python performance-monitor.py --brand acme --action migrate
 """
 
 import argparse
@@ -21,52 +29,173 @@ import json
 import statistics
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, locked, read_json, save_json, write_text
 
 MAX_SNAPSHOTS = 90
 BASELINE_WINDOW = 30
 ANOMALY_THRESHOLD = 2.0  # standard deviations
 
-
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
+LOG_FILE = "snapshots.jsonl"
+SERIES_FILE = "series.json"
+SERIES_VERSION = 1
+NON_NUMERIC = "n/a"  # window slot for a reported but non-numeric value
 
 
-def _load_snapshots(perf_dir):
-    """Load all performance snapshot files, sorted oldest to newest."""
+def _load_legacy_snapshots(perf_dir):
+    """Load per-file snapshot-*.json snapshots, sorted oldest to newest."""
     snapshots = []
     if not perf_dir.exists():
         return snapshots
     for fp in sorted(perf_dir.glob("snapshot-*.json")):
         try:
-            snapshot = json.loads(fp.read_text())
+            snapshot = read_json(fp)
             snapshots.append(snapshot)
         except json.JSONDecodeError:
             continue
     return snapshots
 
 
-def _prune_snapshots(perf_dir):
-    """Remove oldest snapshots if count exceeds MAX_SNAPSHOTS."""
-    files = sorted(perf_dir.glob("snapshot-*.json"))
-    if len(files) > MAX_SNAPSHOTS:
-        for fp in files[: len(files) - MAX_SNAPSHOTS]:
-            fp.unlink()
+def _read_log(perf_dir):
+    """Read the snapshot log, skipping torn or corrupt lines."""
+    snapshots = []
+    log_path = perf_dir / LOG_FILE
+    if not log_path.exists():
+        return snapshots
+    with open(log_path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                snapshots.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return snapshots
+
+
+# ---------------------------------------------------------------------------
+# Rolling series
+# ---------------------------------------------------------------------------
+
+def _empty_series():
+    return {"version": SERIES_VERSION, "snapshots": 0, "log_lines": 0,
+            "window_size": 0, "metrics": {}}
+
+
+def _summarize(values):
+    """Window statistics for one metric (values may contain gaps)."""
+    if all(v is None for v in values):
+        return None
+    present = [v for v in values if v is not None and v != NON_NUMERIC]
+    if not present:
+        return {"n": 0}
+    return {
+        "n": len(present),
+        "mean": statistics.mean(present),
+        "std_dev": _safe_stdev(present),
+        "min": min(present),
+        "max": max(present),
+    }
+
+
+def _series_append(series, metrics):
+    """Slide the baseline window forward by one snapshot.
+
+    Each metric keeps one slot per snapshot in the window (None when the
+    snapshot did not report it), so a metric's stats always cover the same
+    last BASELINE_WINDOW snapshots as the original per-file scan did.
+    """
+    size = min(series["window_size"] + 1, BASELINE_WINDOW)
+    slots = {k: v if isinstance(v, (int, float)) else NON_NUMERIC for k, v in metrics.items()}
+
+    for key in set(series["metrics"]) | set(slots):
+        entry = series["metrics"].get(key)
+        values = entry["values"] if entry else [None] * series["window_size"]
+        values = (values + [slots.get(key)])[-size:]
+        stats = _summarize(values)
+        if stats is None:
+            series["metrics"].pop(key, None)
+            continue
+        series["metrics"][key] = {"values": values, **stats}
+
+    series["window_size"] = size
+    series["snapshots"] += 1
+    return series
+
+
+def _build_series(snapshots):
+    series = _empty_series()
+    for snap in snapshots[-BASELINE_WINDOW:]:
+        _series_append(series, snap.get("metrics", {}))
+    series["snapshots"] = len(snapshots)
+    return series
+
+
+def _load_series(perf_dir):
+    """Return the rolling series, building it in memory from legacy files if needed."""
+    series_path = perf_dir / SERIES_FILE
+    if series_path.exists():
+        try:
+            series = read_json(series_path)
+            if series.get("version") == SERIES_VERSION:
+                return series
+        except json.JSONDecodeError:
+            pass
+        return _build_series(_read_log(perf_dir))
+    return _build_series(_load_legacy_snapshots(perf_dir))
+
+
+def _migrate(perf_dir):
+    """Fold legacy snapshot files and any existing log into a fresh store."""
+    legacy = _load_legacy_snapshots(perf_dir)
+    merged = {}
+    for snap in legacy + _read_log(perf_dir):
+        key = (snap.get("recorded_at", ""), snap.get("snapshot_id", ""))
+        merged[key] = snap
+    snapshots = [merged[k] for k in sorted(merged)][-MAX_SNAPSHOTS:]
 
+    perf_dir.mkdir(exist_ok=True)
+    write_text(perf_dir / LOG_FILE,
+               "".join(json.dumps(s, separators=(",", ":")) + "\n" for s in snapshots))
+    series = _build_series(snapshots)
+    series["log_lines"] = len(snapshots)
+    save_json(perf_dir / SERIES_FILE, series, compact=True)
+    return series, len(legacy)
+
+
+def _append_snapshot(perf_dir, snapshot):
+    """Append one snapshot to the log and advance the rolling series."""
+    series_path = perf_dir / SERIES_FILE
+    with locked(series_path):
+        return _append_snapshot_locked(perf_dir, snapshot)
+
+
+def _append_snapshot_locked(perf_dir, snapshot):
+    series_path = perf_dir / SERIES_FILE
+    if series_path.exists():
+        series = _load_series(perf_dir)
+    elif any(perf_dir.glob("snapshot-*.json")):
+        series, _ = _migrate(perf_dir)
+    else:
+        series = _empty_series()
+
+    log_path = perf_dir / LOG_FILE
+    with open(log_path, "a", encoding="utf-8") as fh:
+        fh.write(json.dumps(snapshot, separators=(",", ":")) + "\n")
+    series["log_lines"] = series.get("log_lines", 0) + 1
+    _series_append(series, snapshot["metrics"])
+
+    # Retention: compact the log once it holds twice MAX_SNAPSHOTS lines
+    if series["log_lines"] > 2 * MAX_SNAPSHOTS:
+        kept = _read_log(perf_dir)[-MAX_SNAPSHOTS:]
+        write_text(log_path,
+                   "".join(json.dumps(s, separators=(",", ":")) + "\n" for s in kept))
+        series["log_lines"] = len(kept)
 
-def _extract_metric_keys(snapshots):
-    """Collect all unique metric keys across snapshots."""
-    keys = set()
-    for snap in snapshots:
-        metrics = snap.get("metrics", {})
-        keys.update(metrics.keys())
-    return sorted(keys)
+    save_json(series_path, series, compact=True)
+    return series
+
+
+def _retained(series):
+    return min(series["snapshots"], MAX_SNAPSHOTS)
 
 
 def _safe_stdev(values):
@@ -110,15 +239,13 @@ def pull_metrics(slug, data):
         "metrics": normalized,
     }
 
-    filepath = perf_dir / f"snapshot-{timestamp}.json"
-    filepath.write_text(json.dumps(snapshot, indent=2))
-    _prune_snapshots(perf_dir)
+    _append_snapshot(perf_dir, snapshot)
 
     return {
         "status": "stored",
         "snapshot_id": snapshot["snapshot_id"],
         "metrics": normalized,
-        "path": str(filepath),
+        "path": str(perf_dir / LOG_FILE),
     }
 
 
@@ -141,18 +268,13 @@ def save_snapshot(slug, data):
         "metrics": data,
     }
 
-    filepath = perf_dir / f"snapshot-{timestamp}.json"
-    filepath.write_text(json.dumps(snapshot, indent=2))
-    _prune_snapshots(perf_dir)
-
-    # Count remaining
-    remaining = len(list(perf_dir.glob("snapshot-*.json")))
+    series = _append_snapshot(perf_dir, snapshot)
 
     return {
         "status": "saved",
         "snapshot_id": snapshot["snapshot_id"],
-        "total_snapshots": remaining,
-        "path": str(filepath),
+        "total_snapshots": _retained(series),
+        "path": str(perf_dir / LOG_FILE),
     }
 
 
@@ -165,16 +287,13 @@ def detect_anomalies(slug, data):
     if not data or not isinstance(data, dict):
         return {"error": "Provide current metrics in --data."}
 
-    perf_dir = brand_dir / "performance"
-    snapshots = _load_snapshots(perf_dir)
+    series = _load_series(brand_dir / "performance")
+    window = series["window_size"]
 
-    # Use last BASELINE_WINDOW snapshots
-    recent = snapshots[-BASELINE_WINDOW:]
-
-    if len(recent) < 3:
+    if window < 3:
         return {
             "status": "insufficient_data",
-            "snapshots_available": len(recent),
+            "snapshots_available": window,
             "minimum_required": 3,
             "note": "Need at least 3 historical snapshots to detect anomalies.",
         }
@@ -187,18 +306,12 @@ def detect_anomalies(slug, data):
         if not isinstance(current_value, (int, float)):
             continue
 
-        # Collect historical values for this metric
-        historical = []
-        for snap in recent:
-            val = snap.get("metrics", {}).get(key)
-            if isinstance(val, (int, float)):
-                historical.append(val)
-
-        if len(historical) < 3:
+        stats = series["metrics"].get(key)
+        if not stats or stats["n"] < 3:
             continue
 
-        mean = statistics.mean(historical)
-        stdev = _safe_stdev(historical)
+        mean = stats["mean"]
+        stdev = stats["std_dev"]
 
         if stdev == 0:
             # All historical values identical; flag if current differs at all
@@ -229,7 +342,7 @@ def detect_anomalies(slug, data):
     return {
         "anomalies": anomalies,
         "total_anomalies": len(anomalies),
-        "snapshots_analyzed": len(recent),
+        "snapshots_analyzed": window,
         "threshold": f"{ANOMALY_THRESHOLD} std devs",
     }
 
@@ -240,55 +353,69 @@ def get_baseline(slug):
     if err:
         return {"error": err}
 
-    perf_dir = brand_dir / "performance"
-    snapshots = _load_snapshots(perf_dir)
-
-    # Use last BASELINE_WINDOW snapshots
-    recent = snapshots[-BASELINE_WINDOW:]
+    series = _load_series(brand_dir / "performance")
+    window = series["window_size"]
 
-    if len(recent) < 3:
+    if window < 3:
         return {
             "status": "insufficient_data",
-            "snapshots_available": len(recent),
+            "snapshots_available": window,
             "minimum_required": 3,
             "note": "Need at least 3 snapshots to calculate a meaningful baseline.",
         }
 
-    metric_keys = _extract_metric_keys(recent)
     baselines = {}
 
-    for key in metric_keys:
-        values = []
-        for snap in recent:
-            val = snap.get("metrics", {}).get(key)
-            if isinstance(val, (int, float)):
-                values.append(val)
-
-        if len(values) < 2:
-            baselines[key] = {"status": "insufficient_data", "data_points": len(values)}
+    for key in sorted(series["metrics"]):
+        stats = series["metrics"][key]
+        if stats["n"] < 2:
+            baselines[key] = {"status": "insufficient_data", "data_points": stats["n"]}
             continue
 
         baselines[key] = {
-            "mean": round(statistics.mean(values), 2),
-            "std_dev": round(_safe_stdev(values), 2),
-            "min": round(min(values), 2),
-            "max": round(max(values), 2),
-            "data_points": len(values),
+            "mean": round(stats["mean"], 2),
+            "std_dev": round(stats["std_dev"], 2),
+            "min": round(stats["min"], 2),
+            "max": round(stats["max"], 2),
+            "data_points": stats["n"],
         }
 
     return {
         "baselines": baselines,
-        "snapshots_used": len(recent),
+        "snapshots_used": window,
         "window": f"last {BASELINE_WINDOW} snapshots",
     }
 
 
+def migrate(slug):
+    """Convert per-file snapshots into the append-only log and rolling series."""
+    brand_dir, err = get_brand_dir(slug)
+    if err:
+        return {"error": err}
+
+    perf_dir = brand_dir / "performance"
+    if not perf_dir.exists():
+        return {"status": "nothing_to_migrate", "note": "No performance data stored yet."}
+
+    with locked(perf_dir / SERIES_FILE):
+        series, legacy_count = _migrate(perf_dir)
+    return {
+        "status": "migrated",
+        "legacy_files_read": legacy_count,
+        "snapshots_in_log": series["log_lines"],
+        "metrics_tracked": len(series["metrics"]),
+        "log": str(perf_dir / LOG_FILE),
+        "series": str(perf_dir / SERIES_FILE),
+        "note": "Legacy snapshot-*.json files were left in place and are no longer read; delete them once verified.",
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(description="Performance monitoring for Digital Marketing Pro")
     parser.add_argument("--brand", required=True, help="Brand slug")
     parser.add_argument("--action", required=True,
                         choices=["pull-metrics", "save-snapshot", "detect-anomalies",
-                                 "get-baseline"],
+                                 "get-baseline", "migrate"],
                         help="Action to perform")
     parser.add_argument("--data", help="JSON data (metrics object)")
     args = parser.parse_args()
@@ -329,6 +456,9 @@ def main():
     elif args.action == "get-baseline":
         result = get_baseline(args.brand)
 
+    elif args.action == "migrate":
+        result = migrate(args.brand)
+
     json.dump(result, sys.stdout, indent=2)
     print()
 
@@ -32,6 +32,8 @@ from datetime import datetime
 from pathlib import Path
 from statistics import mean
 
+from brand_store import read_json, save_json
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 ACTIVE_BRAND_FILE = BRANDS_DIR / "_active-brand.json"
 
@@ -47,7 +49,7 @@ def resolve_brand(slug):
 
     if ACTIVE_BRAND_FILE.exists():
         try:
-            active = json.loads(ACTIVE_BRAND_FILE.read_text(encoding="utf-8"))
+            active = read_json(ACTIVE_BRAND_FILE)
             return active.get("active_slug")
         except (json.JSONDecodeError, OSError):
             pass
@@ -76,7 +78,7 @@ def load_test(tests_dir, test_name):
     if not filepath.exists():
         return None, f"Test '{test_name}' not found."
     try:
-        return json.loads(filepath.read_text(encoding="utf-8")), None
+        return read_json(filepath), None
     except json.JSONDecodeError:
         return None, f"Test file corrupted: {test_name}.json"
 
@@ -84,7 +86,7 @@ def load_test(tests_dir, test_name):
 def save_test(tests_dir, test_name, data):
     """Save a test file."""
     filepath = tests_dir / f"{test_name}.json"
-    filepath.write_text(json.dumps(data, indent=2))
+    save_json(filepath, data)
 
 
 # ---------------------------------------------------------------------------
@@ -296,7 +298,7 @@ def action_list_tests(slug, limit):
     tests = []
     for fp in sorted(tests_dir.glob("*.json")):
         try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
+            data = read_json(fp)
         except (json.JSONDecodeError, OSError):
             continue
 
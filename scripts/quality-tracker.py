@@ -8,19 +8,35 @@ Logs eval scores over time, computes weekly trends, detects quality
 regression across scoring dimensions, and surfaces best/worst content.
 
 Storage:
-    ~/.claude-marketing/brands/{slug}/quality/evals/eval-{timestamp}.json
+    ~/.claude-marketing/brands/{slug}/quality/ledger/{YYYY-MM-DD}.jsonl
+        Eval ledger, one compact record per line, one file per day
+    ~/.claude-marketing/brands/{slug}/quality/_daily.json
+        Per-day buckets (count, per-dimension sums, composite min/max),
+        overall and per content type, updated on every log
     ~/.claude-marketing/brands/{slug}/quality/_summary.json
 
+Trend, regression and summary queries read only the day buckets in their
+window. The ledger is opened only for the day holding the window cut-off,
+the day that splits a window in half, the newest days (last 5 evals) and
+best/worst candidates, whose days are pruned by their composite min/max.
+
+Older installs kept one evals/eval-*.json per eval plus evals/batch-*.jsonl;
+they are folded into the ledger automatically the first time a brand is
+read, or explicitly with --action rebuild-index.
+
 Actions:
     log-eval          Log a new content evaluation
+    log-batch         Log many evaluations in one append (JSONL or JSON array)
     get-trends        Weekly trend analysis across scoring dimensions
     get-summary       Overall quality stats and averages
     check-regression  Detect drops in quality vs. rolling baseline
     get-best          Top N evals by composite score
     get-worst         Bottom N evals by composite score
+    rebuild-index     Rebuild the ledger and day buckets from all stored evals
 
 Usage:
     python quality-tracker.py --action log-eval --data '{"content_type":"blog_post","title":"Q1 Recap","scores":{"content_quality":82,"brand_voice":78,"hallucination":95,"readability":75,"composite":82},"grade":"B+"}'
+    python quality-tracker.py --action log-batch --file evals.jsonl
     python quality-tracker.py --action get-trends --days 30
     python quality-tracker.py --action get-trends --content-type blog_post --days 60
     python quality-tracker.py --action get-summary
@@ -31,12 +47,17 @@ Usage:
 """
 
 import argparse
+import heapq
 import json
+import os
+import shutil
 import sys
+import tempfile
 from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from statistics import mean
+
+from brand_store import load_json, locked, read_json, save_json, write_text
 
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 ACTIVE_BRAND_FILE = BRANDS_DIR / "_active-brand.json"
@@ -46,6 +67,10 @@ SCORE_DIMENSIONS = [
     "readability", "composite",
 ]
 
+LEDGER_DIR = "ledger"
+DAILY_FILE = "_daily.json"
+INDEX_VERSION = 1
+
 
 # ---------------------------------------------------------------------------
 # Brand resolution
@@ -58,7 +83,7 @@ def resolve_brand(slug):
 
     if ACTIVE_BRAND_FILE.exists():
         try:
-            active = json.loads(ACTIVE_BRAND_FILE.read_text(encoding="utf-8"))
+            active = read_json(ACTIVE_BRAND_FILE)
             return active.get("active_slug")
         except (json.JSONDecodeError, OSError):
             pass
@@ -85,42 +110,263 @@ def get_quality_dir(slug):
 # Eval file I/O
 # ---------------------------------------------------------------------------
 
-def load_evals(quality_dir, days=None, content_type=None):
-    """Load eval files, optionally filtered by age and content type."""
-    evals_dir = quality_dir / "evals"
-    if not evals_dir.exists():
-        return []
-
-    cutoff = None
-    if days:
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
-
-    evals = []
-    for fp in sorted(evals_dir.glob("eval-*.json")):
+def _iter_eval_records(evals_dir):
+    """Yield every stored eval record: single-eval files and batch logs."""
+    for fp in evals_dir.glob("eval-*.json"):
         try:
-            data = json.loads(fp.read_text(encoding="utf-8"))
+            yield read_json(fp)
         except (json.JSONDecodeError, OSError):
             continue
 
-        # Age filter
-        if cutoff and data.get("timestamp", "") < cutoff:
+    for fp in evals_dir.glob("batch-*.jsonl"):
+        try:
+            lines = fp.read_text(encoding="utf-8").splitlines()
+        except OSError:
             continue
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+# ---------------------------------------------------------------------------
+# Ledger and day buckets
+# ---------------------------------------------------------------------------
+
+def _day_of(record):
+    """Bucket key for a record: the date part of its ISO timestamp."""
+    ts = record.get("timestamp") or ""
+    return ts[:10] if len(ts) >= 10 else "0000-00-00"
+
+
+def _empty_bucket():
+    return {"count": 0, "sums": {}, "n": {}, "max": None, "min": None}
+
+
+def _add_scores(bucket, scores):
+    """Fold one record's scores into a bucket (in place)."""
+    bucket["count"] += 1
+    for dim in SCORE_DIMENSIONS:
+        if dim in scores:
+            bucket["sums"][dim] = bucket["sums"].get(dim, 0) + scores[dim]
+            bucket["n"][dim] = bucket["n"].get(dim, 0) + 1
+    if "max" in bucket:
+        comp = scores.get("composite", 0)
+        bucket["max"] = comp if bucket["max"] is None else max(bucket["max"], comp)
+        bucket["min"] = comp if bucket["min"] is None else min(bucket["min"], comp)
+
+
+def _merge(total, bucket):
+    """Add a day bucket's counts and sums into a running total."""
+    total["count"] += bucket["count"]
+    for dim, val in bucket["sums"].items():
+        total["sums"][dim] = total["sums"].get(dim, 0) + val
+        total["n"][dim] = total["n"].get(dim, 0) + bucket["n"][dim]
+
+
+def _new_total():
+    return {"count": 0, "sums": {}, "n": {}}
+
+
+def _mean(total_sum, n):
+    """Mean that stays an int for exact integer data, like statistics.mean."""
+    if isinstance(total_sum, int) and total_sum % n == 0:
+        return total_sum // n
+    return total_sum / n
 
-        # Content-type filter
-        if content_type and data.get("content_type") != content_type:
+
+def _averages(total):
+    """Per-dimension means of a total, rounded like the reports expect."""
+    return {
+        dim: (round(_mean(total["sums"][dim], total["n"][dim]), 1) if total["n"].get(dim) else None)
+        for dim in SCORE_DIMENSIONS
+    }
+
+
+def _index_record(index, record):
+    """Fold one record into its day bucket; returns the day key."""
+    day_key = _day_of(record)
+    day = index["days"].setdefault(day_key, {"all": _empty_bucket(), "types": {}})
+    scores = record.get("scores", {})
+    _add_scores(day["all"], scores)
+    ct = record.get("content_type", "unknown")
+    _add_scores(day["types"].setdefault(ct, _empty_bucket()), scores)
+    return day_key
+
+
+def _append_to_ledger(quality_dir, records):
+    """Append records to their day files in the ledger."""
+    ledger = quality_dir / LEDGER_DIR
+    ledger.mkdir(exist_ok=True)
+    by_day = defaultdict(list)
+    for record in records:
+        by_day[_day_of(record)].append(record)
+    for day, day_records in by_day.items():
+        with open(ledger / f"{day}.jsonl", "a", encoding="utf-8") as fh:
+            fh.write("".join(json.dumps(r, separators=(",", ":")) + "\n" for r in day_records))
+
+
+def _read_day(quality_dir, day, content_type=None, since=None):
+    """Records of one ledger day in eval_id order.
+
+    Optionally filtered by content type and to timestamps >= since.
+    """
+    records = []
+    try:
+        with open(quality_dir / LEDGER_DIR / f"{day}.jsonl", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if content_type and record.get("content_type") != content_type:
+                    continue
+                if since and record.get("timestamp", "") < since:
+                    continue
+                records.append(record)
+    except OSError:
+        return []
+    records.sort(key=lambda e: e.get("eval_id", ""))
+    return records
+
+
+def _rebuild_index(quality_dir):
+    """Fold legacy eval files and the existing ledger into a fresh ledger + buckets."""
+    evals_dir = quality_dir / "evals"
+    ledger = quality_dir / LEDGER_DIR
+    records = {}
+    legacy = 0
+    if evals_dir.exists():
+        for record in _iter_eval_records(evals_dir):
+            records[record.get("eval_id", f"legacy-{legacy}")] = record
+            legacy += 1
+    if ledger.exists():
+        for fp in ledger.glob("*.jsonl"):
+            for record in _read_day(quality_dir, fp.stem):
+                records[record.get("eval_id", "")] = record
+
+    index = {"version": INDEX_VERSION, "days": {}}
+    by_day = defaultdict(list)
+    for eval_id in sorted(records):
+        record = records[eval_id]
+        by_day[_index_record(index, record)].append(record)
+
+    # Build the new ledger beside the old one and swap it in, so a failure
+    # part-way through never leaves the evals half deleted.
+    for stale in quality_dir.glob(f".{LEDGER_DIR}-*"):
+        shutil.rmtree(stale, ignore_errors=True)  # left by an interrupted rebuild
+    staging = Path(tempfile.mkdtemp(prefix=f".{LEDGER_DIR}-", dir=quality_dir))
+    retired = staging.with_name(staging.name + "-old")
+    try:
+        for day, day_records in by_day.items():
+            write_text(staging / f"{day}.jsonl",
+                       "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in day_records))
+        if ledger.exists():
+            os.replace(ledger, retired)
+        try:
+            os.replace(staging, ledger)
+        except OSError:
+            if retired.exists():
+                os.replace(retired, ledger)
+            raise
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    save_json(quality_dir / DAILY_FILE, index, compact=True)
+    shutil.rmtree(retired, ignore_errors=True)
+    return index, legacy, len(records)
+
+
+def load_index(quality_dir):
+    """Load the day buckets, migrating legacy eval files on first use."""
+    index = load_json(quality_dir / DAILY_FILE)
+    if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+        return index
+    with locked(quality_dir / DAILY_FILE):
+        index = load_json(quality_dir / DAILY_FILE)
+        if isinstance(index, dict) and index.get("version") == INDEX_VERSION:
+            return index
+        return _rebuild_index(quality_dir)[0]
+
+
+def _window(quality_dir, index, days, content_type=None):
+    """[(day, bucket, since)] oldest first for the last `days` days (all if None).
+
+    Whole days come straight from their buckets. The day containing the
+    cut-off is re-bucketed from its ledger file so only evals at or after
+    the cut-off count; `since` is set for that day.
+    """
+    cutoff = (datetime.now() - timedelta(days=days)).isoformat() if days else ""
+    cutoff_day = cutoff[:10]
+    window = []
+    for day in sorted(index["days"]):
+        if day < cutoff_day:
+            continue
+        entry = index["days"][day]
+        bucket = entry["types"].get(content_type) if content_type else entry["all"]
+        if not bucket or not bucket["count"]:
             continue
+        since = None
+        if day == cutoff_day:
+            since = cutoff
+            bucket = _empty_bucket()
+            for record in _read_day(quality_dir, day, content_type, since):
+                _add_scores(bucket, record.get("scores", {}))
+            if not bucket["count"]:
+                continue
+        window.append((day, bucket, since))
+    return window
 
-        evals.append(data)
 
+def load_evals(quality_dir, days=None, content_type=None):
+    """Load full eval records in a window from the ledger, oldest first."""
+    index = load_index(quality_dir)
+    evals = []
+    for day, _, since in _window(quality_dir, index, days, content_type):
+        evals.extend(_read_day(quality_dir, day, content_type, since))
     return evals
 
 
+def _top_records(quality_dir, window, limit, content_type, best):
+    """Best (or worst) `limit` records by composite, reading only days that can qualify.
+
+    A bounded heap of composites tracks the current cut-off; days whose
+    composite max (min for worst) cannot beat it are never opened. Ties keep
+    chronological order, as a stable sort of the whole window would.
+    """
+    sign = 1 if best else -1
+    edge = "max" if best else "min"
+    heap = []  # sign * composite of the current top `limit`
+    candidates = []
+    for day, bucket, since in sorted(window, key=lambda w: sign * w[1][edge], reverse=True):
+        if len(heap) >= limit and sign * bucket[edge] < heap[0]:
+            break
+        for record in _read_day(quality_dir, day, content_type, since):
+            key = sign * record.get("scores", {}).get("composite", 0)
+            if len(heap) < limit:
+                heapq.heappush(heap, key)
+            elif key > heap[0]:
+                heapq.heapreplace(heap, key)
+            elif key < heap[0]:
+                continue
+            candidates.append((day, record))
+
+    cut = heap[0] if len(heap) >= limit else None
+    candidates = [rec for day, rec in sorted(candidates, key=lambda c: (c[0], c[1].get("eval_id", "")))
+                  if cut is None or sign * rec.get("scores", {}).get("composite", 0) >= cut]
+    candidates.sort(key=lambda e: e.get("scores", {}).get("composite", 0), reverse=best)
+    return candidates[:limit]
+
+
 def load_summary(quality_dir):
     """Load the rolling summary file."""
     summary_path = quality_dir / "_summary.json"
     if summary_path.exists():
         try:
-            return json.loads(summary_path.read_text(encoding="utf-8"))
+            return read_json(summary_path)
         except (json.JSONDecodeError, OSError):
             pass
     return {}
@@ -129,50 +375,41 @@ def load_summary(quality_dir):
 def save_summary(quality_dir, summary):
     """Write the rolling summary file."""
     summary_path = quality_dir / "_summary.json"
-    summary_path.write_text(json.dumps(summary, indent=2))
+    save_json(summary_path, summary)
 
 
 # ---------------------------------------------------------------------------
 # Actions
 # ---------------------------------------------------------------------------
 
-def action_log_eval(slug, data):
-    """Persist a new content evaluation and update the running summary."""
-    quality_dir, err = get_quality_dir(slug)
-    if err:
-        return {"error": err}
-
-    # Validate required fields
+def _validate_scores(data):
+    """Return an error string if an eval payload has no usable scores."""
     scores = data.get("scores")
     if not scores or not isinstance(scores, dict):
-        return {"error": "Missing or invalid 'scores' object in --data."}
+        return "Missing or invalid 'scores' object in --data."
     if "composite" not in scores:
-        return {"error": "'scores.composite' is required."}
+        return "'scores.composite' is required."
+    return None
 
-    # Stamp the eval (include milliseconds to avoid collisions)
-    now = datetime.now()
-    timestamp = now.strftime("%Y%m%dT%H%M%S") + f"-{now.microsecond // 1000:03d}"
-    eval_id = f"eval-{timestamp}"
 
-    record = {
+def _build_record(data, eval_id, now):
+    """Normalize an eval payload into the stored record shape."""
+    return {
         "eval_id": eval_id,
         "content_type": data.get("content_type", "unknown"),
         "title": data.get("title", ""),
-        "scores": scores,
+        "scores": data["scores"],
         "grade": data.get("grade", ""),
         "timestamp": data.get("timestamp", now.isoformat()),
     }
 
-    # Save individual eval file
-    evals_dir = quality_dir / "evals"
-    filepath = evals_dir / f"{eval_id}.json"
-    filepath.write_text(json.dumps(record, indent=2))
 
-    # Update running summary
-    summary = load_summary(quality_dir)
+def _update_summary(summary, record, now):
+    """Fold one stored record into the running summary (in place)."""
+    scores = record["scores"]
     count = summary.get("total_evals", 0) + 1
     summary["total_evals"] = count
-    summary["last_eval_id"] = eval_id
+    summary["last_eval_id"] = record["eval_id"]
     summary["last_updated"] = now.isoformat()
 
     # Running averages per dimension
@@ -190,26 +427,105 @@ def action_log_eval(slug, data):
     type_counts[ct] = type_counts.get(ct, 0) + 1
     summary["content_type_counts"] = type_counts
 
-    save_summary(quality_dir, summary)
+    return count
+
+
+def _stamp(now):
+    """Eval id timestamp (include milliseconds to avoid collisions)."""
+    return now.strftime("%Y%m%dT%H%M%S") + f"-{now.microsecond // 1000:03d}"
+
+
+def action_log_eval(slug, data):
+    """Persist a new content evaluation and update the running summary."""
+    quality_dir, err = get_quality_dir(slug)
+    if err:
+        return {"error": err}
+
+    # Validate required fields
+    err = _validate_scores(data)
+    if err:
+        return {"error": err}
+
+    # Stamp the eval
+    now = datetime.now()
+    eval_id = f"eval-{_stamp(now)}"
+    record = _build_record(data, eval_id, now)
+
+    # Append to the ledger and update day buckets + running summary
+    with locked(quality_dir / DAILY_FILE):
+        index = load_index(quality_dir)
+        _append_to_ledger(quality_dir, [record])
+        _index_record(index, record)
+        save_json(quality_dir / DAILY_FILE, index, compact=True)
+
+        summary = load_summary(quality_dir)
+        count = _update_summary(summary, record, now)
+        save_summary(quality_dir, summary)
 
     return {
         "status": "logged",
         "eval_id": eval_id,
         "content_type": record["content_type"],
-        "composite": scores["composite"],
+        "composite": data["scores"]["composite"],
         "grade": record["grade"],
         "total_evals": count,
     }
 
 
+def action_log_batch(slug, items):
+    """Persist many evaluations with one ledger append and one summary write.
+
+    Invalid items are reported by index and skipped.
+    """
+    quality_dir, err = get_quality_dir(slug)
+    if err:
+        return {"error": err}
+
+    now = datetime.now()
+    stamp = _stamp(now)
+    records = []
+    rejected = []
+    for idx, data in enumerate(items):
+        err = _validate_scores(data) if isinstance(data, dict) else "Item is not an object."
+        if err:
+            rejected.append({"index": idx, "error": err})
+            continue
+        records.append(_build_record(data, f"eval-{stamp}-{len(records):05d}", now))
+
+    if not records:
+        return {"error": "No valid evals in batch.", "rejected": rejected}
+
+    with locked(quality_dir / DAILY_FILE):
+        index = load_index(quality_dir)
+        _append_to_ledger(quality_dir, records)
+        for record in records:
+            _index_record(index, record)
+        save_json(quality_dir / DAILY_FILE, index, compact=True)
+
+        summary = load_summary(quality_dir)
+        count = 0
+        for record in records:
+            count = _update_summary(summary, record, now)
+        save_summary(quality_dir, summary)
+
+    return {
+        "status": "logged",
+        "first_eval_id": records[0]["eval_id"],
+        "logged": len(records),
+        "rejected": rejected,
+        "total_evals": count,
+    }
+
+
 def action_get_trends(slug, days, content_type):
     """Compute per-dimension weekly trend buckets."""
     quality_dir, err = get_quality_dir(slug)
     if err:
         return {"error": err}
 
-    evals = load_evals(quality_dir, days=days, content_type=content_type)
-    if not evals:
+    window = _window(quality_dir, load_index(quality_dir), days, content_type)
+    total = sum(bucket["count"] for _, bucket, _ in window)
+    if not total:
         return {
             "period": f"last_{days}_days",
             "total_evals": 0,
@@ -218,39 +534,48 @@ def action_get_trends(slug, days, content_type):
             "note": "No evals found for this period.",
         }
 
-    # Group evals into ISO-week buckets
-    weekly = defaultdict(list)
-    for ev in evals:
+    # Group day buckets into ISO-week buckets
+    weekly = defaultdict(lambda: [0, 0])  # week -> [evals, composite sum]
+    for day, bucket, _ in window:
         try:
-            ts = datetime.fromisoformat(ev["timestamp"])
-        except (ValueError, KeyError):
+            week_label = datetime.fromisoformat(day).strftime("%G-W%V")
+        except ValueError:
             continue
-        week_label = ts.strftime("%G-W%V")
-        weekly[week_label].append(ev)
+        weekly[week_label][0] += bucket["count"]
+        weekly[week_label][1] += bucket["sums"].get("composite", 0)
 
     # Build weekly trend rows
     weekly_trends = []
     for week in sorted(weekly.keys()):
-        bucket = weekly[week]
-        composites = [e["scores"].get("composite", 0) for e in bucket]
+        count, comp_sum = weekly[week]
         weekly_trends.append({
             "week": week,
-            "evals": len(bucket),
-            "composite_avg": round(mean(composites), 1) if composites else 0,
+            "evals": count,
+            "composite_avg": round(_mean(comp_sum, count), 1) if count else 0,
         })
 
-    # Per-dimension current vs. previous half comparison
-    mid = len(evals) // 2
-    first_half = evals[:mid] if mid > 0 else []
-    second_half = evals[mid:] if mid > 0 else evals
+    # Per-dimension current vs. previous half comparison. Whole days go to
+    # one half; only the day straddling the midpoint is read from the ledger.
+    mid = total // 2
+    first_half, second_half = _new_total(), _new_total()
+    seen = 0
+    for day, bucket, since in window:
+        if seen + bucket["count"] <= mid:
+            _merge(first_half, bucket)
+        elif seen >= mid:
+            _merge(second_half, bucket)
+        else:
+            for i, record in enumerate(_read_day(quality_dir, day, content_type, since)):
+                half = first_half if seen + i < mid else second_half
+                _add_scores(half, record.get("scores", {}))
+        seen += bucket["count"]
 
+    prev_avgs = _averages(first_half)
+    curr_avgs = _averages(second_half)
     dimension_trends = {}
     for dim in SCORE_DIMENSIONS:
-        prev_vals = [e["scores"].get(dim) for e in first_half if dim in e.get("scores", {})]
-        curr_vals = [e["scores"].get(dim) for e in second_half if dim in e.get("scores", {})]
-
-        prev_avg = round(mean(prev_vals), 1) if prev_vals else None
-        curr_avg = round(mean(curr_vals), 1) if curr_vals else None
+        prev_avg = prev_avgs[dim]
+        curr_avg = curr_avgs[dim]
 
         if prev_avg is not None and curr_avg is not None:
             diff = round(curr_avg - prev_avg, 1)
@@ -274,7 +599,7 @@ def action_get_trends(slug, days, content_type):
     return {
         "period": f"last_{days}_days",
         "content_type": content_type or "all",
-        "total_evals": len(evals),
+        "total_evals": total,
         "weekly_trends": weekly_trends,
         "dimension_trends": dimension_trends,
     }
@@ -291,16 +616,14 @@ def action_get_summary(slug):
         return {"total_evals": 0, "note": "No evals logged yet."}
 
     # Enrich with best/worst content type by average composite
-    evals = load_evals(quality_dir)
-    type_composites = defaultdict(list)
-    for ev in evals:
-        ct = ev.get("content_type", "unknown")
-        comp = ev.get("scores", {}).get("composite")
-        if comp is not None:
-            type_composites[ct].append(comp)
+    type_totals = defaultdict(_new_total)
+    for entry in load_index(quality_dir)["days"].values():
+        for ct, bucket in entry["types"].items():
+            _merge(type_totals[ct], bucket)
 
     type_averages = {
-        ct: round(mean(vals), 1) for ct, vals in type_composites.items() if vals
+        ct: round(_mean(total["sums"]["composite"], total["n"]["composite"]), 1)
+        for ct, total in type_totals.items() if total["n"].get("composite")
     }
 
     best_type = max(type_averages, key=type_averages.get) if type_averages else None
@@ -319,27 +642,33 @@ def action_check_regression(slug, days):
     if err:
         return {"error": err}
 
-    evals = load_evals(quality_dir, days=days)
-    if len(evals) < 6:
+    window = _window(quality_dir, load_index(quality_dir), days)
+    in_window = sum(bucket["count"] for _, bucket, _ in window)
+    if in_window < 6:
         return {
             "regression_detected": False,
             "alerts": [],
             "baselines": {},
-            "note": f"Need at least 6 evals in the last {days} days for regression detection (found {len(evals)}).",
+            "note": f"Need at least 6 evals in the last {days} days for regression detection (found {in_window}).",
         }
 
     # Compute baseline: mean of all evals in the window
-    baseline = {}
-    for dim in SCORE_DIMENSIONS:
-        vals = [e["scores"].get(dim) for e in evals if dim in e.get("scores", {})]
-        baseline[dim] = round(mean(vals), 1) if vals else None
-
-    # Last 5 evals
-    recent = evals[-5:]
-    recent_avgs = {}
-    for dim in SCORE_DIMENSIONS:
-        vals = [e["scores"].get(dim) for e in recent if dim in e.get("scores", {})]
-        recent_avgs[dim] = round(mean(vals), 1) if vals else None
+    window_total = _new_total()
+    for _, bucket, _ in window:
+        _merge(window_total, bucket)
+    baseline = _averages(window_total)
+
+    # Last 5 evals, reading ledger days newest first
+    recent = []
+    for day, _, since in reversed(window):
+        recent = _read_day(quality_dir, day, since=since) + recent
+        if len(recent) >= 5:
+            break
+    recent = recent[-5:]
+    recent_total = _new_total()
+    for ev in recent:
+        _add_scores(recent_total, ev.get("scores", {}))
+    recent_avgs = _averages(recent_total)
 
     # Detect regression
     alerts = []
@@ -381,7 +710,7 @@ def action_check_regression(slug, days):
         "alert_count": len(alerts),
         "baselines": baseline,
         "recent_averages": recent_avgs,
-        "evals_in_window": len(evals),
+        "evals_in_window": in_window,
         "recent_evals_checked": len(recent),
     }
 
@@ -392,19 +721,17 @@ def action_get_best(slug, limit, content_type, days):
     if err:
         return {"error": err}
 
-    evals = load_evals(quality_dir, days=days, content_type=content_type)
-    if not evals:
+    window = _window(quality_dir, load_index(quality_dir), days, content_type)
+    in_window = sum(bucket["count"] for _, bucket, _ in window)
+    if not in_window:
         return {"evals": [], "total": 0, "note": "No evals found."}
 
-    # Sort descending by composite
-    evals.sort(key=lambda e: e.get("scores", {}).get("composite", 0), reverse=True)
-
-    top = evals[:limit]
+    top = _top_records(quality_dir, window, limit, content_type, best=True)
     return {
         "action": "get-best",
         "content_type": content_type or "all",
         "returned": len(top),
-        "total_in_window": len(evals),
+        "total_in_window": in_window,
         "evals": top,
     }
 
@@ -415,23 +742,38 @@ def action_get_worst(slug, limit, content_type, days):
     if err:
         return {"error": err}
 
-    evals = load_evals(quality_dir, days=days, content_type=content_type)
-    if not evals:
+    window = _window(quality_dir, load_index(quality_dir), days, content_type)
+    in_window = sum(bucket["count"] for _, bucket, _ in window)
+    if not in_window:
         return {"evals": [], "total": 0, "note": "No evals found."}
 
-    # Sort ascending by composite
-    evals.sort(key=lambda e: e.get("scores", {}).get("composite", 0))
-
-    bottom = evals[:limit]
+    bottom = _top_records(quality_dir, window, limit, content_type, best=False)
     return {
         "action": "get-worst",
         "content_type": content_type or "all",
         "returned": len(bottom),
-        "total_in_window": len(evals),
+        "total_in_window": in_window,
         "evals": bottom,
     }
 
 
+def action_rebuild_index(slug):
+    """Rebuild the ledger and day buckets from legacy eval files and the ledger."""
+    quality_dir, err = get_quality_dir(slug)
+    if err:
+        return {"error": err}
+
+    with locked(quality_dir / DAILY_FILE):
+        index, legacy, total = _rebuild_index(quality_dir)
+    return {
+        "status": "rebuilt",
+        "legacy_records_read": legacy,
+        "total_evals": total,
+        "days_indexed": len(index["days"]),
+        "ledger": str(quality_dir / LEDGER_DIR),
+    }
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -442,16 +784,19 @@ def build_parser():
         epilog=(
             "Actions:\n"
             "  log-eval          Log a new content evaluation\n"
+            "  log-batch         Log many evaluations in one append (--file)\n"
             "  get-trends        Weekly trend analysis across scoring dimensions\n"
             "  get-summary       Overall quality stats and averages\n"
             "  check-regression  Detect quality drops vs. rolling baseline\n"
             "  get-best          Top N evals by composite score\n"
             "  get-worst         Bottom N evals by composite score\n"
+            "  rebuild-index     Rebuild the eval ledger and day buckets\n"
             "\n"
             "Examples:\n"
             "  python quality-tracker.py --action log-eval --data "
             "'{\"content_type\":\"blog_post\",\"title\":\"Q1 Recap\","
             "\"scores\":{\"composite\":82},\"grade\":\"B+\"}'\n"
+            "  python quality-tracker.py --action log-batch --file evals.jsonl\n"
             "  python quality-tracker.py --action get-trends --days 60\n"
             "  python quality-tracker.py --action check-regression\n"
             "  python quality-tracker.py --action get-best --limit 10 --content-type email\n"
@@ -460,8 +805,8 @@ def build_parser():
     )
     parser.add_argument(
         "--action", required=True,
-        choices=["log-eval", "get-trends", "get-summary",
-                 "check-regression", "get-best", "get-worst"],
+        choices=["log-eval", "log-batch", "get-trends", "get-summary",
+                 "check-regression", "get-best", "get-worst", "rebuild-index"],
         help="Action to perform.",
     )
     parser.add_argument(
@@ -470,7 +815,11 @@ def build_parser():
     )
     parser.add_argument(
         "--data", default=None,
-        help="JSON eval data (for log-eval).",
+        help="JSON eval data (for log-eval; a JSON array for log-batch).",
+    )
+    parser.add_argument(
+        "--file", default=None,
+        help="JSONL or JSON-array file of eval data (for log-batch).",
     )
     parser.add_argument(
         "--content-type", default=None,
@@ -487,6 +836,29 @@ def build_parser():
     return parser
 
 
+def _load_batch_items(data_arg, file_arg):
+    """Read log-batch items from --data (JSON array) or --file (JSONL/array)."""
+    if file_arg:
+        path = Path(file_arg)
+        if not path.exists():
+            return None, f"File not found: {file_arg}"
+        raw = path.read_text(encoding="utf-8")
+    elif data_arg:
+        raw = data_arg
+    else:
+        return None, "Provide --file or --data with eval items."
+
+    stripped = raw.lstrip()
+    try:
+        if stripped.startswith("["):
+            items = json.loads(stripped)
+        else:
+            items = [json.loads(line) for line in raw.splitlines() if line.strip()]
+    except json.JSONDecodeError as exc:
+        return None, f"Invalid JSON in batch input: {exc}"
+    return items, None
+
+
 def main():
     parser = build_parser()
     args = parser.parse_args()
@@ -512,6 +884,13 @@ def main():
             sys.exit(1)
         result = action_log_eval(slug, data)
 
+    elif args.action == "log-batch":
+        items, err = _load_batch_items(args.data, args.file)
+        if err:
+            print(json.dumps({"error": err}))
+            sys.exit(1)
+        result = action_log_batch(slug, items)
+
     elif args.action == "get-trends":
         result = action_get_trends(slug, args.days, args.content_type)
 
@@ -527,6 +906,9 @@ def main():
     elif args.action == "get-worst":
         result = action_get_worst(slug, args.limit, args.content_type, args.days)
 
+    elif args.action == "rebuild-index":
+        result = action_rebuild_index(slug)
+
     json.dump(result, sys.stdout, indent=2)
     print()
 
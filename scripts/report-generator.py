@@ -22,9 +22,8 @@ import json
 import re
 import sys
 from datetime import datetime
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, save_json
 
 VALID_REPORT_TYPES = [
     "weekly-pulse", "monthly-review", "quarterly-business-review", "custom",
@@ -38,29 +37,14 @@ REPORT_TITLES = {
 }
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_json(path, default=None):
     """Safely load a JSON file, returning default on missing/corrupt."""
-    if default is None:
-        default = {}
-    if not path.exists():
-        return default
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return default
+    return load_json(path, {} if default is None else default)
 
 
 def _save_json(path, data):
     """Write JSON to a file."""
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def _format_metric_value(value):
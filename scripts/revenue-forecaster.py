@@ -6,6 +6,21 @@ multi-month forecasts using linear regression and growth-rate models.
 Supports seasonal multipliers and custom growth-rate overrides. Returns
 blended forecasts with confidence ranges, projected ROAS, and assumptions.
 
+ETS engine (--engine ets, and always for --series-file):
+    Fits exponential smoothing (Holt-Winters) models per series: trend none /
+    additive / damped, seasonality none / additive / multiplicative. Seasonal
+    models are tried once a series has two full seasons; the model with the
+    lowest AICc wins, so seasonality is estimated rather than hand-supplied.
+    Rolling-origin backtests (refit at each origin, forecast the next months)
+    give MAPE per horizon, and the prediction intervals are empirical
+    quantiles of the backtest errors (log actual/forecast) at each horizon.
+    When a horizon has too few errors, all horizons are pooled (scaled to
+    one step, then widened by sqrt(h)); series too short to backtest fall
+    back to in-sample one-step errors. When even those are fewer than
+    MIN_HORIZON_ERRORS, the interval is omitted and marked "unavailable".
+    --series-file takes hundreds of series at once (brand x channel x
+    region) and spreads them across a process pool.
+
 Dependencies: none (stdlib only)
 
 Usage:
@@ -13,11 +28,23 @@ Usage:
     python revenue-forecaster.py --file history.json --forecast-months 6
     python revenue-forecaster.py --file history.json --growth-assumption 0.05
     python revenue-forecaster.py --file history.json --seasonality '{"1":0.85,"11":1.3,"12":1.5}'
+    python revenue-forecaster.py --file history.json --engine ets --forecast-months 6
+    python revenue-forecaster.py --series-file portfolio.csv --forecast-months 3 --workers 8 --output forecasts.json
+
+Series file formats:
+    CSV (long): one row per series and month, e.g. brand,channel,region,month,revenue
+                every column other than month/revenue/spend identifies the series
+                (or name them with --group-by brand,channel)
+    JSON:       [{"id": "acme/search/us", "history": [{"month": "2025-01", "revenue": 50000}, ...]}, ...]
 """
 
 import argparse
+import csv
 import json
+import math
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -292,6 +319,451 @@ def forecast_revenue(historical, forecast_months, growth_assumption, seasonality
     return output
 
 
+# ---------------------------------------------------------------------------
+# ETS / Holt-Winters engine
+# ---------------------------------------------------------------------------
+
+SEASON_LENGTH = 12
+MIN_BACKTEST_TRAIN = 6  # months of history before the first non-seasonal origin
+DEFAULT_BACKTEST_ORIGINS = 12
+DEFAULT_INTERVAL = 0.8
+MIN_HORIZON_ERRORS = 20  # fewer backtest errors than this at a horizon: pool horizons
+
+_ALPHA_GRID = (0.1, 0.3, 0.5, 0.7, 0.9)
+_BETA_GRID = (0.02, 0.1, 0.3)
+_GAMMA_GRID = (0.02, 0.1, 0.3)
+_PHI_GRID = (0.9, 0.98)
+
+
+def _ets_initial(y, trend, season, m):
+    """Initial level, trend and seasonal indices (classical start-up values)."""
+    if season == "N":
+        level = y[0]
+        slope = (y[1] - y[0]) if trend != "N" and len(y) > 1 else 0.0
+        return level, slope, []
+    first = sum(y[:m]) / m
+    second = sum(y[m:2 * m]) / m
+    slope = (second - first) / m if trend != "N" else 0.0
+    if season == "M":
+        seasonal = [y[i] / first if first else 1.0 for i in range(m)]
+    else:
+        seasonal = [y[i] - first for i in range(m)]
+    return first, slope, seasonal
+
+
+def _ets_run(y, spec, params, m, horizon=0, skip=0):
+    """One pass of the Holt-Winters recursions.
+
+    Returns (sse, fitted one-step forecasts, final-state forecasts for 1..horizon);
+    the first `skip` errors are left out of sse.
+    """
+    trend, season = spec
+    alpha, beta, gamma, phi = params
+    level, slope, seasonal = _ets_initial(y, trend, season, m)
+    if trend == "N":
+        phi = 0.0
+    seasonal = list(seasonal)
+    fitted = []
+    sse = 0.0
+    mult = season == "M"
+    additive = season == "A"
+    for t, value in enumerate(y):
+        base = level + phi * slope
+        if mult:
+            s = seasonal[t % m]
+            forecast = base * s
+            new_level = alpha * (value / s if s else value) + (1 - alpha) * base
+        elif additive:
+            s = seasonal[t % m]
+            forecast = base + s
+            new_level = alpha * (value - s) + (1 - alpha) * base
+        else:
+            forecast = base
+            new_level = alpha * value + (1 - alpha) * base
+        if t >= skip:
+            error = value - forecast
+            sse += error * error
+        fitted.append(forecast)
+        if trend != "N":
+            slope = beta * (new_level - level) + (1 - beta) * phi * slope
+        if mult:
+            seasonal[t % m] = gamma * (value / new_level if new_level else 1.0) + (1 - gamma) * s
+        elif additive:
+            seasonal[t % m] = gamma * (value - new_level) + (1 - gamma) * s
+        level = new_level
+
+    forecasts = []
+    damp = 0.0
+    for h in range(1, horizon + 1):
+        damp += phi ** h if trend == "Ad" else (1.0 if trend == "A" else 0.0)
+        base = level + damp * slope
+        idx = (len(y) + h - 1) % m
+        if mult:
+            base *= seasonal[idx]
+        elif additive:
+            base += seasonal[idx]
+        forecasts.append(base)
+    return sse, fitted, forecasts
+
+
+def _free_params(spec):
+    trend, season = spec
+    names = ["alpha"]
+    if trend != "N":
+        names.append("beta")
+    if trend == "Ad":
+        names.append("phi")
+    if season != "N":
+        names.append("gamma")
+    return names
+
+
+def _golden(fn, lo, hi, tol=0.01):
+    """Minimise a unimodal-ish fn on [lo, hi] by golden-section search."""
+    ratio = (math.sqrt(5) - 1) / 2
+    a, b = lo, hi
+    c = b - ratio * (b - a)
+    d = a + ratio * (b - a)
+    fc, fd = fn(c), fn(d)
+    while b - a > tol:
+        if fc < fd:
+            b, d, fd = d, c, fc
+            c = b - ratio * (b - a)
+            fc = fn(c)
+        else:
+            a, c, fc = c, d, fd
+            d = a + ratio * (b - a)
+            fd = fn(d)
+    return (c, fc) if fc < fd else (d, fd)
+
+
+_BOUNDS = {"alpha": (0.01, 0.99), "beta": (0.01, 0.5), "gamma": (0.01, 0.6), "phi": (0.8, 0.99)}
+_SLOT = {"alpha": 0, "beta": 1, "gamma": 2, "phi": 3}
+
+
+def _fit_params(y, spec, m, start=None, skip=0):
+    """Least-squares smoothing parameters: coarse grid (or a warm start), then
+    one sweep of per-parameter golden-section refinement."""
+    free = _free_params(spec)
+
+    def sse(params):
+        value = _ets_run(y, spec, params, m, skip=skip)[0]
+        return value if math.isfinite(value) else float("inf")
+
+    if start is None:
+        best, best_sse = None, float("inf")
+        for alpha in _ALPHA_GRID:
+            for beta in (_BETA_GRID if "beta" in free else (0.0,)):
+                for gamma in (_GAMMA_GRID if "gamma" in free else (0.0,)):
+                    for phi in (_PHI_GRID if "phi" in free else (1.0,)):
+                        candidate = (alpha, beta, gamma, phi)
+                        value = sse(candidate)
+                        if value < best_sse:
+                            best, best_sse = candidate, value
+    else:
+        best = tuple(start)
+        best_sse = sse(best)
+
+    params = list(best)
+    for name in free:
+        slot = _SLOT[name]
+
+        def along(v, slot=slot):
+            trial = list(params)
+            trial[slot] = v
+            return sse(trial)
+
+        value, value_sse = _golden(along, *_BOUNDS[name])
+        if value_sse < best_sse:
+            params[slot] = value
+            best_sse = value_sse
+    return tuple(params), best_sse
+
+
+def _aicc(sse, n, k):
+    if sse <= 0 or n - k - 1 <= 0:
+        return float("-inf") if sse <= 0 else float("inf")
+    return n * math.log(sse / n) + 2 * k + 2 * k * (k + 1) / (n - k - 1)
+
+
+def _candidate_specs(y, m):
+    specs = [("N", "N"), ("A", "N"), ("Ad", "N")]
+    if len(y) >= 2 * m:
+        seasons = ["A"] + (["M"] if min(y) > 0 else [])
+        specs += [(trend, season) for season in seasons for trend in ("N", "A", "Ad")]
+    return specs
+
+
+def select_ets(y, m=SEASON_LENGTH):
+    """Fit every candidate model; return (spec, params, aicc) with the lowest AICc.
+
+    Seasonal start-up values reproduce the first season exactly, so when
+    seasonal models compete every candidate is scored on the errors after
+    the first season only.
+    """
+    specs = _candidate_specs(y, m)
+    skip = m if any(season != "N" for _, season in specs) else 0
+    best = None
+    for spec in specs:
+        params, sse = _fit_params(y, spec, m, skip=skip)
+        k = len(_free_params(spec)) + 1 + (spec[0] != "N")
+        score = _aicc(sse, len(y) - skip, k)
+        if best is None or score < best[2]:
+            best = (spec, params, score)
+    return best
+
+
+def seasonal_strength(y, m=SEASON_LENGTH):
+    """Strength of seasonality (0-1) from a classical additive decomposition."""
+    n = len(y)
+    if n < 2 * m:
+        return None
+    half = m // 2
+    trend = [None] * n
+    for t in range(half, n - half):
+        window = y[t - half:t + half + 1]
+        # centred 2xm moving average for even m
+        trend[t] = (sum(window) - (window[0] + window[-1]) / 2) / m if m % 2 == 0 else sum(window) / m
+    detrended = [y[t] - trend[t] for t in range(n) if trend[t] is not None]
+    offsets = [t % m for t in range(n) if trend[t] is not None]
+    means = {}
+    for value, k in zip(detrended, offsets):
+        means.setdefault(k, []).append(value)
+    index = {k: sum(v) / len(v) for k, v in means.items()}
+    remainder = [value - index[k] for value, k in zip(detrended, offsets)]
+
+    def var(xs):
+        mean = sum(xs) / len(xs)
+        return sum((x - mean) ** 2 for x in xs) / len(xs)
+
+    total = var(detrended)
+    return round(max(0.0, 1 - var(remainder) / total), 3) if total > 0 else 0.0
+
+
+def _quantile(values, q):
+    ordered = sorted(values)
+    pos = (len(ordered) - 1) * q
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def backtest(y, spec, params, m, horizon, origins):
+    """Rolling-origin evaluation: refit at each origin, forecast `horizon` months.
+
+    Returns {h: [(actual, forecast), ...]} for h = 1..horizon.
+    """
+    min_train = max(2 * m if spec[1] != "N" else MIN_BACKTEST_TRAIN, 3)
+    first = max(min_train, len(y) - origins)
+    pairs = {h: [] for h in range(1, horizon + 1)}
+    for origin in range(first, len(y)):
+        train = y[:origin]
+        fitted, _ = _fit_params(train, spec, m, start=params)
+        forecasts = _ets_run(train, spec, fitted, m, horizon=min(horizon, len(y) - origin))[2]
+        for h, forecast in enumerate(forecasts, 1):
+            pairs[h].append((y[origin + h - 1], forecast))
+    return pairs
+
+
+def _mape(pairs):
+    errors = [abs(a - f) / abs(a) for a, f in pairs if a]
+    return round(sum(errors) / len(errors) * 100, 2) if errors else None
+
+
+def _log_errors(pairs):
+    return [math.log(a / f) for a, f in pairs if a > 0 and f > 0]
+
+
+def forecast_series_ets(history, forecast_months, m=SEASON_LENGTH, origins=DEFAULT_BACKTEST_ORIGINS,
+                        interval=DEFAULT_INTERVAL):
+    """ETS forecast with backtest MAPE and empirical prediction intervals for one series."""
+    months, y, filled = _regularize(history)
+    spec, params, aicc = select_ets(y, m)
+    _, fitted, point = _ets_run(y, spec, params, m, horizon=forecast_months)
+
+    pairs = backtest(y, spec, params, m, forecast_months, origins)
+    all_pairs = [p for h in pairs for p in pairs[h]]
+    lo_q, hi_q = (1 - interval) / 2, 1 - (1 - interval) / 2
+
+    # Interval errors: backtest log errors for this horizon when there are
+    # enough of them; otherwise every backtest error, normalised to one step
+    # (e / sqrt(h')) and widened back by sqrt(h). In-sample one-step errors
+    # are the last resort when the series is too short to backtest; with
+    # fewer than MIN_HORIZON_ERRORS of any kind no interval is reported, as
+    # quantiles of a handful of errors are meaningless.
+    pooled = [e / math.sqrt(h) for h in pairs for e in _log_errors(pairs[h])]
+    one_step = _log_errors(list(zip(y[1:], fitted[1:])))
+    forecasts = []
+    month = months[-1]
+    for h, value in enumerate(point, 1):
+        month = next_month(month)
+        errors = _log_errors(pairs.get(h, []))
+        method = "backtest"
+        if len(errors) < MIN_HORIZON_ERRORS:
+            if len(pooled) >= MIN_HORIZON_ERRORS:
+                base, method = pooled, "backtest_pooled"
+            elif len(one_step) >= MIN_HORIZON_ERRORS:
+                base, method = one_step, "in_sample"
+            else:
+                base, method = [], "unavailable"
+            errors = [e * math.sqrt(h) for e in base]
+        entry = {"month": month, "forecast": round(max(0.0, value), 2)}
+        if not errors:
+            entry["interval_method"] = "unavailable"
+        elif value > 0:
+            entry["interval_low"] = round(value * math.exp(_quantile(errors, lo_q)), 2)
+            entry["interval_high"] = round(value * math.exp(_quantile(errors, hi_q)), 2)
+            entry["interval_method"] = method
+        forecasts.append(entry)
+
+    trend, season = spec
+    result = {
+        "model": {
+            "type": f"ETS({trend},{season})",
+            "trend": {"N": "none", "A": "additive", "Ad": "damped"}[trend],
+            "seasonality": {"N": "none", "A": "additive", "M": "multiplicative"}[season],
+            "alpha": round(params[0], 3),
+            "aicc": round(aicc, 2) if math.isfinite(aicc) else None,
+        },
+        "months_analyzed": len(y),
+        "seasonal_strength": seasonal_strength(y, m),
+        "backtest": {
+            "origins": len(pairs.get(1, [])),
+            "mape": _mape(all_pairs),
+            "mape_by_horizon": {str(h): _mape(p) for h, p in pairs.items() if p},
+        },
+        "forecast": forecasts,
+        "interval": interval,
+    }
+    if trend != "N":
+        result["model"]["beta"] = round(params[1], 3)
+    if trend == "Ad":
+        result["model"]["phi"] = round(params[3], 3)
+    if season != "N":
+        result["model"]["gamma"] = round(params[2], 3)
+    if filled:
+        result["warnings"] = [f"{filled} missing month(s) filled by linear interpolation"]
+    return result
+
+
+def _month_ordinal(month_str):
+    return int(month_str[:4]) * 12 + int(month_str[5:7]) - 1
+
+
+def _regularize(history):
+    """Sorted months and revenues with gaps filled by linear interpolation."""
+    points = sorted((h["month"], float(h["revenue"])) for h in history)
+    months, values = [points[0][0]], [points[0][1]]
+    filled = 0
+    for month, value in points[1:]:
+        gap = _month_ordinal(month) - _month_ordinal(months[-1])
+        if gap <= 0:
+            values[-1] += value  # duplicate month: combine
+            continue
+        for step in range(1, gap):
+            months.append(next_month(months[-1]))
+            values.append(values[-1] + (value - values[-1]) * step / gap)
+            filled += 1
+        months.append(month)
+        values.append(value)
+    return months, values, filled
+
+
+# ---------------------------------------------------------------------------
+# Multi-series portfolio
+# ---------------------------------------------------------------------------
+
+def load_series_file(path, group_by=None):
+    """Read a portfolio of series: returns (list of {"id", "keys", "history"}, error)."""
+    path = Path(path)
+    if not path.exists():
+        return None, f"File not found: {path}"
+    try:
+        if path.suffix.lower() == ".csv":
+            series = {}
+            with open(path, newline="", encoding="utf-8-sig") as fh:
+                reader = csv.DictReader(fh)
+                fields = [f.strip() for f in reader.fieldnames or []]
+                reader.fieldnames = fields
+                if "month" not in fields or "revenue" not in fields:
+                    return None, "CSV needs 'month' and 'revenue' columns"
+                keys = group_by or [f for f in fields if f not in ("month", "revenue", "spend")]
+                for row in reader:
+                    key_values = [(row.get(k) or "").strip() for k in keys]
+                    sid = "/".join(key_values) or "series"
+                    entry = series.setdefault(sid, {"id": sid, "keys": dict(zip(keys, key_values)),
+                                                    "history": []})
+                    entry["history"].append({"month": row["month"].strip(), "revenue": float(row["revenue"])})
+            return list(series.values()), None
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if isinstance(data, dict):
+            data = data.get("series", [])
+        out = []
+        for i, item in enumerate(data):
+            history = item.get("history") or item.get("historical") or []
+            for h in history:
+                h["revenue"] = float(h["revenue"])
+            out.append({"id": str(item.get("id", i)),
+                        "keys": {k: v for k, v in item.items() if k not in ("id", "history", "historical")},
+                        "history": history})
+        return out, None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as exc:
+        return None, f"Could not read series file: {exc}"
+
+
+def _forecast_task(task):
+    """Process-pool entry point: forecast one series, never raise."""
+    series, forecast_months, m, origins, interval = task
+    history = series["history"]
+    if len(history) < 2:
+        return {"id": series["id"], "error": "At least 2 months of history required"}
+    try:
+        result = forecast_series_ets(history, forecast_months, m, origins, interval)
+    except (ValueError, ZeroDivisionError, OverflowError, KeyError, TypeError) as exc:
+        return {"id": series["id"], "error": f"Forecasting failed: {exc}"}
+    return {"id": series["id"], "keys": series.get("keys", {}), **result}
+
+
+def forecast_portfolio(series_list, forecast_months, m=SEASON_LENGTH, origins=DEFAULT_BACKTEST_ORIGINS,
+                       interval=DEFAULT_INTERVAL, workers=None):
+    """Forecast every series (in a process pool when workers > 1) and summarise."""
+    workers = workers or os.cpu_count() or 1
+    tasks = [(s, forecast_months, m, origins, interval) for s in series_list]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            results = list(pool.map(_forecast_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+    else:
+        results = [_forecast_task(t) for t in tasks]
+
+    ok = [r for r in results if "error" not in r]
+    totals = {}
+    for r in ok:
+        for f in r["forecast"]:
+            totals[f["month"]] = totals.get(f["month"], 0.0) + f["forecast"]
+    mapes = sorted(r["backtest"]["mape"] for r in ok if r["backtest"]["mape"] is not None)
+    models = {}
+    for r in ok:
+        models[r["model"]["type"]] = models.get(r["model"]["type"], 0) + 1
+
+    summary = {
+        "series_count": len(results),
+        "series_forecasted": len(ok),
+        "series_failed": len(results) - len(ok),
+        "forecast_months": forecast_months,
+        "workers": min(workers, len(tasks)) if len(tasks) > 1 else 1,
+        "median_backtest_mape": round(_quantile(mapes, 0.5), 2) if mapes else None,
+        "models_selected": dict(sorted(models.items(), key=lambda kv: -kv[1])),
+        "portfolio_forecast": [{"month": mo, "forecast": round(v, 2)} for mo, v in sorted(totals.items())],
+        "least_accurate_series": [
+            {"id": r["id"], "mape": r["backtest"]["mape"], "model": r["model"]["type"]}
+            for r in sorted((r for r in ok if r["backtest"]["mape"] is not None),
+                            key=lambda r: -r["backtest"]["mape"])[:10]
+        ],
+    }
+    return {"summary": summary, "series": results}
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -320,12 +792,72 @@ def main():
         "--seasonality", default=None,
         help='JSON object with month indices and multipliers: {"11":1.3,"12":1.5}',
     )
+    parser.add_argument(
+        "--engine", choices=["blend", "ets"], default="blend",
+        help="Single-series engine: blend (linear + growth, default) or ets (Holt-Winters with backtests)",
+    )
+    parser.add_argument(
+        "--series-file", default=None,
+        help="CSV (long format) or JSON file with many series to forecast with the ETS engine",
+    )
+    parser.add_argument(
+        "--group-by", default=None,
+        help="Comma-separated CSV columns identifying a series (default: all but month/revenue/spend)",
+    )
+    parser.add_argument(
+        "--season-length", type=int, default=SEASON_LENGTH,
+        help=f"Seasonal period in months for the ETS engine (default: {SEASON_LENGTH})",
+    )
+    parser.add_argument(
+        "--backtest-origins", type=int, default=DEFAULT_BACKTEST_ORIGINS,
+        help=f"Rolling-origin backtest points per series (default: {DEFAULT_BACKTEST_ORIGINS})",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=DEFAULT_INTERVAL,
+        help=f"Prediction interval coverage for the ETS engine (default: {DEFAULT_INTERVAL})",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="Processes for --series-file (default: CPU count)",
+    )
+    parser.add_argument(
+        "--output", default=None,
+        help="With --series-file: write full per-series results here and print only the summary",
+    )
     args = parser.parse_args()
 
+    if args.forecast_months < 1 or args.forecast_months > 24:
+        message = "forecast-months must be at least 1" if args.forecast_months < 1 else "forecast-months cannot exceed 24"
+        json.dump({"error": message}, sys.stdout, indent=2)
+        print()
+        sys.exit(0)
+    if not 0 < args.interval < 1 or args.season_length < 2 or args.backtest_origins < 0:
+        json.dump({"error": "interval must be in (0, 1), season-length >= 2, backtest-origins >= 0"},
+                  sys.stdout, indent=2)
+        print()
+        sys.exit(0)
+
+    # --- Portfolio mode ---
+    if args.series_file:
+        group_by = [g.strip() for g in args.group_by.split(",")] if args.group_by else None
+        series_list, err = load_series_file(args.series_file, group_by)
+        if err:
+            json.dump({"error": err}, sys.stdout, indent=2)
+            print()
+            sys.exit(0)
+        result = forecast_portfolio(series_list, args.forecast_months, args.season_length,
+                                    args.backtest_origins, args.interval, args.workers)
+        if args.output:
+            Path(args.output).write_text(json.dumps(result, indent=2), encoding="utf-8")
+            result = {**result["summary"], "output": args.output}
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+
     # --- Input loading ---
     if not args.historical and not args.file:
         json.dump(
-            {"error": "Provide either --historical (JSON array) or --file (path to JSON file)"},
+            {"error": "Provide either --historical (JSON array), --file (path to JSON file) or --series-file"},
             sys.stdout, indent=2,
         )
         print()
@@ -447,6 +979,16 @@ def main():
     historical.sort(key=lambda h: h["month"])
 
     # --- Run forecast ---
+    if args.engine == "ets":
+        try:
+            result = forecast_series_ets(historical, args.forecast_months, args.season_length,
+                                         args.backtest_origins, args.interval)
+        except (ValueError, ZeroDivisionError, OverflowError) as exc:
+            result = {"error": f"Forecasting failed: {exc}"}
+        json.dump(result, sys.stdout, indent=2)
+        print()
+        return
+
     try:
         result = forecast_revenue(
             historical=historical,
@@ -3,14 +3,21 @@
 
 Runs probabilistic revenue simulations across marketing scenarios using
 normal distributions for ROI, optional saturation curves, and multi-channel
-interaction bonuses. Uses stdlib random module (not numpy) for zero-dep
-portability.
+interaction bonuses.
 
-Dependencies: none (stdlib only)
+Two engines share one code path. When numpy is installed the whole
+trials x months x channels matrix for a scenario is drawn in a few
+vectorized chunks; otherwise the stdlib random module is used. Percentiles,
+target probability and per-channel contributions all come from the same
+draw. Results are reproducible for a given --seed and engine (the engine
+used is reported in the output).
+
+Dependencies: none (stdlib only); numpy optional for the fast engine
 
 Usage:
     python revenue-simulator.py --action simulate --scenarios '[{"name":"Aggressive","channels":[{"name":"Google Ads","budget":10000,"roi_mean":3.2,"roi_std":0.8}],"months":6}]'
     python revenue-simulator.py --action simulate --scenarios '[...]' --target 500000
+    python revenue-simulator.py --action simulate --scenarios '[...]' --simulations 100000 --engine numpy
     python revenue-simulator.py --action what-if --current '{"channels":[{"name":"Google Ads","budget":5000,"roi_mean":3.0}]}' --scenarios '[{"channels":[{"name":"Google Ads","budget":8000,"roi_mean":3.0}]}]'
     python revenue-simulator.py --action sensitivity --base-scenario '{"channels":[{"name":"PPC","budget":10000,"roi_mean":3.0,"roi_std":0.5}],"months":6}' --variable budget --range '[5000,20000,6]'
     python revenue-simulator.py --action channel-interaction --data '{"channels":[{"name":"PPC","solo_performance":100,"combined_performance":120}]}'
@@ -24,8 +31,16 @@ import random
 import sys
 from pathlib import Path
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
 NUM_SIMULATIONS = 10000
+REPORT_PERCENTILES = (10, 25, 50, 75, 90)
+CHUNK_CELLS = 2_000_000  # normal draws held in memory at once (numpy engine)
+ENGINES = ("auto", "numpy", "python")
 
 
 def _saturation_curve(budget, saturation_point):
@@ -47,59 +62,130 @@ def _percentile(sorted_vals, pct):
     return sorted_vals[lower] * (1 - frac) + sorted_vals[upper] * frac
 
 
-def _run_simulation(channels, months, interaction_bonus, seed):
-    """Run NUM_SIMULATIONS Monte Carlo trials and return revenue distribution."""
+def _resolve_engine(engine):
+    """Map 'auto' to the fastest available engine."""
+    if engine == "auto":
+        return "numpy" if np is not None else "python"
+    return engine
+
+
+def _channel_params(channels):
+    """Per-channel (roi_mean, roi_std, budget x saturation multiplier)."""
+    params = []
+    for ch in channels:
+        scale = ch["budget"]
+        sat = ch.get("saturation_point")
+        if sat and sat > 0:
+            scale *= _saturation_curve(ch["budget"], sat)
+        params.append((ch["roi_mean"], ch.get("roi_std", 0.0), scale))
+    return params
+
+
+def _bonus_factor(channels, interaction_bonus):
+    """Multi-channel interaction bonus applied to every month's revenue."""
+    if len(channels) > 1 and interaction_bonus > 0:
+        return 1.0 + interaction_bonus
+    return 1.0
+
+
+def _draw_python(channels, months, interaction_bonus, seed, simulations):
+    """Stdlib engine. Returns (sorted trial totals, per-channel revenue sums)."""
     rng = random.Random(seed)
+    params = _channel_params(channels)
+    factor = _bonus_factor(channels, interaction_bonus)
+    channel_sums = [0.0] * len(params)
     results = []
 
-    for _ in range(NUM_SIMULATIONS):
+    for _ in range(simulations):
         total_revenue = 0.0
         for _m in range(months):
             month_revenue = 0.0
-            for ch in channels:
-                roi = rng.gauss(ch["roi_mean"], ch.get("roi_std", 0.0))
-                roi = max(roi, 0.0)  # ROI can't go negative
-                raw_revenue = ch["budget"] * roi
-
-                # Apply saturation curve if specified
-                sat = ch.get("saturation_point")
-                if sat and sat > 0:
-                    raw_revenue *= _saturation_curve(ch["budget"], sat)
-
+            for i, (mean, std, scale) in enumerate(params):
+                roi = max(rng.gauss(mean, std), 0.0)  # ROI can't go negative
+                raw_revenue = scale * roi
+                channel_sums[i] += raw_revenue
                 month_revenue += raw_revenue
-
-            # Multi-channel interaction bonus
-            if len(channels) > 1 and interaction_bonus > 0:
-                month_revenue *= (1.0 + interaction_bonus)
-
-            total_revenue += month_revenue
+            total_revenue += month_revenue * factor
         results.append(round(total_revenue, 2))
 
     results.sort()
-    return results
-
+    return results, channel_sums
+
+
+def _draw_numpy(channels, months, interaction_bonus, seed, simulations):
+    """Vectorized engine. Returns (sorted trial totals, per-channel revenue sums).
+
+    Draws are generated in trial-major chunks from one seeded Generator, so
+    the result does not depend on the chunk size.
+    """
+    rng = np.random.default_rng(seed)
+    params = _channel_params(channels)
+    means = np.array([p[0] for p in params], dtype=float)
+    stds = np.array([p[1] for p in params], dtype=float)
+    scales = np.array([p[2] for p in params], dtype=float)
+    factor = _bonus_factor(channels, interaction_bonus)
+
+    totals = np.empty(simulations)
+    channel_sums = np.zeros(len(params))
+    chunk = max(1, CHUNK_CELLS // max(months * len(params), 1))
+    for start in range(0, simulations, chunk):
+        size = min(chunk, simulations - start)
+        roi = rng.standard_normal((size, months, len(params)))
+        roi *= stds
+        roi += means
+        np.maximum(roi, 0.0, out=roi)
+        per_channel = roi.sum(axis=1) * scales  # (size, channels)
+        channel_sums += per_channel.sum(axis=0)
+        totals[start:start + size] = per_channel.sum(axis=1) * factor
+
+    totals.sort()
+    return totals, channel_sums.tolist()
+
+
+def _run_simulation(channels, months, interaction_bonus, seed,
+                    simulations=NUM_SIMULATIONS, engine="auto", target=None):
+    """Run the Monte Carlo trials for one scenario and summarize them.
+
+    Returns a dict with the mean, REPORT_PERCENTILES, probability of
+    reaching ``target`` (if given) and per-channel contributions, all
+    computed from a single draw.
+    """
+    engine = _resolve_engine(engine)
+    if engine == "numpy":
+        dist, channel_sums = _draw_numpy(
+            channels, months, interaction_bonus, seed, simulations)
+        mean = float(dist.mean())
+        pct_values = np.percentile(dist, REPORT_PERCENTILES).tolist()
+        hits = int((dist >= target).sum()) if target is not None else None
+    else:
+        dist, channel_sums = _draw_python(
+            channels, months, interaction_bonus, seed, simulations)
+        mean = sum(dist) / len(dist)
+        pct_values = [_percentile(dist, p) for p in REPORT_PERCENTILES]
+        hits = sum(1 for v in dist if v >= target) if target is not None else None
+
+    summary = {
+        "engine": engine,
+        "mean": mean,
+        "percentiles": dict(zip(REPORT_PERCENTILES, pct_values)),
+        "channel_contributions": _channel_contributions(
+            channels, channel_sums, simulations),
+    }
+    if hits is not None:
+        summary["probability_of_target"] = round(hits / simulations * 100, 1)
+    return summary
 
-def _channel_contributions(channels, months, interaction_bonus, seed):
-    """Estimate each channel's share of total revenue."""
-    rng = random.Random(seed)
-    contrib = {ch["name"]: 0.0 for ch in channels}
-    runs = 1000  # lighter run for breakdown
 
-    for _ in range(runs):
-        for _m in range(months):
-            for ch in channels:
-                roi = rng.gauss(ch["roi_mean"], ch.get("roi_std", 0.0))
-                roi = max(roi, 0.0)
-                rev = ch["budget"] * roi
-                sat = ch.get("saturation_point")
-                if sat and sat > 0:
-                    rev *= _saturation_curve(ch["budget"], sat)
-                contrib[ch["name"]] += rev
+def _channel_contributions(channels, channel_sums, simulations):
+    """Each channel's share of total (pre-bonus) revenue across all trials."""
+    contrib = {}
+    for ch, val in zip(channels, channel_sums):
+        contrib[ch["name"]] = contrib.get(ch["name"], 0.0) + val
 
     total = sum(contrib.values())
     if total > 0:
         return [{"channel": name, "share": round(val / total * 100, 1),
-                 "estimated_revenue": round(val / runs, 2)}
+                 "estimated_revenue": round(val / simulations, 2)}
                 for name, val in contrib.items()]
     return [{"channel": name, "share": 0, "estimated_revenue": 0} for name in contrib]
 
@@ -108,8 +194,9 @@ def _channel_contributions(channels, months, interaction_bonus, seed):
 # Actions
 # ---------------------------------------------------------------------------
 
-def simulate(scenarios, target, seed):
+def simulate(scenarios, target, seed, simulations=NUM_SIMULATIONS, engine="auto"):
     results = []
+    used_engine = _resolve_engine(engine)
     for sc in scenarios:
         name = sc.get("name", "Unnamed")
         channels = sc.get("channels", [])
@@ -120,44 +207,45 @@ def simulate(scenarios, target, seed):
             results.append({"name": name, "error": "No channels defined."})
             continue
 
-        dist = _run_simulation(channels, months, interaction_bonus, seed)
+        sim = _run_simulation(channels, months, interaction_bonus, seed,
+                              simulations, engine, target)
+        pcts = sim["percentiles"]
         entry = {
             "name": name,
             "months": months,
             "total_budget": sum(ch["budget"] for ch in channels) * months,
-            "expected_revenue": round(sum(dist) / len(dist), 2),
-            "p10": round(_percentile(dist, 10), 2),
-            "p25": round(_percentile(dist, 25), 2),
-            "p50": round(_percentile(dist, 50), 2),
-            "p75": round(_percentile(dist, 75), 2),
-            "p90": round(_percentile(dist, 90), 2),
-            "channel_contributions": _channel_contributions(
-                channels, months, interaction_bonus, seed),
+            "expected_revenue": round(sim["mean"], 2),
+            "p10": round(pcts[10], 2),
+            "p25": round(pcts[25], 2),
+            "p50": round(pcts[50], 2),
+            "p75": round(pcts[75], 2),
+            "p90": round(pcts[90], 2),
+            "channel_contributions": sim["channel_contributions"],
         }
         if target is not None:
-            hits = sum(1 for v in dist if v >= target)
-            entry["probability_of_target"] = round(hits / len(dist) * 100, 1)
+            entry["probability_of_target"] = sim["probability_of_target"]
             entry["target"] = target
 
         results.append(entry)
-    return {"scenarios": results, "simulations_per_scenario": NUM_SIMULATIONS, "seed": seed}
+    return {"scenarios": results, "simulations_per_scenario": simulations,
+            "seed": seed, "engine": used_engine}
 
 
-def what_if(current, alternatives, seed):
+def what_if(current, alternatives, seed, simulations=NUM_SIMULATIONS, engine="auto"):
     # Simulate current
     curr_channels = current.get("channels", [])
     curr_months = current.get("months", 1)
     curr_bonus = current.get("interaction_bonus", 0.0)
-    curr_dist = _run_simulation(curr_channels, curr_months, curr_bonus, seed)
-    curr_mean = sum(curr_dist) / len(curr_dist) if curr_dist else 0
+    curr_mean = _run_simulation(curr_channels, curr_months, curr_bonus, seed,
+                                simulations, engine)["mean"]
 
     comparisons = []
     for i, alt in enumerate(alternatives):
         alt_channels = alt.get("channels", curr_channels)
         alt_months = alt.get("months", curr_months)
         alt_bonus = alt.get("interaction_bonus", curr_bonus)
-        alt_dist = _run_simulation(alt_channels, alt_months, alt_bonus, seed)
-        alt_mean = sum(alt_dist) / len(alt_dist) if alt_dist else 0
+        alt_mean = _run_simulation(alt_channels, alt_months, alt_bonus, seed,
+                                   simulations, engine)["mean"]
         delta = alt_mean - curr_mean
         pct_change = round(delta / curr_mean * 100, 1) if curr_mean else 0
 
@@ -173,10 +261,13 @@ def what_if(current, alternatives, seed):
         "current_expected_revenue": round(curr_mean, 2),
         "current_total_budget": sum(ch["budget"] for ch in curr_channels) * curr_months,
         "comparisons": comparisons,
+        "simulations_per_scenario": simulations,
+        "engine": _resolve_engine(engine),
     }
 
 
-def sensitivity(base_scenario, variable, var_range, seed):
+def sensitivity(base_scenario, variable, var_range, seed,
+                simulations=NUM_SIMULATIONS, engine="auto"):
     channels = base_scenario.get("channels", [])
     months = base_scenario.get("months", 1)
     bonus = base_scenario.get("interaction_bonus", 0.0)
@@ -201,16 +292,16 @@ def sensitivity(base_scenario, variable, var_range, seed):
             for ch in modified:
                 ch["saturation_point"] = val
 
-        dist = _run_simulation(modified, months, bonus, seed)
-        mean_rev = sum(dist) / len(dist) if dist else 0
+        sim = _run_simulation(modified, months, bonus, seed, simulations, engine)
         data_points.append({
             "variable_value": round(val, 2),
-            "expected_revenue": round(mean_rev, 2),
-            "p25": round(_percentile(dist, 25), 2),
-            "p75": round(_percentile(dist, 75), 2),
+            "expected_revenue": round(sim["mean"], 2),
+            "p25": round(sim["percentiles"][25], 2),
+            "p75": round(sim["percentiles"][75], 2),
         })
 
-    return {"variable": variable, "range": var_range, "data_points": data_points}
+    return {"variable": variable, "range": var_range, "data_points": data_points,
+            "simulations_per_point": simulations, "engine": _resolve_engine(engine)}
 
 
 def channel_interaction(data):
@@ -317,8 +408,20 @@ def main():
     parser.add_argument("--target", type=float, help="Revenue target (for simulate)")
     parser.add_argument("--seed", type=int, default=42,
                         help="Random seed for reproducibility (default: 42)")
+    parser.add_argument("--simulations", type=int, default=NUM_SIMULATIONS,
+                        help=f"Monte Carlo trials per scenario (default: {NUM_SIMULATIONS})")
+    parser.add_argument("--engine", choices=list(ENGINES), default="auto",
+                        help="Simulation engine: numpy (vectorized), python (stdlib), "
+                             "or auto = numpy when installed (default: auto)")
     args = parser.parse_args()
 
+    if args.simulations < 1:
+        print(json.dumps({"error": "--simulations must be at least 1"}))
+        sys.exit(1)
+    if args.engine == "numpy" and np is None:
+        print(json.dumps({"error": "numpy not installed. Use --engine python or: pip install numpy"}))
+        sys.exit(1)
+
     result = None
 
     if args.action == "simulate":
@@ -332,7 +435,7 @@ def main():
             sys.exit(1)
         if not isinstance(scenarios, list):
             scenarios = [scenarios]
-        result = simulate(scenarios, args.target, args.seed)
+        result = simulate(scenarios, args.target, args.seed, args.simulations, args.engine)
 
     elif args.action == "what-if":
         if not args.current:
@@ -349,7 +452,7 @@ def main():
             sys.exit(1)
         if not isinstance(alternatives, list):
             alternatives = [alternatives]
-        result = what_if(current, alternatives, args.seed)
+        result = what_if(current, alternatives, args.seed, args.simulations, args.engine)
 
     elif args.action == "sensitivity":
         if not args.base_scenario:
@@ -370,7 +473,7 @@ def main():
         if not isinstance(vr, list) or len(vr) != 3:
             print(json.dumps({"error": "--range must be [min, max, steps]"}))
             sys.exit(1)
-        result = sensitivity(base, args.variable, vr, args.seed)
+        result = sensitivity(base, args.variable, vr, args.seed, args.simulations, args.engine)
 
     elif args.action == "channel-interaction":
         if not args.data:
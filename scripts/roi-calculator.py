@@ -6,25 +6,47 @@ Campaign ROI calculator with multi-touch attribution models. Computes ROI,
 ROAS, CPA, and contribution metrics per channel, applies attribution models
 across multi-channel data, and generates optimisation recommendations.
 
+Path-level attribution: --paths streams a CSV or JSONL file (or loads a JSON
+array) of customer journeys (converting and non-converting), one path per row:
+    CSV:   path,converted,value,count        e.g. "Google Ads > Email > Direct",1,120,1
+    JSONL: {"path": ["Google Ads", "Email"], "converted": true, "value": 120, "count": 1}
+    JSONL: {"path": "Google Ads > Email", "conversions": 3, "value": 360, "count": 40}
+"converted" is a boolean (true/false, yes/no, 1/0): every one of the row's
+"count" journeys converted, or none did. For a group where only some
+converted, give "conversions" instead, a count between 0 and "count"; it
+takes precedence over "converted". "value" (conversion revenue) and "count"
+(default 1) are optional.
+Identical paths are grouped and folded into Markov transition counts and
+channel-set counts, so memory stays bounded however many rows are read.
+Channel conversions and revenue are then re-attributed from the paths with
+the chosen model (markov, shapley, or any rule-based model applied per path)
+before metrics are computed.
+
 Dependencies: none (stdlib only)
 
 Usage:
     python roi-calculator.py --channels '[{"name":"Google Ads","spend":5000,"conversions":150,"revenue":22500}]'
     python roi-calculator.py --file channels.json --attribution linear --period "Q1 2026"
     python roi-calculator.py --channels '[...]' --attribution time_decay --ltv 1200
+    python roi-calculator.py --file channels.json --paths journeys.csv --attribution markov
+    python roi-calculator.py --file channels.json --paths journeys.jsonl --attribution shapley
 """
 
 import argparse
+import csv
 import json
 import math
 import sys
+from collections import defaultdict
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
 # Attribution helpers
 # ---------------------------------------------------------------------------
 
-VALID_MODELS = {"last_touch", "first_touch", "linear", "time_decay", "position_based"}
+RULE_MODELS = {"last_touch", "first_touch", "linear", "time_decay", "position_based"}
+PATH_MODELS = {"markov", "shapley"}
+VALID_MODELS = RULE_MODELS | PATH_MODELS
 
 
 def apply_attribution(channels, model):
@@ -71,6 +93,344 @@ def apply_attribution(channels, model):
     return weights
 
 
+# ---------------------------------------------------------------------------
+# Path-level attribution
+# ---------------------------------------------------------------------------
+
+PATH_SEPARATOR = ">"
+PATH_BUFFER = 100000          # distinct paths held before folding into the aggregates
+SHAPLEY_MAX_CHANNELS = 16     # exact Shapley enumerates 2^n coalitions
+START, CONVERSION, NULL = "(start)", "(conversion)", "(null)"
+
+
+_PATH_CACHE = {}
+
+
+def _parse_path(raw):
+    """Channel tuple from "A > B > C" or a list, with repeated touches collapsed."""
+    if isinstance(raw, str):
+        path = _PATH_CACHE.get(raw)
+        if path is not None:
+            return path
+        parts = raw.split(PATH_SEPARATOR)
+    else:
+        parts = raw or []
+    path = []
+    for part in parts:
+        name = str(part).strip()
+        if name and (not path or path[-1] != name):
+            path.append(name)
+    path = tuple(path)
+    if isinstance(raw, str):
+        if len(_PATH_CACHE) >= PATH_BUFFER:
+            _PATH_CACHE.clear()
+        _PATH_CACHE[raw] = path
+    return path
+
+
+def _number(value, default=0.0):
+    if value.__class__ in (int, float):
+        return float(value)
+    if isinstance(value, bool):
+        return 1.0 if value else 0.0
+    if value is None or value == "":
+        return default
+    if isinstance(value, str) and value.strip().lower() in ("true", "yes", "y"):
+        return 1.0
+    if isinstance(value, str) and value.strip().lower() in ("false", "no", "n"):
+        return 0.0
+    return float(value)
+
+
+def _converted(value):
+    """A row's "converted" flag: a boolean, 1/0, or true/false/yes/no."""
+    if value is None or value == "":
+        return False
+    if isinstance(value, str):
+        flag = value.strip().lower()
+        if flag in ("true", "yes", "y"):
+            return True
+        if flag in ("false", "no", "n"):
+            return False
+        value = _number(value)
+    if value in (0, 1):
+        return bool(value)
+    raise ValueError(f'"converted" must be a boolean, got {value!r}; use "conversions" for a count')
+
+
+def iter_path_records(filepath):
+    """Yield (path, journeys, conversions, value) per row of a CSV, JSONL or JSON file."""
+    path = Path(filepath)
+    suffix = path.suffix.lower()
+    with path.open(encoding="utf-8", newline="") as fh:
+        if suffix in (".jsonl", ".ndjson"):
+            rows = (json.loads(line) for line in fh if line.strip())
+        elif suffix == ".json":
+            rows = json.load(fh)
+            if not isinstance(rows, list):
+                raise ValueError("a .json paths file must contain an array of path records")
+        else:
+            rows = csv.DictReader(fh)
+        for row in rows:
+            if not isinstance(row, dict):
+                raise ValueError("each path record must be an object")
+            raw = row.get("path", row.get("channels", row.get("touchpoints")))
+            journeys = _number(row.get("count"), 1.0)
+            if row.get("conversions") not in (None, ""):
+                conversions = _number(row["conversions"])
+                if not 0 <= conversions <= journeys:
+                    raise ValueError(f'"conversions" ({conversions:g}) must be between 0 and "count" ({journeys:g})')
+            else:
+                conversions = journeys if _converted(row.get("converted")) else 0.0
+            yield _parse_path(raw), journeys, conversions, _number(row.get("value", row.get("revenue")))
+
+
+class PathAggregator:
+    """Streaming path statistics in bounded memory.
+
+    Identical paths are grouped in a buffer of at most buffer_size entries;
+    each flush folds the groups into first-order Markov transition counts,
+    channel-set (coalition) counts and, for a rule-based model, per-path
+    credit. Memory is
+    O(buffer + channels^2 + distinct channel sets), independent of row count.
+    """
+
+    def __init__(self, rule_model=None, buffer_size=PATH_BUFFER):
+        self.buffer_size = buffer_size
+        self.buffer = {}
+        self.transitions = defaultdict(float)     # (from, to) -> journeys
+        self.coalitions = defaultdict(lambda: [0.0, 0.0])   # frozenset -> [journeys, conversions]
+        self.rule_model = rule_model
+        self.rule_credit = defaultdict(float)
+        self.channels = set()
+        self.rows = 0
+        self.journeys = 0.0
+        self.conversions = 0.0
+        self.value = 0.0
+        self.empty_paths = 0
+        self.path_groups = 0
+
+    def add(self, path, journeys, conversions, value=0.0):
+        self.rows += 1
+        if not path:
+            self.empty_paths += 1
+            return
+        group = self.buffer.get(path)
+        if group is None:
+            self.buffer[path] = [journeys, conversions, value]
+            if len(self.buffer) >= self.buffer_size:
+                self.flush()
+        else:
+            group[0] += journeys
+            group[1] += conversions
+            group[2] += value
+
+    def flush(self):
+        for path, (journeys, conversions, value) in self.buffer.items():
+            self.path_groups += 1
+            self.journeys += journeys
+            self.conversions += conversions
+            self.value += value
+            self.channels.update(path)
+
+            self.transitions[(START, path[0])] += journeys
+            for src, dst in zip(path, path[1:]):
+                self.transitions[(src, dst)] += journeys
+            self.transitions[(path[-1], CONVERSION)] += conversions
+            self.transitions[(path[-1], NULL)] += journeys - conversions
+
+            coalition = self.coalitions[frozenset(path)]
+            coalition[0] += journeys
+            coalition[1] += conversions
+
+            if conversions and self.rule_model:
+                for channel, weight in zip(path, apply_attribution(path, self.rule_model)):
+                    self.rule_credit[channel] += weight * conversions
+        self.buffer = {}
+
+    def stats(self):
+        return {
+            "rows": self.rows,
+            "journeys": round(self.journeys, 2),
+            "conversions": round(self.conversions, 2),
+            "conversion_rate": round(self.conversions / self.journeys, 4) if self.journeys else 0.0,
+            "conversion_value": round(self.value, 2),
+            "path_groups": self.path_groups,
+            "empty_paths": self.empty_paths,
+            "channels": len(self.channels),
+        }
+
+
+def aggregate_paths(filepath, model=None, buffer_size=PATH_BUFFER):
+    """Stream a journey file into a PathAggregator. Returns (aggregator, error)."""
+    if not Path(filepath).exists():
+        return None, f"File not found: {filepath}"
+    agg = PathAggregator(model if model in RULE_MODELS else None, buffer_size)
+    try:
+        for record in iter_path_records(filepath):
+            agg.add(*record)
+    except (OSError, ValueError, AttributeError, TypeError) as exc:
+        return None, f"Failed to read paths (row {agg.rows + 1}): {exc}"
+    agg.flush()
+    if not agg.conversions:
+        return None, "Path file contains no conversions"
+    return agg, None
+
+
+def _invert(matrix):
+    """Gauss-Jordan inverse of a square matrix (list of lists); None if singular."""
+    n = len(matrix)
+    a = [row[:] + [1.0 if r == c else 0.0 for c in range(n)] for r, row in enumerate(matrix)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            return None
+        a[col], a[pivot] = a[pivot], a[col]
+        scale = a[col][col]
+        a[col] = [v / scale for v in a[col]]
+        for r in range(n):
+            if r != col and a[r][col]:
+                factor = a[r][col]
+                a[r] = [v - factor * pv for v, pv in zip(a[r], a[col])]
+    return [row[n:] for row in a]
+
+
+def markov_attribution(agg):
+    """Removal-effect attribution on the first-order journey Markov chain.
+
+    With N = (I - Q)^-1 over the transient states (start + channels), x = N r
+    is the conversion probability from each state and h_c = N[start][c] /
+    N[c][c] the probability of ever reaching channel c. Removing c sends every
+    journey that reaches it to null, so P(-c) = P - h_c * x_c: one inversion
+    gives every removal effect.
+    """
+    channels = sorted(agg.channels)
+    states = [START] + channels
+    index = {state: i for i, state in enumerate(states)}
+    n = len(states)
+
+    outbound = [0.0] * n
+    for (src, _), journeys in agg.transitions.items():
+        outbound[index[src]] += journeys
+    i_minus_q = [[1.0 if r == c else 0.0 for c in range(n)] for r in range(n)]
+    to_conversion = [0.0] * n
+    for (src, dst), journeys in agg.transitions.items():
+        i = index[src]
+        if not outbound[i]:
+            continue
+        if dst == CONVERSION:
+            to_conversion[i] += journeys / outbound[i]
+        elif dst != NULL:
+            i_minus_q[i][index[dst]] -= journeys / outbound[i]
+
+    fundamental = _invert(i_minus_q)
+    if fundamental is None:
+        return None, "Markov chain has no exit from some channels; cannot compute removal effects"
+    convert_from = [sum(f * r for f, r in zip(row, to_conversion)) for row in fundamental]
+    base = convert_from[0]
+    if base <= 0:
+        return None, "Conversion probability is zero; cannot compute removal effects"
+
+    effects = {}
+    for channel in channels:
+        c = index[channel]
+        reach = fundamental[0][c] / fundamental[c][c] if fundamental[c][c] else 0.0
+        effects[channel] = max(0.0, min(1.0, reach * convert_from[c] / base))
+    total = sum(effects.values())
+    weights = {ch: (e / total if total else 1.0 / len(channels)) for ch, e in effects.items()}
+    return {
+        "weights": weights,
+        "base_conversion_probability": round(base, 6),
+        "removal_effects": {ch: round(e, 6) for ch, e in effects.items()},
+    }, None
+
+
+def shapley_attribution(agg):
+    """Exact Shapley values for the conversion-rate coalition game.
+
+    v(S) is the conversion rate of journeys that touched only channels in S.
+    Journey and conversion counts per channel set are summed over all subsets
+    once (subset-sum table over bitmasks), so every coalition value is a
+    lookup when the 2^(n-1) marginal contributions per channel are taken.
+    """
+    channels = sorted(agg.channels)
+    n = len(channels)
+    if n > SHAPLEY_MAX_CHANNELS:
+        return None, (f"Shapley attribution enumerates 2^n coalitions and supports up to "
+                      f"{SHAPLEY_MAX_CHANNELS} channels ({n} found). Use --attribution markov.")
+    bit = {ch: 1 << i for i, ch in enumerate(channels)}
+    size = 1 << n
+    journeys = [0.0] * size
+    conversions = [0.0] * size
+    for members, (j, c) in agg.coalitions.items():
+        mask = sum(bit[ch] for ch in members)
+        journeys[mask] += j
+        conversions[mask] += c
+    for i in range(n):
+        b = 1 << i
+        for mask in range(size):
+            if mask & b:
+                journeys[mask] += journeys[mask ^ b]
+                conversions[mask] += conversions[mask ^ b]
+    value = [c / j if j else 0.0 for c, j in zip(conversions, journeys)]
+
+    coeff = [math.factorial(k) * math.factorial(n - k - 1) / math.factorial(n) for k in range(n)]
+    phi = [0.0] * n
+    for mask in range(size):
+        k = bin(mask).count("1")
+        if k == n:
+            continue
+        base = value[mask]
+        w = coeff[k]
+        for i in range(n):
+            if not mask & (1 << i):
+                phi[i] += w * (value[mask | (1 << i)] - base)
+
+    positive = [max(0.0, p) for p in phi]
+    total = sum(positive)
+    weights = {ch: (p / total if total else 1.0 / n) for ch, p in zip(channels, positive)}
+    return {
+        "weights": weights,
+        "coalitions_observed": len(agg.coalitions),
+        "shapley_values": {ch: round(p, 6) for ch, p in zip(channels, phi)},
+    }, None
+
+
+def path_attribution(agg, model):
+    """Channel weights (name -> share of conversions) from aggregated paths."""
+    if model == "markov":
+        return markov_attribution(agg)
+    if model == "shapley":
+        return shapley_attribution(agg)
+    credit = agg.rule_credit
+    total = sum(credit.values())
+    return {"weights": {ch: c / total for ch, c in sorted(credit.items())}}, None
+
+
+def attribute_channels(channels, weights, agg):
+    """Channel dicts with conversions and revenue re-attributed from paths.
+
+    Conversions are the path conversions times each channel's weight; revenue
+    is the path conversion value (or, when the file carries none, the
+    reported channel revenue total) times the weight. Channels seen in paths
+    but absent from the channel data are added with zero spend.
+    """
+    reported_revenue = sum(ch["revenue"] for ch in channels)
+    total_value = agg.value if agg.value > 0 else reported_revenue
+    attributed = []
+    for ch in channels + [{"name": name, "spend": 0, "conversions": 0, "revenue": 0}
+                          for name in sorted(set(weights) - {c["name"] for c in channels})]:
+        w = weights.get(ch["name"], 0.0)
+        attributed.append(dict(
+            ch,
+            conversions=round(agg.conversions * w, 2),
+            revenue=round(total_value * w, 2),
+            reported_conversions=ch["conversions"],
+            reported_revenue=ch["revenue"],
+        ))
+    return attributed, [weights.get(ch["name"], 0.0) for ch in attributed]
+
+
 # ---------------------------------------------------------------------------
 # Metric calculations
 # ---------------------------------------------------------------------------
@@ -99,6 +459,9 @@ def calculate_channel_metrics(channel, total_revenue, ltv=None):
         "contribution_percent": round(contribution, 2),
         "ltv_cac_ratio": None,
     }
+    if "reported_conversions" in channel:
+        result["reported_conversions"] = channel["reported_conversions"]
+        result["reported_revenue"] = channel["reported_revenue"]
 
     if ltv is not None and cpa is not None and cpa > 0:
         result["ltv_cac_ratio"] = round(ltv / cpa, 2)
@@ -275,6 +638,11 @@ def main():
         "--ltv", type=float, default=None,
         help="Average customer lifetime value (enables LTV:CAC ratio)",
     )
+    parser.add_argument(
+        "--paths", default=None,
+        help="CSV, JSONL or JSON-array file of customer journey paths; re-attributes channel conversions "
+             "and revenue from the paths (required for markov and shapley)",
+    )
     args = parser.parse_args()
 
     # --- Load and validate ---
@@ -289,6 +657,26 @@ def main():
         print()
         return
 
+    if args.attribution in PATH_MODELS and not args.paths:
+        json.dump({"error": f"--attribution {args.attribution} requires --paths"}, sys.stdout, indent=2)
+        print()
+        return
+
+    # --- Path-level attribution ---
+    path_summary = None
+    if args.paths:
+        agg, err = aggregate_paths(args.paths, args.attribution)
+        if not err:
+            result, err = path_attribution(agg, args.attribution)
+        if err:
+            json.dump({"error": err}, sys.stdout, indent=2)
+            print()
+            return
+        channels, weights = attribute_channels(channels, result.pop("weights"), agg)
+        path_summary = {**agg.stats(), **result}
+    else:
+        weights = apply_attribution(channels, args.attribution)
+
     # --- Compute per-channel metrics ---
     total_revenue = sum(ch["revenue"] for ch in channels)
     channel_metrics = [
@@ -297,7 +685,6 @@ def main():
     ]
 
     # --- Attribution weights ---
-    weights = apply_attribution(channels, args.attribution)
     for i, cm in enumerate(channel_metrics):
         cm["attribution_weight"] = round(weights[i], 4)
 
@@ -312,6 +699,8 @@ def main():
     if args.period:
         output["period"] = args.period
     output["attribution_model"] = args.attribution
+    if path_summary:
+        output["path_attribution"] = path_summary
     output["channels"] = channel_metrics
     output["summary"] = summary
     output["recommendations"] = recommendations
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+scorer-daemon.py
+================
+Long-running local scoring service for brand-voice-scorer.py and
+content-scorer.py.
+
+Both scorers spend most of a short run importing NLTK, checking tokenizer
+data and loading the punkt model. The daemon imports each scorer once and
+keeps the tokenizers, indicator word sets and brand profiles warm, so a
+social post scores in milliseconds instead of paying the cold start.
+
+The scorer CLIs try the daemon automatically (through scorer_client.py)
+when its socket exists and fall back to their normal in-process behaviour
+when it is not running (or when --no-daemon is passed).
+
+Dependencies: stdlib only (json, sys, os, argparse, pathlib, socket,
+              socketserver, subprocess, threading, importlib, io,
+              contextlib, time). The scorers themselves need nltk/textstat.
+
+Protocol (JSON lines, one request per line, over the Unix socket or stdio):
+    {"id": 1, "method": "brand_voice.score", "params": {"brand": "acme", "text": "..."}}
+    {"id": 2, "method": "content.score", "params": {"text": "...", "content_type": "social", "keyword": null}}
+    {"id": 3, "method": "ping"}
+    {"id": 4, "method": "shutdown"}
+  Replies: {"id": 1, "result": {...}} or {"id": 1, "error": "..."}
+
+Usage:
+    python scorer-daemon.py --action start      # detach and serve on the socket
+    python scorer-daemon.py --action status
+    python scorer-daemon.py --action stop
+    python scorer-daemon.py --action serve      # serve on the socket in the foreground
+    python scorer-daemon.py --action stdio      # serve JSON lines on stdin/stdout
+
+Socket:
+    ~/.claude-marketing/scorer-daemon.sock
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import scorer_client
+from scorer_client import SOCKET_PATH
+
+MEMORY_ROOT = Path.home() / ".claude-marketing"
+BRANDS_DIR = MEMORY_ROOT / "brands"
+SCRIPTS_DIR = Path(__file__).resolve().parent
+START_TIMEOUT = 30  # seconds to wait for a detached daemon to come up
+
+SCORER_SCRIPTS = {
+    "brand_voice": "brand-voice-scorer.py",
+    "content": "content-scorer.py",
+}
+
+
+# ---------------------------------------------------------------------------
+# Warm state
+# ---------------------------------------------------------------------------
+
+class ScorerState:
+    """Scorer modules and brand profiles kept loaded for the daemon's life."""
+
+    def __init__(self):
+        self.modules = {}   # key -> module
+        self.errors = {}    # key -> fallback dict / error string
+        self.profiles = {}  # slug -> (mtime, normalized profile)
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0
+
+    def load(self):
+        """Import every scorer once; missing dependencies are recorded."""
+        for key, script in SCORER_SCRIPTS.items():
+            module_name = "_dm_" + Path(script).stem.replace("-", "_")
+            captured = io.StringIO()
+            try:
+                spec = importlib.util.spec_from_file_location(
+                    module_name, SCRIPTS_DIR / script,
+                )
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_name] = module
+                with contextlib.redirect_stdout(captured):
+                    spec.loader.exec_module(module)
+                self.modules[key] = module
+            except SystemExit:
+                sys.modules.pop(module_name, None)
+                try:
+                    self.errors[key] = json.loads(captured.getvalue())
+                except (json.JSONDecodeError, TypeError):
+                    self.errors[key] = f"{script} exited during import"
+            except Exception as exc:
+                sys.modules.pop(module_name, None)
+                self.errors[key] = f"Failed to import {script}: {exc}"
+
+        # Force the punkt model into memory now rather than on first request
+        content = self.modules.get("content")
+        if content is not None:
+            content.sent_tokenize("Warm up. Tokenizer.")
+
+    def profile(self, slug):
+        """Return a normalized brand profile, reloaded when the file changes."""
+        module = self.modules["brand_voice"]
+        profile_path = BRANDS_DIR / slug / "profile.json"
+        try:
+            mtime = profile_path.stat().st_mtime
+        except OSError:
+            mtime = None
+        with self.lock:
+            cached = self.profiles.get(slug)
+            if cached and cached[0] == mtime and mtime is not None:
+                return cached[1]
+        profile = module.load_brand_profile(slug)
+        if "error" not in profile:
+            with self.lock:
+                self.profiles[slug] = (mtime, profile)
+        return profile
+
+
+# ---------------------------------------------------------------------------
+# Request handling
+# ---------------------------------------------------------------------------
+
+def _require(state, key):
+    """Return the loaded scorer module or raise with its fallback reason."""
+    module = state.modules.get(key)
+    if module is None:
+        reason = state.errors.get(key, "not loaded")
+        if isinstance(reason, dict):
+            reason = reason.get("message", "missing dependency")
+        raise RuntimeError(f"{SCORER_SCRIPTS[key]} unavailable: {reason}")
+    return module
+
+
+def handle_request(state, request):
+    """Dispatch one decoded request and return the reply dict."""
+    req_id = request.get("id")
+    method = request.get("method")
+    params = request.get("params") or {}
+    state.requests += 1
+
+    try:
+        if method == "ping":
+            result = {
+                "status": "ok",
+                "pid": os.getpid(),
+                "uptime_seconds": round(time.time() - state.started_at, 1),
+                "requests_served": state.requests,
+                "loaded": sorted(state.modules),
+                "unavailable": sorted(state.errors),
+                "cached_profiles": sorted(state.profiles),
+            }
+        elif method == "brand_voice.score":
+            module = _require(state, "brand_voice")
+            profile = state.profile(params["brand"])
+            if "error" in profile:
+                return {"id": req_id, "error": profile["error"]}
+            result = module.score_content(params["text"], profile)
+        elif method == "content.score":
+            module = _require(state, "content")
+            result = module.score_content(
+                params["text"],
+                params.get("content_type", "blog"),
+                params.get("keyword"),
+            )
+        elif method == "shutdown":
+            result = {"status": "stopping"}
+        else:
+            return {"id": req_id, "error": f"Unknown method: {method}"}
+    except KeyError as exc:
+        return {"id": req_id, "error": f"Missing parameter: {exc.args[0]}"}
+    except Exception as exc:
+        return {"id": req_id, "error": f"{type(exc).__name__}: {exc}"}
+
+    if isinstance(result, dict) and "error" in result:
+        return {"id": req_id, "error": result["error"], "result": result}
+    return {"id": req_id, "result": result}
+
+
+def _serve_lines(state, reader, writer):
+    """Answer JSON-line requests until EOF. Returns True on shutdown."""
+    for line in reader:
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as exc:
+            request = None
+            reply = {"id": None, "error": f"Invalid JSON: {exc}"}
+        else:
+            if isinstance(request, dict):
+                reply = handle_request(state, request)
+            else:
+                reply = {"id": None, "error": "Request must be a JSON object"}
+        writer.write(json.dumps(reply) + "\n")
+        writer.flush()
+        if isinstance(request, dict) and request.get("method") == "shutdown":
+            return True
+    return False
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        reader = io.TextIOWrapper(self.rfile, encoding="utf-8")
+        writer = io.TextIOWrapper(self.wfile, encoding="utf-8")
+        if _serve_lines(self.server.state, reader, writer):
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+# ---------------------------------------------------------------------------
+# Actions
+# ---------------------------------------------------------------------------
+
+def action_serve():
+    """Serve on the Unix socket in the foreground until shutdown."""
+    if not hasattr(socket, "AF_UNIX"):
+        return {"error": "Unix sockets are not available on this platform. Use --action stdio."}
+    if scorer_client.request("ping", timeout=1):
+        return {"error": f"Scorer daemon already running on {SOCKET_PATH}"}
+
+    state = ScorerState()
+    state.load()
+
+    MEMORY_ROOT.mkdir(parents=True, exist_ok=True)
+    if SOCKET_PATH.exists():
+        SOCKET_PATH.unlink()  # stale socket from a crashed daemon
+    server = _Server(str(SOCKET_PATH), _Handler)
+    server.state = state
+    os.chmod(SOCKET_PATH, 0o600)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        with contextlib.suppress(OSError):
+            SOCKET_PATH.unlink()
+    return {"status": "stopped", "requests_served": state.requests}
+
+
+def action_start():
+    """Launch a detached daemon and wait until it answers a ping."""
+    reply = scorer_client.request("ping", timeout=1)
+    if reply:
+        return {"status": "already_running", **reply.get("result", {})}
+
+    log_path = MEMORY_ROOT / "scorer-daemon.log"
+    MEMORY_ROOT.mkdir(parents=True, exist_ok=True)
+    with open(log_path, "a", encoding="utf-8") as log:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--action", "serve"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        reply = scorer_client.request("ping", timeout=1)
+        if reply:
+            return {"status": "started", "socket": str(SOCKET_PATH), **reply.get("result", {})}
+        time.sleep(0.1)
+    return {"error": f"Scorer daemon did not start within {START_TIMEOUT}s. See {log_path}"}
+
+
+def action_status():
+    reply = scorer_client.request("ping", timeout=1)
+    if not reply:
+        return {"status": "not_running", "socket": str(SOCKET_PATH)}
+    return {"status": "running", "socket": str(SOCKET_PATH), **reply.get("result", {})}
+
+
+def action_stop():
+    reply = scorer_client.request("shutdown", timeout=2)
+    if not reply:
+        return {"status": "not_running"}
+    return {"status": "stopped"}
+
+
+def action_stdio():
+    """Serve JSON-line requests on stdin/stdout (for a parent process)."""
+    state = ScorerState()
+    with contextlib.redirect_stdout(sys.stderr):
+        state.load()
+    _serve_lines(state, sys.stdin, sys.stdout)
+    return None
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+ACTION_DISPATCH = {
+    "start": action_start,
+    "stop": action_stop,
+    "status": action_status,
+    "serve": action_serve,
+    "stdio": action_stdio,
+}
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Warm scoring service for brand-voice and content scoring.",
+        epilog=(
+            "Actions:\n"
+            "  start   Launch a detached daemon on the Unix socket\n"
+            "  stop    Ask a running daemon to shut down\n"
+            "  status  Report whether the daemon is running\n"
+            "  serve   Serve on the Unix socket in the foreground\n"
+            "  stdio   Serve JSON-line requests on stdin/stdout\n"
+            "\n"
+            "While the daemon is running, brand-voice-scorer.py and\n"
+            "content-scorer.py route requests to it automatically.\n"
+            "\n"
+            "Examples:\n"
+            "  python scorer-daemon.py --action start\n"
+            "  python brand-voice-scorer.py --brand acme --text \"New drop!\"\n"
+            "  python scorer-daemon.py --action stop\n"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--action", required=True, choices=list(ACTION_DISPATCH),
+        help="Action to perform.",
+    )
+    return parser
+
+
+def main():
+    parser = build_parser()
+    args = parser.parse_args()
+
+    result = ACTION_DISPATCH[args.action]()
+    if result is None:
+        return
+    print(json.dumps(result, indent=2))
+    if "error" in result:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
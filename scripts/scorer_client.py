@@ -0,0 +1,102 @@
+"""
+scorer_client.py
+================
+Shared client for scorer-daemon.py, used by brand-voice-scorer.py,
+content-scorer.py and the daemon's own start/status/stop actions.
+
+- request(method, params): one JSON-lines request over the daemon's Unix
+  socket; the raw reply, or None when the daemon is not reachable
+- score(method, params): the reply's result, or None when the daemon is not
+  reachable or answered with an error
+- fast_path(method, fields, required, choices): the scorers' pre-import fast
+  path. Parses just the flags the daemon needs, validates them the way the
+  scorer's argparse parser would, prints the daemon's result and exits, or
+  returns so the scorer runs its normal CLI (which then reports any usage
+  error with its own messages and exit codes)
+
+Dependencies: stdlib only (argparse, json, socket, sys, pathlib)
+
+Usage (at the top of a scorer, before its heavy imports):
+    import scorer_client
+
+    if __name__ == "__main__":
+        scorer_client.fast_path("brand_voice.score", {"--brand": "brand"}, required=("brand",))
+"""
+
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+
+SOCKET_PATH = Path.home() / ".claude-marketing" / "scorer-daemon.sock"
+CLIENT_TIMEOUT = 5  # seconds
+
+
+def request(method, params=None, timeout=CLIENT_TIMEOUT):
+    """Send one request to the running daemon. Returns the reply or None."""
+    if not hasattr(socket, "AF_UNIX") or not SOCKET_PATH.exists():
+        return None
+    message = {"id": 1, "method": method, "params": params or {}}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(SOCKET_PATH))
+            sock.sendall((json.dumps(message) + "\n").encode("utf-8"))
+            with sock.makefile("r", encoding="utf-8") as fh:
+                return json.loads(fh.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def score(method, params, timeout=CLIENT_TIMEOUT):
+    """The daemon's result for one request, or None if unavailable or it failed."""
+    reply = request(method, params, timeout)
+    # Errors are left to the normal CLI path so messages and exit codes match
+    if not isinstance(reply, dict) or "error" in reply:
+        return None
+    return reply.get("result")
+
+
+def fast_path(method, fields, required=(), choices=None, argv=None):
+    """Score through the daemon and exit, or return to run the full CLI.
+
+    fields maps the scorer's flags to the request params they fill (besides
+    "text", which comes from --text or --file). Only a request the scorer's
+    own parser would accept is sent: every required param present, values
+    within choices, and exactly one of --text/--file.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if "-h" in argv or "--help" in argv:
+        return
+    pre = argparse.ArgumentParser(add_help=False)
+    for flag, dest in fields.items():
+        pre.add_argument(flag, dest=dest)
+    pre.add_argument("--text")
+    pre.add_argument("--file")
+    pre.add_argument("--no-daemon", action="store_true")
+    try:
+        args, _ = pre.parse_known_args(argv)
+    except SystemExit:  # malformed flags: let the scorer's parser report them
+        return
+    if args.no_daemon or (args.text is None) == (args.file is None):
+        return
+    if any(getattr(args, dest) is None for dest in required):
+        return
+    for dest, allowed in (choices or {}).items():
+        value = getattr(args, dest)
+        if value is not None and value not in allowed:
+            return
+    if args.text is not None:
+        text = args.text
+    else:
+        try:
+            text = Path(args.file).read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError):
+            return
+    params = {"text": text, **{dest: getattr(args, dest) for dest in fields.values()}}
+    result = score(method, params)
+    if result is None:
+        return
+    print(json.dumps(result, indent=2))
+    sys.exit(0)
@@ -28,7 +28,7 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, locked, read_json, save_json
 
 SCHEMA_TYPES = [
     "Organization", "Product", "FAQ", "HowTo", "Article",
@@ -36,14 +36,6 @@ SCHEMA_TYPES = [
 ]
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _change_id(prefix):
     """Generate a unique change ID with timestamp."""
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -52,18 +44,12 @@ def _change_id(prefix):
 
 def _load_json(path):
     """Safely load a JSON file, returning empty list on failure."""
-    if not path.exists():
-        return []
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return []
+    return load_json(path, [])
 
 
 def _save_json(path, data):
     """Write JSON data to file, creating parent dirs as needed."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    save_json(path, data)
 
 
 def update_meta(slug, url, title=None, description=None,
@@ -85,7 +71,7 @@ def update_meta(slug, url, title=None, description=None,
     old_values = None
     for fp in changes_dir.glob("meta-*.json"):
         try:
-            existing = json.loads(fp.read_text(encoding="utf-8"))
+            existing = read_json(fp)
             if existing.get("url") == url and existing.get("status") == "completed":
                 old_values = {
                     "title": existing.get("new_title"),
@@ -181,7 +167,7 @@ def create_redirect(slug, source_url, target_url, redirect_type):
     existing_redirects = {}
     for fp in redirects_dir.glob("redirect-*.json"):
         try:
-            r = json.loads(fp.read_text(encoding="utf-8"))
+            r = read_json(fp)
             existing_redirects[r.get("source_url")] = r.get("target_url")
         except (json.JSONDecodeError, OSError):
             continue
@@ -239,14 +225,16 @@ def submit_sitemap(slug, sitemap_url):
     seo_dir = brand_dir / "seo"
     seo_dir.mkdir(parents=True, exist_ok=True)
 
-    submissions = _load_json(seo_dir / "sitemap-submissions.json")
+    submissions_path = seo_dir / "sitemap-submissions.json"
     entry = {
         "sitemap_url": sitemap_url,
         "status": "pending",
         "submitted_at": datetime.now().isoformat(),
     }
-    submissions.append(entry)
-    _save_json(seo_dir / "sitemap-submissions.json", submissions)
+    with locked(submissions_path):
+        submissions = _load_json(submissions_path)
+        submissions.append(entry)
+        _save_json(submissions_path, submissions)
 
     return {"status": "recorded", "sitemap_url": sitemap_url, "total_submissions": len(submissions)}
 
@@ -339,7 +327,7 @@ def get_status(slug, status_filter="all"):
             if fp.name.startswith("_"):
                 continue
             try:
-                record = json.loads(fp.read_text(encoding="utf-8"))
+                record = read_json(fp)
                 changes.append(record)
             except (json.JSONDecodeError, OSError):
                 continue
@@ -370,7 +358,7 @@ def complete_change(slug, change_id):
             if fp.name.startswith("_"):
                 continue
             try:
-                record = json.loads(fp.read_text(encoding="utf-8"))
+                record = read_json(fp)
                 rid = (record.get("change_id") or record.get("deployment_id")
                        or record.get("redirect_id") or record.get("request_id"))
                 if rid == change_id:
@@ -39,6 +39,8 @@ FULL_DEPS = LITE_DEPS + [
     # AI visibility checking (ai-visibility-checker.py --mode api)
     "openai>=1.0",
     "anthropic>=0.40",
+    # Vectorized simulation engines (revenue-simulator.py, journey-engine.py)
+    "numpy>=1.24",
 ]
 
 
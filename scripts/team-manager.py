@@ -25,9 +25,8 @@ import json
 import sys
 import uuid
 from datetime import datetime, timezone
-from pathlib import Path
 
-BRANDS_DIR = Path.home() / ".claude-marketing" / "brands"
+from brand_store import get_brand_dir, load_json, locked, read_json, save_json
 
 VALID_ROLES = [
     "content-lead", "media-buyer", "email-manager", "social-manager",
@@ -56,20 +55,12 @@ def _now_iso():
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def get_brand_dir(slug):
-    """Get and validate brand directory."""
-    brand_dir = BRANDS_DIR / slug
-    if not brand_dir.exists():
-        return None, f"Brand '{slug}' not found. Run /dm:brand-setup first."
-    return brand_dir, None
-
-
 def _load_json(path):
     """Load a JSON file, returning (data, err)."""
     if not path.exists():
         return None, f"File not found: {path.name}"
     try:
-        return json.loads(path.read_text(encoding="utf-8")), None
+        return read_json(path), None
     except json.JSONDecodeError:
         return None, f"Corrupted JSON: {path.name}"
 
@@ -85,21 +76,17 @@ def _risk_index(level):
 def _update_roster(team_dir, member_id, action="add", summary=None):
     """Add or remove a member from the _roster.json index."""
     roster_path = team_dir / "_roster.json"
-    roster = []
-    if roster_path.exists():
-        try:
-            roster = json.loads(roster_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            roster = []
+    with locked(roster_path):
+        roster = load_json(roster_path, [])
 
-    if action == "remove":
-        roster = [m for m in roster if m.get("member_id") != member_id]
-    elif action == "add" and summary:
-        # Remove existing entry first to avoid duplicates
-        roster = [m for m in roster if m.get("member_id") != member_id]
-        roster.append(summary)
+        if action == "remove":
+            roster = [m for m in roster if m.get("member_id") != member_id]
+        elif action == "add" and summary:
+            # Remove existing entry first to avoid duplicates
+            roster = [m for m in roster if m.get("member_id") != member_id]
+            roster.append(summary)
 
-    roster_path.write_text(json.dumps(roster, indent=2), encoding="utf-8")
+        save_json(roster_path, roster)
 
 
 def add_member(slug, data):
@@ -141,7 +128,7 @@ def add_member(slug, data):
     }
 
     filepath = team_dir / f"{member_id}.json"
-    filepath.write_text(json.dumps(member, indent=2), encoding="utf-8")
+    save_json(filepath, member)
 
     # Update roster index
     _update_roster(team_dir, member_id, "add", {
@@ -241,7 +228,7 @@ def update_role(slug, member_id, data):
         member["permissions"] = data["permissions"]
 
     member["updated_at"] = _now_iso()
-    filepath.write_text(json.dumps(member, indent=2), encoding="utf-8")
+    save_json(filepath, member)
 
     # Update roster
     _update_roster(team_dir, member_id, "add", {
@@ -371,7 +358,7 @@ def assign_task(slug, data):
     cap["current_tasks"] = cap.get("current_tasks", 0) + 1
     member["capacity"] = cap
     member["updated_at"] = _now_iso()
-    member_path.write_text(json.dumps(member, indent=2), encoding="utf-8")
+    save_json(member_path, member)
 
     # Save assignment
     assignments_dir = team_dir / "assignments"
@@ -392,7 +379,7 @@ def assign_task(slug, data):
     }
 
     filepath = assignments_dir / f"{assignment_id}.json"
-    filepath.write_text(json.dumps(assignment, indent=2), encoding="utf-8")
+    save_json(filepath, assignment)
 
     return {
         "status": "assigned",
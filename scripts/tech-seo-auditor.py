@@ -6,26 +6,41 @@ status codes, redirect chains, meta tags, HTTP headers, security posture, and
 speed hints. Returns a per-URL score (0-100) with categorized issues and an
 aggregate summary.
 
+Crawl mode (--concurrency > 1) audits URLs on a thread pool sharing
+keep-alive connections per host, with at most --per-host requests in flight
+to any one host and --delay seconds between request starts to it. The same
+check_* functions score every page. --sitemap ingests a sitemap.xml (or a
+sitemap index / .xml.gz) as the URL list, and --jsonl streams results as
+they finish followed by a {"summary": ...} line. Plain http:// URLs work, so
+a local stand-in server (python -m http.server) can be crawled for testing.
+
 Dependencies: none (stdlib only)
 
 Usage:
     python tech-seo-auditor.py --url "https://example.com"
     python tech-seo-auditor.py --urls '["https://example.com", "https://example.org"]'
     python tech-seo-auditor.py --file urls.txt --checks status,meta,security --timeout 15
+    python tech-seo-auditor.py --sitemap https://example.com/sitemap.xml --concurrency 16 --jsonl > audit.jsonl
+    python tech-seo-auditor.py --sitemap sitemap.xml --max-urls 500 --concurrency 8 --per-host 2 --delay 0.5
 """
 
 import argparse
+import contextlib
 import gzip
+import http.client
 import io
 import json
 import sys
+import threading
 import time
 import ssl
+import xml.etree.ElementTree as ET
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from html.parser import HTMLParser
 from pathlib import Path
-from urllib.request import Request, urlopen
+from urllib.request import HTTPRedirectHandler, Request, build_opener, urlopen
 from urllib.error import HTTPError, URLError
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -33,6 +48,10 @@ from urllib.parse import urlparse
 
 ALL_CHECKS = {"status", "redirects", "meta", "headers", "security", "speed_hints"}
 MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+DEFAULT_PER_HOST = 4     # concurrent requests per host in crawl mode
+DEFAULT_DELAY = 0.1      # seconds between request starts to the same host
+MAX_SITEMAPS = 1000      # sitemap files read when following sitemap indexes
 USER_AGENT = "TechSEOAuditor/1.0 (+https://github.com/indranilbanerjee/digital-marketing-pro)"
 
 
@@ -100,6 +119,16 @@ def _decompress_body(body, headers):
     return body
 
 
+class _NoRedirectHandler(HTTPRedirectHandler):
+    """Surface 3xx responses as HTTPError so each hop can be recorded."""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+_NO_REDIRECT_OPENER = build_opener(_NoRedirectHandler)
+
+
 def follow_redirects(url, timeout):
     """Manually follow redirects, recording each hop.
 
@@ -116,14 +145,8 @@ def follow_redirects(url, timeout):
 
         req = _build_request(current_url, timeout)
         try:
-            # Use a custom opener that does NOT auto-follow redirects
-            import urllib.request as _ur
-            class NoRedirectHandler(_ur.HTTPRedirectHandler):
-                def redirect_request(self, req, fp, code, msg, headers, newurl):
-                    return None
-            opener = _ur.build_opener(NoRedirectHandler)
             start = time.monotonic()
-            resp = opener.open(req, timeout=timeout)
+            resp = _NO_REDIRECT_OPENER.open(req, timeout=timeout)
             ttfb_ms = round((time.monotonic() - start) * 1000)
             status = resp.getcode()
             headers = {k.lower(): v for k, v in resp.getheaders()}
@@ -134,7 +157,7 @@ def follow_redirects(url, timeout):
             ttfb_ms = 0
             status = exc.code
             headers = {k.lower(): v for k, v in exc.headers.items()}
-            if status in (301, 302, 303, 307, 308):
+            if status in REDIRECT_CODES:
                 location = headers.get("location", "")
                 if not location:
                     return current_url, status, hops, headers, b"", ttfb_ms, "Redirect without Location header"
@@ -186,6 +209,265 @@ def fetch_url(url, timeout):
     }
 
 
+# ---------------------------------------------------------------------------
+# Concurrent crawl (--concurrency > 1)
+# ---------------------------------------------------------------------------
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections per (scheme, host, port), shared by threads.
+
+    urllib sends "Connection: close" and opens a socket per request; the pool
+    reuses idle connections instead, so a crawl of one site pays the TCP/TLS
+    handshake once per worker rather than once per URL and redirect hop.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+        self.opened = 0
+        self.reused = 0
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop(), True
+            self.opened += 1
+        scheme, host, port = key
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return conn, False
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def get(self, url):
+        """GET url on a pooled connection.
+
+        Returns (status, headers, raw_body, ttfb_ms) with lower-cased header names.
+        """
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"unknown url type: {url!r}")
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip, br"}
+
+        while True:
+            conn, reused = self._checkout(key)
+            try:
+                start = time.monotonic()
+                conn.request("GET", path, headers=request_headers)
+                resp = conn.getresponse()
+                ttfb_ms = round((time.monotonic() - start) * 1000)
+                body = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if reused:
+                    continue  # the server dropped an idle keep-alive socket; retry fresh
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            headers = {k.lower(): v for k, v in resp.getheaders()}
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return resp.status, headers, body, ttfb_ms
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class HostThrottle:
+    """Per-host concurrency limit plus a minimum gap between request starts."""
+
+    def __init__(self, per_host, delay):
+        self.per_host = max(1, per_host)
+        self.delay = max(0.0, delay)
+        self._slots = {}
+        self._next_start = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def slot(self, host):
+        with self._lock:
+            sem = self._slots.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        sem.acquire()
+        try:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay
+            if start > now:
+                time.sleep(start - now)
+            yield
+        finally:
+            sem.release()
+
+
+class Crawler:
+    """fetch_url() equivalent over a ConnectionPool, throttled per host."""
+
+    def __init__(self, timeout, per_host=DEFAULT_PER_HOST, delay=DEFAULT_DELAY):
+        self.pool = ConnectionPool(timeout)
+        self.throttle = HostThrottle(per_host, delay)
+
+    def follow_redirects(self, url):
+        """Same contract and return tuple as the module-level follow_redirects()."""
+        hops = []
+        current_url = url
+        visited = set()
+
+        for _ in range(MAX_REDIRECTS):
+            if current_url in visited:
+                return current_url, None, hops, {}, b"", 0, "Redirect loop detected"
+            visited.add(current_url)
+
+            try:
+                with self.throttle.slot(urlsplit(current_url).netloc):
+                    status, headers, raw, ttfb_ms = self.pool.get(current_url)
+            except Exception as exc:
+                return current_url, None, hops, {}, b"", 0, str(exc)
+
+            if status in REDIRECT_CODES:
+                location = headers.get("location", "")
+                if not location:
+                    return current_url, status, hops, headers, b"", 0, "Redirect without Location header"
+                location = urljoin(current_url, location)
+                hops.append({"from": current_url, "to": location, "status": status})
+                current_url = location
+                continue
+
+            # urllib reports non-2xx responses through HTTPError without a
+            # timing; keep that so both modes score speed hints identically.
+            if not 200 <= status < 300:
+                ttfb_ms = 0
+            return current_url, status, hops, headers, _decompress_body(raw, headers), ttfb_ms, None
+
+        return current_url, None, hops, {}, b"", 0, f"Too many redirects (>{MAX_REDIRECTS})"
+
+    def fetch(self, url):
+        final_url, status, hops, headers, body, ttfb_ms, error = self.follow_redirects(url)
+        return {
+            "final_url": final_url,
+            "status_code": status,
+            "hops": hops,
+            "headers": headers,
+            "body": body,
+            "ttfb_ms": ttfb_ms,
+            "error": error,
+        }
+
+    def close(self):
+        self.pool.close()
+
+
+def crawl(urls, checks, timeout, concurrency, per_host=DEFAULT_PER_HOST, delay=DEFAULT_DELAY):
+    """Audit urls across a thread pool, yielding (position, result) as each finishes.
+
+    At most concurrency * 4 audits are queued at once, so a large sitemap
+    does not materialise every pending future up front.
+    """
+    crawler = Crawler(timeout, per_host, delay)
+    max_in_flight = concurrency * 4
+
+    def _audit(position, url):
+        try:
+            return position, audit_url(url, checks, timeout, fetch=crawler.fetch)
+        except Exception as exc:
+            return position, _failed_result(url, exc)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            pending = set()
+            for position, url in enumerate(urls):
+                pending.add(pool.submit(_audit, position, url))
+                if len(pending) >= max_in_flight:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in as_completed(pending):
+                yield future.result()
+    finally:
+        crawler.close()
+
+
+# ---------------------------------------------------------------------------
+# Sitemap ingestion
+# ---------------------------------------------------------------------------
+
+def _xml_locs(xml_bytes):
+    """Return ("urlset"|"sitemapindex", [loc, ...]) from a sitemap document."""
+    if xml_bytes[:2] == b"\x1f\x8b":
+        xml_bytes = gzip.decompress(xml_bytes)
+    root = ET.fromstring(xml_bytes)
+    kind = root.tag.rsplit("}", 1)[-1]
+    locs = []
+    for elem in root.iter():
+        if elem.tag.rsplit("}", 1)[-1] == "loc" and elem.text and elem.text.strip():
+            locs.append(elem.text.strip())
+    return kind, locs
+
+
+def load_sitemap(source, timeout, max_urls=None):
+    """Collect page URLs from a sitemap URL or local file, following sitemap indexes.
+
+    Returns (urls, error). URLs keep sitemap order with duplicates removed.
+    """
+    queue = [source]
+    seen_sitemaps = set()
+    urls = {}
+    while queue and len(seen_sitemaps) < MAX_SITEMAPS:
+        current = queue.pop(0)
+        if current in seen_sitemaps:
+            continue
+        seen_sitemaps.add(current)
+
+        if urlparse(current).scheme in ("http", "https"):
+            data = fetch_url(current, timeout)
+            if data["status_code"] != 200:
+                reason = data["error"] or f"HTTP {data['status_code']}"
+                if current == source:
+                    return [], f"Could not fetch sitemap {current}: {reason}"
+                continue
+            raw = data["body"]
+        else:
+            try:
+                raw = Path(current).read_bytes()
+            except OSError as exc:
+                return [], f"Could not read sitemap {current}: {exc}"
+
+        try:
+            kind, locs = _xml_locs(raw)
+        except (ET.ParseError, OSError, EOFError) as exc:
+            if current == source:
+                return [], f"Invalid sitemap XML in {current}: {exc}"
+            continue
+
+        if kind == "sitemapindex":
+            queue.extend(locs)
+            continue
+        for loc in locs:
+            urls.setdefault(loc, None)
+            if max_urls and len(urls) >= max_urls:
+                return list(urls), None
+    return list(urls), None
+
+
 # ---------------------------------------------------------------------------
 # Individual check functions
 # ---------------------------------------------------------------------------
@@ -408,13 +690,17 @@ def check_speed_hints(data, issues):
 # Main audit logic
 # ---------------------------------------------------------------------------
 
-def audit_url(url, checks, timeout):
-    """Run all requested checks against a single URL and return the result dict."""
+def audit_url(url, checks, timeout, fetch=None):
+    """Run all requested checks against a single URL and return the result dict.
+
+    fetch(url) -> fetch_url()-style dict; defaults to a one-off urllib fetch.
+    Crawl mode passes Crawler.fetch to reuse pooled connections.
+    """
     issues = []
     score = 100
 
     # Fetch the URL
-    data = fetch_url(url, timeout)
+    data = fetch(url) if fetch else fetch_url(url, timeout)
 
     result = {
         "url": url,
@@ -483,6 +769,57 @@ def audit_url(url, checks, timeout):
     return result
 
 
+def _audit_sequential(urls, checks, timeout):
+    """Audit urls one at a time with plain urllib fetches."""
+    for url in urls:
+        try:
+            yield audit_url(url, checks, timeout)
+        except Exception as exc:
+            yield _failed_result(url, exc)
+
+
+def _failed_result(url, exc):
+    """Result dict for a URL whose audit raised unexpectedly."""
+    return {
+        "url": url,
+        "status_code": None,
+        "response_time_ms": 0,
+        "redirects": [],
+        "redirect_count": 0,
+        "meta": {},
+        "headers": {},
+        "security": {},
+        "speed_hints": {},
+        "issues": [{"severity": "critical", "category": "status", "message": f"Unexpected error: {exc}"}],
+        "score": 0,
+    }
+
+
+class _Summary:
+    """Running totals for the aggregate summary block."""
+
+    def __init__(self):
+        self.scores = []
+        self.severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
+
+    def add(self, result):
+        self.scores.append(result["score"])
+        for issue in result.get("issues", []):
+            sev = issue.get("severity", "low")
+            if sev in self.severity_counts:
+                self.severity_counts[sev] += 1
+
+    def as_dict(self):
+        return {
+            "urls_checked": len(self.scores),
+            "average_score": round(sum(self.scores) / max(len(self.scores), 1), 1),
+            "critical_issues": self.severity_counts["critical"],
+            "high_issues": self.severity_counts["high"],
+            "medium_issues": self.severity_counts["medium"],
+            "low_issues": self.severity_counts["low"],
+        }
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -501,6 +838,18 @@ def main():
                         help="Comma-separated checks to run (default: all). Options: status, redirects, meta, headers, security, speed_hints")
     parser.add_argument("--timeout", type=int, default=10,
                         help="Request timeout in seconds (default: 10)")
+    parser.add_argument("--sitemap", default=None,
+                        help="sitemap.xml URL or local path; sitemap indexes and .xml.gz are followed")
+    parser.add_argument("--max-urls", type=int, default=None,
+                        help="Audit at most this many URLs")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Concurrent audits; above 1 uses the pooled keep-alive crawler (default: 1)")
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST,
+                        help=f"Max concurrent requests per host in crawl mode (default: {DEFAULT_PER_HOST})")
+    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY,
+                        help=f"Seconds between request starts to the same host in crawl mode (default: {DEFAULT_DELAY})")
+    parser.add_argument("--jsonl", action="store_true",
+                        help="Stream one JSON result per line as audits finish, then a {\"summary\": ...} line")
     args = parser.parse_args()
 
     # --- Resolve URL list ---
@@ -533,9 +882,18 @@ def main():
             json.dump({"error": f"Could not read file: {exc}"}, sys.stdout, indent=2)
             print()
             sys.exit(0)
+    if args.sitemap:
+        sitemap_urls, error = load_sitemap(args.sitemap, args.timeout, args.max_urls)
+        if error:
+            json.dump({"error": error}, sys.stdout, indent=2)
+            print()
+            sys.exit(0)
+        urls.extend(sitemap_urls)
+    if args.max_urls:
+        urls = urls[:args.max_urls]
 
     if not urls:
-        json.dump({"error": "Provide at least one URL via --url, --urls, or --file"}, sys.stdout, indent=2)
+        json.dump({"error": "Provide at least one URL via --url, --urls, --file, or --sitemap"}, sys.stdout, indent=2)
         print()
         sys.exit(0)
 
@@ -551,47 +909,29 @@ def main():
             sys.exit(0)
 
     # --- Run audits ---
-    results = []
-    for url in urls:
-        try:
-            result = audit_url(url, checks, args.timeout)
-        except Exception as exc:
-            result = {
-                "url": url,
-                "status_code": None,
-                "response_time_ms": 0,
-                "redirects": [],
-                "redirect_count": 0,
-                "meta": {},
-                "headers": {},
-                "security": {},
-                "speed_hints": {},
-                "issues": [{"severity": "critical", "category": "status", "message": f"Unexpected error: {exc}"}],
-                "score": 0,
-            }
-        results.append(result)
-
-    # --- Summary ---
-    scores = [r["score"] for r in results]
-    severity_counts = {"critical": 0, "high": 0, "medium": 0, "low": 0}
-    for r in results:
-        for issue in r.get("issues", []):
-            sev = issue.get("severity", "low")
-            if sev in severity_counts:
-                severity_counts[sev] += 1
-
-    summary = {
-        "urls_checked": len(results),
-        "average_score": round(sum(scores) / max(len(scores), 1), 1),
-        "critical_issues": severity_counts["critical"],
-        "high_issues": severity_counts["high"],
-        "medium_issues": severity_counts["medium"],
-        "low_issues": severity_counts["low"],
-    }
+    summary = _Summary()
+    if args.concurrency > 1:
+        completed = crawl(urls, checks, args.timeout, args.concurrency, args.per_host, args.delay)
+    else:
+        completed = enumerate(_audit_sequential(urls, checks, args.timeout))
+
+    if args.jsonl:
+        for _, result in completed:
+            summary.add(result)
+            sys.stdout.write(json.dumps(result) + "\n")
+            sys.stdout.flush()
+        sys.stdout.write(json.dumps({"summary": summary.as_dict()}) + "\n")
+        return
+
+    results = [None] * len(urls)
+    for position, result in completed:
+        results[position] = result
+    for result in results:
+        summary.add(result)
 
     output = {
         "results": results,
-        "summary": summary,
+        "summary": summary.as_dict(),
     }
 
     json.dump(output, sys.stdout, indent=2)
@@ -1,15 +1,27 @@
 #!/usr/bin/env python3
-"""Batch UTM parameter generation with GA4 channel grouping validation."""
+"""Batch UTM parameter generation with GA4 channel grouping validation.
+
+Streaming mode (--csv with --output) reads rows lazily and writes CSV or JSONL
+as it goes, so memory stays flat for link sheets of any size. Identical
+parameter sets are built once (bounded cache keyed on the normalized tuple)
+and QR codes are rendered in a process pool straight to --qr-dir or --qr-zip.
+"""
 
 import argparse
+import base64
 import csv
+import hashlib
+import importlib.util
 import json
+import os
 import re
 import sys
-import io
-import base64
+import zipfile
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import urlencode, urlparse
+from urllib.parse import urlparse
 
 # GA4 default channel groupings and their expected source/medium patterns
 GA4_CHANNEL_RULES = {
@@ -26,7 +38,24 @@ GA4_CHANNEL_RULES = {
     "Audio": {"medium": ["audio", "podcast"]},
 }
 
+# medium -> [(channel, allowed sources or None)] in rule order, so channel
+# detection is one dict lookup instead of a scan over every rule
+_GA4_BY_MEDIUM = {}
+for _channel, _rules in GA4_CHANNEL_RULES.items():
+    _sources = frozenset(_rules["source"]) if _rules.get("source") else None
+    for _medium in _rules.get("medium", []):
+        _GA4_BY_MEDIUM.setdefault(_medium, []).append((_channel, _sources))
 
+STREAM_CACHE_SIZE = 20000       # distinct parameter sets remembered while streaming
+QR_INFLIGHT_PER_WORKER = 8      # pending QR renders per pool worker
+QR_ERROR_SAMPLES = 20           # failed QR renders listed in the streaming summary
+QR_NOTE = "Install 'qrcode' and 'Pillow' packages for QR generation"
+STREAM_FIELDS = ["row", "base_url", "tagged_url", "utm_source", "utm_medium", "utm_campaign",
+                 "utm_content", "utm_term", "ga4_channel_grouping", "warnings", "error",
+                 "duplicate_of", "qr_file"]
+
+
+@lru_cache(maxsize=65536)
 def sanitize_param(value):
     """Lowercase, replace spaces with underscores, strip non-URL-safe chars."""
     if not value:
@@ -37,6 +66,7 @@ def sanitize_param(value):
     return value
 
 
+@lru_cache(maxsize=4096)
 def validate_base_url(url):
     """Check that a URL has a scheme and netloc."""
     parsed = urlparse(url)
@@ -50,29 +80,31 @@ def validate_base_url(url):
 
 def detect_ga4_channel(source, medium):
     """Return the likely GA4 default channel grouping."""
-    for channel, rules in GA4_CHANNEL_RULES.items():
-        medium_match = medium in rules.get("medium", [])
-        source_list = rules.get("source", [])
-        if medium_match:
-            if source_list and source not in source_list:
-                continue
+    for channel, sources in _GA4_BY_MEDIUM.get(medium, ()):
+        if sources is None or source in sources:
             return channel
     return "Unassigned"
 
 
-def generate_qr(url):
-    """Return a base64-encoded PNG QR code or None if library unavailable."""
+def qr_png(url):
+    """Return PNG bytes of a QR code for url, or None if library unavailable."""
     try:
         import qrcode
         from io import BytesIO
         qr = qrcode.make(url)
         buf = BytesIO()
         qr.save(buf, format="PNG")
-        return base64.b64encode(buf.getvalue()).decode("ascii")
+        return buf.getvalue()
     except ImportError:
         return None
 
 
+def generate_qr(url):
+    """Return a base64-encoded PNG QR code or None if library unavailable."""
+    png = qr_png(url)
+    return base64.b64encode(png).decode("ascii") if png else None
+
+
 def build_utm_url(base_url, source, medium, campaign, content="", term="", with_qr=False):
     """Build a single UTM-tagged URL and return a result dict."""
     base_url, err = validate_base_url(base_url)
@@ -106,7 +138,9 @@ def build_utm_url(base_url, source, medium, campaign, content="", term="", with_
         params["utm_term"] = term
 
     separator = "&" if "?" in base_url else "?"
-    tagged_url = base_url + separator + urlencode(params) if params else base_url
+    # sanitize_param leaves only [a-z0-9_.-], which urlencode would not escape
+    query = "&".join(f"{key}={value}" for key, value in params.items())
+    tagged_url = base_url + separator + query if params else base_url
 
     channel = detect_ga4_channel(source, medium)
 
@@ -119,14 +153,30 @@ def build_utm_url(base_url, source, medium, campaign, content="", term="", with_
     if warnings:
         result["warnings"] = warnings
     if with_qr:
-        qr_data = generate_qr(tagged_url)
-        if qr_data:
-            result["qr_code_base64_png"] = qr_data
+        try:
+            qr_data = generate_qr(tagged_url)
+        except Exception as e:  # e.g. qrcode's DataOverflowError for very long URLs
+            result["qr_code_error"] = f"QR generation failed: {e}"
         else:
-            result["qr_code_note"] = "Install 'qrcode' and 'Pillow' packages for QR generation"
+            if qr_data:
+                result["qr_code_base64_png"] = qr_data
+            else:
+                result["qr_code_note"] = QR_NOTE
     return result
 
 
+def _row_args(row):
+    """build_utm_url keyword arguments from a CSV row (either column naming)."""
+    return {
+        "base_url": row.get("base_url", row.get("url", "")),
+        "source": row.get("source", row.get("utm_source", "")),
+        "medium": row.get("medium", row.get("utm_medium", "")),
+        "campaign": row.get("campaign", row.get("utm_campaign", "")),
+        "content": row.get("content", row.get("utm_content", "")),
+        "term": row.get("term", row.get("utm_term", "")),
+    }
+
+
 def process_csv(filepath, with_qr=False):
     """Read a CSV with columns: base_url, source, medium, campaign, content, term."""
     path = Path(filepath)
@@ -137,15 +187,7 @@ def process_csv(filepath, with_qr=False):
         with open(path, newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             for i, row in enumerate(reader):
-                r = build_utm_url(
-                    base_url=row.get("base_url", row.get("url", "")),
-                    source=row.get("source", row.get("utm_source", "")),
-                    medium=row.get("medium", row.get("utm_medium", "")),
-                    campaign=row.get("campaign", row.get("utm_campaign", "")),
-                    content=row.get("content", row.get("utm_content", "")),
-                    term=row.get("term", row.get("utm_term", "")),
-                    with_qr=with_qr,
-                )
+                r = build_utm_url(**_row_args(row), with_qr=with_qr)
                 r["row"] = i + 1
                 results.append(r)
     except Exception as e:
@@ -153,6 +195,196 @@ def process_csv(filepath, with_qr=False):
     return results
 
 
+# ---------------------------------------------------------------------------
+# Streaming mode
+# ---------------------------------------------------------------------------
+
+def normalized_key(args):
+    """Tuple identifying the tagged URL a row produces (URL + sanitized params)."""
+    base_url, err = validate_base_url(args["base_url"] or "")
+    if err:
+        return None
+    return (base_url,) + tuple(sanitize_param(args[k] or "")
+                               for k in ("source", "medium", "campaign", "content", "term"))
+
+
+class QRSink:
+    """Render QR codes in a process pool and write them to a directory or zip.
+
+    At most workers * QR_INFLIGHT_PER_WORKER renders are pending at once, so
+    memory does not grow with the number of links. Files are named by a hash
+    of the tagged URL; a URL whose file already exists is not rendered again.
+    A render that raises is counted in failed and the first QR_ERROR_SAMPLES
+    are kept in errors, so one bad URL does not stop the stream.
+    """
+
+    def __init__(self, qr_dir=None, qr_zip=None, workers=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.pending = deque()
+        self.written = 0
+        self.failed = 0
+        self.errors = []
+        self.zip = None
+        self.dir = None
+        if qr_zip:
+            Path(qr_zip).parent.mkdir(parents=True, exist_ok=True)
+            self.zip = zipfile.ZipFile(qr_zip, "w", zipfile.ZIP_STORED)
+        else:
+            self.dir = Path(qr_dir)
+            self.dir.mkdir(parents=True, exist_ok=True)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    @staticmethod
+    def filename(url):
+        return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".png"
+
+    def _exists(self, name):
+        if self.zip is not None:
+            return name in self.zip.NameToInfo
+        return (self.dir / name).exists()
+
+    def submit(self, url, row=None):
+        """Queue a render for url; returns the file name it will be written to."""
+        name = self.filename(url)
+        if not self._exists(name) and not any(n == name for n, _, _ in self.pending):
+            self.pending.append((name, row, self.pool.submit(qr_png, url)))
+            while len(self.pending) > self.workers * QR_INFLIGHT_PER_WORKER:
+                self._drain_one()
+        return name
+
+    def _drain_one(self):
+        name, row, future = self.pending.popleft()
+        try:
+            png = future.result()
+        except Exception as e:
+            self.failed += 1
+            if len(self.errors) < QR_ERROR_SAMPLES:
+                self.errors.append({"row": row, "qr_file": name, "error": f"QR generation failed: {e}"})
+            return
+        if png is None:
+            self.failed += 1
+        elif self.zip is not None:
+            self.zip.writestr(name, png)
+            self.written += 1
+        else:
+            (self.dir / name).write_bytes(png)
+            self.written += 1
+
+    def close(self):
+        while self.pending:
+            self._drain_one()
+        self.pool.shutdown()
+        if self.zip is not None:
+            self.zip.close()
+
+
+def _qr_available():
+    return all(importlib.util.find_spec(name) is not None for name in ("qrcode", "PIL"))
+
+
+def _flat_row(result):
+    params = result.get("params", {})
+    return {
+        "row": result["row"],
+        "base_url": result.get("base_url", ""),
+        "tagged_url": result.get("tagged_url", ""),
+        "utm_source": params.get("utm_source", ""),
+        "utm_medium": params.get("utm_medium", ""),
+        "utm_campaign": params.get("utm_campaign", ""),
+        "utm_content": params.get("utm_content", ""),
+        "utm_term": params.get("utm_term", ""),
+        "ga4_channel_grouping": result.get("ga4_channel_grouping", ""),
+        "warnings": "; ".join(result.get("warnings", [])),
+        "error": result.get("error", ""),
+        "duplicate_of": result.get("duplicate_of", ""),
+        "qr_file": result.get("qr_file", ""),
+    }
+
+
+def stream_csv(filepath, output, fmt=None, qr_dir=None, qr_zip=None, workers=None,
+               skip_duplicates=False, cache_size=STREAM_CACHE_SIZE):
+    """Tag every row of a CSV and write results incrementally to output.
+
+    Rows are read lazily and each result is written before the next row is
+    read. Results for a normalized parameter set are cached (LRU, cache_size
+    entries), so repeated rows reuse the first result and are marked with
+    duplicate_of (or dropped with skip_duplicates). Returns a summary dict.
+    """
+    path = Path(filepath)
+    if not path.exists():
+        return {"error": f"File not found: {filepath}"}
+    fmt = fmt or ("jsonl" if Path(output).suffix.lower() in (".jsonl", ".ndjson") else "csv")
+
+    summary = {"mode": "stream", "output": str(output), "format": fmt, "rows": 0, "written": 0,
+               "unique_param_sets": 0, "duplicates": 0, "errors": 0, "rows_with_warnings": 0}
+    channels = Counter()
+    cache = OrderedDict()
+    qr = None
+    if qr_dir or qr_zip:
+        if _qr_available():
+            qr = QRSink(qr_dir, qr_zip, workers)
+        else:
+            summary["qr_code_note"] = QR_NOTE
+
+    try:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(path, newline="", encoding="utf-8") as f, \
+                open(output, "w", newline="", encoding="utf-8") as out:
+            writer = None
+            if fmt == "csv":
+                writer = csv.DictWriter(out, fieldnames=STREAM_FIELDS)
+                writer.writeheader()
+            for i, row in enumerate(csv.DictReader(f)):
+                args = _row_args(row)
+                key = normalized_key(args)
+                cached = cache.get(key) if key is not None else None
+                if cached is not None:
+                    cache.move_to_end(key)
+                    result = dict(cached, duplicate_of=cached["row"])
+                    summary["duplicates"] += 1
+                    if skip_duplicates:
+                        summary["rows"] += 1
+                        continue
+                else:
+                    result = build_utm_url(**args)
+                    result["row"] = i + 1
+                    if qr is not None and "tagged_url" in result:
+                        result["qr_file"] = qr.submit(result["tagged_url"], i + 1)
+                    if key is not None:
+                        summary["unique_param_sets"] += 1
+                        cache[key] = result
+                        if len(cache) > cache_size:
+                            cache.popitem(last=False)
+                result["row"] = i + 1
+
+                summary["rows"] += 1
+                if "error" in result:
+                    summary["errors"] += 1
+                else:
+                    channels[result["ga4_channel_grouping"]] += 1
+                if result.get("warnings"):
+                    summary["rows_with_warnings"] += 1
+
+                if writer is not None:
+                    writer.writerow(_flat_row(result))
+                else:
+                    out.write(json.dumps(result) + "\n")
+                summary["written"] += 1
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        return {"error": f"CSV streaming failed at row {summary['rows'] + 1}: {e}"}
+    finally:
+        if qr is not None:
+            qr.close()
+
+    summary["ga4_channels"] = dict(channels.most_common())
+    if qr is not None:
+        summary["qr"] = {"target": str(qr_zip or qr_dir), "written": qr.written, "failed": qr.failed,
+                         "workers": qr.workers}
+        if qr.errors:
+            summary["qr"]["errors"] = qr.errors
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(description="Batch UTM parameter generation with GA4 validation")
     parser.add_argument("--base-url", help="Base URL to tag")
@@ -163,12 +395,32 @@ def main():
     parser.add_argument("--term", default="", help="Paid keyword term")
     parser.add_argument("--csv", dest="csv_file", help="CSV file for batch mode")
     parser.add_argument("--qr", action="store_true", help="Generate QR codes")
+    parser.add_argument("--output", help="Streaming mode: write batch results to this CSV or JSONL file "
+                                         "row by row and print only a summary")
+    parser.add_argument("--format", choices=["csv", "jsonl"],
+                        help="Output format for --output (default: from the file extension)")
+    parser.add_argument("--qr-dir", help="Streaming mode: write one PNG QR code per unique URL to this directory")
+    parser.add_argument("--qr-zip", help="Streaming mode: write QR PNGs into this zip file instead")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="QR rendering processes (default: CPU count)")
+    parser.add_argument("--skip-duplicates", action="store_true",
+                        help="Streaming mode: omit rows whose parameter set was already written")
     args = parser.parse_args()
 
     if not args.base_url and not args.csv_file:
         parser.error("Provide --base-url or --csv")
+    if (args.output or args.qr_dir or args.qr_zip) and not args.csv_file:
+        parser.error("--output, --qr-dir and --qr-zip require --csv")
+    if (args.qr_dir or args.qr_zip) and not args.output:
+        parser.error("--qr-dir/--qr-zip require --output (streaming mode)")
+    if args.qr and args.output:
+        parser.error("--qr embeds base64 PNGs in batch/single output; with --output use --qr-dir or --qr-zip")
 
-    if args.csv_file:
+    if args.output:
+        output = stream_csv(args.csv_file, args.output, fmt=args.format, qr_dir=args.qr_dir,
+                            qr_zip=args.qr_zip, workers=args.workers,
+                            skip_duplicates=args.skip_duplicates)
+    elif args.csv_file:
         output = {"mode": "batch", "results": process_csv(args.csv_file, with_qr=args.qr)}
     else:
         result = build_utm_url(
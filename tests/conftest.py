@@ -0,0 +1,29 @@
+"""Shared helpers for the script tests.
+
+Scripts live in scripts/ with hyphenated file names, so they are loaded by
+path rather than imported.
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))  # for brand_store, pattern_scanner, ...
+
+
+def _load(filename):
+    name = "_test_" + Path(filename).stem.replace("-", "_")
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[name]
+
+
+@pytest.fixture
+def load_script():
+    return _load
@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import pytest
+
+PANEL_ID = "panel-test"  # seeds every simulated answer
+SEGMENTS = [
+    {"name": "Enterprise", "size_pct": 40, "demographics": {"income": "high"}, "psychographics": {"engagement": "high"}},
+    {"name": "SMB", "size_pct": 35, "demographics": {"income": "medium"}, "psychographics": {"engagement": "medium"}},
+    {"name": "Freelancers", "size_pct": 25, "demographics": {"income": "low"}, "psychographics": {"engagement": "low"}},
+]
+VARIANTS = [{"name": "A", "headline": "Ship 2x faster", "body": "Automate reports for your team.", "cta": "Start free trial"},
+            {"name": "B", "headline": "The reliable analytics platform", "body": "Trusted by 500 teams.", "cta": "Book a demo"}]
+STATEMENTS = [{"name": "Value", "statement": "We deliver 10x ROI"},
+              {"name": "Trust", "statement": "Secure, compliant analytics trusted by enterprises"}]
+# Segment-mode output recorded before the respondent engine was added
+GOLDEN = Path(__file__).parent / "data" / "audience_simulator_segment_mode.json"
+
+
+@pytest.fixture
+def sim(load_script, tmp_path, monkeypatch):
+    module = load_script("audience-simulator.py")
+    monkeypatch.setattr(module, "BRANDS_DIR", tmp_path)
+    (tmp_path / "acme").mkdir()
+    created = module.create_panel("acme", "Test", json.dumps(SEGMENTS))
+    panels = tmp_path / "acme" / "panels"
+    (panels / created["panel_id"]).rename(panels / PANEL_ID)
+    panel_file = panels / PANEL_ID / "panel.json"
+    panel = json.loads(panel_file.read_text())
+    panel["panel_id"] = PANEL_ID
+    panel_file.write_text(json.dumps(panel))
+    return module
+
+
+def _run_all(sim, respondents=None):
+    return {
+        "message": sim.test_message("acme", PANEL_ID, json.dumps(VARIANTS), respondents),
+        "positioning": sim.test_positioning("acme", PANEL_ID, json.dumps(STATEMENTS), respondents),
+        "pricing": sim.test_pricing("acme", PANEL_ID, "[29, 49, 79]", "SaaS analytics", respondents),
+        "focus": sim.focus_group("acme", PANEL_ID, "New dashboard", json.dumps(["First reaction?"]), respondents),
+    }
+
+
+def test_segment_mode_output_unchanged(sim):
+    assert _run_all(sim) == json.loads(GOLDEN.read_text())
+
+
+def test_respondent_mode_is_deterministic(sim):
+    if sim.np is None:
+        pytest.skip("numpy not installed")
+    first = _run_all(sim, respondents=300)
+    second = _run_all(sim, respondents=300)
+
+    assert first == second
+    for result in first.values():
+        assert "error" not in result
+        assert result["respondents_per_segment"] == 300
+    assert first != _run_all(sim, respondents=301)
+
+
+@pytest.mark.parametrize("respondents", [-1, 100001])
+def test_respondent_bounds_share_one_message(sim, respondents):
+    created = sim.create_panel("acme", "Bad", json.dumps(SEGMENTS), respondents)
+    tested = sim.test_message("acme", PANEL_ID, json.dumps(VARIANTS), respondents)
+    assert created == tested == {"error": sim.RESPONDENTS_RANGE_ERROR}
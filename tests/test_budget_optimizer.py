@@ -0,0 +1,87 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "budget-optimizer.py"
+
+
+def _channel(name, spend=0, revenue=0, **extra):
+    return {"name": name, "spend": spend, "conversions": 0, "revenue": revenue, **extra}
+
+
+def _fitted():
+    return [
+        _channel("Search", 1000, 4000, history=[{"spend": 500, "revenue": 2500}]),
+        _channel("Social", 2000, 5000, history=[{"spend": 1000, "revenue": 3200}]),
+        _channel("Display", 1500, 2000),
+    ]
+
+
+def _within(allocation, bounds):
+    return all(low - 0.01 <= a <= high + 0.01 for a, (low, high) in zip(allocation, bounds))
+
+
+def test_no_data_channels_respect_max_spend(load_script):
+    bo = load_script("budget-optimizer.py")
+    channels = [_channel("A", max_spend=500), _channel("B")]
+
+    allocation, _, diagnostics = bo.optimise(channels, 10000, 0, 10)
+
+    assert allocation == [500.0, 8500.0]
+    assert "unallocated" not in diagnostics
+
+
+def test_no_data_channels_report_unallocated(load_script):
+    bo = load_script("budget-optimizer.py")
+    channels = [_channel("A", max_spend=500), _channel("B", max_spend=1000)]
+
+    allocation, _, diagnostics = bo.optimise(channels, 10000, 0, 10)
+
+    assert allocation == [500.0, 1000.0]
+    assert diagnostics["unallocated"] == 7500.0
+
+
+@pytest.mark.parametrize("solver", ["bisection", "greedy"])
+def test_curve_solvers_respect_bounds(load_script, solver):
+    bo = load_script("budget-optimizer.py")
+    channels = _fitted() + [_channel("New", max_spend=300)]
+
+    allocation, test_budget, diagnostics = bo.optimise(
+        channels, 10000, 100, 10, solver=solver, max_change_pct=20)
+
+    bounds = bo.spend_bounds(channels, 100, 20)
+    assert _within(allocation, bounds)
+    assert allocation[3] == 300.0
+    assert round(sum(allocation) + diagnostics.get("unallocated", 0), 2) == 10000 - test_budget
+
+
+@pytest.mark.parametrize("solver", ["bisection", "greedy"])
+def test_curve_solvers_spend_budget_and_equalise_marginals(load_script, solver):
+    bo = load_script("budget-optimizer.py")
+    channels = _fitted()
+
+    allocation, test_budget, diagnostics = bo.optimise(channels, 9000, 0, 10, solver=solver)
+
+    assert round(sum(allocation), 2) == 9000 - test_budget
+    assert diagnostics["marginal_roas_spread"] < 0.05
+
+
+def test_solvers_agree(load_script):
+    bo = load_script("budget-optimizer.py")
+    bisection, _, _ = bo.optimise(_fitted(), 9000, 0, 10, solver="bisection")
+    greedy, _, _ = bo.optimise(_fitted(), 9000, 0, 10, solver="greedy")
+    assert all(abs(a - b) < 10 for a, b in zip(bisection, greedy))
+
+
+def test_proportional_output_has_no_curve_details():
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT), "--channels", json.dumps(_fitted()),
+         "--total-budget", "9000", "--solver", "proportional"],
+        capture_output=True, text=True, check=True)
+    output = json.loads(result.stdout)
+    assert "optimizer" not in output
+    for channel in output["optimized_allocation"]["channels"]:
+        assert "marginal_roas" not in channel and "response_curve" not in channel
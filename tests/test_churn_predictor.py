@@ -0,0 +1,62 @@
+import csv
+
+import pytest
+
+
+def _write_customers(path, rows=20):
+    with open(path, "w", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["customer_id", "login_frequency_recent", "login_frequency_baseline", "payment_failures"])
+        for i in range(rows):
+            writer.writerow([f"c{i}", i % 5, 5, i % 3])
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("top", [0, 3])
+def test_score_customers_top(load_script, tmp_path, engine, top):
+    churn = load_script("churn-predictor.py")
+    if engine == "numpy" and churn.np is None:
+        pytest.skip("numpy not installed")
+    path = tmp_path / "customers.csv"
+    _write_customers(path)
+
+    result = churn.score_customers(str(path), top_n=top, engine=engine)
+
+    assert "error" not in result
+    assert result["customers_scored"] == 20
+    assert len(result["top_risk_customers"]) == top
+
+
+def test_score_customers_engines_agree(load_script, tmp_path):
+    churn = load_script("churn-predictor.py")
+    if churn.np is None:
+        pytest.skip("numpy not installed")
+    path = tmp_path / "customers.csv"
+    _write_customers(path)
+
+    fast = churn.score_customers(str(path), top_n=5, engine="numpy")
+    slow = churn.score_customers(str(path), top_n=5, engine="python")
+    fast.pop("engine"), slow.pop("engine")
+    assert fast == slow
+
+
+def test_non_finite_values_count_as_missing(load_script, tmp_path):
+    churn = load_script("churn-predictor.py")
+    if churn.np is None:
+        pytest.skip("numpy not installed")
+    path = tmp_path / "customers.csv"
+    _write_customers(path)
+    with open(path, "a", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(["inf1", "inf", 5, 1])
+        writer.writerow(["inf2", 3, "-inf", "inf"])
+        writer.writerow(["nan1", "nan", "NaN", 0])
+        writer.writerow(["nan2", 2, 5, "nan"])
+
+    fast = churn.score_customers(str(path), top_n=5, engine="numpy")
+    slow = churn.score_customers(str(path), top_n=5, engine="python")
+
+    assert "error" not in fast and "error" not in slow
+    assert fast["customers_scored"] == 24
+    fast.pop("engine"), slow.pop("engine")
+    assert fast == slow
@@ -0,0 +1,31 @@
+import pytest
+
+
+def _evidence(n):
+    return {"evidence": [
+        {"claim": f"Revenue grew {i + 10}% in fiscal quarter {i}", "source": f"report-{i}", "verified": True}
+        for i in range(n)
+    ]}
+
+
+@pytest.mark.parametrize("text", [
+    "We serve 9000+ companies worldwide.",
+    "Revenue grew 45% last year.",
+])
+def test_confidence_matches_full_scan(load_script, text):
+    cv = load_script("claim-verifier.py")
+    evidence = _evidence(120)
+
+    indexed = cv.verify_claims(text, evidence, candidates=cv.DEFAULT_CANDIDATES)
+    full = cv.verify_claims(text, evidence, candidates=0)
+
+    assert indexed["claims"], "expected at least one extracted claim"
+    assert indexed == full
+
+
+def test_no_overlap_falls_back_to_every_item(load_script):
+    cv = load_script("claim-verifier.py")
+    index = cv.EvidenceIndex.build(_evidence(120)["evidence"])
+    norm = cv._normalize_text("We serve 9000+ companies worldwide.")
+    nums = cv._extract_numbers("We serve 9000+ companies worldwide.")
+    assert list(index.candidates(norm, nums, 5)) == list(range(120))
@@ -0,0 +1,88 @@
+import argparse
+import io
+import json
+import threading
+
+
+def test_hung_inproc_scorer_is_abandoned_and_capped(load_script, monkeypatch):
+    er = load_script("eval-runner.py")
+    release = threading.Event()
+
+    def hang(runner, ctx):
+        release.wait(10)
+        return True, {}, None
+
+    monkeypatch.setattr(er, "SUBPROCESS_TIMEOUT", 0.1)
+    monkeypatch.setattr(er, "ABANDONED_THREAD_LIMIT", 1)
+    monkeypatch.setattr(er, "_ABANDONED", set())
+    monkeypatch.setattr(er, "_load_sibling", lambda script: (object(), None, None))
+    monkeypatch.setattr(er, "_run_inproc", hang)
+    try:
+        report = er._run_eval(
+            dimensions_to_run=["readability"], base_weights={"readability": 1.0},
+            content="Some copy.", brand_slug=None, evidence_path=None, schema_name=None,
+            content_type="general", eval_type="quick", log_results=False,
+            config={"weights": {}, "minimum_dimension_scores": {}}, engine="inproc",
+        )
+        assert "Timed out" in str(report)
+        assert er._abandoned_threads() == 1
+        assert er._dimension_engine({"script": "readability-analyzer.py"}, "inproc") == "subprocess"
+    finally:
+        release.set()
+
+    (future,) = er._ABANDONED
+    future.result(timeout=5)
+    assert er._abandoned_threads() == 0
+    assert er._dimension_engine({"script": "readability-analyzer.py"}, "inproc") == "inproc"
+
+
+def test_daemon_future_reports_result_and_exception(load_script):
+    er = load_script("eval-runner.py")
+    assert er._submit_daemon(sum, [1, 2, 3]).result(timeout=5) == 6
+    error = er._submit_daemon(int, "x").exception(timeout=5)
+    assert isinstance(error, ValueError)
+
+
+def _batch_args(tmp_path, lines):
+    path = tmp_path / "items.jsonl"
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    return argparse.Namespace(batch=str(path), action="run-quick", brand=None, evidence=None,
+                              schema=None, content_type=None, engine="inproc", workers=1, log=False)
+
+
+def test_batch_reports_bad_items_and_continues(load_script, tmp_path, monkeypatch):
+    er = load_script("eval-runner.py")
+    real_run_eval = er._run_eval
+
+    def run_eval(**kwargs):
+        if kwargs["content"] == "boom":
+            raise RuntimeError("scorer exploded")
+        return real_run_eval(**kwargs)
+
+    monkeypatch.setattr(er, "_run_eval", run_eval)
+    args = _batch_args(tmp_path, [
+        {"id": "good", "text": "Our new plan helps teams ship faster. Try it today."},
+        {"id": "number", "text": 123},
+        {"id": "boom", "text": "boom"},
+        {"id": "type", "text": "Fine copy.", "content_type": ["blog"]},
+    ])
+    out = io.StringIO()
+
+    summary = er.run_batch(args, out)["batch_summary"]
+
+    rows = {row["item_id"]: row for row in map(json.loads, out.getvalue().splitlines())}
+    assert set(rows) == {"good", "number", "boom", "type"}
+    assert "error" not in rows["good"]
+    assert "must be a string" in rows["number"]["error"]
+    assert "scorer exploded" in rows["boom"]["error"]
+    assert "content_type" in rows["type"]["error"]
+    assert (summary["items"], summary["evaluated"], summary["failed"]) == (4, 1, 3)
+    assert rows["good"]["eval_id"].startswith(summary["batch_id"])
+
+
+def test_batch_ids_differ_between_runs(load_script, tmp_path):
+    er = load_script("eval-runner.py")
+    args = _batch_args(tmp_path, [{"id": "a", "text": "Short copy."}])
+    first = er.run_batch(args, io.StringIO())["batch_summary"]["batch_id"]
+    second = er.run_batch(args, io.StringIO())["batch_summary"]["batch_id"]
+    assert first != second
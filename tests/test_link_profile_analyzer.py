@@ -0,0 +1,48 @@
+import json
+
+
+def _link(i):
+    return {"url": f"https://site{i % 7}.com/p{i}", "anchor_text": "acme", "da": i % 101, "follow": i % 4 != 0}
+
+
+def test_stream_counts_malformed_jsonl_lines(load_script, tmp_path):
+    lpa = load_script("link-profile-analyzer.py")
+    links = [_link(i) for i in range(200)]
+    path = tmp_path / "links.jsonl"
+    lines = [json.dumps(link) for link in links]
+    lines.insert(50, "not json")
+    lines.insert(120, '{"url": "https://broken.com",')
+    lines.append('{"url": "https://x.com", "da": "n/a"}')  # valid JSON, bad DA
+    lines.append('{"url": "https://inf.com", "da": Infinity}')
+    path.write_text("\n".join(lines) + "\n")
+
+    result = lpa.analyze_stream(lpa.iter_link_file(path), None)
+
+    assert result["rows_invalid"] == 4
+    expected = lpa.analyze_profile(links, None)
+    assert {k: v for k, v in result.items() if k != "rows_invalid"} == expected
+
+
+def test_stream_matches_array_analysis(load_script, tmp_path):
+    lpa = load_script("link-profile-analyzer.py")
+    links = [_link(i) for i in range(300)]
+    path = tmp_path / "links.jsonl"
+    path.write_text("".join(json.dumps(link) + "\n" for link in links))
+
+    streamed = lpa.analyze_stream(lpa.iter_link_file(path), "acme.com")
+    assert streamed == lpa.analyze_profile(links, "acme.com")
+    assert "rows_invalid" not in streamed
+
+
+def test_stream_counts_infinite_csv_da(load_script, tmp_path):
+    lpa = load_script("link-profile-analyzer.py")
+    path = tmp_path / "links.csv"
+    path.write_text("url,anchor_text,da,follow\n"
+                    "https://a.com/x,acme,40,true\n"
+                    "https://b.com/y,acme,1.0e400,true\n"
+                    "https://c.com/z,acme,-1.0e400,false\n")
+
+    result = lpa.analyze_stream(lpa.iter_link_file(path), None)
+
+    assert result["profile_summary"]["total_links"] == 1
+    assert result["rows_invalid"] == 2
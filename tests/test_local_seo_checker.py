@@ -0,0 +1,56 @@
+import argparse
+import json
+
+import pytest
+
+
+@pytest.mark.parametrize("address, expected", [
+    ("100 Main St Suite A1 2ND Floor, Austin, TX 78701", "78701"),
+    ("Unit B2 1ST Ave, Austin TX 78701", "78701"),
+    ("100 Main St, Austin, TX 78701-1234", "78701"),
+    ("10 Downing St, London SW1A 2AA", "SW1A2AA"),
+    ("24 Sussex Dr, Ottawa ON K1A 0B1", "K1A0B1"),
+    ("No postcode here", ""),
+])
+def test_extract_postcode_from_address(load_script, address, expected):
+    lsc = load_script("local-seo-checker.py")
+    assert lsc.extract_postcode("", address) == expected
+
+
+@pytest.mark.parametrize("postcode, expected", [
+    (78701.0, "78701"),
+    (78701, "78701"),
+    (2134, "02134"),
+    ("sw1a 2aa", "SW1A2AA"),
+    ("78701-1234", "78701"),
+])
+def test_extract_postcode_explicit_value(load_script, postcode, expected):
+    lsc = load_script("local-seo-checker.py")
+    assert lsc.extract_postcode(postcode, "") == expected
+
+
+def test_unit_designator_does_not_block_match(load_script):
+    lsc = load_script("local-seo-checker.py")
+    locations = [{"location_id": "atx", "name": "Acme Dental",
+                  "address": "100 Main St Suite A1 2ND Floor, Austin, TX 78701", "phone": "512-555-0100"}]
+    citations = [{"source": "yelp", "name": "Acme Dental", "address": "100 Main St, Austin, TX 78701"}]
+
+    result = lsc.analyze_locations(locations, citations, workers=1)
+
+    assert result["unmatched_citations"] == []
+    assert result["matrix"][0]["citations_checked"] == 1
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_run_locations_rejects_non_object_records(load_script, tmp_path):
+    lsc = load_script("local-seo-checker.py")
+    good = [{"location_id": "a", "name": "Acme", "address": "1 Main St, Austin, TX 78701"}]
+    for locations, citations in (([1, 2], good), (good, [1, 2])):
+        args = argparse.Namespace(locations=_write(tmp_path / "loc.json", locations),
+                                  file=_write(tmp_path / "cit.json", citations), workers=1, output=None)
+        result = lsc.run_locations(args)
+        assert "error" in result
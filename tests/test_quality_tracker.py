@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+
+def _record(i, day):
+    return {"eval_id": f"eval-{i:03d}", "timestamp": f"{day}T10:00:00", "content_type": "blog",
+            "scores": {"composite": 60 + i}}
+
+
+def _setup(tmp_path, qt):
+    quality_dir = tmp_path / "quality"
+    ledger = quality_dir / qt.LEDGER_DIR
+    ledger.mkdir(parents=True)
+    (quality_dir / "evals").mkdir()
+    for day, ids in (("2026-01-01", range(3)), ("2026-01-02", range(3, 5))):
+        (ledger / f"{day}.jsonl").write_text(
+            "".join(json.dumps(_record(i, day)) + "\n" for i in ids), encoding="utf-8")
+    return quality_dir, ledger
+
+
+def test_rebuild_keeps_every_record(load_script, tmp_path):
+    qt = load_script("quality-tracker.py")
+    quality_dir, ledger = _setup(tmp_path, qt)
+
+    index, legacy, total = qt._rebuild_index(quality_dir)
+
+    assert (legacy, total) == (0, 5)
+    assert sorted(index["days"]) == ["2026-01-01", "2026-01-02"]
+    assert sorted(fp.name for fp in ledger.iterdir()) == ["2026-01-01.jsonl", "2026-01-02.jsonl"]
+    assert [p.name for p in quality_dir.iterdir() if p.name.startswith(".")] == []
+
+
+def test_failed_rebuild_leaves_old_ledger(load_script, tmp_path, monkeypatch):
+    qt = load_script("quality-tracker.py")
+    quality_dir, ledger = _setup(tmp_path, qt)
+    before = {fp.name: fp.read_text(encoding="utf-8") for fp in ledger.iterdir()}
+    written = []
+
+    def failing_write(path, text):
+        if written:
+            raise OSError("disk full")
+        written.append(path)
+
+    monkeypatch.setattr(qt, "write_text", failing_write)
+    with pytest.raises(OSError):
+        qt._rebuild_index(quality_dir)
+
+    assert {fp.name: fp.read_text(encoding="utf-8") for fp in ledger.iterdir()} == before
+    assert [p.name for p in quality_dir.iterdir() if p.name.startswith(".")] == []
@@ -0,0 +1,28 @@
+import math
+
+import pytest
+
+
+def _history(months, base=50000.0):
+    return [{"month": f"{2022 + i // 12}-{i % 12 + 1:02d}",
+             "revenue": round(base * (1 + 0.01 * i) * (1 + 0.1 * math.sin(i * math.pi / 6)), 2)}
+            for i in range(months)]
+
+
+@pytest.mark.parametrize("months", [2, 3, 6])
+def test_short_history_has_no_interval(load_script, months):
+    rf = load_script("revenue-forecaster.py")
+    result = rf.forecast_series_ets(_history(months), 3)
+
+    for entry in result["forecast"]:
+        assert entry["interval_method"] == "unavailable"
+        assert "interval_low" not in entry and "interval_high" not in entry
+
+
+def test_long_history_has_interval(load_script):
+    rf = load_script("revenue-forecaster.py")
+    result = rf.forecast_series_ets(_history(36), 3)
+
+    for entry in result["forecast"]:
+        assert entry["interval_method"] != "unavailable"
+        assert entry["interval_low"] < entry["interval_high"]
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+
+def _records(load_script, path):
+    roi = load_script("roi-calculator.py")
+    return [(p, j, c, v) for p, j, c, v in roi.iter_path_records(path)]
+
+
+def test_converted_flag_and_conversions_count(load_script, tmp_path):
+    path = tmp_path / "paths.csv"
+    path.write_text(
+        "path,converted,conversions,value,count\n"
+        "A > B,1,,100,5\n"      # all five converted
+        "A > B,no,,0,4\n"
+        "B,,1,30,5\n"           # one of five converted, not five
+        "C,true,2,50,10\n",     # conversions wins over the flag
+        encoding="utf-8",
+    )
+    assert [(c, j) for _, j, c, _ in _records(load_script, path)] == [
+        (5.0, 5.0), (0.0, 4.0), (1.0, 5.0), (2.0, 10.0)]
+
+
+@pytest.mark.parametrize("row", [
+    {"path": "A", "converted": 3, "count": 5},
+    {"path": "A", "converted": 0.5, "count": 2},
+    {"path": "A", "conversions": 6, "count": 5},
+    {"path": "A", "conversions": -1},
+])
+def test_invalid_conversion_fields_are_rejected(load_script, tmp_path, row):
+    roi = load_script("roi-calculator.py")
+    path = tmp_path / "paths.jsonl"
+    path.write_text(json.dumps(row) + "\n", encoding="utf-8")
+    agg, error = roi.aggregate_paths(path)
+    assert agg is None and "row 1" in error
+
+
+def test_json_array_file(load_script, tmp_path):
+    rows = [{"path": ["A", "B"], "converted": True, "value": 120},
+            {"path": "B > C", "conversions": 2, "count": 3, "value": 60}]
+    json_path = tmp_path / "paths.json"
+    json_path.write_text(json.dumps(rows, indent=2), encoding="utf-8")
+    jsonl_path = tmp_path / "paths.jsonl"
+    jsonl_path.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+
+    assert _records(load_script, json_path) == _records(load_script, jsonl_path)
+    assert _records(load_script, json_path)[1] == (("B", "C"), 3.0, 2.0, 60.0)
+
+
+def test_json_file_must_hold_an_array(load_script, tmp_path):
+    roi = load_script("roi-calculator.py")
+    path = tmp_path / "paths.json"
+    path.write_text(json.dumps({"path": "A", "converted": True}), encoding="utf-8")
+    agg, error = roi.aggregate_paths(path)
+    assert agg is None and "array" in error
@@ -0,0 +1,72 @@
+import json
+import socketserver
+import threading
+
+import pytest
+
+import scorer_client
+
+
+@pytest.fixture
+def daemon(tmp_path, monkeypatch):
+    """A stand-in daemon that records requests and echoes their params."""
+    requests = []
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            message = json.loads(self.rfile.readline())
+            requests.append(message)
+            reply = {"id": message["id"], "result": {"echo": message["params"]}}
+            self.wfile.write((json.dumps(reply) + "\n").encode("utf-8"))
+
+    path = tmp_path / "d.sock"
+    server = socketserver.UnixStreamServer(str(path), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(scorer_client, "SOCKET_PATH", path)
+    yield requests
+    server.shutdown()
+    server.server_close()
+
+
+def _content_fast_path(argv):
+    scorer_client.fast_path(
+        "content.score",
+        {"--type": "content_type", "--keyword": "keyword"},
+        required=("content_type",),
+        choices={"content_type": ("blog", "social")},
+        argv=argv,
+    )
+
+
+def test_valid_request_is_served_by_daemon(daemon, capsys):
+    with pytest.raises(SystemExit) as exc:
+        _content_fast_path(["--text", "Hello", "--type", "blog"])
+    assert exc.value.code == 0
+    assert daemon[0]["params"] == {"text": "Hello", "content_type": "blog", "keyword": None}
+    assert json.loads(capsys.readouterr().out) == {"echo": daemon[0]["params"]}
+
+
+@pytest.mark.parametrize("argv", [
+    ["--text", "Hello", "--type", "blgo"],       # not one of the choices
+    ["--text", "Hello"],                          # required flag missing
+    ["--text", "Hello", "--file", "x.md", "--type", "blog"],  # mutually exclusive
+    ["--text", "Hello", "--type", "blog", "--no-daemon"],
+    ["--text", "Hello", "--type", "blog", "--help"],
+])
+def test_invalid_or_opted_out_requests_fall_through(daemon, argv):
+    _content_fast_path(argv)  # returns instead of exiting
+    assert daemon == []
+
+
+def test_content_types_match_weights(load_script):
+    pytest.importorskip("textstat")
+    pytest.importorskip("nltk")
+    scorer = load_script("content-scorer.py")
+    assert set(scorer.CONTENT_TYPES) == set(scorer.CONTENT_TYPE_WEIGHTS)
+
+
+def test_request_without_daemon_returns_none(tmp_path, monkeypatch):
+    monkeypatch.setattr(scorer_client, "SOCKET_PATH", tmp_path / "missing.sock")
+    assert scorer_client.request("ping") is None
+    assert scorer_client.score("content.score", {}) is None
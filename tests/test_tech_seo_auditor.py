@@ -0,0 +1,99 @@
+import http.server
+import threading
+
+import pytest
+
+GOOD_PAGE = """<!doctype html><html><head>
+<title>Acme project management software for teams</title>
+<meta name="description" content="{desc}">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<link rel="canonical" href="{base}/good">
+</head><body><h1>Acme</h1></body></html>"""
+BARE_PAGE = "<!doctype html><html><head></head><body>No meta here.</body></html>"
+NOINDEX_PAGE = ('<html><head><title>Internal staging page for the Acme web team</title>'
+                '<meta name="robots" content="noindex"></head><body></body></html>')
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so the crawler can reuse connections
+    routes = {}
+
+    def do_GET(self):
+        status, headers, body = self.routes.get(self.path, (404, {}, "not found"))
+        body = body.encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site():
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    html = {"Content-Type": "text/html; charset=utf-8"}
+    _Handler.routes = {
+        "/good": (200, html, GOOD_PAGE.format(base=base, desc="Plan projects, track work and ship on time. " * 3)),
+        "/bare": (200, html, BARE_PAGE),
+        "/noindex": (200, html, NOINDEX_PAGE),
+        "/old": (301, {"Location": "/hop1"}, ""),
+        "/hop1": (302, {"Location": "/hop2"}, ""),
+        "/hop2": (301, {"Location": f"{base}/good"}, ""),
+        "/sitemap.xml": (200, {"Content-Type": "application/xml"},
+                         '<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+                         + "".join(f"<url><loc>{base}{p}</loc></url>"
+                                   for p in ("/good", "/bare", "/noindex", "/old", "/missing", "/good"))
+                         + "</urlset>"),
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield base
+    server.shutdown()
+    server.server_close()
+
+
+def _messages(result):
+    return [issue["message"] for issue in result["issues"]]
+
+
+def _comparable(result):
+    """Result without timings, which differ from run to run."""
+    result = {k: v for k, v in result.items() if k != "response_time_ms"}
+    result["speed_hints"] = {k: v for k, v in result["speed_hints"].items() if k != "ttfb_ms"}
+    return result
+
+
+def test_sitemap_crawl_findings(load_script, site):
+    tsa = load_script("tech-seo-auditor.py")
+    urls, error = tsa.load_sitemap(f"{site}/sitemap.xml", timeout=5)
+    assert error is None
+    assert [u[len(site):] for u in urls] == ["/good", "/bare", "/noindex", "/old", "/missing"]
+
+    crawled = tsa.crawl(urls, tsa.ALL_CHECKS, 5, concurrency=4, delay=0)
+    results = {result["url"][len(site):]: result for _, result in crawled}
+
+    assert results["/good"]["status_code"] == 200
+    assert results["/good"]["meta"]["title_status"] == "good"
+    assert "Missing title tag" in _messages(results["/bare"])
+    assert "Missing viewport meta tag (poor mobile rendering)" in _messages(results["/bare"])
+    assert results["/noindex"]["meta"]["noindex"] is True
+    assert results["/old"]["redirect_count"] == 3
+    assert any("Long redirect chain" in m for m in _messages(results["/old"]))
+    assert "Non-200 status code: 404" in _messages(results["/missing"])
+    assert results["/missing"]["score"] < results["/good"]["score"]
+
+
+def test_crawl_matches_sequential_audit(load_script, site):
+    tsa = load_script("tech-seo-auditor.py")
+    urls = [f"{site}{p}" for p in ("/good", "/bare", "/noindex", "/old", "/missing")]
+
+    sequential = [_comparable(r) for r in tsa._audit_sequential(urls, tsa.ALL_CHECKS, 5)]
+    crawled = sorted(tsa.crawl(urls, tsa.ALL_CHECKS, 5, concurrency=3, delay=0))
+
+    assert [_comparable(r) for _, r in crawled] == sequential
+
@@ -0,0 +1,68 @@
+import csv
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "utm-generator.py"
+
+
+def _write_links(path, urls):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["base_url", "source", "medium", "campaign"])
+        for url in urls:
+            writer.writerow([url, "newsletter", "email", "spring"])
+
+
+def test_stream_records_failed_qr_renders(load_script, tmp_path):
+    pytest.importorskip("qrcode")
+    pytest.importorskip("PIL")
+    utm = load_script("utm-generator.py")
+    too_long = "https://example.com/" + "a" * 4000  # over the largest QR version
+    links = tmp_path / "links.csv"
+    _write_links(links, ["https://example.com/a", too_long, "https://example.com/b"])
+    qr_zip = tmp_path / "qr.zip"
+
+    summary = utm.stream_csv(links, tmp_path / "out.csv", qr_zip=qr_zip, workers=1)
+
+    assert "error" not in summary
+    assert summary["written"] == 3
+    assert summary["qr"]["written"] == 2
+    assert summary["qr"]["failed"] == 1
+    [failure] = summary["qr"]["errors"]
+    assert failure["row"] == 2
+    assert failure["error"].startswith("QR generation failed")
+    with zipfile.ZipFile(qr_zip) as zf:
+        assert len(zf.namelist()) == 2
+        assert failure["qr_file"] not in zf.namelist()
+
+
+def test_single_mode_records_qr_error(load_script, monkeypatch):
+    utm = load_script("utm-generator.py")
+
+    def boom(url):
+        raise ValueError("data too long")
+
+    monkeypatch.setattr(utm, "generate_qr", boom)
+    result = utm.build_utm_url("https://example.com", "newsletter", "email", "spring", with_qr=True)
+
+    assert result["qr_code_error"] == "QR generation failed: data too long"
+    assert "tagged_url" in result and "qr_code_base64_png" not in result
+
+
+def test_qr_flag_rejected_in_streaming_mode(tmp_path):
+    links = tmp_path / "links.csv"
+    _write_links(links, ["https://example.com/a"])
+
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT), "--csv", str(links),
+         "--output", str(tmp_path / "out.csv"), "--qr"],
+        capture_output=True, text=True,
+    )
+
+    assert proc.returncode == 2
+    assert "--qr-dir or --qr-zip" in proc.stderr
+    assert not (tmp_path / "out.csv").exists()